@@ -1,5 +1,6 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Optional
+from typing import List, Optional
 from app.models.schemas import (
     StatisticsRequest,
     StatisticsResponse,
@@ -14,6 +15,7 @@ from datetime import datetime, timedelta
 import logging
 
 from app.middleware.auth import get_current_user_or_service
+from app.services.gee_executor import run_gee
 
 router = APIRouter(dependencies=[Depends(get_current_user_or_service)])
 logger = logging.getLogger(__name__)
@@ -48,7 +50,8 @@ async def get_statistics(
         if satellite_provider.provider_name == "Google Earth Engine":
             from app.services import earth_engine_service
 
-            statistics = earth_engine_service.get_statistics(
+            statistics = await run_gee(
+                earth_engine_service.get_statistics,
                 request.aoi.geometry.model_dump(),
                 request.date_range.start_date,
                 request.date_range.end_date,
@@ -67,7 +70,8 @@ async def get_statistics(
                     "p98": stats.get(f"{index_name}_p98"),
                 }
         else:
-            stats_results = satellite_provider.get_statistics(
+            stats_results = await run_gee(
+                satellite_provider.get_statistics,
                 geometry=request.aoi.geometry.model_dump(),
                 start_date=request.date_range.start_date,
                 end_date=request.date_range.end_date,
@@ -107,7 +111,7 @@ async def compare_periods(
     aoi: dict,
     period1: dict,
     period2: dict,
-    indices: list,
+    indices: List[str],
     provider: Optional[str] = Query(
         None, description="Satellite provider (gee, cdse, or auto)"
     ),
@@ -118,25 +122,33 @@ async def compare_periods(
         if satellite_provider.provider_name == "Google Earth Engine":
             from app.services import earth_engine_service
 
-            stats1 = earth_engine_service.get_statistics(
-                aoi, period1["start_date"], period1["end_date"], indices
-            )
-            stats2 = earth_engine_service.get_statistics(
-                aoi, period2["start_date"], period2["end_date"], indices
+            # Both periods in one Earth Engine round trip
+            stats1, stats2 = await run_gee(
+                earth_engine_service.get_statistics_for_periods,
+                aoi,
+                [
+                    (period1["start_date"], period1["end_date"]),
+                    (period2["start_date"], period2["end_date"]),
+                ],
+                indices,
             )
             get_val = lambda stats, idx, suffix: stats[idx].get(f"{idx}_{suffix}", 0)
         else:
-            raw1 = satellite_provider.get_statistics(
-                geometry=aoi,
-                start_date=period1["start_date"],
-                end_date=period1["end_date"],
-                indices=indices,
-            )
-            raw2 = satellite_provider.get_statistics(
-                geometry=aoi,
-                start_date=period2["start_date"],
-                end_date=period2["end_date"],
-                indices=indices,
+            raw1, raw2 = await asyncio.gather(
+                run_gee(
+                    satellite_provider.get_statistics,
+                    geometry=aoi,
+                    start_date=period1["start_date"],
+                    end_date=period1["end_date"],
+                    indices=indices,
+                ),
+                run_gee(
+                    satellite_provider.get_statistics,
+                    geometry=aoi,
+                    start_date=period2["start_date"],
+                    end_date=period2["end_date"],
+                    indices=indices,
+                ),
             )
             stats1 = {k: v.statistics for k, v in raw1.items()}
             stats2 = {k: v.statistics for k, v in raw2.items()}
@@ -186,7 +198,8 @@ async def check_cloud_coverage(
         satellite_provider = get_satellite_provider(provider)
         max_cloud_threshold = request.max_cloud_coverage or 10.0
 
-        result_obj = satellite_provider.check_cloud_coverage(
+        result_obj = await run_gee(
+            satellite_provider.check_cloud_coverage,
             geometry=request.geometry.model_dump(),
             start_date=request.date_range.start_date,
             end_date=request.date_range.end_date,
@@ -202,7 +215,8 @@ async def check_cloud_coverage(
             logger.info(
                 f"No images found with {max_cloud_threshold}% cloud threshold, trying 50%"
             )
-            result_obj = satellite_provider.check_cloud_coverage(
+            result_obj = await run_gee(
+                satellite_provider.check_cloud_coverage,
                 geometry=request.geometry.model_dump(),
                 start_date=request.date_range.start_date,
                 end_date=request.date_range.end_date,
@@ -252,7 +266,8 @@ async def generate_index_image(
 
         for threshold in cloud_thresholds:
             try:
-                cloud_obj = satellite_provider.check_cloud_coverage(
+                cloud_obj = await run_gee(
+                    satellite_provider.check_cloud_coverage,
                     geometry=aoi.get("geometry", {}),
                     start_date=date_range.get("start_date"),
                     end_date=date_range.get("end_date"),
@@ -289,7 +304,8 @@ async def generate_index_image(
 
                 logger.info(f"Trying with extended date range: {description}")
                 try:
-                    cloud_obj = satellite_provider.check_cloud_coverage(
+                    cloud_obj = await run_gee(
+                        satellite_provider.check_cloud_coverage,
                         geometry=aoi.get("geometry", {}),
                         start_date=start_date_ext.strftime("%Y-%m-%d"),
                         end_date=end_date_ext.strftime("%Y-%m-%d"),
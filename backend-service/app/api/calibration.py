@@ -1,14 +1,19 @@
+import asyncio
 from datetime import date, datetime
+import json
 import logging
-from typing import Any, SupportsFloat, TypedDict, cast
+from typing import Any, AsyncIterator, SupportsFloat, TypedDict, cast
 
 import numpy as np
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from ..core.config import settings
 from ..services.calibration.support.gdd_service import precompute_gdd
 from ..services.calibration.orchestrator import run_calibration_pipeline
 from ..services.calibration.types import CalibrationInput, CalibrationOutput
+from ..services.gee_executor import run_gee
 from ..services.supabase_service import supabase_service
 
 router = APIRouter()
@@ -524,6 +529,15 @@ class CalibrationRunV2Request(BaseModel):
     satellite_images: list[dict[str, Any]]
     weather_rows: list[dict[str, Any]]
     ndvi_raster_pixels: list[dict[str, Any]] | None = None
+    # Last output for this parcel; unchanged stages and closed cycle years are reused
+    previous_output: CalibrationOutput | None = None
+
+
+class CalibrationBatchRequest(BaseModel):
+    items: list[CalibrationRunV2Request] = Field(min_length=1)
+    # Referential per crop_type, shared by items sent without reference_data
+    reference_data: dict[str, dict[str, Any]] = Field(default_factory=dict)
+    max_concurrency: int | None = Field(default=None, ge=1)
 
 
 class ExtractRasterRequest(BaseModel):
@@ -597,6 +611,7 @@ async def _run_v2(request: CalibrationRunV2Request) -> CalibrationOutput:
             weather_rows=request.weather_rows,
             storage=None,
             ndvi_raster_pixels=request.ndvi_raster_pixels,
+            previous_output=request.previous_output,
             supabase_svc=supabase_service,
         )
     except ValueError as exc:
@@ -617,6 +632,65 @@ async def _run_v2(request: CalibrationRunV2Request) -> CalibrationOutput:
         ) from exc
 
 
+def _share_batch_referentials(request: CalibrationBatchRequest) -> None:
+    """Point items of the same crop at one referential object.
+
+    Items without ``reference_data`` take the batch-level referential for
+    their crop; items with their own keep it. Downstream caches keyed by
+    referential content then parse each crop's referential once.
+    """
+    shared = {
+        _normalize_crop_type(crop): ref for crop, ref in request.reference_data.items()
+    }
+    for item in request.items:
+        calibration_input = item.calibration_input
+        crop_type = _normalize_crop_type(calibration_input.crop_type)
+        if not calibration_input.reference_data and crop_type in shared:
+            calibration_input.reference_data = shared[crop_type]
+
+
+async def _run_batch_item(index: int, item: CalibrationRunV2Request) -> dict[str, Any]:
+    parcel_id = item.calibration_input.parcel_id
+    try:
+        output = await _run_v2(item)
+    except HTTPException as exc:
+        return {
+            "index": index,
+            "parcel_id": parcel_id,
+            "status": "error",
+            "status_code": exc.status_code,
+            "error": exc.detail,
+        }
+    return {
+        "index": index,
+        "parcel_id": parcel_id,
+        "status": "ok",
+        "output": output.model_dump(mode="json"),
+    }
+
+
+async def _stream_batch(request: CalibrationBatchRequest) -> AsyncIterator[str]:
+    """Yield one NDJSON line per parcel, in completion order."""
+    limit = request.max_concurrency or settings.CALIBRATION_BATCH_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def bounded(index: int, item: CalibrationRunV2Request) -> dict[str, Any]:
+        async with semaphore:
+            return await _run_batch_item(index, item)
+
+    tasks = [
+        asyncio.create_task(bounded(index, item))
+        for index, item in enumerate(request.items)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield json.dumps(await next_done) + "\n"
+    finally:
+        # Client went away: don't keep calibrating parcels nobody will read
+        for task in tasks:
+            task.cancel()
+
+
 class PercentilesRequest(BaseModel):
     values: list[float]
     percentiles: list[int]
@@ -736,6 +810,16 @@ async def run_calibration_v2_legacy(request: CalibrationRunV2Request):
     return await _run_v2(request)
 
 
+@router.post("/v2/run-batch")
+async def run_calibration_v2_batch(request: CalibrationBatchRequest):
+    """Calibrate many parcels; streams ``application/x-ndjson`` lines
+    ``{index, parcel_id, status, output | error}`` as parcels finish."""
+    _share_batch_referentials(request)
+    return StreamingResponse(
+        _stream_batch(request), media_type="application/x-ndjson"
+    )
+
+
 @router.post("/v2/precompute-gdd", response_model=PrecomputeGddResponse)
 async def precompute_gdd_v2(request: PrecomputeGddRequest):
     request.crop_type = _normalize_crop_type(request.crop_type)
@@ -757,7 +841,7 @@ async def extract_ndvi_raster(request: ExtractRasterRequest):
 
     ee_service = EarthEngineService()
     try:
-        ee_service.initialize()
+        await run_gee(ee_service.initialize)
     except Exception as exc:
         message = str(exc)
         if (
@@ -775,7 +859,8 @@ async def extract_ndvi_raster(request: ExtractRasterRequest):
 
     geometry = {"type": "Polygon", "coordinates": [request.geometry]}
 
-    result = ee_service.extract_ndvi_raster(
+    result = await run_gee(
+        ee_service.extract_ndvi_raster,
         geometry=geometry,
         start_date=request.start_date,
         end_date=request.end_date,
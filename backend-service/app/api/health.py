@@ -24,12 +24,10 @@ async def detailed_health_check():
     from app.services import earth_engine_service
 
     try:
-        # Run GEE init in a thread with a 15s timeout so it can't hang the server
-        loop = asyncio.get_event_loop()
-        await asyncio.wait_for(
-            loop.run_in_executor(None, earth_engine_service.initialize),
-            timeout=15,
-        )
+        # Run GEE init on the GEE executor with a 15s timeout so it can't hang the server
+        from app.services.gee_executor import run_gee
+
+        await asyncio.wait_for(run_gee(earth_engine_service.initialize), timeout=15)
         ee_status = True
     except (asyncio.TimeoutError, Exception):
         ee_status = False
@@ -46,3 +44,22 @@ async def detailed_health_check():
 async def readiness_check():
     """Readiness probe - checks basic service availability, not external deps"""
     return {"ready": True}
+
+
+@router.get("/gee-metrics")
+async def gee_metrics_snapshot():
+    """Blocking Earth Engine round trips per route, plus GEE executor queue stats."""
+    from app.services import gee_executor, gee_metrics
+
+    return {
+        "round_trips": gee_metrics.snapshot(),
+        "executor": gee_executor.snapshot(),
+    }
+
+
+@router.get("/render-cache")
+async def render_cache_snapshot():
+    """Hit/miss counters and memory usage of the rendered index-map cache."""
+    from app.services.render_cache import render_cache
+
+    return render_cache.stats()
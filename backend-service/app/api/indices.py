@@ -1,9 +1,10 @@
 import asyncio
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Depends
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Depends, Request
+from fastapi.responses import Response, StreamingResponse
 from typing import List, Dict, Optional, Tuple, Any
 import uuid
-import hashlib
 import json
+import threading
 import time
 import traceback
 from datetime import datetime, timedelta
@@ -24,10 +25,20 @@ from app.models.schemas import (
 )
 from app.services.satellite import get_satellite_provider
 from app.services.satellite.utils.sentinel2_dates import dedupe_s2_available_dates_by_day
+from app.services.satellite.utils.heatmap_encoding import (
+    HEATMAP_BINARY_MEDIA_TYPE,
+    encode_heatmap,
+    grid_from_points,
+)
 from app.services.supabase_service import supabase_service
+from app.services.observation_store import geometry_fingerprint, observation_store
+from app.services.acquisition_catalogue import select_images
+from app.services.gee_executor import run_gee
+from app.core.config import settings
 import logging
 import ee
 import httpx
+import numpy as np
 
 from app.middleware.auth import get_current_user_or_service
 
@@ -104,8 +115,7 @@ def _log_timeseries_points_shape(
 
 def _geometry_fingerprint(geometry: Dict) -> str:
     """Create a short hash fingerprint of geometry for log correlation."""
-    raw = json.dumps(geometry, sort_keys=True)
-    return hashlib.md5(raw.encode()).hexdigest()[:8]
+    return geometry_fingerprint(geometry)
 
 
 def _lon_to_utm_zone(lon: float) -> int:
@@ -239,12 +249,12 @@ def _coords_depth(coords) -> int:
 
 
 async def _to_thread(fn, *args, **kwargs):
-    """Run a blocking function in a thread pool so it doesn't block the async event loop.
+    """Run a blocking function on the GEE executor so it doesn't block the async event loop.
 
     GEE's .getInfo() calls are synchronous and can take 10-120+ seconds.
     Running them on the main event loop blocks ALL concurrent requests.
     """
-    return await asyncio.to_thread(fn, *args, **kwargs)
+    return await run_gee(fn, *args, **kwargs)
 
 
 def _run_coro_sync(async_fn, *args, **kwargs):
@@ -416,6 +426,152 @@ def _daily_date_range(start_date: str, end_date: str) -> List[str]:
     return dates
 
 
+def _interval_step_days(interval: str) -> int:
+    """PAR averaging window for a time-series interval."""
+    interval_days = {"day": 1, "week": 7, "month": 30, "year": 365}
+    return interval_days.get(interval, 30)
+
+
+async def _load_par_by_date(
+    req_id: str, request: TimeSeriesRequest, geo_summary: Dict
+) -> Dict[str, float]:
+    """Daily PAR over the request range: Supabase cache first, Open-Meteo for missing days."""
+    centroid = _extract_centroid(request.aoi.geometry.model_dump())
+    logger.debug(f"[timeseries][{req_id}] NIRvP: centroid={centroid}")
+
+    par_by_date: Dict[str, float] = {}
+    if centroid is not None:
+        latitude, longitude = centroid
+
+        # 1) Read cache
+        logger.debug(
+            f"[timeseries][{req_id}] NIRvP: Checking PAR cache for "
+            f"lat={latitude:.6f}, lon={longitude:.6f}"
+        )
+        t_cache = time.monotonic()
+        par_by_date = await supabase_service.get_cached_par_data(
+            latitude=latitude,
+            longitude=longitude,
+            start_date=request.date_range.start_date,
+            end_date=request.date_range.end_date,
+        )
+        cache_elapsed = time.monotonic() - t_cache
+        logger.info(
+            f"[timeseries][{req_id}] NIRvP: PAR cache returned {len(par_by_date)} days, "
+            f"elapsed={cache_elapsed:.2f}s"
+        )
+
+        # 2) Fetch and persist only missing days
+        required_dates = set(
+            _daily_date_range(
+                request.date_range.start_date,
+                request.date_range.end_date,
+            )
+        )
+        missing_dates = sorted(required_dates - set(par_by_date.keys()))
+        logger.info(
+            f"[timeseries][{req_id}] NIRvP: PAR coverage: "
+            f"required={len(required_dates)}, cached={len(par_by_date)}, "
+            f"missing={len(missing_dates)}"
+        )
+
+        if missing_dates:
+            logger.debug(
+                f"[timeseries][{req_id}] NIRvP: Missing dates range: "
+                f"{missing_dates[0]} -> {missing_dates[-1]}"
+            )
+            fetched_par = await _fetch_daily_par(
+                latitude=latitude,
+                longitude=longitude,
+                start_date=request.date_range.start_date,
+                end_date=request.date_range.end_date,
+            )
+            if fetched_par:
+                missing_par = {
+                    date_key: value
+                    for date_key, value in fetched_par.items()
+                    if date_key in missing_dates
+                }
+                par_by_date.update(missing_par)
+
+                logger.info(
+                    f"[timeseries][{req_id}] NIRvP: Fetched {len(fetched_par)} PAR values, "
+                    f"matched_missing={len(missing_par)}, "
+                    f"total_par_days={len(par_by_date)}"
+                )
+
+                if missing_par:
+                    await supabase_service.upsert_par_data(
+                        latitude=latitude,
+                        longitude=longitude,
+                        par_by_date=missing_par,
+                    )
+                    logger.debug(
+                        f"[timeseries][{req_id}] NIRvP: Persisted {len(missing_par)} PAR values to cache"
+                    )
+            else:
+                logger.warning(
+                    f"[timeseries][{req_id}] NIRvP: PAR fetch returned NO data "
+                    f"({request.date_range.start_date} -> {request.date_range.end_date}), "
+                    f"lat={latitude:.6f}, lon={longitude:.6f}"
+                )
+    else:
+        logger.warning(
+            f"[timeseries][{req_id}] NIRvP: Could not extract centroid from geometry! "
+            f"PAR multiplication will fail. geometry={geo_summary}"
+        )
+
+    return par_by_date
+
+
+def _apply_par(
+    req_id: str,
+    points: List[Dict[str, Any]],
+    par_by_date: Dict[str, float],
+    step_days: int,
+    fallback_par: Optional[float],
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """NIRv points → NIRvP points; returns (points, skipped_no_par, used_fallback)."""
+    nirvp_series = []
+    skipped_count = 0
+    used_fallback_count = 0
+    for point in points:
+        point_date = str(point["date"])[:10]
+        par_mean = _window_par_mean(point_date, step_days, par_by_date)
+        if par_mean is None:
+            par_mean = fallback_par
+            if par_mean is not None:
+                used_fallback_count += 1
+        if par_mean is None:
+            logger.debug(
+                f"[timeseries][{req_id}] NIRvP: Skipping point {point_date}: "
+                f"no PAR data (window or fallback)"
+            )
+            skipped_count += 1
+            continue
+        nirvp_series.append(
+            {
+                "date": point_date,
+                "value": float(point["value"]) * float(par_mean),
+            }
+        )
+    return nirvp_series, skipped_count, used_fallback_count
+
+
+def _series_statistics(values: List[Optional[float]]) -> Optional[Dict[str, float]]:
+    """mean/std/min/max/median over the non-null values, or None."""
+    present = [v for v in values if v is not None]
+    if not present:
+        return None
+    return {
+        "mean": float(np.mean(present)),
+        "std": float(np.std(present)),
+        "min": float(np.min(present)),
+        "max": float(np.max(present)),
+        "median": float(np.median(present)),
+    }
+
+
 @router.post("/calculate", response_model=IndexCalculationResponse)
 async def calculate_indices(
     request: IndexCalculationRequest,
@@ -477,15 +633,16 @@ async def calculate_indices(
                     f"[calculate][{req_id}] GEE: Fetching Sentinel-2 collection..."
                 )
                 # Force tile-level only: SCL reserved for available-dates. B2,B3,B4,B8 at 10m.
-                collection = earth_engine_service.get_sentinel2_collection(
+                lazy = earth_engine_service.get_sentinel2_collection_lazy(
                     request.aoi.geometry.model_dump(),
                     request.date_range.start_date,
                     request.date_range.end_date,
                     request.cloud_coverage,
                     use_aoi_cloud_filter=False,
                 )
+                collection = lazy.collection
 
-                collection_size = collection.size().getInfo()
+                collection_size = lazy.size()
                 logger.info(
                     f"[calculate][{req_id}] GEE: Collection size={collection_size} images, "
                     f"elapsed={time.monotonic() - t_gee:.2f}s"
@@ -824,95 +981,8 @@ async def get_time_series(
                 f"[timeseries][{req_id}] NIRvP: Starting PAR multiplication. "
                 f"Base NIRv points={len(time_series_data)}"
             )
-            centroid = _extract_centroid(request.aoi.geometry.model_dump())
-            interval_days = {"day": 1, "week": 7, "month": 30, "year": 365}
-            step_days = interval_days.get(request.interval.value, 30)
-            logger.debug(
-                f"[timeseries][{req_id}] NIRvP: centroid={centroid}, step_days={step_days}"
-            )
-
-            par_by_date: Dict[str, float] = {}
-            if centroid is not None:
-                latitude, longitude = centroid
-
-                # 1) Read cache
-                logger.debug(
-                    f"[timeseries][{req_id}] NIRvP: Checking PAR cache for "
-                    f"lat={latitude:.6f}, lon={longitude:.6f}"
-                )
-                t_cache = time.monotonic()
-                par_by_date = await supabase_service.get_cached_par_data(
-                    latitude=latitude,
-                    longitude=longitude,
-                    start_date=request.date_range.start_date,
-                    end_date=request.date_range.end_date,
-                )
-                cache_elapsed = time.monotonic() - t_cache
-                logger.info(
-                    f"[timeseries][{req_id}] NIRvP: PAR cache returned {len(par_by_date)} days, "
-                    f"elapsed={cache_elapsed:.2f}s"
-                )
-
-                # 2) Fetch and persist only missing days
-                required_dates = set(
-                    _daily_date_range(
-                        request.date_range.start_date,
-                        request.date_range.end_date,
-                    )
-                )
-                missing_dates = sorted(required_dates - set(par_by_date.keys()))
-                logger.info(
-                    f"[timeseries][{req_id}] NIRvP: PAR coverage: "
-                    f"required={len(required_dates)}, cached={len(par_by_date)}, "
-                    f"missing={len(missing_dates)}"
-                )
-
-                if missing_dates:
-                    logger.debug(
-                        f"[timeseries][{req_id}] NIRvP: Missing dates range: "
-                        f"{missing_dates[0]} -> {missing_dates[-1]}"
-                    )
-                    fetched_par = await _fetch_daily_par(
-                        latitude=latitude,
-                        longitude=longitude,
-                        start_date=request.date_range.start_date,
-                        end_date=request.date_range.end_date,
-                    )
-                    if fetched_par:
-                        missing_par = {
-                            date_key: value
-                            for date_key, value in fetched_par.items()
-                            if date_key in missing_dates
-                        }
-                        par_by_date.update(missing_par)
-
-                        logger.info(
-                            f"[timeseries][{req_id}] NIRvP: Fetched {len(fetched_par)} PAR values, "
-                            f"matched_missing={len(missing_par)}, "
-                            f"total_par_days={len(par_by_date)}"
-                        )
-
-                        if missing_par:
-                            await supabase_service.upsert_par_data(
-                                latitude=latitude,
-                                longitude=longitude,
-                                par_by_date=missing_par,
-                            )
-                            logger.debug(
-                                f"[timeseries][{req_id}] NIRvP: Persisted {len(missing_par)} PAR values to cache"
-                            )
-                    else:
-                        logger.warning(
-                            f"[timeseries][{req_id}] NIRvP: PAR fetch returned NO data "
-                            f"({request.date_range.start_date} -> {request.date_range.end_date}), "
-                            f"lat={latitude:.6f}, lon={longitude:.6f}"
-                        )
-            else:
-                logger.warning(
-                    f"[timeseries][{req_id}] NIRvP: Could not extract centroid from geometry! "
-                    f"PAR multiplication will fail. geometry={geo_summary}"
-                )
-
+            step_days = _interval_step_days(request.interval.value)
+            par_by_date = await _load_par_by_date(req_id, request, geo_summary)
             fallback_par = (
                 sum(par_by_date.values()) / len(par_by_date) if par_by_date else None
             )
@@ -921,64 +991,29 @@ async def get_time_series(
                 f"par_by_date_count={len(par_by_date)}"
             )
 
-            nirvp_series = []
-            skipped_count = 0
-            used_fallback_count = 0
-            for point in time_series_data:
-                point_date = str(point["date"])[:10]
-                par_mean = _window_par_mean(point_date, step_days, par_by_date)
-                if par_mean is None:
-                    par_mean = fallback_par
-                    if par_mean is not None:
-                        used_fallback_count += 1
-                if par_mean is None:
-                    logger.debug(
-                        f"[timeseries][{req_id}] NIRvP: Skipping point {point_date}: "
-                        f"no PAR data (window or fallback)"
-                    )
-                    skipped_count += 1
-                    continue
-                nirvp_series.append(
-                    {
-                        "date": point_date,
-                        "value": float(point["value"]) * float(par_mean),
-                    }
-                )
-            time_series_data = nirvp_series
+            time_series_data, skipped_count, used_fallback_count = _apply_par(
+                req_id, time_series_data, par_by_date, step_days, fallback_par
+            )
 
             logger.info(
                 f"[timeseries][{req_id}] NIRvP: Final series: "
-                f"output_points={len(nirvp_series)}, "
+                f"output_points={len(time_series_data)}, "
                 f"skipped_no_par={skipped_count}, "
                 f"used_fallback={used_fallback_count}"
             )
 
         # Calculate statistics
-        if time_series_data:
-            values = [
-                point["value"]
-                for point in time_series_data
-                if point["value"] is not None
-            ]
-            if values:
-                import numpy as np
-
-                statistics = {
-                    "mean": float(np.mean(values)),
-                    "std": float(np.std(values)),
-                    "min": float(np.min(values)),
-                    "max": float(np.max(values)),
-                    "median": float(np.median(values)),
-                }
-                logger.debug(f"[timeseries][{req_id}] Statistics: {statistics}")
-            else:
-                statistics = None
-                logger.warning(
-                    f"[timeseries][{req_id}] All values in time series are None! "
-                    f"data_points={len(time_series_data)}"
-                )
+        statistics = _series_statistics(
+            [point["value"] for point in time_series_data]
+        )
+        if statistics is not None:
+            logger.debug(f"[timeseries][{req_id}] Statistics: {statistics}")
+        elif time_series_data:
+            logger.warning(
+                f"[timeseries][{req_id}] All values in time series are None! "
+                f"data_points={len(time_series_data)}"
+            )
         else:
-            statistics = None
             logger.warning(
                 f"[timeseries][{req_id}] Empty time series data, no statistics to compute"
             )
@@ -1015,6 +1050,250 @@ async def get_time_series(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+TIMESERIES_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+TIMESERIES_SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _wants_sse(http_request: Request, format: Optional[str]) -> bool:
+    """SSE when asked via ?format=sse or Accept: text/event-stream; NDJSON otherwise."""
+    if format:
+        return format.lower() == "sse"
+    return TIMESERIES_SSE_MEDIA_TYPE in http_request.headers.get("accept", "")
+
+
+def _stream_event(event: Dict[str, Any], sse: bool) -> str:
+    payload = json.dumps(event, default=str, separators=(",", ":"))
+    if sse:
+        return f"event: {event['type']}\ndata: {payload}\n\n"
+    return payload + "\n"
+
+
+async def _gee_time_series_batches(req_id: str, request: TimeSeriesRequest, index: str):
+    """Per-observation GEE batches as each chunk completes (most recent first).
+
+    The blocking iteration runs as one job on the GEE executor and hands
+    batches over through a queue; a closed stream stops it after the current
+    chunk. If the per-observation path fails before producing anything, the
+    full get_time_series() fallback is returned as a single batch.
+    """
+    from app.services import earth_engine_service
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def pump():
+        batches = earth_engine_service.iter_time_series(
+            request.aoi.geometry.model_dump(),
+            request.date_range.start_date,
+            request.date_range.end_date,
+            index,
+            max_cloud_coverage=request.cloud_coverage,
+            use_aoi_cloud_filter=True,
+        )
+        try:
+            for batch in batches:
+                loop.call_soon_threadsafe(queue.put_nowait, ("batch", batch))
+                if stop.is_set():
+                    break
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
+        finally:
+            batches.close()
+            loop.call_soon_threadsafe(queue.put_nowait, ("end", None))
+
+    job = asyncio.ensure_future(run_gee(pump))
+    # pump() reports its own errors through the queue
+    job.add_done_callback(lambda f: f.cancelled() or f.exception())
+    emitted = 0
+    try:
+        while True:
+            kind, item = await queue.get()
+            if kind == "end":
+                break
+            if kind == "error":
+                if emitted:
+                    raise item
+                logger.warning(
+                    f"[timeseries-stream][{req_id}] per-observation stream failed ({item}), "
+                    f"falling back to get_time_series"
+                )
+                data = await _to_thread(
+                    earth_engine_service.get_time_series,
+                    request.aoi.geometry.model_dump(),
+                    request.date_range.start_date,
+                    request.date_range.end_date,
+                    index,
+                    request.interval.value,
+                    max_cloud_coverage=request.cloud_coverage,
+                    use_aoi_cloud_filter=True,
+                )
+                yield {
+                    "start": request.date_range.start_date,
+                    "end": request.date_range.end_date,
+                    "source": "gee",
+                    "data": sorted(data, key=lambda p: p["date"], reverse=True),
+                }
+                continue
+            emitted += 1
+            yield item
+    finally:
+        stop.set()
+
+
+async def _time_series_events(
+    req_id: str,
+    request: TimeSeriesRequest,
+    satellite_provider: Any,
+    geo_summary: Dict,
+    sse: bool,
+):
+    """start → chunk* → done (or error) events for /timeseries/stream."""
+    t_start = time.monotonic()
+    requested_index = request.index.value
+    base_index = "NIRv" if requested_index == "NIRvP" else requested_index
+
+    yield _stream_event(
+        {
+            "type": "start",
+            "index": requested_index,
+            "aoi_name": request.aoi.name,
+            "start_date": request.date_range.start_date,
+            "end_date": request.date_range.end_date,
+        },
+        sse,
+    )
+
+    # PAR is loaded alongside the first GEE chunk and applied per chunk
+    par_task = (
+        asyncio.ensure_future(_load_par_by_date(req_id, request, geo_summary))
+        if requested_index == "NIRvP"
+        else None
+    )
+    step_days = _interval_step_days(request.interval.value)
+    values_by_date: Dict[str, Optional[float]] = {}
+    chunks = 0
+
+    try:
+        if satellite_provider.provider_name == "Google Earth Engine":
+            batches = _gee_time_series_batches(req_id, request, base_index)
+        else:
+            batches = _provider_time_series_batches(request, satellite_provider, base_index)
+
+        async for batch in batches:
+            points = batch["data"]
+            if par_task is not None:
+                par_by_date = await par_task
+                fallback_par = (
+                    sum(par_by_date.values()) / len(par_by_date) if par_by_date else None
+                )
+                points, _, _ = _apply_par(
+                    req_id, points, par_by_date, step_days, fallback_par
+                )
+            for point in points:
+                values_by_date[point["date"]] = point["value"]
+            chunks += 1
+            yield _stream_event(
+                {
+                    "type": "chunk",
+                    "start": batch["start"],
+                    "end": batch["end"],
+                    "source": batch["source"],
+                    "data": points,
+                    "statistics": _series_statistics(list(values_by_date.values())),
+                    "data_points": len(values_by_date),
+                },
+                sse,
+            )
+
+        statistics = _series_statistics(list(values_by_date.values()))
+        logger.info(
+            f"[timeseries-stream][{req_id}] === DONE === "
+            f"index={requested_index}, chunks={chunks}, "
+            f"data_points={len(values_by_date)}, "
+            f"total_elapsed={time.monotonic() - t_start:.2f}s"
+        )
+        yield _stream_event(
+            {
+                "type": "done",
+                "statistics": statistics,
+                "data_points": len(values_by_date),
+            },
+            sse,
+        )
+    except Exception as e:
+        logger.error(
+            f"[timeseries-stream][{req_id}] === FAILED === "
+            f"error={e}, chunks={chunks}, index={requested_index}\n"
+            f"{traceback.format_exc()}"
+        )
+        yield _stream_event({"type": "error", "detail": "Internal server error"}, sse)
+    finally:
+        if par_task is not None and not par_task.done():
+            par_task.cancel()
+
+
+async def _provider_time_series_batches(
+    request: TimeSeriesRequest, satellite_provider: Any, index: str
+):
+    """Non-GEE providers have no chunked path: the whole series as one batch."""
+    ts_result = await _to_thread(
+        satellite_provider.get_time_series,
+        geometry=request.aoi.geometry.model_dump(),
+        start_date=request.date_range.start_date,
+        end_date=request.date_range.end_date,
+        index=index,
+        interval=request.interval.value,
+    )
+    points = [_interfaces_ts_point_to_api_dict(p) for p in ts_result.data]
+    yield {
+        "start": request.date_range.start_date,
+        "end": request.date_range.end_date,
+        "source": satellite_provider.provider_name,
+        "data": sorted(points, key=lambda p: str(p["date"]), reverse=True),
+    }
+
+
+@router.post("/timeseries/stream")
+async def stream_time_series(
+    request: TimeSeriesRequest,
+    http_request: Request,
+    provider: Optional[str] = Query(
+        None, description="Satellite provider (gee, cdse, or auto)"
+    ),
+    format: Optional[str] = Query(
+        None, description="ndjson (default) or sse; also negotiated via Accept"
+    ),
+):
+    """Streaming variant of /timeseries: one event per completed chunk.
+
+    Emits a ``start`` event, then ``chunk`` events (points newest first, a
+    point replaces any earlier one with the same date, plus running
+    statistics), then ``done`` with the final statistics, or ``error``.
+    """
+    req_id = str(uuid.uuid4())[:8]
+    geo_summary = _geometry_summary(request.aoi.geometry.model_dump())
+    logger.info(
+        f"[timeseries-stream][{req_id}] === START === "
+        f"geometry={geo_summary}, "
+        f"dates={request.date_range.start_date} -> {request.date_range.end_date}, "
+        f"index={request.index.value}, provider_param={provider!r}"
+    )
+
+    try:
+        satellite_provider = get_satellite_provider(provider)
+    except Exception as e:
+        logger.error(f"[timeseries-stream][{req_id}] Provider resolution failed: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    sse = _wants_sse(http_request, format)
+    return StreamingResponse(
+        _time_series_events(req_id, request, satellite_provider, geo_summary, sse),
+        media_type=TIMESERIES_SSE_MEDIA_TYPE if sse else TIMESERIES_NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/export")
 async def export_index_map(
     request: ExportRequest,
@@ -1262,12 +1541,53 @@ async def get_interactive_data(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _wants_binary_heatmap(http_request: Request, format: Optional[str]) -> bool:
+    """Binary when ?format=binary or the Accept header asks for the heatmap media type."""
+    if format:
+        return format == "binary"
+    accept = http_request.headers.get("accept", "")
+    return HEATMAP_BINARY_MEDIA_TYPE in accept or "application/octet-stream" in accept
+
+
+def _binary_heatmap_response(data_dict: Dict[str, Any], encoding: str) -> Response:
+    """Encode the provider's raster as-is; point-sampled providers are binned first."""
+    header = {k: v for k, v in data_dict.items() if k not in ("pixel_data", "raster")}
+    grid = data_dict.get("raster")
+    if grid is None:
+        metadata = header.get("metadata") or {}
+        source_grid = metadata.get("grid") or {}
+        pixel_size = None
+        if source_grid.get("pixel_width") and source_grid.get("pixel_height"):
+            pixel_size = (source_grid["pixel_width"], source_grid["pixel_height"])
+        grid = grid_from_points(
+            data_dict.get("pixel_data") or [],
+            scale_m=metadata.get("sample_scale"),
+            pixel_size=pixel_size,
+        )
+    return Response(
+        content=encode_heatmap(grid, header, dtype=encoding),
+        media_type=HEATMAP_BINARY_MEDIA_TYPE,
+    )
+
+
 @router.post("/heatmap", response_model=HeatmapDataResponse)
 async def get_heatmap_data(
     request: HeatmapRequest,
+    http_request: Request,
     provider: Optional[str] = Query(
         None, description="Satellite provider (gee, cdse, or auto)"
     ),
+    format: Optional[str] = Query(
+        None,
+        pattern="^(json|binary)$",
+        description=f"Response format; 'binary' returns {HEATMAP_BINARY_MEDIA_TYPE} "
+        "(also selected via the Accept header)",
+    ),
+    encoding: str = Query(
+        "float32",
+        pattern="^(float32|uint16)$",
+        description="Value encoding for the binary format",
+    ),
 ):
     """Get heatmap data for ECharts heatmap visualization"""
     req_id = str(uuid.uuid4())[:8]
@@ -1299,6 +1619,7 @@ async def get_heatmap_data(
         )
 
     t_start = time.monotonic()
+    binary = _wants_binary_heatmap(http_request, format)
 
     try:
         satellite_provider = get_satellite_provider(provider)
@@ -1319,6 +1640,7 @@ async def get_heatmap_data(
                 request.date,
                 request.index.value,
                 request.grid_size,
+                as_grid=binary,
             )
             gee_elapsed = time.monotonic() - t_gee
             logger.info(
@@ -1355,6 +1677,15 @@ async def get_heatmap_data(
             f"[heatmap][{req_id}] Response data_dict keys={list(data_dict.keys()) if isinstance(data_dict, dict) else 'N/A'}"
         )
 
+        if binary:
+            response = _binary_heatmap_response(data_dict, encoding)
+            total_elapsed = time.monotonic() - t_start
+            logger.info(
+                f"[heatmap][{req_id}] === DONE (binary {encoding}, "
+                f"{len(response.body)} bytes) === total_elapsed={total_elapsed:.2f}s"
+            )
+            return response
+
         total_elapsed = time.monotonic() - t_start
         logger.info(
             f"[heatmap][{req_id}] === DONE === total_elapsed={total_elapsed:.2f}s"
@@ -1520,7 +1851,7 @@ async def get_available_dates(
                 f"[available-dates][{req_id}] GEE: Initializing Earth Engine..."
             )
             t_init = time.monotonic()
-            earth_engine_service.initialize()
+            await _to_thread(earth_engine_service.initialize)
             init_elapsed = time.monotonic() - t_init
             logger.debug(
                 f"[available-dates][{req_id}] GEE: Earth Engine init took {init_elapsed:.2f}s"
@@ -1540,31 +1871,45 @@ async def get_available_dates(
                 )
                 raise
 
-            # Compute geometry area for diagnostics
-            try:
-                t_area = time.monotonic()
-                area_sq_m = aoi.area().getInfo()
-                area_elapsed = time.monotonic() - t_area
-                area_hectares = area_sq_m / 10000.0 if area_sq_m else 0
-                logger.info(
-                    f"[available-dates][{req_id}] GEE: Geometry area = {area_sq_m:.2f} m² "
-                    f"({area_hectares:.2f} hectares), computed in {area_elapsed:.2f}s"
-                )
-                if area_sq_m and area_sq_m < 100:
+            if request.parcel_id:
+                try:
+                    # SQLite write; keep it off the event loop
+                    await _to_thread(
+                        observation_store.bind_parcel,
+                        request.parcel_id,
+                        geometry_fingerprint(aoi_geometry, length=None),
+                    )
+                except Exception as bind_err:
                     logger.warning(
-                        f"[available-dates][{req_id}] GEE: VERY SMALL geometry area "
-                        f"({area_sq_m:.2f} m²). May not intersect any S2 pixels at 10m resolution."
+                        f"[available-dates][{req_id}] Could not bind parcel geometry: {bind_err}"
                     )
-                if area_sq_m and area_sq_m > 1e9:
+
+            # Compute geometry area for diagnostics (one extra round trip, debug only)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    t_area = time.monotonic()
+                    area_sq_m = await _to_thread(aoi.area().getInfo)
+                    area_elapsed = time.monotonic() - t_area
+                    area_hectares = area_sq_m / 10000.0 if area_sq_m else 0
+                    logger.info(
+                        f"[available-dates][{req_id}] GEE: Geometry area = {area_sq_m:.2f} m² "
+                        f"({area_hectares:.2f} hectares), computed in {area_elapsed:.2f}s"
+                    )
+                    if area_sq_m and area_sq_m < 100:
+                        logger.warning(
+                            f"[available-dates][{req_id}] GEE: VERY SMALL geometry area "
+                            f"({area_sq_m:.2f} m²). May not intersect any S2 pixels at 10m resolution."
+                        )
+                    if area_sq_m and area_sq_m > 1e9:
+                        logger.warning(
+                            f"[available-dates][{req_id}] GEE: VERY LARGE geometry area "
+                            f"({area_hectares:.0f} ha). May span multiple S2 tiles with varying coverage."
+                        )
+                except Exception as area_err:
                     logger.warning(
-                        f"[available-dates][{req_id}] GEE: VERY LARGE geometry area "
-                        f"({area_hectares:.0f} ha). May span multiple S2 tiles with varying coverage."
+                        f"[available-dates][{req_id}] GEE: Could not compute geometry area: {area_err}"
                     )
-            except Exception as area_err:
-                logger.warning(
-                    f"[available-dates][{req_id}] GEE: Could not compute geometry area: {area_err}"
-                )
-                area_hectares = None
+                    area_hectares = None
 
             # Use the same SCL-based AOI cloud filter as heatmap/timeseries
             # via get_sentinel2_collection → filter_by_scl_coverage (SCL, 20m, no buffer)
@@ -1577,7 +1922,26 @@ async def get_available_dates(
             t_gee = time.monotonic()
 
             def _gee_get_filtered_dates():
-                filtered_collection = earth_engine_service.get_sentinel2_collection(
+                if settings.ACQUISITION_CATALOGUE_ENABLED:
+                    try:
+                        entries = earth_engine_service.get_acquisitions(
+                            aoi_geometry, start_date, end_date
+                        )
+                        return [
+                            {
+                                "date": image["date"],
+                                "cloud_coverage": image["aoi_cloud"],
+                                "timestamp": image["timestamp"],
+                            }
+                            for image in select_images(entries, max_cloud_coverage)
+                        ]
+                    except Exception as catalogue_err:
+                        logger.warning(
+                            f"[available-dates][{req_id}] Acquisition catalogue failed, "
+                            f"falling back to a full SCL scan: {catalogue_err}"
+                        )
+
+                lazy = earth_engine_service.get_sentinel2_collection_lazy(
                     aoi_geometry,
                     start_date,
                     end_date,
@@ -1585,10 +1949,6 @@ async def get_available_dates(
                     use_aoi_cloud_filter=True,
                 )
 
-                collection_size = filtered_collection.size().getInfo()
-                if collection_size == 0:
-                    return []
-
                 # Extract date + cloud info from each filtered image
                 def extract_date_info(image):
                     date = ee.Date(image.get("system:time_start"))
@@ -1606,8 +1966,14 @@ async def get_available_dates(
                         },
                     )
 
-                features = filtered_collection.map(extract_date_info)
-                info_list = features.getInfo()
+                # Emptiness check fused into the date listing (one round trip)
+                fused = lazy.evaluate(
+                    payload={"features": lazy.collection.map(extract_date_info)},
+                    operation="available_dates",
+                )
+                if fused["size"] == 0:
+                    return []
+                info_list = fused["features"]
 
                 results = []
                 for f in info_list.get("features", []):
@@ -18,6 +18,7 @@ from app.models.schemas import (
     CloudCoverageCheckResponse,
 )
 from app.services import earth_engine_service
+from app.services.gee_executor import run_gee
 from app.services.supabase_service import supabase_service
 from app.services.satellite import get_satellite_provider
 from app.middleware.auth import require_organization_access, get_current_user
@@ -126,7 +127,8 @@ async def get_parcel_satellite_data(
 async def check_cloud_coverage(request: CloudCoverageCheckRequest, current_user: dict = Depends(get_current_user)):
     """Check cloud coverage availability for given parameters"""
     try:
-        result = earth_engine_service.check_cloud_coverage(
+        result = await run_gee(
+            earth_engine_service.check_cloud_coverage,
             request.geometry.model_dump(),
             request.date_range.start_date,
             request.date_range.end_date,
@@ -358,7 +360,8 @@ async def process_batch_job(
 
                 # Check cloud coverage if requested
                 if request.check_cloud_coverage:
-                    cloud_check = earth_engine_service.check_cloud_coverage(
+                    cloud_check = await run_gee(
+                        earth_engine_service.check_cloud_coverage,
                         geometry,
                         request.date_range.start_date,
                         request.date_range.end_date,
@@ -374,19 +377,19 @@ async def process_batch_job(
 
                 satellite_provider = get_satellite_provider()
 
-                collection = earth_engine_service.get_sentinel2_collection(
+                lazy = earth_engine_service.get_sentinel2_collection_lazy(
                     geometry,
                     request.date_range.start_date,
                     request.date_range.end_date,
                     request.cloud_coverage,
                 )
 
-                if collection.size().getInfo() == 0:
+                if await run_gee(lazy.is_empty):
                     logger.warning(f"No images for parcel {parcel['parcel_id']}")
                     failed_tasks += 1
                     continue
 
-                image = collection.sort("CLOUDY_PIXEL_PERCENTAGE").first()
+                image = lazy.best_image()
                 index_results = earth_engine_service.calculate_vegetation_indices(
                     image, [idx.value for idx in request.indices]
                 )
@@ -398,15 +401,17 @@ async def process_batch_job(
                     if index_image is None:
                         continue
 
-                    stats = index_image.reduceRegion(
-                        reducer=ee.Reducer.mean()
-                        .combine(ee.Reducer.minMax(), "", True)
-                        .combine(ee.Reducer.stdDev(), "", True),
-                        geometry=aoi,
-                        scale=request.scale,
-                        maxPixels=1e13,
-                        # Use native projection to avoid "geometry outside projection validity" errors
-                    ).getInfo()
+                    stats = await run_gee(
+                        index_image.reduceRegion(
+                            reducer=ee.Reducer.mean()
+                            .combine(ee.Reducer.minMax(), "", True)
+                            .combine(ee.Reducer.stdDev(), "", True),
+                            geometry=aoi,
+                            scale=request.scale,
+                            maxPixels=1e13,
+                            # Use native projection to avoid "geometry outside projection validity" errors
+                        ).getInfo
+                    )
 
                     idx_name = index.value
                     result_data = {
@@ -420,9 +425,9 @@ async def process_batch_job(
                         "min_value": stats.get(f"{idx_name}_min", 0),
                         "max_value": stats.get(f"{idx_name}_max", 0),
                         "std_value": stats.get(f"{idx_name}_stdDev", 0),
-                        "cloud_coverage_percentage": image.get(
-                            "CLOUDY_PIXEL_PERCENTAGE"
-                        ).getInfo(),
+                        "cloud_coverage_percentage": await run_gee(
+                            image.get("CLOUDY_PIXEL_PERCENTAGE").getInfo
+                        ),
                         "metadata": {"provider": satellite_provider.provider_name},
                     }
 
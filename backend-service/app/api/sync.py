@@ -53,6 +53,7 @@ async def _run_parcel_sync(
     parcel_name: Optional[str],
     indices: List[str],
 ):
+    from app.services.gee_executor import run_gee
     from app.services.satellite.factory import get_satellite_provider
     from app.services.supabase_service import supabase_service
 
@@ -78,60 +79,82 @@ async def _run_parcel_sync(
 
     total_saved = 0
 
+    # One pass over the scene collection for all indices (not one per index)
+    try:
+        series_by_index = await run_gee(
+            satellite_provider.get_time_series_multi,
+            geometry,
+            start_date,
+            end_date,
+            indices,
+            "week",
+        )
+    except Exception as e:
+        # Keep the per-index isolation: one failing index must not drop the others
+        logger.error(
+            f"Multi-index sync failed for parcel {parcel_id}, retrying per index: {e}"
+        )
+        series_by_index = {}
+        for index in indices:
+            try:
+                series_by_index[index] = await run_gee(
+                    satellite_provider.get_time_series,
+                    geometry,
+                    start_date,
+                    end_date,
+                    index,
+                    "week",
+                )
+            except Exception as index_error:
+                logger.error(f"Failed to sync {index} for parcel {parcel_id}: {index_error}")
+
     for index in indices:
-        try:
-            ts_result = satellite_provider.get_time_series(
-                geometry,
-                start_date,
-                end_date,
-                index,
-                "week",
-            )
-
-            for point in ts_result.data:
-                if point.value is None:
-                    continue
-                try:
-                    row: Dict[str, Any] = {
-                        "parcel_id": parcel_id,
-                        "organization_id": organization_id,
-                        "farm_id": farm_id,
-                        "index_name": index,
-                        "date": str(point.date)[:10],
-                        "mean_value": float(point.value),
-                        "image_source": "sentinel-2",
-                    }
-                    for key in (
-                        "min_value",
-                        "max_value",
-                        "std_value",
-                        "median_value",
-                        "percentile_25",
-                        "percentile_75",
-                        "percentile_90",
-                    ):
-                        v = getattr(point, key, None)
-                        if v is not None:
-                            row[key] = float(v)
-                    pc = getattr(point, "pixel_count", None)
-                    if pc is not None:
-                        row["pixel_count"] = int(pc)
-                    cc = getattr(point, "cloud_coverage", None)
-                    if cc is not None:
-                        row["cloud_coverage_percentage"] = float(cc)
-                    await supabase_service.save_satellite_data(row)
-                    total_saved += 1
-                except Exception:
-                    pass
-
-            logger.info(
-                f"Synced {index} for parcel {parcel_id} via {provider_name}: "
-                f"{len(ts_result.data)} points"
-            )
-        except Exception as e:
-            logger.error(f"Failed to sync {index} for parcel {parcel_id}: {e}")
+        ts_result = series_by_index.get(index)
+        if ts_result is None:
+            logger.error(f"Failed to sync {index} for parcel {parcel_id}: no series")
             continue
 
+        for point in ts_result.data:
+            if point.value is None:
+                continue
+            try:
+                row: Dict[str, Any] = {
+                    "parcel_id": parcel_id,
+                    "organization_id": organization_id,
+                    "farm_id": farm_id,
+                    "index_name": index,
+                    "date": str(point.date)[:10],
+                    "mean_value": float(point.value),
+                    "image_source": "sentinel-2",
+                }
+                for key in (
+                    "min_value",
+                    "max_value",
+                    "std_value",
+                    "median_value",
+                    "percentile_25",
+                    "percentile_75",
+                    "percentile_90",
+                ):
+                    v = getattr(point, key, None)
+                    if v is not None:
+                        row[key] = float(v)
+                pc = getattr(point, "pixel_count", None)
+                if pc is not None:
+                    row["pixel_count"] = int(pc)
+                cc = getattr(point, "cloud_coverage", None)
+                if cc is not None:
+                    row["cloud_coverage_percentage"] = float(cc)
+                await supabase_service.save_satellite_data(row)
+                total_saved += 1
+            except Exception:
+                pass
+
+        logger.info(
+            f"Synced {index} for parcel {parcel_id} via {provider_name}: "
+            f"{len(ts_result.data)} points"
+        )
+
     logger.info(
         f"Sync complete for parcel {parcel_id}: {total_saved} data points saved"
     )
@@ -62,6 +62,45 @@ class Settings(BaseSettings):
     DEFAULT_SCALE: int = 10  # meters
     MAX_PIXELS: int = 1e13
 
+    # Max concurrent per-observation chunk requests per time-series call
+    GEE_TS_CHUNK_WORKERS: int = 4
+
+    # Threads dedicated to blocking Earth Engine calls from async routes
+    GEE_EXECUTOR_WORKERS: int = 8
+
+    # Heatmap fetch: "pixels" (one computePixels grid at an AOI-derived
+    # resolution) or "sample" (legacy sample(numPixels) point features)
+    GEE_HEATMAP_MODE: str = "pixels"
+    GEE_HEATMAP_MAX_PIXELS: int = 50000
+
+    # Rendered static index maps (data URLs). Disk tier is off when the path is empty;
+    # least recently used files are pruned beyond RENDER_CACHE_DISK_MAX_BYTES.
+    RENDER_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RENDER_CACHE_DISK_PATH: str = ""
+    RENDER_CACHE_DISK_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    # Per-observation time-series store (SQLite). Empty path -> TEMP_STORAGE_PATH.
+    TIMESERIES_STORE_ENABLED: bool = True
+    TIMESERIES_STORE_PATH: str = ""
+    # Dates newer than this many days are re-queried (late GEE ingestion)
+    TIMESERIES_STORE_SETTLE_DAYS: int = 5
+    # Per-geometry acquisition catalogue (dates + AOI SCL cloud %) kept in the
+    # same store; serves available-dates and seeds AOI-filtered collections
+    ACQUISITION_CATALOGUE_ENABLED: bool = True
+
+    # Calibration stage execution: "thread" (asyncio.to_thread) or "process" pool.
+    # Process workers default to os.cpu_count() when 0.
+    CALIBRATION_STAGE_EXECUTOR: str = "thread"
+    CALIBRATION_PROCESS_WORKERS: int = 0
+    # Parcels run concurrently by /api/calibration/v2/run-batch
+    CALIBRATION_BATCH_CONCURRENCY: int = 4
+    # Stored transitions of closed phenology cycle years (SQLite), so those
+    # years are not replayed. Empty path -> TEMP_STORAGE_PATH.
+    CALIBRATION_CHECKPOINTS_ENABLED: bool = True
+    CALIBRATION_CHECKPOINT_PATH: str = ""
+    # Compiled crop referentials kept in memory, keyed by (crop, content hash)
+    CALIBRATION_REFERENTIAL_CACHE_SIZE: int = 32
+
     # Automated processing
     AUTOMATED_PROCESSING_ENABLED: bool = False
     PROCESSING_INTERVAL: int = 3600  # seconds
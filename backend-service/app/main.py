@@ -2,7 +2,7 @@ import re
 from collections.abc import Awaitable, Callable
 from typing import cast
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
@@ -21,6 +21,7 @@ from .api import (
 )
 from .core.config import settings
 from .middleware.auth import close_http_client
+from .services import gee_metrics
 import logging
 
 _startup_logger = logging.getLogger(__name__)
@@ -39,10 +40,30 @@ class NormalizePathMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+def _route_template(request: Request) -> str:
+    # Newer FastAPI keeps included routes un-prefixed and exposes the
+    # prefixed path on the effective route context instead
+    effective = request.scope.get("fastapi", {}).get("effective_route_context")
+    if effective is not None:
+        return effective.path
+    return getattr(request.scope.get("route"), "path", "unmatched")
+
+
+async def tag_gee_route(request: Request) -> None:
+    """Count GEE round trips per route template, e.g. ``GET /api/sync/parcel/{parcel_id}/status``.
+
+    Keying by the raw path would add one metrics entry per parcel. Declared
+    async so the context variable is set in the task that runs the endpoint;
+    each request has its own context, so nothing leaks between requests.
+    """
+    gee_metrics.current_route.set(f"{request.method} {_route_template(request)}")
+
+
 app = FastAPI(
     title="AgroGina Backend Service",
     description="Agricultural technology backend service for satellite imagery analysis, PDF generation, and data processing",
     version="2.0.0",
+    dependencies=[Depends(tag_gee_route)],
 )
 
 # CORS: Allow the NestJS API and configured frontend origins.
@@ -97,7 +118,14 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up shared resources on application shutdown."""
+    from .services.calibration.orchestrator import shutdown_stage_pool
+    from .services.gee_executor import shutdown_gee_executor
+    from .services.weather_service import close_http_client as close_weather_client
+
     await close_http_client()
+    await close_weather_client()
+    shutdown_stage_pool()
+    shutdown_gee_executor()
 
 
 # Include routers
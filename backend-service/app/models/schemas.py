@@ -284,6 +284,7 @@ class AvailableDatesRequest(BaseModel):
     start_date: str = Field(..., pattern=r'^\d{4}-\d{2}-\d{2}$', description="Start date in YYYY-MM-DD format")
     end_date: str = Field(..., pattern=r'^\d{4}-\d{2}-\d{2}$', description="End date in YYYY-MM-DD format")
     cloud_coverage: Optional[float] = Field(30.0, ge=0, le=100, description="Maximum cloud coverage percentage")
+    parcel_id: Optional[str] = Field(None, description="Parcel the AOI belongs to; a changed boundary drops its cached acquisitions")
 
     @field_validator('end_date')
     @classmethod
@@ -0,0 +1,96 @@
+"""
+Per-geometry catalogue of Sentinel-2 acquisitions.
+
+Every scene over an AOI that passes the tile pre-filter is scored once with the
+SCL AOI cloud percentage and stored per acquisition date in the observation
+store (date ranges already scanned are tracked there too). The date picker,
+heatmap and timeseries then filter by cloud threshold locally instead of
+re-running the SCL scoring over the whole range, and only dates after the last
+settled scan are submitted to Earth Engine.
+
+A parcel's entries are dropped when its boundary fingerprint changes
+(``ObservationStore.bind_parcel``); a different geometry simply maps to a
+different key.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.services.observation_store import ObservationSeriesKey, geometry_fingerprint
+
+# Same tile-level gate as get_sentinel2_collection(use_aoi_cloud_filter=True)
+TILE_PREFILTER = 25
+CATALOGUE_INDEX = "ACQUISITIONS"
+SCL_SCALE = 20
+
+
+def catalogue_key(geometry: Dict) -> ObservationSeriesKey:
+    return ObservationSeriesKey(
+        fingerprint=geometry_fingerprint(geometry, length=None),
+        index=CATALOGUE_INDEX,
+        scale=SCL_SCALE,
+        cloud_mode=f"tile<={TILE_PREFILTER}",
+    )
+
+
+def group_by_date(scenes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fold scanned scenes into one catalogue entry per acquisition date.
+
+    Each entry keeps every scene (id, AOI and tile cloud %) plus the date's
+    lowest AOI cloud percentage and earliest timestamp.
+    """
+    by_date: Dict[str, Dict[str, Any]] = {}
+    for scene in scenes:
+        day = scene.get("date")
+        if not day or not scene.get("id"):
+            continue
+        entry = by_date.setdefault(
+            day,
+            {"date": day, "timestamp": scene.get("timestamp"), "images": []},
+        )
+        entry["images"].append(
+            {
+                "id": scene["id"],
+                "aoi_cloud": _as_float(scene.get("aoi_cloud")),
+                "tile_cloud": _as_float(scene.get("tile_cloud")),
+            }
+        )
+        timestamp = scene.get("timestamp")
+        if timestamp is not None and (
+            entry["timestamp"] is None or timestamp < entry["timestamp"]
+        ):
+            entry["timestamp"] = timestamp
+
+    for entry in by_date.values():
+        clouds = [i["aoi_cloud"] for i in entry["images"] if i["aoi_cloud"] is not None]
+        entry["aoi_cloud"] = min(clouds) if clouds else None
+    return sorted(by_date.values(), key=lambda e: e["date"])
+
+
+def select_images(
+    entries: Iterable[Dict[str, Any]], max_cloud: float
+) -> List[Dict[str, Any]]:
+    """Scenes whose AOI SCL cloud % is within ``max_cloud`` (unscored scenes never pass)."""
+    return [
+        {**image, "date": entry["date"], "timestamp": entry.get("timestamp")}
+        for entry in entries
+        for image in entry.get("images", [])
+        if image.get("aoi_cloud") is not None and image["aoi_cloud"] <= max_cloud
+    ]
+
+
+def best_image_info(images: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """id/date/cloud of the lowest tile-cloud scene, as LazyCollection.first_info()."""
+    if not images:
+        return None
+    best = min(
+        images,
+        key=lambda i: i["tile_cloud"] if i.get("tile_cloud") is not None else float("inf"),
+    )
+    return {"id": best["id"], "date": best["date"], "cloud": best.get("tile_cloud")}
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from app.services.supabase_service import supabase_service
 from app.services.satellite import get_satellite_provider
+from app.services.gee_executor import run_gee
 from app.models.schemas import BatchProcessingRequest, VegetationIndex
 
 logger = logging.getLogger(__name__)
@@ -122,7 +123,8 @@ class AutomatedProcessingService:
             start_date = end_date - timedelta(days=7)
 
             satellite_provider = get_satellite_provider()
-            cloud_check_obj = satellite_provider.check_cloud_coverage(
+            cloud_check_obj = await run_gee(
+                satellite_provider.check_cloud_coverage,
                 geometry=geometry,
                 start_date=start_date.strftime("%Y-%m-%d"),
                 end_date=end_date.strftime("%Y-%m-%d"),
@@ -181,7 +183,7 @@ class AutomatedProcessingService:
                 from app.services import earth_engine_service
                 import ee
 
-                collection = earth_engine_service.get_sentinel2_collection(
+                lazy = earth_engine_service.get_sentinel2_collection_lazy(
                     geometry,
                     date,
                     (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime(
@@ -190,13 +192,13 @@ class AutomatedProcessingService:
                     max_cloud_coverage=10.0,
                 )
 
-                if collection.size().getInfo() == 0:
+                if await run_gee(lazy.is_empty):
                     logger.warning(
                         f"No images found for parcel {parcel_id} on date {date}"
                     )
                     return
 
-                image = collection.sort("CLOUDY_PIXEL_PERCENTAGE").first()
+                image = lazy.best_image()
                 index_results = earth_engine_service.calculate_vegetation_indices(
                     image, indices_to_calculate
                 )
@@ -217,7 +219,7 @@ class AutomatedProcessingService:
                             maxPixels=1e13,
                         )
 
-                        stats_result = stats.getInfo()
+                        stats_result = await run_gee(stats.getInfo)
 
                         satellite_data = {
                             "organization_id": organization_id,
@@ -259,7 +261,8 @@ class AutomatedProcessingService:
                 end_date_str = (
                     datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)
                 ).strftime("%Y-%m-%d")
-                stats_results = satellite_provider.get_statistics(
+                stats_results = await run_gee(
+                    satellite_provider.get_statistics,
                     geometry=geometry,
                     start_date=date,
                     end_date=end_date_str,
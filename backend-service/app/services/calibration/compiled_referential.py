@@ -0,0 +1,183 @@
+"""Crop referentials compiled once and shared by every calibration.
+
+Each pipeline stage used to re-derive the same structures from
+``reference_data`` on every run: cycle months, phenology periods, weather
+and satellite thresholds, phase definitions with their compiled condition
+trees, maturity-phase boundaries, calibration capabilities. A handful of crop
+referentials serve thousands of parcels, so :func:`compile_referential` builds
+a :class:`CompiledReferential` once per (crop type, referential content hash)
+and keeps it in an LRU cache. The orchestrator compiles with the content hash
+it already computed and hands the same object to every stage.
+
+Lookups that depend on a parcel attribute (planting system, variety, maturity
+phase) are computed on first use and memoised on the object.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from app.core.config import settings
+
+from .pipeline.s1_satellite_extraction import _extract_plausibility_config
+from .pipeline.s4_state_machine import (
+    PhaseConfig,
+    PhaseRules,
+    extract_phase_config,
+    phase_rules_from_referential,
+    resolve_chill_threshold,
+)
+from .referential_utils import (
+    CalibrationCapabilities,
+    WeatherThresholdConfig,
+    get_calibration_capabilities,
+    get_cycle_months_from_stades_bbch,
+    get_gdd_tbase_tupper,
+    get_phase_boundaries_from_reference,
+    get_phenology_periods_from_stades_bbch,
+    get_satellite_thresholds_from_referential,
+    get_weather_thresholds,
+    referential_content_hash,
+)
+from .types import MaturityPhase
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledReferential:
+    """Everything the pipeline derives from one crop referential.
+
+    Shared between concurrent calibrations: treat every attribute and every
+    returned value as read-only (``phase_config`` returns a fresh copy).
+    """
+
+    crop_type: str
+    content_hash: str
+    reference_data: dict[str, Any] | None = field(repr=False)
+    cycle_months: tuple[int, int] | None
+    phenology_periods: dict[str, set[int]] | None = field(repr=False)
+    gdd_tbase_tupper: tuple[float | None, float | None]
+    weather_thresholds: WeatherThresholdConfig = field(repr=False)
+    plausibility: tuple[float, int, float]
+    phase_boundaries: dict[MaturityPhase, tuple[int, int]] = field(repr=False)
+    phase_rules: PhaseRules = field(repr=False)
+    _memo: dict[tuple, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def _memoised(self, key: tuple, build: Any) -> Any:
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+    def capabilities(self, subtype: str | None = None) -> CalibrationCapabilities:
+        return self._memoised(
+            ("capabilities", subtype),
+            lambda: get_calibration_capabilities(
+                self.crop_type, self.reference_data, subtype=subtype
+            ),
+        )
+
+    def phase_config(self, maturity_phase: str | None = None) -> PhaseConfig:
+        """State-machine ``PhaseConfig``; a copy, since callers set its chill threshold."""
+        cfg = self._memoised(
+            ("phase_config", maturity_phase),
+            lambda: extract_phase_config(self.reference_data, maturity_phase=maturity_phase),
+        )
+        return replace(cfg)
+
+    def chill_threshold(self, variety: str | None) -> int:
+        gdd_ref = self.reference_data.get("gdd") if self.reference_data else None
+        return self._memoised(
+            ("chill_threshold", variety),
+            lambda: resolve_chill_threshold(variety, gdd_ref, self.reference_data),
+        )
+
+    def satellite_thresholds(
+        self, planting_system: str | None, index_key: str
+    ) -> dict[str, Any] | None:
+        if not self.reference_data:
+            return None
+        return self._memoised(
+            ("satellite_thresholds", planting_system, index_key),
+            lambda: get_satellite_thresholds_from_referential(
+                self.reference_data, planting_system, index_key
+            ),
+        )
+
+    def __reduce__(self) -> tuple:
+        # Process-pool stages receive the worker's cached instance instead of
+        # a copy; compiled predicates are closures and would not pickle anyway.
+        return _compiled_from_pickle, (self.crop_type, self.reference_data, self.content_hash)
+
+
+def _compile(
+    crop_type: str, reference_data: dict[str, Any] | None, content_hash: str
+) -> CompiledReferential:
+    cycle_months = None
+    phenology_periods = None
+    if reference_data:
+        cycle_months = get_cycle_months_from_stades_bbch(reference_data)
+        phenology_periods = get_phenology_periods_from_stades_bbch(reference_data)
+    return CompiledReferential(
+        crop_type=crop_type,
+        content_hash=content_hash,
+        reference_data=reference_data,
+        cycle_months=cycle_months,
+        phenology_periods=phenology_periods,
+        gdd_tbase_tupper=get_gdd_tbase_tupper(crop_type, reference_data),
+        weather_thresholds=get_weather_thresholds(crop_type, reference_data),
+        plausibility=_extract_plausibility_config(reference_data),
+        phase_boundaries=get_phase_boundaries_from_reference(reference_data or {}),
+        phase_rules=phase_rules_from_referential(reference_data),
+    )
+
+
+_cache: OrderedDict[tuple[str, str], CompiledReferential] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compile_referential(
+    crop_type: str,
+    reference_data: dict[str, Any] | None,
+    *,
+    content_hash: str | None = None,
+) -> CompiledReferential:
+    """Cached ``CompiledReferential`` for ``(crop_type, referential content)``.
+
+    Pass ``content_hash`` when the caller already has
+    ``referential_content_hash(reference_data)``; hashing a full referential
+    costs more than compiling it. Least recently used entries are evicted
+    beyond ``settings.CALIBRATION_REFERENTIAL_CACHE_SIZE``.
+    """
+    if content_hash is None:
+        content_hash = referential_content_hash(reference_data)
+    key = (crop_type, content_hash)
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    compiled = _compile(crop_type, reference_data, content_hash)
+    with _cache_lock:
+        # Another thread may have compiled the same referential meanwhile
+        compiled = _cache.setdefault(key, compiled)
+        _cache.move_to_end(key)
+        while len(_cache) > max(1, settings.CALIBRATION_REFERENTIAL_CACHE_SIZE):
+            _cache.popitem(last=False)
+    return compiled
+
+
+def _compiled_from_pickle(
+    crop_type: str, reference_data: dict[str, Any] | None, content_hash: str
+) -> CompiledReferential:
+    return compile_referential(crop_type, reference_data, content_hash=content_hash)
+
+
+def clear_compiled_referential_cache() -> None:
+    """Drop every compiled referential (for tests that edit referentials in place)."""
+    with _cache_lock:
+        _cache.clear()
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import multiprocessing
+import os
+import threading
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, date, datetime
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 import numpy as np
 
+from app.core.config import settings
+
 from .support.age_adjustment import (
     determine_maturity_phase,
     get_threshold_adjustment,
@@ -20,13 +27,32 @@ from .pipeline.s1_satellite_extraction import extract_satellite_history
 from .pipeline.s2_weather_extraction import extract_weather_history
 from .pipeline.s2a_signal_classification import classify_signal
 from .pipeline.s3_percentile_calculation import calculate_percentiles
-from .pipeline.s4_phenology_detection import detect_phenology
+from .pipeline.s4_phenology_detection import detect_phenology_cycles, phenology_cycle_digests
+from .pipeline.s4_state_machine import (
+    SeasonTimeline,
+    timeline_from_transitions,
+    timelines_from_phase_timeline,
+)
 from .pipeline.s5_anomaly_detection import detect_anomalies
 from .pipeline.s6_yield_potential import calculate_yield_potential
 from .pipeline.s7_zone_detection import classify_zones
 from .pipeline.s8_health_score import calculate_health_score
-from .referential_utils import get_calibration_capabilities, get_gdd_tbase_tupper
+from .series import IndexSeries
+from .compiled_referential import CompiledReferential, compile_referential
+from .referential_utils import (
+    get_gdd_tbase_tupper,
+    referential_content_hash,
+)
+from .support.cycle_checkpoints import CycleCheckpointKey, cycle_checkpoint_store
 from .support.gdd_service import compute_daily_gdd
+from .support.incremental import (
+    CYCLE_PREFIX,
+    IMAGES_PREFIX,
+    WEATHER_PREFIX,
+    content_hash,
+    first_changed_month,
+    monthly_digests,
+)
 from .types import (
     CalibrationInput,
     CalibrationMetadata,
@@ -34,10 +60,153 @@ from .types import (
     ConfidenceComponent,
     ConfidenceScore,
     MaturityPhase,
+    Step2Output,
     WeatherRowAccessor,
 )
 
 
+T = TypeVar("T")
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Shared stage pool, created on first use.
+
+    Workers are spawned rather than forked: the API process runs GEE and
+    HTTP client threads whose locks must not be inherited mid-flight.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            workers = settings.CALIBRATION_PROCESS_WORKERS or os.cpu_count() or 1
+            _process_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_stage_pool() -> None:
+    """Stop the stage process pool (application shutdown)."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+async def _run_stage(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a CPU-bound pipeline stage off the event loop.
+
+    With ``CALIBRATION_STAGE_EXECUTOR="process"`` the stage runs in the shared
+    process pool, so arguments and results must be picklable (stage outputs
+    are Pydantic models and plain dicts). Otherwise it runs in a thread.
+    """
+    if settings.CALIBRATION_STAGE_EXECUTOR == "process":
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_process_pool(), functools.partial(fn, *args, **kwargs)
+        )
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+class _StageCache:
+    """Input hashes of this run and the stage outputs reusable from the last one.
+
+    A stage is reused when the digest of its inputs equals the one recorded
+    in ``previous_output.metadata.input_hashes``; see ``support.incremental``.
+    """
+
+    def __init__(self, previous_output: CalibrationOutput | None, parcel_id: str) -> None:
+        if previous_output is not None and previous_output.parcel_id != parcel_id:
+            previous_output = None
+        self.previous = previous_output
+        self.previous_hashes: dict[str, str] = (
+            dict(previous_output.metadata.input_hashes) if previous_output else {}
+        )
+        self.hashes: dict[str, str] = {}
+        self.reused: list[str] = []
+
+    def same(self, key: str) -> bool:
+        return self.previous is not None and self.previous_hashes.get(key) == self.hashes.get(key)
+
+    def lookup(self, key: str, digest: str, attr: str) -> Any | None:
+        """Record ``digest`` and return the previous ``attr`` output if it matches."""
+        self.hashes[key] = digest
+        if not self.same(key):
+            return None
+        cached = getattr(self.previous, attr)
+        if cached is not None:
+            self.reused.append(key)
+        return cached
+
+
+async def _cached_stage(
+    cache: _StageCache,
+    key: str,
+    attr: str,
+    digest: str,
+    fn: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    cached = cache.lookup(key, digest, attr)
+    if cached is not None:
+        return cached
+    return await _run_stage(fn, *args, **kwargs)
+
+
+async def _completed(value: T) -> T:
+    return value
+
+
+def _month_start(month: str) -> date:
+    return date.fromisoformat(f"{month}-01")
+
+
+def _load_cycle_checkpoints(
+    key: CycleCheckpointKey, cycle_digests: dict[int, str]
+) -> dict[int, SeasonTimeline]:
+    """Stored closed cycle years whose input digest still matches this run's."""
+    if not settings.CALIBRATION_CHECKPOINTS_ENABLED:
+        return {}
+    return {
+        year: timeline_from_transitions(year, entry["transitions"])
+        for year, entry in cycle_checkpoint_store.load(key).items()
+        if cycle_digests.get(year) == entry["digest"]
+    }
+
+
+async def _phenology_stage(
+    cache: _StageCache,
+    digest: str,
+    checkpoint_key: CycleCheckpointKey,
+    cycle_digests: dict[int, str],
+    /,
+    *args: Any,
+    **kwargs: Any,
+):
+    """S4 through the stage cache; persists transitions of newly closed cycle years."""
+    cached = cache.lookup("s4", digest, "step4")
+    if cached is not None:
+        return cached
+    step4, closed = await _run_stage(detect_phenology_cycles, *args, **kwargs)
+    if closed and settings.CALIBRATION_CHECKPOINTS_ENABLED:
+        await asyncio.to_thread(
+            cycle_checkpoint_store.save,
+            checkpoint_key,
+            {
+                year: {"digest": cycle_digests[year], "transitions": transitions}
+                for year, transitions in closed.items()
+                if year in cycle_digests
+            },
+        )
+    return step4
+
+
 def _get_frost_threshold(reference_data: dict[str, Any] | None) -> float:
     """Read frost threshold from referentiel seuils_meteo.gel.threshold_c."""
     if reference_data:
@@ -49,21 +218,16 @@ def _get_frost_threshold(reference_data: dict[str, Any] | None) -> float:
 
 
 def _is_evergreen(
-    crop_type: str,
-    reference_data: dict[str, Any] | None,
+    referential: CompiledReferential,
     planting_system: str | None = None,
 ) -> bool:
     """Determine if crop is evergreen from referentiel capacites_calibrage."""
-    if reference_data:
-        cap = reference_data.get("capacites_calibrage") or {}
+    if referential.reference_data:
+        cap = referential.reference_data.get("capacites_calibrage") or {}
         # Explicit flag if present
         if "evergreen" in cap:
             return bool(cap["evergreen"])
-    capabilities = get_calibration_capabilities(
-        crop_type,
-        reference_data,
-        subtype=planting_system,
-    )
+    capabilities = referential.capabilities(planting_system)
     if capabilities.phenology_mode == "state_machine":
         return True
     return False
@@ -159,17 +323,16 @@ def _latest_analysis_fields(
     return parsed, data if isinstance(data, dict) else {}
 
 
-def _observed_points(points: list[Any]) -> list[Any]:
-    return [
-        point for point in points if point.is_observed
-    ]
+def _observed_points(series: IndexSeries) -> IndexSeries:
+    return series.observed()
 
 
-def _observed_month_span(points: list[Any]) -> int:
-    if not points:
+def _observed_month_span(series: IndexSeries) -> int:
+    if not len(series):
         return 0
-    first = min(point.date for point in points)
-    last = max(point.date for point in points)
+    # Series are date-sorted
+    first = series.date_at(0)
+    last = series.date_at(-1)
     return ((last.year - first.year) * 12) + (last.month - first.month) + 1
 
 
@@ -226,6 +389,7 @@ async def _enrich_step2_with_gdd(
     supabase_svc,
     weather_rows: list[dict[str, Any]] | None = None,
     reference_data: dict[str, Any] | None = None,
+    resume: tuple[Step2Output, str] | None = None,
 ) -> None:
     """Populate step2 monthly GDD totals and cumulative from ``weather_gdd_daily``.
 
@@ -235,26 +399,42 @@ async def _enrich_step2_with_gdd(
       ``weather_rows`` in memory using the referential formula, then persist
       to ``weather_gdd_daily`` asynchronously (fire-and-forget sync).
     - Skipped gracefully when Supabase is unavailable (tests, offline).
+    - With ``resume=(previous_step2, month)``, months before ``month`` are
+      taken from the previous output and only later rows are read and folded.
     """
+    monthly_totals: dict[str, float] = defaultdict(float)
+    cumulative = 0.0
+    cumulative_by_month: dict[str, float] = {}
+    if resume is not None:
+        previous_step2, resume_month = resume
+        for month, value in sorted(previous_step2.cumulative_gdd.items()):
+            if month < resume_month:
+                cumulative_by_month[month] = value
+                cumulative = value
+        for agg in previous_step2.monthly_aggregates:
+            if agg.month < resume_month:
+                monthly_totals[agg.month] = agg.gdd_total
+        start_date = max(start_date, f"{resume_month}-01")
+
     rows = await supabase_svc.get_gdd_timeseries(
         lat, lon, crop_type, start_date, end_date
     )
 
-    if not rows:
+    if not rows and weather_rows:
         # Cache miss — compute from weather_rows already in memory
-        if not weather_rows:
-            return
-        rows = _compute_gdd_from_weather_rows(weather_rows, crop_type, reference_data)
-        if not rows:
-            return
-        # Fire-and-forget: persist to weather_gdd_daily for future calibrations
-        asyncio.ensure_future(
-            supabase_svc.upsert_gdd_rows(lat, lon, crop_type, rows)
+        rows = _compute_gdd_from_weather_rows(
+            [r for r in weather_rows if str(r.get("date", ""))[:10] >= start_date],
+            crop_type,
+            reference_data,
         )
+        if rows:
+            # Fire-and-forget: persist to weather_gdd_daily for future calibrations
+            asyncio.ensure_future(
+                supabase_svc.upsert_gdd_rows(lat, lon, crop_type, rows)
+            )
+    if not rows and resume is None:
+        return
 
-    monthly_totals: dict[str, float] = defaultdict(float)
-    cumulative = 0.0
-    cumulative_by_month: dict[str, float] = {}
     for row in rows:
         daily = float(row.get("gdd_daily") or 0.0)
         cumulative += daily
@@ -267,6 +447,23 @@ async def _enrich_step2_with_gdd(
         agg.gdd_total = round(monthly_totals.get(agg.month, 0.0), 3)
 
 
+def _gdd_resume_point(
+    cache: _StageCache, weather_changed_from: str | None
+) -> tuple[Step2Output, str] | None:
+    """Where GDD accumulation can resume from the previous step2, if anywhere.
+
+    The previous run's last month may have been partial, so accumulation
+    restarts at the earlier of that month and the first changed weather month.
+    """
+    if cache.previous is None or weather_changed_from is None:
+        return None
+    previous_step2 = cache.previous.step2
+    if not previous_step2.cumulative_gdd:
+        return None
+    last_month = max(previous_step2.cumulative_gdd)
+    return previous_step2, min(last_month, weather_changed_from)
+
+
 async def run_calibration_pipeline(
     *,
     calibration_input: CalibrationInput,
@@ -290,31 +487,78 @@ async def run_calibration_pipeline(
         reference_data=calibration_input.reference_data,
     )
     normalized_images = _normalize_satellite_images(satellite_images)
-    observed_ndvi_points: list[Any] = []  # populated after step1 completes
+    observed_ndvi_points = IndexSeries.empty()  # populated after step1 completes
+
+    # Incremental recalibration: digests of this run's inputs, compared with
+    # the ones recorded in previous_output to skip unchanged work.
+    cache = _StageCache(previous_output, calibration_input.parcel_id)
+    reference_hash = referential_content_hash(calibration_input.reference_data)
+    # Derived referential structures, shared with every parcel of this crop
+    referential = compile_referential(
+        calibration_input.crop_type,
+        calibration_input.reference_data,
+        content_hash=reference_hash,
+    )
+    cache.hashes.update(monthly_digests(normalized_images, IMAGES_PREFIX))
+    cache.hashes.update(monthly_digests(weather_rows, WEATHER_PREFIX))
+    cache.hashes["s1/config"] = content_hash(
+        calibration_input.organization_id,
+        calibration_input.parcel_id,
+        storage is not None,
+        reference_hash,
+    )
+    cache.hashes["s2/config"] = content_hash(calibration_input.crop_type, reference_hash)
+    images_changed_from = None
+    weather_changed_from = None
+    if cache.same("s1/config"):
+        images_changed_from = first_changed_month(
+            cache.previous_hashes, cache.hashes, IMAGES_PREFIX
+        )
+    if cache.same("s2/config"):
+        weather_changed_from = first_changed_month(
+            cache.previous_hashes, cache.hashes, WEATHER_PREFIX
+        )
+    reuse_step1 = cache.same("s1/config") and images_changed_from is None
+    reuse_step2 = cache.same("s2/config") and weather_changed_from is None
 
     # --- Phase 1: S1(satellite_extraction) + S2(weather_extraction) — independent ---
+    # The storage client is not picklable, so S1 stays on a thread when it uploads.
+    run_s1 = asyncio.to_thread if storage is not None else _run_stage
     step1, step2 = await asyncio.gather(
-        asyncio.to_thread(
+        _completed(cache.previous.step1)
+        if reuse_step1
+        else run_s1(
             extract_satellite_history,
             organization_id=calibration_input.organization_id,
             parcel_id=calibration_input.parcel_id,
             images=normalized_images,
             storage=storage,
             reference_data=calibration_input.reference_data,
+            referential=referential,
+            # Only the tail from the first changed month is re-cleaned
+            previous=cache.previous.step1 if images_changed_from else None,
+            changed_from=_month_start(images_changed_from) if images_changed_from else None,
         ),
-        asyncio.to_thread(
+        _completed(cache.previous.step2)
+        if reuse_step2
+        else _run_stage(
             extract_weather_history,
             weather_data=weather_rows,
             crop_type=calibration_input.crop_type,
             reference_data=calibration_input.reference_data,
+            referential=referential,
         ),
     )
+    if reuse_step1:
+        cache.reused.append("s1")
+    if reuse_step2:
+        cache.reused.append("s2")
 
     # Override step2.chill_hours with real-hourly count when location is known.
     # Hard-fail per chill-hours-hourly-fetch design — no sine fallback in production.
     # Tests without lat/lon in weather_rows skip this branch (preserves fixtures).
     location = _extract_location_from_weather_rows(weather_rows)
-    if location is not None and calibration_input.crop_type == "olivier":
+    if location is not None and calibration_input.crop_type == "olivier" and not reuse_step2:
         from app.services.weather.chill_hours import compute_hourly_chill_hours
         lat, lon = location
         # Use the latest weather year as reference (calibration runs Apr–Jun typically)
@@ -325,16 +569,12 @@ async def run_calibration_pipeline(
         )
 
     # Capability & data guard (sequential — depends on step1)
-    capabilities = get_calibration_capabilities(
-        calibration_input.crop_type,
-        calibration_input.reference_data,
-        subtype=calibration_input.planting_system,
-    )
+    capabilities = referential.capabilities(calibration_input.planting_system)
     if not capabilities.supported:
         raise ValueError(
             f"Calibration is not supported for crop_type '{calibration_input.crop_type}'"
         )
-    observed_ndvi_points = _observed_points(step1.index_time_series.get("NDVI", []))
+    observed_ndvi_points = _observed_points(step1.series("NDVI"))
     if len(observed_ndvi_points) < capabilities.min_observed_images:
         raise ValueError(
             f"Calibration requires at least {capabilities.min_observed_images} "
@@ -343,42 +583,109 @@ async def run_calibration_pipeline(
 
     for required_index in capabilities.required_indices:
         key = _canon_index_key(required_index)
-        observed_points = _observed_points(step1.index_time_series.get(key, []))
+        observed_points = _observed_points(step1.series(key))
         if not observed_points:
             raise ValueError(
                 f"Calibration requires observed {key} series for planting_system "
                 f"'{calibration_input.planting_system or 'default'}'"
             )
 
-    nirv_series_raw = [
-        {"date": p.date.isoformat(), "value": p.value}
-        for p in step1.index_time_series.get("NIRv", [])
-    ]
+    nirv_series_raw = step1.series("NIRv").records()
+
+    # Stage-input digests. step2 is hashed before the GDD enrichment below,
+    # which is what S2a/S4 see; a reused step2 is already enriched, so its
+    # recorded digest is carried over instead.
+    step1_hash = content_hash(step1)
+    step2_hash = (
+        cache.previous_hashes["s2/output"]
+        if reuse_step2 and "s2/output" in cache.previous_hashes
+        else content_hash(step2)
+    )
+    cache.hashes["s2/output"] = step2_hash
+    maturity_value = maturity_phase.value if isinstance(maturity_phase, MaturityPhase) else None
+
+    # S4 per cycle year: closed years whose inputs are unchanged keep their
+    # timeline, from the stored checkpoints or from previous_output
+    cycle_digests = phenology_cycle_digests(
+        step1,
+        step2,
+        crop_type=calibration_input.crop_type,
+        variety=calibration_input.variety,
+        reference_data=calibration_input.reference_data,
+        maturity_phase=maturity_value,
+        referential=referential,
+    )
+    for year, digest in cycle_digests.items():
+        cache.hashes[f"{CYCLE_PREFIX}{year}"] = digest
+    checkpoint_key = CycleCheckpointKey(
+        parcel_id=calibration_input.parcel_id,
+        referential_hash=reference_hash,
+        variety=calibration_input.variety,
+        maturity_phase=maturity_value,
+    )
+    reuse_cycles = await asyncio.to_thread(
+        _load_cycle_checkpoints, checkpoint_key, cycle_digests
+    )
+    if cache.previous is not None:
+        for year, timeline in timelines_from_phase_timeline(
+            cache.previous.step4.phase_timeline
+        ).items():
+            if year not in reuse_cycles and cache.same(f"{CYCLE_PREFIX}{year}"):
+                reuse_cycles[year] = timeline
+    cache.reused.extend(f"{CYCLE_PREFIX}{year}" for year in sorted(reuse_cycles))
 
     # --- Phase 2: S2A(signal_classification) + S3(percentile_calculation) + S4(phenology_detection) + S6(yield_potential) ---
     signal_classification, step3, step4, step6 = await asyncio.gather(
-        asyncio.to_thread(
+        _cached_stage(
+            cache, "s2a", "signal_classification",
+            content_hash(step1_hash, step2_hash, calibration_input.crop_type),
             classify_signal,
             step1, step2, calibration_input.crop_type,
         ),
-        asyncio.to_thread(
+        _cached_stage(
+            cache, "s3", "step3",
+            content_hash(
+                step1_hash,
+                reference_hash,
+                calibration_input.crop_type,
+                calibration_input.planting_system,
+            ),
             calculate_percentiles,
             step1,
             reference_data=calibration_input.reference_data,
             crop_type=calibration_input.crop_type,
             planting_system=calibration_input.planting_system,
+            referential=referential,
         ),
-        asyncio.to_thread(
-            detect_phenology,
+        _phenology_stage(
+            cache,
+            content_hash(cycle_digests),
+            checkpoint_key,
+            cycle_digests,
             step1,
             step2,
             crop_type=calibration_input.crop_type,
             variety=calibration_input.variety,
             planting_system=calibration_input.planting_system,
             reference_data=calibration_input.reference_data,
-            maturity_phase=maturity_phase.value if isinstance(maturity_phase, MaturityPhase) else None,
+            maturity_phase=maturity_value,
+            reuse=reuse_cycles or None,
+            referential=referential,
         ),
-        asyncio.to_thread(
+        _cached_stage(
+            cache, "s6", "step6",
+            content_hash(
+                step1_hash,
+                reference_hash,
+                calibration_input.planting_year,
+                calibration_input.crop_type,
+                calibration_input.variety,
+                calibration_input.harvest_records,
+                maturity_phase,
+                calibration_input.plant_count,
+                calibration_input.area_hectares,
+                calibration_input.density_per_hectare,
+            ),
             calculate_yield_potential,
             planting_year=calibration_input.planting_year,
             crop_type=calibration_input.crop_type,
@@ -390,11 +697,14 @@ async def run_calibration_pipeline(
             plant_count=calibration_input.plant_count,
             area_hectares=calibration_input.area_hectares,
             density_per_hectare=calibration_input.density_per_hectare,
+            referential=referential,
         ),
     )
 
     # Enrich step2 GDD from weather_gdd_daily (cache-first, compute-on-miss).
-    if supabase_svc is not None:
+    # A reused step2 is already enriched; a changed one resumes the previous
+    # accumulation from the earlier of its first changed and last month.
+    if supabase_svc is not None and not reuse_step2:
         location = _extract_location_from_weather_rows(weather_rows)
         if location:
             dates = [str(r.get("date", "")) for r in weather_rows if r.get("date")]
@@ -409,6 +719,7 @@ async def run_calibration_pipeline(
                     supabase_svc=supabase_svc,
                     weather_rows=weather_rows,
                     reference_data=calibration_input.reference_data,
+                    resume=_gdd_resume_point(cache, weather_changed_from),
                 )
 
     if not step4.yearly_stages:
@@ -420,27 +731,50 @@ async def run_calibration_pipeline(
             "Calibration requires enough observed satellite history to compute NDVI percentiles"
         )
 
+    observed_gci_points = _observed_points(step1.series("GCI"))
+
     # --- Phase 3: S5(anomaly_detection) + S7(zone_classification) — independent ---
     step5, step7 = await asyncio.gather(
-        asyncio.to_thread(
+        _cached_stage(
+            cache, "s5", "step5",
+            content_hash(
+                step1_hash,
+                step2,
+                step4,
+                adjustment,
+                reference_hash,
+                calibration_input.planting_system,
+                calibration_input.crop_type,
+            ),
             detect_anomalies,
             step1, step2, step4, adjustment,
             reference_data=calibration_input.reference_data,
             planting_system=calibration_input.planting_system,
             crop_type=calibration_input.crop_type,
+            referential=referential,
         ),
-        asyncio.to_thread(
+        _cached_stage(
+            cache, "s7", "step7",
+            content_hash(
+                ndvi_percentiles,
+                ndvi_raster_pixels,
+                observed_ndvi_points,
+                step3.global_percentiles.get("GCI"),
+                observed_gci_points,
+            ),
             classify_zones,
             ndvi_percentiles,
             ndvi_raster_pixels=ndvi_raster_pixels,
             observed_ndvi_points=observed_ndvi_points,
             gci_percentiles=step3.global_percentiles.get("GCI"),
-            observed_gci_points=_observed_points(step1.index_time_series.get("GCI", [])),
+            observed_gci_points=observed_gci_points,
         ),
     )
 
     # --- Phase 4: S8(health_score) — needs S1 + S3 + S7 ---
-    step8 = await asyncio.to_thread(
+    step8 = await _cached_stage(
+        cache, "s8", "step8",
+        content_hash(step1_hash, step3, step7),
         calculate_health_score,
         step1=step1,
         step3=step3,
@@ -487,11 +821,7 @@ async def run_calibration_pipeline(
         data_quality_flags.append("insufficient_satellite_data")
     if not has_real_zones:
         data_quality_flags.append("single_pixel_zones")
-    if _is_evergreen(
-        calibration_input.crop_type,
-        calibration_input.reference_data,
-        calibration_input.planting_system,
-    ) and not step4.referential_cycle_used:
+    if _is_evergreen(referential, calibration_input.planting_system) and not step4.referential_cycle_used:
         data_quality_flags.append("evergreen_phenology_approximate")
     if step4.status != "ok":
         data_quality_flags.append(f"phenology_{step4.status}")
@@ -527,5 +857,7 @@ async def run_calibration_pipeline(
             version="v2",
             generated_at=datetime.now(UTC),
             data_quality_flags=data_quality_flags,
+            input_hashes=cache.hashes,
+            reused_stages=cache.reused,
         ),
     )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import date
 from statistics import mean, pstdev
-from typing import Iterable
+from typing import TYPE_CHECKING
 
 import numpy as np
 try:
@@ -10,8 +10,12 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - exercised in minimal envs
     savgol_filter = None
 
+from ..series import FLAG_INTERPOLATED, FLAG_OUTLIER, IndexSeries
 from ..types import IndexTimePoint, Step1Output
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 SUPPORTED_INDICES = (
     "NDVI",
@@ -68,12 +72,14 @@ def _to_number_or_none(value: object) -> float | None:
     return None
 
 
-def _mark_temporal_artefacts(
-    values: list[IndexTimePoint],
+def _artefact_mask(
+    ordinals: np.ndarray,
+    values: np.ndarray,
+    interpolated: np.ndarray,
     spike_threshold: float = 0.30,
     confirm_window_days: int = 10,
     confirm_tolerance: float = 0.10,
-) -> int:
+) -> np.ndarray:
     """Flag artefacts using temporal plausibility from the referential.
 
     Implements ``protocole_phenologique.filtrage.fait_au_calibrage.plausibilite_temporelle``:
@@ -87,61 +93,95 @@ def _mark_temporal_artefacts(
     download time already removes cloud-contaminated pixels; this catches
     residual artefacts (thin shadows, sensor glitches, field-edge bleed)
     without flagging legitimate seasonal transitions.
+
+    ``values`` is ``(n_series, n_points)`` over the shared date-sorted
+    ``ordinals``; ``interpolated`` flags gap-filled columns, which are never
+    used as the pre-spike reference nor as the snap-back value. Returns the
+    boolean outlier mask, same shape as ``values``.
     """
-    if len(values) < 3:
-        return 0
+    n = ordinals.shape[0]
+    outliers = np.zeros(values.shape, dtype=bool)
+    if n < 3:
+        return outliers
+
+    prev = values[:, :-1]
+    curr = values[:, 1:]
+    # Column i of the (n - 1)-wide arrays is the point at position i + 1
+    reference = ~interpolated[:-1] & (prev != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.abs(prev)
+        spike = reference & ~(np.abs(curr - prev) / scale <= spike_threshold)
+
+        # Snap-back look-ahead: the points after each spike candidate that
+        # fall within confirm_window_days of it, as a (n - 1, width) grid
+        positions = np.arange(1, n)
+        window_end = np.searchsorted(
+            ordinals, ordinals[1:] + confirm_window_days, side="right"
+        )
+        width = int((window_end - positions - 1).max())
+        confirmed = np.zeros(spike.shape, dtype=bool)
+        if width > 0:
+            ahead = positions[:, None] + np.arange(1, width + 1)[None, :]
+            in_window = ahead < window_end[:, None]
+            ahead = np.minimum(ahead, n - 1)
+            in_window &= ~interpolated[ahead]
+            returns = (
+                np.abs(values[:, ahead] - prev[:, :, None]) / scale[:, :, None]
+                <= confirm_tolerance
+            )
+            confirmed = (returns & in_window[None, :, :]).any(axis=2)
 
-    count = 0
-    i = 1
-    while i < len(values):
-        prev = values[i - 1]
-        curr = values[i]
-
-        # Skip already-flagged or interpolated points
-        if prev.outlier or prev.interpolated:
-            i += 1
-            continue
+    # A flagged point cannot be the pre-spike reference of the next one, so
+    # within a run of consecutive candidates only every other one is flagged.
+    candidate = spike & confirmed
+    columns = np.broadcast_to(np.arange(n - 1), candidate.shape)
+    run_start = candidate.copy()
+    run_start[:, 1:] &= ~candidate[:, :-1]
+    last_start = np.maximum.accumulate(np.where(run_start, columns, -1), axis=1)
+    outliers[:, 1:] = candidate & ((columns - last_start) % 2 == 0)
+    return outliers
 
-        # Step 1: detect spike
-        if prev.value == 0:
-            i += 1
-            continue
 
-        relative_change = abs(curr.value - prev.value) / abs(prev.value)
-        if relative_change <= spike_threshold:
-            i += 1
-            continue
+def _mark_temporal_artefacts(
+    values: list[IndexTimePoint],
+    spike_threshold: float = 0.30,
+    confirm_window_days: int = 10,
+    confirm_tolerance: float = 0.10,
+) -> int:
+    """Point-list form of :func:`_artefact_mask`; sets ``outlier`` in place.
 
-        # Step 2: look ahead within confirm_window_days for a snap-back
-        confirmed = False
-        for j in range(i + 1, len(values)):
-            days_ahead = (values[j].date - curr.date).days
-            if days_ahead > confirm_window_days:
-                break
-            if values[j].outlier or values[j].interpolated:
-                continue
-            # Check if it returns to ±tolerance of the pre-spike value
-            if abs(values[j].value - prev.value) / abs(prev.value) <= confirm_tolerance:
-                confirmed = True
-                break
-
-        if confirmed:
-            # Mark the spike point as artefact
-            curr.outlier = True
+    Returns the number of newly flagged points.
+    """
+    if len(values) < 3:
+        return 0
+    series = IndexSeries.from_points(values)
+    mask = _artefact_mask(
+        series.ordinals,
+        series.values[None, :],
+        series.interpolated_mask,
+        spike_threshold=spike_threshold,
+        confirm_window_days=confirm_window_days,
+        confirm_tolerance=confirm_tolerance,
+    )[0]
+    count = 0
+    for point, flagged in zip(values, mask.tolist()):
+        if flagged and not point.outlier:
+            point.outlier = True
             count += 1
-
-        i += 1
-
     return count
 
 
 def _smooth_series(
-    points: list[IndexTimePoint],
+    values: np.ndarray,
+    outliers: np.ndarray,
     window: int = 7,
     polyorder: int = 2,
 ) -> None:
     """Apply Savitzky-Golay smoothing in-place, skipping outlier-flagged points.
 
+    Rows of ``values`` sharing an outlier pattern are smoothed together along
+    the date axis.
+
     Parameters
     ----------
     window : int
@@ -156,46 +196,57 @@ def _smooth_series(
         # of failing the entire calibration module at import time.
         return
 
-    valid_indices = [i for i, p in enumerate(points) if not p.outlier]
-    if len(valid_indices) < window:
-        return
-
-    values = np.array([points[i].value for i in valid_indices], dtype=np.float64)
-
-    effective_window = min(window, len(values))
-    if effective_window % 2 == 0:
-        effective_window -= 1
-    if effective_window < polyorder + 2:
-        return
-
-    smoothed = savgol_filter(values, effective_window, polyorder)
-    for j, idx in enumerate(valid_indices):
-        points[idx].value = round(float(smoothed[j]), 6)
+    groups: dict[bytes, list[int]] = {}
+    for row, pattern in enumerate(np.packbits(outliers, axis=1)):
+        groups.setdefault(pattern.tobytes(), []).append(row)
+    for rows in groups.values():
+        keep = np.flatnonzero(~outliers[rows[0]])
+        if keep.shape[0] < window:
+            continue
+        effective_window = min(window, keep.shape[0])
+        if effective_window % 2 == 0:
+            effective_window -= 1
+        if effective_window < polyorder + 2:
+            continue
+        block = np.ix_(rows, keep)
+        values[block] = np.round(
+            savgol_filter(values[block], effective_window, polyorder, axis=1), 6
+        )
 
 
-def _interpolate_between(
-    start: IndexTimePoint,
-    end: IndexTimePoint,
+def _interpolate_gaps(
+    ordinals: np.ndarray,
+    values: np.ndarray,
     max_gap_days: int,
-) -> Iterable[IndexTimePoint]:
-    gap_days = (end.date - start.date).days
-    if gap_days <= 1 or gap_days > max_gap_days:
-        return []
-
-    interpolated: list[IndexTimePoint] = []
-    for day_step in range(1, gap_days):
-        target_date = start.date + timedelta(days=day_step)
-        ratio = day_step / gap_days
-        value = start.value + ((end.value - start.value) * ratio)
-        interpolated.append(
-            IndexTimePoint(
-                date=target_date,
-                value=round(value, 6),
-                outlier=False,
-                interpolated=True,
-            )
-        )
-    return interpolated
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Insert daily linearly interpolated points into gaps of 2..``max_gap_days`` days.
+
+    Each gap is interpolated between its bounding observations, so with
+    several observations on one date the gap starts from the last one and
+    ends at the first. Returns the new ordinals, values and the interpolated
+    column mask.
+    """
+    n = ordinals.shape[0]
+    gaps = np.diff(ordinals)
+    fill = np.where((gaps > 1) & (gaps <= max_gap_days), gaps - 1, 0)
+    total = int(fill.sum())
+    if total == 0:
+        return ordinals, values, np.zeros(n, dtype=bool)
+
+    segment = np.repeat(np.arange(n - 1), fill)
+    step = np.arange(total) - np.repeat(np.cumsum(fill) - fill, fill) + 1
+    start = values[:, segment]
+    filled = np.round(
+        start + (values[:, segment + 1] - start) * (step / gaps[segment]), 6
+    )
+    # np.insert keeps the given order for equal positions: the gap days
+    # land after their segment's first observation, in date order.
+    at = segment + 1
+    return (
+        np.insert(ordinals, at, ordinals[segment] + step),
+        np.insert(values, at, filled, axis=1),
+        np.insert(np.zeros(n, dtype=bool), at, True),
+    )
 
 
 def _extract_plausibility_config(
@@ -238,6 +289,123 @@ def _extract_plausibility_config(
     return spike, window, tolerance
 
 
+# Raw observations re-cleaned before the first changed date when extending a
+# previous series, and the guard kept clear of both ends of that tail. The
+# guard covers the Savitzky-Golay half-window and the artefact look-ahead, so
+# an unchanged overlap means the earlier output is exact up to the splice.
+_SPLICE_CONTEXT = 28
+_SPLICE_GUARD = 7
+
+
+def _clean_block(
+    ordinals: np.ndarray,
+    values: np.ndarray,
+    *,
+    interpolate_max_gap_days: int,
+    plausibility: tuple[float, int, float],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gap-fill, flag artefacts and smooth series sharing one date axis.
+
+    ``values`` is ``(n_series, n_points)`` over the date-sorted raw
+    ``ordinals``. Returns the cleaned ordinals with per-series values and
+    ``IndexSeries`` flags.
+    """
+    spike_thresh, confirm_window, confirm_tol = plausibility
+
+    # TODO: linear interpolation is not in the referential spec — the DB
+    # should already contain clean per-date median values from SCL-filtered
+    # pixels.  Kept for now to fill short gaps between Sentinel-2 revisits;
+    # reconsider once data pipeline is fully validated.
+    ordinals, values, interpolated = _interpolate_gaps(
+        ordinals, values, max_gap_days=interpolate_max_gap_days
+    )
+    outliers = _artefact_mask(
+        ordinals,
+        values,
+        interpolated,
+        spike_threshold=spike_thresh,
+        confirm_window_days=confirm_window,
+        confirm_tolerance=confirm_tol,
+    )
+    values = values.copy()
+    _smooth_series(values, outliers)
+    flags = np.where(outliers, FLAG_OUTLIER, 0).astype(np.uint8)
+    flags[:, interpolated] |= FLAG_INTERPOLATED
+    return ordinals, values, flags
+
+
+def _clean_series(
+    ordinals: np.ndarray,
+    values: np.ndarray,
+    *,
+    interpolate_max_gap_days: int,
+    plausibility: tuple[float, int, float],
+) -> IndexSeries:
+    """:func:`_clean_block` for a single date-sorted raw series."""
+    cleaned_ordinals, cleaned, flags = _clean_block(
+        ordinals,
+        values[None, :],
+        interpolate_max_gap_days=interpolate_max_gap_days,
+        plausibility=plausibility,
+    )
+    return IndexSeries(cleaned_ordinals, cleaned[0], flags[0])
+
+
+def _extend_series(
+    previous: list[IndexSeries],
+    ordinals: np.ndarray,
+    values: np.ndarray,
+    changed_from: date,
+    *,
+    interpolate_max_gap_days: int,
+    plausibility: tuple[float, int, float],
+) -> list[IndexSeries | None]:
+    """Reuse each ``previous`` series up to a splice point and re-clean only the tail.
+
+    The tail starts ``_SPLICE_CONTEXT`` raw observations before the first
+    point on or after ``changed_from``. Its cleaned values must match
+    ``previous`` over an overlap window away from both edges; then the
+    sequential artefact flags and the local smoothing window are in the same
+    state as in a full run and the spliced series equals it. A row is None
+    (caller runs the full clean) when the history is too short or the overlap
+    disagrees.
+    """
+    extended: list[IndexSeries | None] = [None] * len(previous)
+    first_new = int(np.searchsorted(ordinals, changed_from.toordinal(), side="left"))
+    tail_start = first_new - _SPLICE_CONTEXT
+    if tail_start < 0:
+        return extended
+    overlap_from = ordinals[tail_start + _SPLICE_GUARD]
+    split = ordinals[first_new - _SPLICE_GUARD]
+    if split <= overlap_from:
+        return extended
+
+    tail_ordinals, tail_values, tail_flags = _clean_block(
+        ordinals[tail_start:],
+        values[:, tail_start:],
+        interpolate_max_gap_days=interpolate_max_gap_days,
+        plausibility=plausibility,
+    )
+    tail_overlap = (tail_ordinals >= overlap_from) & (tail_ordinals < split)
+    tail_rest = tail_ordinals >= split
+
+    for row, before in enumerate(previous):
+        if not len(before) or split > before.ordinals[-1]:
+            continue
+        tail = IndexSeries(tail_ordinals, tail_values[row], tail_flags[row])
+        overlap = (before.ordinals >= overlap_from) & (before.ordinals < split)
+        if tail.filter(tail_overlap) != before.filter(overlap):
+            continue
+        head = before.filter(before.ordinals < split)
+        rest = tail.filter(tail_rest)
+        extended[row] = IndexSeries(
+            np.concatenate([head.ordinals, rest.ordinals]),
+            np.concatenate([head.values, rest.values]),
+            np.concatenate([head.flags, rest.flags]),
+        )
+    return extended
+
+
 def extract_satellite_history(
     *,
     organization_id: str,
@@ -248,10 +416,19 @@ def extract_satellite_history(
     interpolate_max_gap_days: int = 15,
     fallback_series: dict[str, list[dict[str, object]]] | None = None,
     reference_data: dict | None = None,
+    previous: Step1Output | None = None,
+    changed_from: date | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step1Output:
-    index_points: dict[str, list[IndexTimePoint]] = {
-        index: [] for index in SUPPORTED_INDICES
-    }
+    """Parse, filter, gap-fill, de-spike and smooth the per-index series.
+
+    With ``previous`` (an earlier output for the same parcel) and
+    ``changed_from`` (no input image before that date differs from the
+    earlier run), each series is extended by re-cleaning only its tail; see
+    :func:`_extend_series`.
+    """
+    index_ordinals: dict[str, list[int]] = {index: [] for index in SUPPORTED_INDICES}
+    index_values: dict[str, list[float]] = {index: [] for index in SUPPORTED_INDICES}
     raster_paths: dict[str, list[str]] = {index: [] for index in SUPPORTED_INDICES}
 
     filtered_image_count = 0
@@ -269,6 +446,7 @@ def extract_satellite_history(
 
         cloud_values.append(cloud)
         image_date = date.fromisoformat(str(raw_image.get("date")))
+        image_ordinal = image_date.toordinal()
         raw_indices = raw_image.get("indices")
         indices = raw_indices if isinstance(raw_indices, dict) else {}
 
@@ -276,14 +454,8 @@ def extract_satellite_history(
             index_value = _to_number_or_none(_raw_index_value(indices, index))
             if index_value is None:
                 continue
-            index_points[index].append(
-                IndexTimePoint(
-                    date=image_date,
-                    value=index_value,
-                    outlier=False,
-                    interpolated=False,
-                )
-            )
+            index_ordinals[index].append(image_ordinal)
+            index_values[index].append(index_value)
 
             if storage is not None:
                 path = storage.build_path(
@@ -296,66 +468,77 @@ def extract_satellite_history(
 
     if fallback_series:
         for index in SUPPORTED_INDICES:
-            if index_points[index]:
+            if index_ordinals[index]:
                 continue
             for row in fallback_series.get(index, []):
-                index_points[index].append(
-                    IndexTimePoint(
-                        date=date.fromisoformat(str(row.get("date"))),
-                        value=_to_number(row.get("mean_value")),
-                        outlier=False,
-                        interpolated=False,
-                    )
+                index_ordinals[index].append(
+                    date.fromisoformat(str(row.get("date"))).toordinal()
                 )
+                index_values[index].append(_to_number(row.get("mean_value")))
 
     # Extract plausibility config from referential
-    spike_thresh, confirm_window, confirm_tol = _extract_plausibility_config(reference_data)
-
-    interpolated_dates_set: set[date] = set()
-    total_outliers = 0
+    plausibility = (
+        referential.plausibility
+        if referential is not None
+        else _extract_plausibility_config(reference_data)
+    )
 
+    # Indices read from the same images share one date axis and are cleaned
+    # as a single (n_indices, n_dates) block.
+    blocks: dict[bytes, tuple[np.ndarray, list[str], list[np.ndarray]]] = {}
     for index in SUPPORTED_INDICES:
-        sorted_points = sorted(index_points[index], key=lambda item: item.date)
-        enriched_points: list[IndexTimePoint] = []
-
-        # TODO: linear interpolation is not in the referential spec — the DB
-        # should already contain clean per-date median values from SCL-filtered
-        # pixels.  Kept for now to fill short gaps between Sentinel-2 revisits;
-        # reconsider once data pipeline is fully validated.
-        for idx, current in enumerate(sorted_points):
-            enriched_points.append(current)
-            if idx == len(sorted_points) - 1:
-                continue
-
-            next_point = sorted_points[idx + 1]
-            generated = list(
-                _interpolate_between(
-                    current,
-                    next_point,
-                    max_gap_days=interpolate_max_gap_days,
-                )
+        ordinals = np.asarray(index_ordinals[index], dtype=np.int64)
+        order = np.argsort(ordinals, kind="stable")
+        ordinals = ordinals[order]
+        values = np.asarray(index_values[index], dtype=np.float64)[order]
+        _, names, rows = blocks.setdefault(ordinals.tobytes(), (ordinals, [], []))
+        names.append(index)
+        rows.append(values)
+
+    series_by_index: dict[str, IndexSeries] = {}
+    for ordinals, names, rows in blocks.values():
+        values = np.vstack(rows)
+        if previous is not None and changed_from is not None:
+            extended = _extend_series(
+                [previous.series(name) for name in names],
+                ordinals,
+                values,
+                changed_from,
+                interpolate_max_gap_days=interpolate_max_gap_days,
+                plausibility=plausibility,
             )
-            for generated_point in generated:
-                interpolated_dates_set.add(generated_point.date)
-                enriched_points.append(generated_point)
-
-        enriched_points = sorted(enriched_points, key=lambda item: item.date)
-        total_outliers += _mark_temporal_artefacts(
-            enriched_points,
-            spike_threshold=spike_thresh,
-            confirm_window_days=confirm_window,
-            confirm_tolerance=confirm_tol,
+            for name, series in zip(names, extended):
+                if series is not None:
+                    series_by_index[name] = series
+        pending = [row for row, name in enumerate(names) if name not in series_by_index]
+        if not pending:
+            continue
+        cleaned_ordinals, cleaned, flags = _clean_block(
+            ordinals,
+            values[pending],
+            interpolate_max_gap_days=interpolate_max_gap_days,
+            plausibility=plausibility,
         )
-        _smooth_series(enriched_points)
-        index_points[index] = enriched_points
+        for position, row in enumerate(pending):
+            series_by_index[names[row]] = IndexSeries(
+                cleaned_ordinals, cleaned[position], flags[position]
+            )
+
+    series_by_index = {index: series_by_index[index] for index in SUPPORTED_INDICES}
+    total_outliers = sum(int(series.outlier_mask.sum()) for series in series_by_index.values())
+    interpolated_ordinals = np.unique(
+        np.concatenate(
+            [series.ordinals[series.interpolated_mask] for series in series_by_index.values()]
+        )
+    )
 
     cloud_coverage_mean = round(mean(cloud_values), 3) if cloud_values else 100.0
 
     return Step1Output(
-        index_time_series=index_points,
+        index_time_series=series_by_index,
         cloud_coverage_mean=cloud_coverage_mean,
         filtered_image_count=filtered_image_count,
         outlier_count=total_outliers,
-        interpolated_dates=sorted(interpolated_dates_set),
+        interpolated_dates=[date.fromordinal(int(o)) for o in interpolated_ordinals],
         raster_paths=raster_paths,
     )
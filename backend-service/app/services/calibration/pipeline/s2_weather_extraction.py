@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import date
+from typing import TYPE_CHECKING
 
-from ..referential_utils import get_weather_thresholds
+from ..referential_utils import WeatherThresholdConfig, get_weather_thresholds
 from ..support.gdd_service import estimate_chill_hours
 from ..types import (
     ExtremeEvent,
@@ -13,6 +14,9 @@ from ..types import (
     WeatherRowAccessor,
 )
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 # Moroccan Mediterranean climate — season boundaries for drought detection
 _DRY_SEASON_MONTHS = {6, 7, 8, 9}
@@ -24,8 +28,10 @@ def _drought_threshold_from_config(
     crop_type: str,
     *,
     reference_data: dict[str, object] | None = None,
+    config: WeatherThresholdConfig | None = None,
 ) -> int:
-    config = get_weather_thresholds(crop_type, reference_data)
+    if config is None:
+        config = get_weather_thresholds(crop_type, reference_data)
     if month in _DRY_SEASON_MONTHS:
         return config.drought_days_dry_season
     if month in _TRANSITION_MONTHS:
@@ -39,6 +45,7 @@ def extract_weather_history(
     frost_threshold: float | None = None,
     heat_threshold: float | None = None,
     reference_data: dict[str, object] | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step2Output:
     """Extract weather history: daily records, precipitation, extremes, chill hours.
 
@@ -53,7 +60,11 @@ def extract_weather_history(
     drought_streak = 0
     heat_streak = 0
 
-    thresholds = get_weather_thresholds(crop_type, reference_data)
+    thresholds = (
+        referential.weather_thresholds
+        if referential is not None
+        else get_weather_thresholds(crop_type, reference_data)
+    )
     effective_frost_threshold = (
         thresholds.frost_threshold_c if frost_threshold is None else frost_threshold
     )
@@ -109,7 +120,7 @@ def extract_weather_history(
         if drought_streak == _drought_threshold_from_config(
             current_date.month,
             crop_type,
-            reference_data=reference_data,
+            config=thresholds,
         ):
             extremes.append(
                 ExtremeEvent(
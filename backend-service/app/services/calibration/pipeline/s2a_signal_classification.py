@@ -17,6 +17,8 @@ from __future__ import annotations
 from datetime import timedelta
 from statistics import mean, median
 
+import numpy as np
+
 from ..types import (
     SignalClassificationOutput,
     Step1Output,
@@ -31,11 +33,10 @@ _SPRING_MONTHS = {4, 5, 6}
 
 def _count_cycles(satellite: Step1Output) -> int:
     """Count distinct calendar years with data (proxy for complete cycles)."""
-    years: set[int] = set()
-    for points in satellite.index_time_series.values():
-        for p in points:
-            years.add(p.date.year)
-    return len(years)
+    years = [series.years for series in satellite.index_time_series.values()]
+    if not years:
+        return 0
+    return int(np.unique(np.concatenate(years)).size)
 
 
 def _compute_baselines(
@@ -45,63 +46,54 @@ def _compute_baselines(
 
     Returns (ratio_nirv_ndvi_baseline, ndvi_peak_baseline).
     """
-    nirv_points = satellite.index_time_series.get("NIRv", [])
-    ndvi_points = satellite.index_time_series.get("NDVI", [])
+    nirv = satellite.series("NIRv")
+    ndvi = satellite.series("NDVI")
 
-    if not nirv_points or not ndvi_points:
+    if not len(nirv) or not len(ndvi):
         return None, None
 
-    # Build date→value lookups (non-outlier only)
-    nirv_by_date = {
-        p.date: p.value for p in nirv_points if not p.outlier
-    }
-    ndvi_by_date = {
-        p.date: p.value for p in ndvi_points if not p.outlier
-    }
+    # One value per date (non-outlier only)
+    nirv = nirv.without_outliers().last_per_day()
+    ndvi = ndvi.without_outliers().last_per_day()
 
     # Ratio NIRv/NDVI for July-September (REGLE_2_1.Ratio_NIRv_NDVI_ete)
-    summer_ratios: list[float] = []
-    for d, nirv_val in nirv_by_date.items():
-        if d.month not in _SUMMER_MONTHS:
-            continue
-        ndvi_val = ndvi_by_date.get(d)
-        if ndvi_val is not None and ndvi_val > 0.01:
-            summer_ratios.append(nirv_val / ndvi_val)
+    ndvi_by_day = dict(zip(ndvi.ordinals.tolist(), ndvi.values.tolist()))
+    summer = nirv.filter(np.isin(nirv.months, list(_SUMMER_MONTHS)))
+    summer_ratios = [
+        nirv_val / ndvi_by_day[day]
+        for day, nirv_val in zip(summer.ordinals.tolist(), summer.values.tolist())
+        if ndvi_by_day.get(day, 0.0) > 0.01
+    ]
 
     ratio_baseline = median(summer_ratios) if len(summer_ratios) >= 3 else None
 
     # NDVI peak per year in spring (REGLE_2_1.NDVI_pic_habituel)
-    yearly_peaks: dict[int, float] = {}
-    for d, val in ndvi_by_date.items():
-        if d.month not in _SPRING_MONTHS:
-            continue
-        if d.year not in yearly_peaks or val > yearly_peaks[d.year]:
-            yearly_peaks[d.year] = val
+    spring = ndvi.filter(np.isin(ndvi.months, list(_SPRING_MONTHS)))
+    spring_years = spring.years
+    yearly_peaks = [
+        float(spring.values[spring_years == year].max())
+        for year in np.unique(spring_years)
+    ]
 
-    ndvi_peak = median(list(yearly_peaks.values())) if len(yearly_peaks) >= 2 else None
+    ndvi_peak = median(yearly_peaks) if len(yearly_peaks) >= 2 else None
 
     return ratio_baseline, ndvi_peak
 
 
 def _latest_value(satellite: Step1Output, index: str) -> float | None:
     """Get the most recent non-outlier value for an index."""
-    points = satellite.index_time_series.get(index, [])
-    for p in reversed(sorted(points, key=lambda x: x.date)):
-        if not p.outlier:
-            return p.value
-    return None
+    series = satellite.series(index).without_outliers()
+    if not len(series):
+        return None
+    return float(series.values[-1])
 
 
 def _ndvi_declining(satellite: Step1Output) -> bool:
     """REGLE_2_5 — Check if NDVI trend is negative (dNDVI/dt ≤ 0)."""
-    ndvi_points = [
-        p for p in satellite.index_time_series.get("NDVI", [])
-        if not p.outlier
-    ]
-    if len(ndvi_points) < 2:
+    values = satellite.series("NDVI").without_outliers().values
+    if len(values) < 2:
         return False
-    ordered = sorted(ndvi_points, key=lambda p: p.date)
-    return ordered[-1].value <= ordered[-2].value
+    return bool(values[-1] <= values[-2])
 
 
 def classify_signal(
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -10,8 +9,12 @@ from ..referential_utils import (
     DEFAULT_PERIODS,
     get_phenology_periods_from_stades_bbch,
 )
+from ..series import IndexSeries
 from ..types import PercentileSet, Step1Output, Step3Output
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 # Minimum observations for meaningful percentile statistics.
 # Below this threshold, P10/P90 are unreliable noise.
@@ -19,7 +22,7 @@ MIN_PERCENTILE_SAMPLES = 10
 MIN_PERIOD_SAMPLES = 5
 
 
-def _as_percentile_set(values: list[float]) -> PercentileSet:
+def _as_percentile_set(values: list[float] | np.ndarray) -> PercentileSet:
     arr = np.array(values, dtype=np.float64)
     p10, p25, p50, p75, p90 = np.percentile(arr, [10, 25, 50, 75, 90])
     avg = float(np.mean(arr))
@@ -37,10 +40,10 @@ def _as_percentile_set(values: list[float]) -> PercentileSet:
 
 
 def _collect_period_values(
-    points: list[tuple[date, float]],
+    series: IndexSeries,
     period_months: set[int],
-) -> list[float]:
-    return [value for point_date, value in points if point_date.month in period_months]
+) -> np.ndarray:
+    return series.values[np.isin(series.months, list(period_months))]
 
 
 def calculate_percentiles(
@@ -49,42 +52,37 @@ def calculate_percentiles(
     reference_data: dict[str, Any] | None = None,
     crop_type: str | None = None,
     planting_system: str | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step3Output:
     periods = phenology_periods or DEFAULT_PERIODS
     if reference_data and crop_type:
-        ref_periods = get_phenology_periods_from_stades_bbch(reference_data)
+        ref_periods = (
+            referential.phenology_periods
+            if referential is not None
+            else get_phenology_periods_from_stades_bbch(reference_data)
+        )
         if ref_periods:
             periods = ref_periods
 
     global_percentiles: dict[str, PercentileSet] = {}
     period_percentiles: dict[str, dict[str, PercentileSet]] = defaultdict(dict)
 
-    for index, points in satellite_data.index_time_series.items():
-        if not points:
+    for index, series in satellite_data.index_time_series.items():
+        if not len(series):
             continue
 
-        observed = [
-            (point.date, point.value)
-            for point in points
-            if not point.interpolated
-        ]
-        valid = [
-            (point.date, point.value)
-            for point in points
-            if point.is_observed
-        ]
-        if not valid:
-            valid = observed
-
-        values = [value for _, value in valid]
-
-        if len(values) < MIN_PERCENTILE_SAMPLES:
+        valid = series.observed()
+        if not len(valid):
+            valid = series.without_interpolated()
+
+        if len(valid) < MIN_PERCENTILE_SAMPLES:
             continue
 
-        global_percentiles[index] = _as_percentile_set(values)
+        global_percentiles[index] = _as_percentile_set(valid.values)
 
-        first_date = min(point_date for point_date, _ in valid)
-        last_date = max(point_date for point_date, _ in valid)
+        # Series are date-sorted
+        first_date = valid.date_at(0)
+        last_date = valid.date_at(-1)
         month_span = (last_date.year - first_date.year) * 12 + (
             last_date.month - first_date.month
         )
@@ -6,14 +6,20 @@ transition thresholds, cycle months, and chill requirements.
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .s4_state_machine import (
+    SeasonTimeline,
+    cycle_input_digests,
+    transition_to_dict,
     run_state_machine,
     map_timelines_to_step4output,
 )
 from ..types import Step1Output, Step2Output, Step4Output
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 def detect_phenology(
     satellite_data: Step1Output,
@@ -24,6 +30,8 @@ def detect_phenology(
     planting_system: str | None = None,
     reference_data: dict[str, Any] | None = None,
     maturity_phase: str | None = None,
+    reuse: dict[int, SeasonTimeline] | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step4Output:
     """Detect phenological stages from satellite and weather data.
 
@@ -42,37 +50,101 @@ def detect_phenology(
         reference_data: Parsed referential JSON; all thresholds read from here.
         maturity_phase: Tree maturity phase from age_adjustment. Juvenile trees
                         use a simplified phenology (no fruiting phases).
+        reuse: Previous timelines of cycle years whose ``phenology_cycle_digests``
+               are unchanged; those years are not simulated again.
+        referential: Compiled ``reference_data`` shared across calibrations
+                     (see ``compiled_referential``); derived on the fly if None.
+    """
+    step4, _ = detect_phenology_cycles(
+        satellite_data,
+        weather_data,
+        index_key=index_key,
+        crop_type=crop_type,
+        variety=variety,
+        planting_system=planting_system,
+        reference_data=reference_data,
+        maturity_phase=maturity_phase,
+        reuse=reuse,
+        referential=referential,
+    )
+    return step4
+
+
+def detect_phenology_cycles(
+    satellite_data: Step1Output,
+    weather_data: Step2Output,
+    index_key: str = "NIRv",
+    crop_type: str | None = None,
+    variety: str | None = None,
+    planting_system: str | None = None,
+    reference_data: dict[str, Any] | None = None,
+    maturity_phase: str | None = None,
+    reuse: dict[int, SeasonTimeline] | None = None,
+    referential: CompiledReferential | None = None,
+) -> tuple[Step4Output, dict[int, list[dict]]]:
+    """``detect_phenology`` plus the transitions of newly closed cycle years.
+
+    The second element maps each closed cycle year that was simulated in this
+    call (not taken from ``reuse``) to its serialised transitions, ready to be
+    persisted in ``support.cycle_checkpoints``.
     """
     _ = index_key, planting_system  # not used by state machine; kept for call-site compat
     observed = _filter_observed(satellite_data)
-    return _run_state_machine(
+    timelines = _run_state_machine(
         observed,
         weather_data,
         crop_type=crop_type or "olivier",
         variety=variety,
         reference_data=reference_data,
         maturity_phase=maturity_phase,
+        reuse=reuse,
+        referential=referential,
+    )
+    closed = {
+        tl.year: [transition_to_dict(t) for t in tl.transitions]
+        for tl in timelines
+        if tl.closed
+    }
+    return map_timelines_to_step4output(timelines), closed
+
+
+def phenology_cycle_digests(
+    satellite_data: Step1Output,
+    weather_data: Step2Output,
+    crop_type: str | None = None,
+    variety: str | None = None,
+    reference_data: dict[str, Any] | None = None,
+    maturity_phase: str | None = None,
+    referential: CompiledReferential | None = None,
+) -> dict[int, str]:
+    """Per cycle-year digest of the state-machine inputs ``detect_phenology`` uses."""
+    weather_days, nirv_series, ndvi_series = _state_machine_inputs(
+        _filter_observed(satellite_data), weather_data
+    )
+    return cycle_input_digests(
+        weather_days=weather_days,
+        nirv_series=nirv_series,
+        ndvi_series=ndvi_series,
+        crop_type=crop_type or "olivier",
+        variety=variety,
+        reference_data=reference_data,
+        maturity_phase=maturity_phase,
+        referential=referential,
     )
 
 
 def _filter_observed(satellite_data: Step1Output) -> Step1Output:
     """Return a copy of satellite_data with outlier/interpolated points removed."""
     filtered = {
-        name: [p for p in points if p.is_observed]
-        for name, points in satellite_data.index_time_series.items()
+        name: series.observed()
+        for name, series in satellite_data.index_time_series.items()
     }
     return satellite_data.model_copy(update={"index_time_series": filtered})
 
 
-def _run_state_machine(
-    satellite_data: Step1Output,
-    weather_data: Step2Output,
-    crop_type: str = "olivier",
-    variety: str | None = None,
-    reference_data: dict[str, Any] | None = None,
-    maturity_phase: str | None = None,
-) -> Step4Output:
-    """Run the state machine for a single crop and return Step4Output."""
+def _state_machine_inputs(
+    satellite_data: Step1Output, weather_data: Step2Output
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
     weather_days = [
         {
             "date": w.date,
@@ -82,16 +154,27 @@ def _run_state_machine(
         }
         for w in weather_data.daily_weather
     ]
-    nirv_series = [
-        {"date": p.date.isoformat(), "value": p.value}
-        for p in satellite_data.index_time_series.get("NIRv", [])
-    ]
-    ndvi_series = [
-        {"date": p.date.isoformat(), "value": p.value}
-        for p in satellite_data.index_time_series.get("NDVI", [])
-    ]
+    nirv_series = satellite_data.series("NIRv").records()
+    ndvi_series = satellite_data.series("NDVI").records()
+    return weather_days, nirv_series, ndvi_series
+
+
+def _run_state_machine(
+    satellite_data: Step1Output,
+    weather_data: Step2Output,
+    crop_type: str = "olivier",
+    variety: str | None = None,
+    reference_data: dict[str, Any] | None = None,
+    maturity_phase: str | None = None,
+    reuse: dict[int, SeasonTimeline] | None = None,
+    referential: CompiledReferential | None = None,
+) -> list[SeasonTimeline]:
+    """Run the state machine for a single crop and return its season timelines."""
+    weather_days, nirv_series, ndvi_series = _state_machine_inputs(
+        satellite_data, weather_data
+    )
 
-    timelines = run_state_machine(
+    return run_state_machine(
         weather_days=weather_days,
         nirv_series=nirv_series,
         ndvi_series=ndvi_series,
@@ -99,5 +182,6 @@ def _run_state_machine(
         variety=variety,
         reference_data=reference_data,
         maturity_phase=maturity_phase,
+        reuse=reuse,
+        referential=referential,
     )
-    return map_timelines_to_step4output(timelines)
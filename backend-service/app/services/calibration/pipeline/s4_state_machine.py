@@ -57,12 +57,22 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
 
-from ..support.condition_evaluator import evaluate
-from ..support.gdd_service import compute_daily_gdd, estimate_chill_hours
-from ..support.formula_evaluator import compute_preliminary_signals
+import numpy as np
+
+from ..support.condition_evaluator import compile_condition, evaluate
+from ..support.gdd_service import (
+    compute_daily_gdd,
+    compute_daily_gdd_array,
+    estimate_chill_hours,
+)
+from ..support.formula_evaluator import compile_preliminary_signals
 from ..types import WeatherRowAccessor
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +109,9 @@ class SeasonTimeline:
     year: int
     transitions: list[PhaseTransition] = field(default_factory=list)
     mode: str = "NORMAL"  # NORMAL | AMORCAGE
+    # Simulated in this run and followed by a later cycle, so its transitions
+    # are final (see ``support.cycle_checkpoints``)
+    closed: bool = field(default=False, compare=False)
 
 
 @dataclass
@@ -181,6 +194,77 @@ def compute_daily_signals(
     )
 
 
+@dataclass
+class WeatherColumns:
+    """Columnar daily weather for one cycle year, in input row order.
+
+    Built once by ``precompute_weather_columns`` so the per-day loop reads
+    plain floats instead of re-slicing and re-summing the 30-day history.
+    Values are Python floats (``ndarray.tolist()``) to keep ``DailySignals``
+    identical to ``compute_daily_signals`` output.
+    """
+
+    tmax: list[float]
+    tmin: list[float]
+    tmoy: list[float]
+    gdd_jour: list[float]
+    precip: list[float]
+    precip_30j: list[float]
+    tmax_30j_pct: list[float]
+
+
+def precompute_weather_columns(
+    weather_rows: list[dict],
+    *,
+    tbase: float = 7.5,
+    tupper: float = 30.0,
+    heat_count_threshold: float = 30.0,
+    window: int = 30,
+) -> WeatherColumns:
+    """Vectorised equivalent of ``compute_daily_signals`` weather fields.
+
+    Row ``i``'s rolling window covers rows ``max(0, i - window + 1)..i``, the
+    same slice ``run_state_machine`` used to build ``weather_history_30d``.
+    Rolling sums use a zero-padded sliding window rather than a cumulative
+    sum so dry spells sum to exactly 0.0.
+    """
+    n = len(weather_rows)
+    tmax = np.empty(n)
+    tmin = np.empty(n)
+    precip = np.empty(n)
+    for i, row in enumerate(weather_rows):
+        wd = WeatherRowAccessor(row)
+        tmax[i] = wd.temp_max
+        tmin[i] = wd.temp_min
+        precip[i] = wd.precipitation
+
+    tmoy = (tmax + tmin) / 2.0
+    gdd_jour = compute_daily_gdd_array(tmax, tmin, tbase, tupper)
+
+    if n:
+        pad = np.zeros(window - 1)
+        windows = np.lib.stride_tricks.sliding_window_view(
+            np.concatenate([pad, precip]), window
+        )
+        precip_30j = windows.sum(axis=1)
+        hot = np.concatenate([pad, (tmax > heat_count_threshold).astype(float)])
+        hot_days = np.lib.stride_tricks.sliding_window_view(hot, window).sum(axis=1)
+        window_len = np.minimum(np.arange(1, n + 1), window)
+        tmax_30j_pct = hot_days / window_len * 100.0
+    else:
+        precip_30j = tmax_30j_pct = np.empty(0)
+
+    return WeatherColumns(
+        tmax=tmax.tolist(),
+        tmin=tmin.tolist(),
+        tmoy=tmoy.tolist(),
+        gdd_jour=gdd_jour.tolist(),
+        precip=precip.tolist(),
+        precip_30j=precip_30j.tolist(),
+        tmax_30j_pct=tmax_30j_pct.tolist(),
+    )
+
+
 # ---------------------------------------------------------------------------
 # State machine config — extracted from referential
 # ---------------------------------------------------------------------------
@@ -432,6 +516,77 @@ def load_phase_definitions(reference_data: dict | None) -> list[PhaseDefinition]
     return definitions
 
 
+@dataclass(frozen=True)
+class PhaseRules:
+    """Phase, streak and preliminary-signal rules of one referential, compiled.
+
+    Immutable, so one instance is shared by every ``CropPhaseStateMachine``
+    built from the same referential (all cycle years, all parcels).
+    """
+
+    phase_definitions: tuple[PhaseDefinition, ...]
+    phase_order: tuple[str, ...]
+    streak_definitions: dict[str, dict]
+    preliminary_formulas: dict[str, str]
+    streak_predicates: tuple[tuple[str, Callable[..., bool]], ...] = field(repr=False)
+    exit_predicates: dict[str, list[tuple[dict, Callable[..., bool]]]] = field(repr=False)
+    preliminary: Callable[[dict[str, float]], dict[str, float]] | None = field(repr=False)
+
+
+def compile_phase_rules(
+    phase_definitions: list[PhaseDefinition] | None = None,
+    streak_definitions: dict[str, dict] | None = None,
+    preliminary_formulas: dict[str, str] | None = None,
+) -> PhaseRules:
+    """Compile condition trees and formulas once; falls back to the olive defaults."""
+    phase_defs = phase_definitions if phase_definitions else _DEFAULT_PHASE_DEFINITIONS
+    streaks = (
+        streak_definitions if streak_definitions is not None
+        else dict(_DEFAULT_STREAK_DEFINITIONS)
+    )
+    formulas = preliminary_formulas or {}
+    return PhaseRules(
+        phase_definitions=tuple(phase_defs),
+        phase_order=tuple(_phase_cycle_order_from_defs(phase_defs)),
+        streak_definitions=streaks,
+        preliminary_formulas=formulas,
+        streak_predicates=tuple(
+            (name, compile_condition(condition)) for name, condition in streaks.items()
+        ),
+        exit_predicates={
+            pd.name: [(rule, compile_condition(rule["when"])) for rule in pd.exits]
+            for pd in phase_defs
+        },
+        preliminary=compile_preliminary_signals(formulas) if formulas else None,
+    )
+
+
+def phase_rules_from_referential(reference_data: dict | None) -> PhaseRules:
+    """``PhaseRules`` from ``stades_bbch``/``phases_config``, ``signaux.streaks``
+    and ``protocole_phenologique.calculs_preliminaires``.
+
+    Builds everything afresh; calibrations share the result through
+    ``compile_referential``, which caches it per referential content hash.
+    """
+    phase_defs = load_phase_definitions(reference_data)
+
+    streak_defs: dict[str, dict] | None = None
+    prelim_formulas: dict[str, str] = {}
+    if reference_data:
+        signaux = reference_data.get("signaux")
+        if isinstance(signaux, dict):
+            streaks = signaux.get("streaks")
+            if isinstance(streaks, dict) and streaks:
+                streak_defs = dict(streaks)
+        proto = reference_data.get("protocole_phenologique")
+        if isinstance(proto, dict):
+            raw = proto.get("calculs_preliminaires", {})
+            if isinstance(raw, dict):
+                prelim_formulas = {k: v for k, v in raw.items() if isinstance(v, str)}
+
+    return compile_phase_rules(phase_defs, streak_defs, prelim_formulas)
+
+
 def extract_phase_config(
     reference_data: dict | None,
     maturity_phase: str | None = None,
@@ -577,8 +732,8 @@ class CropPhaseStateMachine:
     handler functions.
 
     Phase definitions (``PhaseDefinition``) specify exit conditions as
-    JSON condition trees evaluated by ``condition_evaluator.evaluate()``.
-    Streaks (warm, cold, hot, hot_dry) are also driven by referential
+    JSON condition trees, compiled once per referential into ``PhaseRules``
+    with ``condition_evaluator.compile_condition()``.  Streaks (warm, cold, hot, hot_dry) are also driven by referential
     conditions from ``signaux.streaks``.
     """
 
@@ -591,20 +746,27 @@ class CropPhaseStateMachine:
         phase_definitions: list[PhaseDefinition] | None = None,
         streak_definitions: dict[str, dict] | None = None,
         preliminary_formulas: dict[str, str] | None = None,
+        rules: PhaseRules | None = None,
     ) -> None:
         self.tmoy_q25 = tmoy_q25
         self.cfg = config or PhaseConfig(chill_threshold=chill_threshold)
         self.chill_threshold = self.cfg.chill_threshold
 
-        # Phase definitions — use provided or defaults
-        phase_defs = phase_definitions if phase_definitions else _DEFAULT_PHASE_DEFINITIONS
+        # Referential rules, compiled once; process_day only calls closures.
+        # Precompiled ``rules`` take precedence over the raw definitions.
+        if rules is None:
+            rules = compile_phase_rules(
+                phase_definitions, streak_definitions, preliminary_formulas
+            )
         self.phases_by_name: dict[str, PhaseDefinition] = {
-            pd.name: pd for pd in phase_defs
+            pd.name: pd for pd in rules.phase_definitions
         }
-        self.phase_order: list[str] = _phase_cycle_order_from_defs(phase_defs)
-
-        # Referential formulas (calculs_preliminaires)
-        self.preliminary_formulas: dict[str, str] = preliminary_formulas or {}
+        self.phase_order: list[str] = list(rules.phase_order)
+        self.preliminary_formulas: dict[str, str] = rules.preliminary_formulas
+        self.streak_definitions: dict[str, dict] = rules.streak_definitions
+        self._streak_predicates = rules.streak_predicates
+        self._exit_predicates = rules.exit_predicates
+        self._preliminary = rules.preliminary
 
         # Peak/min tracking for derived signals (reset each cycle)
         self.ndvi_peak: float = 0.0
@@ -612,11 +774,6 @@ class CropPhaseStateMachine:
         self.nirv_min_hist: float = float("inf")
         self.nirv_max_hist: float = float("-inf")
 
-        # Streak definitions and counters
-        self.streak_definitions: dict[str, dict] = (
-            streak_definitions if streak_definitions is not None
-            else dict(_DEFAULT_STREAK_DEFINITIONS)
-        )
         self.streak_counters: dict[str, int] = {
             name: 0 for name in self.streak_definitions
         }
@@ -686,8 +843,8 @@ class CropPhaseStateMachine:
             "precip_30j": signals.precip_30j,
             "Tmoy_Q25": self.tmoy_q25,
         }
-        for name, condition in self.streak_definitions.items():
-            if evaluate(condition, raw_ctx):
+        for name, predicate in self._streak_predicates:
+            if predicate(raw_ctx):
                 self.streak_counters[name] = self.streak_counters.get(name, 0) + 1
             else:
                 self.streak_counters[name] = 0
@@ -696,10 +853,10 @@ class CropPhaseStateMachine:
         context = self._build_context(signals)
 
         # Evaluate exit conditions for current phase
-        phase_def = self.phases_by_name.get(self.current_phase)
-        if phase_def:
-            for exit_rule in phase_def.exits:
-                matched = evaluate(exit_rule["when"], context)
+        exits = self._exit_predicates.get(self.current_phase)
+        if exits:
+            for exit_rule, predicate in exits:
+                matched = predicate(context)
                 # Debug: log exit condition evaluation
                 if signals.current_date.day == 1:  # log once per month to avoid spam
                     logger.debug(
@@ -791,9 +948,8 @@ class CropPhaseStateMachine:
         ctx.update(self.streak_counters)
 
         # Compute referential calculs_preliminaires formulas
-        if self.preliminary_formulas:
-            derived = compute_preliminary_signals(self.preliminary_formulas, ctx)
-            ctx.update(derived)
+        if self._preliminary is not None:
+            ctx.update(self._preliminary(ctx))
 
         return ctx
 
@@ -848,6 +1004,27 @@ class CropPhaseStateMachine:
         self.current_phase = resolved
 
 
+def transition_to_dict(t: PhaseTransition) -> dict:
+    return {
+        "phase": t.phase if isinstance(t.phase, str) else t.phase.value,
+        "start_date": t.start_date.isoformat(),
+        "end_date": t.end_date.isoformat() if t.end_date else None,
+        "gdd_at_entry": t.gdd_at_entry,
+        "confidence": t.confidence,
+    }
+
+
+def _transition_from_dict(raw: dict) -> PhaseTransition:
+    end_date = raw.get("end_date")
+    return PhaseTransition(
+        phase=raw["phase"],
+        start_date=date.fromisoformat(str(raw["start_date"])[:10]),
+        end_date=date.fromisoformat(str(end_date)[:10]) if end_date else None,
+        gdd_at_entry=float(raw.get("gdd_at_entry", 0.0)),
+        confidence=raw.get("confidence", "MODEREE"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Full-season runner
 # ---------------------------------------------------------------------------
@@ -856,7 +1033,9 @@ from ..referential_utils import (
     get_cycle_months_from_stades_bbch,
     cycle_year_for_date,
     get_gdd_tbase_tupper,
+    referential_content_hash,
 )
+from ..support.incremental import content_hash
 from collections import defaultdict
 from statistics import mean as _mean
 from datetime import timedelta
@@ -885,6 +1064,114 @@ def _build_satellite_lookup(series: list[dict]) -> dict[str, float]:
     return lookup
 
 
+# Bump when the simulation changes so digests from older runs stop matching
+_CYCLE_DIGEST_VERSION = 1
+
+
+def _cycle_months(
+    reference_data: dict | None, referential: CompiledReferential | None
+) -> tuple[int, int] | None:
+    if referential is not None:
+        return referential.cycle_months
+    if reference_data:
+        return get_cycle_months_from_stades_bbch(reference_data)
+    return None
+
+
+def _group_weather_by_cycle(
+    weather_days: list[dict], cycle_months: tuple[int, int] | None
+) -> dict[int, list[dict]]:
+    """Date-sorted weather rows per cycle year (olive: Dec-Nov, from the referential)."""
+    start_month = cycle_months[0] if cycle_months else 12
+    end_month = cycle_months[1] if cycle_months else 11
+
+    sorted_weather = sorted(weather_days, key=lambda w: str(w.get("date", "")))
+    weather_by_year: dict[int, list[dict]] = defaultdict(list)
+    for w in sorted_weather:
+        raw_date = w.get("date")
+        if raw_date is None:
+            continue
+        if isinstance(raw_date, str):
+            d = date.fromisoformat(raw_date[:10])
+        else:
+            d = raw_date
+        cy = cycle_year_for_date(d, start_month, end_month)
+        weather_by_year[cy].append(w)
+    return weather_by_year
+
+
+def _is_complete_cycle(year_weather: list[dict]) -> bool:
+    """At least 120 weather days spanning at least 120 days."""
+    if len(year_weather) < 120:
+        return False
+    first_date = _parse_date(year_weather[0].get("date"))
+    last_date = _parse_date(year_weather[-1].get("date"))
+    return not (first_date and last_date and (last_date - first_date).days < 120)
+
+
+def timelines_from_phase_timeline(
+    phase_timeline: list[dict] | None,
+) -> dict[int, SeasonTimeline]:
+    """Rebuild ``SeasonTimeline`` objects from ``Step4Output.phase_timeline``."""
+    timelines: dict[int, SeasonTimeline] = {}
+    for entry in phase_timeline or []:
+        transitions = [_transition_from_dict(t) for t in entry.get("transitions", [])]
+        year = int(entry["year"])
+        timelines[year] = SeasonTimeline(
+            year=year, transitions=transitions, mode=entry.get("mode", "NORMAL")
+        )
+    return timelines
+
+
+def timeline_from_transitions(year: int, transitions: list[dict]) -> SeasonTimeline:
+    """``SeasonTimeline`` of a closed cycle year from its stored transitions."""
+    return SeasonTimeline(
+        year=year, transitions=[_transition_from_dict(t) for t in transitions]
+    )
+
+
+def cycle_input_digests(
+    *,
+    weather_days: list[dict],
+    nirv_series: list[dict],
+    ndvi_series: list[dict],
+    crop_type: str = "olivier",
+    variety: str | None = None,
+    reference_data: dict | None = None,
+    maturity_phase: str | None = None,
+    referential: CompiledReferential | None = None,
+) -> dict[int, str]:
+    """Digest of everything ``run_state_machine`` reads for each cycle year.
+
+    Each cycle year runs on a fresh machine, so a year whose digest matches a
+    previous run's yields the same transitions and can be passed as ``reuse``.
+    """
+    config_key = (
+        _CYCLE_DIGEST_VERSION,
+        crop_type,
+        variety,
+        maturity_phase,
+        referential.content_hash
+        if referential is not None
+        else referential_content_hash(reference_data),
+    )
+    nirv_lookup = _build_satellite_lookup(nirv_series)
+    ndvi_lookup = _build_satellite_lookup(ndvi_series)
+
+    digests: dict[int, str] = {}
+    for year, year_weather in _group_weather_by_cycle(
+        weather_days, _cycle_months(reference_data, referential)
+    ).items():
+        day_keys = [str(w.get("date"))[:10] for w in year_weather]
+        digests[year] = content_hash(
+            config_key,
+            year_weather,
+            [nirv_lookup.get(k) for k in day_keys],
+            [ndvi_lookup.get(k) for k in day_keys],
+        )
+    return digests
+
+
 def run_state_machine(
     *,
     weather_days: list[dict],
@@ -894,6 +1181,8 @@ def run_state_machine(
     variety: str | None = None,
     reference_data: dict | None = None,
     maturity_phase: str | None = None,
+    reuse: dict[int, SeasonTimeline] | None = None,
+    referential: CompiledReferential | None = None,
 ) -> list[SeasonTimeline]:
     """Run the referential-driven phenology state machine for any crop.
 
@@ -935,34 +1224,34 @@ def run_state_machine(
         maturity_phase: Tree maturity phase (``JUVENILE``, ``PLEINE_PRODUCTION``,
                         etc.).  Controls which phases are active — juvenile trees
                         may skip fruiting phases if ``phases_par_maturite`` defines it.
+        reuse: Timelines of cycle years whose inputs are known to be unchanged
+               (see ``cycle_input_digests``); those years are not simulated.
+        referential: ``compile_referential(crop_type, reference_data)``; when
+                     given, steps 1-6 are read from it instead of re-derived.
 
     Returns:
         List of ``SeasonTimeline`` objects, one per complete agronomic cycle year.
+        Simulated years that are closed (weather exists for a later cycle) are
+        marked ``closed``.
     """
     if not weather_days:
         return []
 
     # All thresholds from referential — no crop-specific hardcoding below this line.
-    cfg = extract_phase_config(reference_data, maturity_phase=maturity_phase)
-    gdd_ref = reference_data.get("gdd") if reference_data else None
-    cfg.chill_threshold = resolve_chill_threshold(variety, gdd_ref, reference_data)
-
-    # Load structured phase definitions from referential (or use defaults)
-    phase_defs = load_phase_definitions(reference_data)
-    if not phase_defs:
-        phase_defs = list(_DEFAULT_PHASE_DEFINITIONS)
-
-    # Load streak definitions from referential signaux.streaks (or use defaults)
-    streak_defs: dict[str, dict] | None = None
-    if reference_data:
-        signaux = reference_data.get("signaux")
-        if isinstance(signaux, dict):
-            streaks = signaux.get("streaks")
-            if isinstance(streaks, dict) and streaks:
-                streak_defs = dict(streaks)
+    if referential is not None:
+        cfg = referential.phase_config(maturity_phase)
+        cfg.chill_threshold = referential.chill_threshold(variety)
+        rules = referential.phase_rules
+        ref_tbase, ref_tupper = referential.gdd_tbase_tupper
+    else:
+        cfg = extract_phase_config(reference_data, maturity_phase=maturity_phase)
+        gdd_ref = reference_data.get("gdd") if reference_data else None
+        cfg.chill_threshold = resolve_chill_threshold(variety, gdd_ref, reference_data)
+        # Phase definitions, streaks and calculs_preliminaires (or defaults)
+        rules = phase_rules_from_referential(reference_data)
+        ref_tbase, ref_tupper = get_gdd_tbase_tupper(crop_type, reference_data)
 
     # GDD formula: tbase and tupper read from referential, with per-crop fallbacks.
-    ref_tbase, ref_tupper = get_gdd_tbase_tupper(crop_type, reference_data)
     gdd_tbase = ref_tbase if ref_tbase is not None else 7.5
     gdd_tupper = ref_tupper if ref_tupper is not None else 30.0
 
@@ -970,38 +1259,25 @@ def run_state_machine(
     nirv_lookup = _build_satellite_lookup(nirv_series)
     ndvi_lookup = _build_satellite_lookup(ndvi_series)
 
-    # Get cycle months from referential (olive: Dec-Nov)
-    cycle_months = None
-    if reference_data:
-        cycle_months = get_cycle_months_from_stades_bbch(reference_data)
-    start_month = cycle_months[0] if cycle_months else 12
-    end_month = cycle_months[1] if cycle_months else 11
-
-    # Group weather days by cycle year
-    sorted_weather = sorted(weather_days, key=lambda w: str(w.get("date", "")))
-    weather_by_year: dict[int, list[dict]] = defaultdict(list)
-    for w in sorted_weather:
-        raw_date = w.get("date")
-        if raw_date is None:
-            continue
-        if isinstance(raw_date, str):
-            d = date.fromisoformat(raw_date[:10])
-        else:
-            d = raw_date
-        cy = cycle_year_for_date(d, start_month, end_month)
-        weather_by_year[cy].append(w)
+    weather_by_year = _group_weather_by_cycle(
+        weather_days, _cycle_months(reference_data, referential)
+    )
+    open_year = max(weather_by_year) if weather_by_year else None
 
     timelines: list[SeasonTimeline] = []
 
     for year in sorted(weather_by_year.keys()):
         year_weather = weather_by_year[year]
-        if len(year_weather) < 120:
+        if not _is_complete_cycle(year_weather):
             continue
 
-        # Check date span
-        first_date = _parse_date(year_weather[0].get("date"))
-        last_date = _parse_date(year_weather[-1].get("date"))
-        if first_date and last_date and (last_date - first_date).days < 120:
+        if reuse and year in reuse:
+            # Cycle inputs unchanged since the run that produced it
+            timelines.append(SeasonTimeline(
+                year=year,
+                transitions=reuse[year].transitions,
+                mode="AMORCAGE" if len(timelines) < 3 else "NORMAL",
+            ))
             continue
 
         cycle_tmoy_q25 = _compute_tmoy_q25(year_weather)
@@ -1011,22 +1287,11 @@ def run_state_machine(
             "yes" if cycle_tmoy_q25 >= 15 else "no",
         )
 
-        # Load calculs_preliminaires formulas from referential
-        prelim_formulas: dict[str, str] = {}
-        if reference_data:
-            proto = reference_data.get("protocole_phenologique")
-            if isinstance(proto, dict):
-                raw = proto.get("calculs_preliminaires", {})
-                if isinstance(raw, dict):
-                    prelim_formulas = {k: v for k, v in raw.items() if isinstance(v, str)}
-
         # Create state machine for this year
         machine = CropPhaseStateMachine(
             tmoy_q25=cycle_tmoy_q25,
             config=cfg,
-            phase_definitions=phase_defs,
-            streak_definitions=streak_defs,
-            preliminary_formulas=prelim_formulas,
+            rules=rules,
         )
         machine._gdd_tbase = gdd_tbase
         machine._gdd_tupper = gdd_tupper
@@ -1036,15 +1301,15 @@ def run_state_machine(
         prev_ndvi: float | None = None
         prev_sat_date: date | None = None
 
+        columns = precompute_weather_columns(
+            year_weather, tbase=gdd_tbase, tupper=gdd_tupper
+        )
+
         for i, w in enumerate(year_weather):
             d = _parse_date(w.get("date"))
             if d is None:
                 continue
 
-            # Build 30-day weather history
-            start_idx = max(0, i - 29)
-            history_30d = year_weather[start_idx:i + 1]
-
             # Satellite lookup for this day
             date_key = d.isoformat()
             nirv_val = nirv_lookup.get(date_key)
@@ -1054,17 +1319,26 @@ def run_state_machine(
             if prev_sat_date and (nirv_val is not None or ndvi_val is not None):
                 days_since = max(1, (d - prev_sat_date).days)
 
-            signals = compute_daily_signals(
+            d_nirv_dt: float | None = None
+            d_ndvi_dt: float | None = None
+            if nirv_val is not None and prev_nirv is not None:
+                d_nirv_dt = (nirv_val - prev_nirv) / days_since
+            if ndvi_val is not None and prev_ndvi is not None:
+                d_ndvi_dt = (ndvi_val - prev_ndvi) / days_since
+
+            signals = DailySignals(
                 current_date=d,
-                weather_day=w,
-                weather_history_30d=history_30d,
-                satellite_nirv=nirv_val,
-                satellite_ndvi=ndvi_val,
-                prev_nirv=prev_nirv,
-                prev_ndvi=prev_ndvi,
-                days_since_prev_satellite=days_since,
-                tbase=gdd_tbase,
-                tupper=gdd_tupper,
+                tmax=columns.tmax[i],
+                tmin=columns.tmin[i],
+                tmoy=columns.tmoy[i],
+                gdd_jour=columns.gdd_jour[i],
+                precip=columns.precip[i],
+                precip_30j=columns.precip_30j[i],
+                tmax_30j_pct=columns.tmax_30j_pct[i],
+                d_nirv_dt=d_nirv_dt,
+                d_ndvi_dt=d_ndvi_dt,
+                nirv=nirv_val,
+                ndvi=ndvi_val,
             )
             machine.process_day(signals)
 
@@ -1089,6 +1363,7 @@ def run_state_machine(
             year=year,
             transitions=machine.transitions,
             mode=mode,
+            closed=year != open_year,
         ))
 
     return timelines
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from datetime import timedelta
 from statistics import mean, pstdev
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from ..referential_utils import get_satellite_thresholds_from_referential
 from ..types import AnomalyRecord, Step1Output, Step2Output, Step4Output, Step5Output
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 def _nearest_weather_event(step2: Step2Output, target_date) -> str | None:
     for event in step2.extreme_events:
@@ -36,24 +39,28 @@ def detect_anomalies(
     reference_data: dict[str, Any] | None = None,
     planting_system: str | None = None,
     crop_type: str | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step5Output:
     _ = (phenology, age_adjustment)
 
     anomalies: list[AnomalyRecord] = []
 
-    for index, points in satellite.index_time_series.items():
-        observed_points = [
-            point for point in points if point.is_observed
-        ]
-        if len(observed_points) < 6:
+    for index, series in satellite.index_time_series.items():
+        observed = series.observed()
+        if len(observed) < 6:
             continue
 
-        ordered = sorted(observed_points, key=lambda point: point.date)
+        # Series are date-sorted
+        ordered = observed.to_points()
 
         # Referential thresholds: flag points below alerte (and optionally below vigilance)
         if reference_data and planting_system:
-            thresholds = get_satellite_thresholds_from_referential(
-                reference_data, planting_system, index
+            thresholds = (
+                referential.satellite_thresholds(planting_system, index)
+                if referential is not None
+                else get_satellite_thresholds_from_referential(
+                    reference_data, planting_system, index
+                )
             )
             if thresholds:
                 alerte = thresholds.get("alerte")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 from ..referential_utils import (
     get_phase_boundaries_from_reference,
@@ -16,6 +18,9 @@ from ..types import (
     YieldPotential,
 )
 
+if TYPE_CHECKING:
+    from ..compiled_referential import CompiledReferential
+
 
 def _extract_reference_range(value: Any) -> tuple[float, float]:
     if isinstance(value, (int, float)):
@@ -43,8 +48,13 @@ def _resolve_bracket(
     age: int,
     rendement_map: dict[str, Any],
     reference_data: dict[str, Any],
+    referential: CompiledReferential | None = None,
 ) -> tuple[str, tuple[float, float]]:
-    boundaries = get_phase_boundaries_from_reference(reference_data)
+    boundaries = (
+        referential.phase_boundaries
+        if referential is not None
+        else get_phase_boundaries_from_reference(reference_data)
+    )
     best: tuple[str, tuple[float, float], int] | None = None
     has_age_scoped_entries = False
 
@@ -81,17 +91,16 @@ def _round_yearly_means(yearly_means: dict[int, float]) -> dict[int, float]:
 def _detect_olive_alternance(
     *, satellite_data: Step1Output, current_year: int
 ) -> AlternanceInfo:
-    ndvi_points = satellite_data.index_time_series.get("NDVI", [])
+    ndvi = satellite_data.series("NDVI")
 
-    yearly_values: dict[int, list[float]] = {}
-    for point in ndvi_points:
-        year_values = yearly_values.setdefault(point.date.year, [])
-        year_values.append(point.value)
-
-    yearly_means: dict[int, float] = {}
-    for year, values in yearly_values.items():
-        if values:
-            yearly_means[year] = sum(values) / len(values)
+    years, inverse, counts = np.unique(
+        ndvi.years, return_inverse=True, return_counts=True
+    )
+    sums = np.bincount(inverse, weights=ndvi.values, minlength=years.size)
+    yearly_means: dict[int, float] = {
+        int(year): float(total / count)
+        for year, total, count in zip(years, sums, counts)
+    }
 
     if len(yearly_means) < 3:
         return AlternanceInfo(
@@ -189,6 +198,7 @@ def calculate_yield_potential(
     plant_count: int | None = None,
     area_hectares: float | None = None,
     density_per_hectare: int | None = None,
+    referential: CompiledReferential | None = None,
 ) -> Step6Output:
     _ = (crop_type, maturity_phase)
 
@@ -199,7 +209,9 @@ def calculate_yield_potential(
     rendement_map = profile.yield_curve if profile is not None else {}
     reference_unit = profile.yield_unit if profile is not None else "kg/tree"
 
-    bracket, (min_ref, max_ref) = _resolve_bracket(age, rendement_map, reference_data)
+    bracket, (min_ref, max_ref) = _resolve_bracket(
+        age, rendement_map, reference_data, referential
+    )
     historical_avg = _historical_average(harvest_records)
 
     has_density = (density_per_hectare is not None and density_per_hectare > 0) or (
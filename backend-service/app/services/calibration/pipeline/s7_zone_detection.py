@@ -6,6 +6,7 @@ from typing import Any, Literal, cast
 import numpy as np
 from numpy.typing import NDArray
 
+from ..series import IndexSeries
 from ..types import GeoJsonFeatureCollection, NutritionalZones, PercentileSet, Step7Output, ZoneSummary
 
 
@@ -37,11 +38,11 @@ def _pattern_type(class_counts: Counter[str], total: int) -> str:
 
 def _build_raster(
     ndvi_raster_pixels: list[dict[str, Any]] | None,
-    observed_ndvi_points: list[Any] | None,
+    observed_ndvi_points: IndexSeries | None,
 ) -> tuple[NDArray[np.float64], bool, list[dict[str, float]] | None]:
     """Build raster array from raw pixel data. Returns (raster, has_real_zones, pixel_coords)."""
     fallback_values = (
-        [p.value for p in observed_ndvi_points] if observed_ndvi_points else [0.0]
+        observed_ndvi_points.values if observed_ndvi_points else [0.0]
     )
     median_ndvi = float(np.median(fallback_values))
 
@@ -145,9 +146,9 @@ def classify_zones(
     percentiles: PercentileSet,
     *,
     ndvi_raster_pixels: list[dict[str, Any]] | None = None,
-    observed_ndvi_points: list[Any] | None = None,
+    observed_ndvi_points: IndexSeries | None = None,
     gci_percentiles: PercentileSet | None = None,
-    observed_gci_points: list[Any] | None = None,
+    observed_gci_points: IndexSeries | None = None,
     pixel_size_m2: float = 100.0,
 ) -> Step7Output:
     """Classify parcel zones: NDVI (vigor) + GCI (nutritional/chlorophyll).
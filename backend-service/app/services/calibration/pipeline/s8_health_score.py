@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from statistics import median
+import numpy as np
 
 from ..types import (
     HealthScore,
@@ -25,19 +25,16 @@ def _clamp(value: float) -> float:
 def _rolling_median(
     step1: Step1Output, index: str, window: int = _ROLLING_WINDOW
 ) -> float:
-    points = step1.index_time_series.get(index, [])
-    if not points:
-        return 0.0
-
-    observed = [p for p in points if not p.interpolated]
-    valid = [p for p in observed if not p.outlier]
-    if not valid:
+    series = step1.series(index)
+    observed = series.without_interpolated()
+    valid = observed.without_outliers()
+    if not len(valid):
         valid = observed
-    if not valid:
+    if not len(valid):
         return 0.0
 
-    sorted_pts = sorted(valid, key=lambda item: item.date)[-window:]
-    return float(median(p.value for p in sorted_pts))
+    # Series are date-sorted
+    return float(np.median(valid.values[-window:]))
 
 
 def _temporal_homogeneity(step3: Step3Output) -> float:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
@@ -871,6 +872,18 @@ def get_gdd_tbase_tupper(
     return tbase, tupper
 
 
+def referential_content_hash(reference_data: dict[str, Any] | None) -> str:
+    """Stable digest of a referential's content, independent of key order.
+
+    Used to share parsed referential structures between runs that received
+    equal referentials as distinct dict objects (e.g. one per batch item).
+    """
+    if not reference_data:
+        return ""
+    payload = json.dumps(reference_data, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
 def clear_gdd_referential_cache() -> None:
     """Clear LRU cache (for tests that swap referential files)."""
     _load_referential_data_from_file.cache_clear()
@@ -0,0 +1,226 @@
+"""Columnar index time series used inside the calibration pipeline.
+
+``Step1Output.index_time_series`` used to hold one Pydantic ``IndexTimePoint``
+per observed or interpolated day, which for a multi-year history means tens of
+thousands of model instances that every later stage re-filtered with list
+comprehensions. :class:`IndexSeries` stores the same data as three parallel
+arrays (date ordinals, float64 values, a uint8 bit field for the
+outlier/interpolated flags) sorted by date, so stages filter with boolean masks.
+
+It still behaves as a read-only sequence of ``IndexTimePoint`` for code that
+iterates points, and validates from / serialises to the ``list[IndexTimePoint]``
+shape, so the API payload and stored calibrations are unchanged.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+from pydantic_core import core_schema
+
+FLAG_OUTLIER = 1
+FLAG_INTERPOLATED = 2
+
+# date(1970, 1, 1).toordinal(); ordinals are shifted onto the datetime64 epoch
+_EPOCH_ORDINAL = 719163
+
+
+class IndexSeries:
+    """Date-sorted (ordinal, value, flags) columns for one index."""
+
+    __slots__ = ("ordinals", "values", "flags")
+
+    def __init__(
+        self,
+        ordinals: Any,
+        values: Any,
+        flags: Any | None = None,
+    ) -> None:
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.flags = (
+            np.zeros(self.ordinals.shape, dtype=np.uint8)
+            if flags is None
+            else np.asarray(flags, dtype=np.uint8)
+        )
+
+    @classmethod
+    def empty(cls) -> "IndexSeries":
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+    @classmethod
+    def from_points(cls, points: Iterable[Any]) -> "IndexSeries":
+        """Build from ``IndexTimePoint``-like objects; sorts by date (stable)."""
+        points = list(points)
+        if not points:
+            return cls.empty()
+        ordinals = np.fromiter(
+            (p.date.toordinal() for p in points), dtype=np.int64, count=len(points)
+        )
+        values = np.fromiter(
+            (p.value for p in points), dtype=np.float64, count=len(points)
+        )
+        flags = np.fromiter(
+            (
+                (FLAG_OUTLIER if p.outlier else 0)
+                | (FLAG_INTERPOLATED if p.interpolated else 0)
+                for p in points
+            ),
+            dtype=np.uint8,
+            count=len(points),
+        )
+        order = np.argsort(ordinals, kind="stable")
+        return cls(ordinals[order], values[order], flags[order])
+
+    # --- masks and filtering -------------------------------------------------
+
+    @property
+    def outlier_mask(self) -> np.ndarray:
+        return (self.flags & FLAG_OUTLIER).astype(bool)
+
+    @property
+    def interpolated_mask(self) -> np.ndarray:
+        return (self.flags & FLAG_INTERPOLATED).astype(bool)
+
+    @property
+    def observed_mask(self) -> np.ndarray:
+        """Real data: neither interpolated nor an outlier."""
+        return self.flags == 0
+
+    def filter(self, mask: np.ndarray) -> "IndexSeries":
+        return IndexSeries(self.ordinals[mask], self.values[mask], self.flags[mask])
+
+    def observed(self) -> "IndexSeries":
+        return self.filter(self.observed_mask)
+
+    def without_outliers(self) -> "IndexSeries":
+        return self.filter(~self.outlier_mask)
+
+    def without_interpolated(self) -> "IndexSeries":
+        return self.filter(~self.interpolated_mask)
+
+    def last_per_day(self) -> "IndexSeries":
+        """Keep the last point of each date, like building a ``{date: value}`` dict."""
+        if len(self) < 2:
+            return self
+        keep = np.append(self.ordinals[1:] != self.ordinals[:-1], True)
+        return self.filter(keep)
+
+    # --- calendar columns ----------------------------------------------------
+
+    @property
+    def datetimes(self) -> np.ndarray:
+        """Dates as ``datetime64[D]``."""
+        return (self.ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+
+    @property
+    def years(self) -> np.ndarray:
+        return self.datetimes.astype("datetime64[Y]").astype(np.int64) + 1970
+
+    @property
+    def months(self) -> np.ndarray:
+        return self.datetimes.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+    @property
+    def dates(self) -> list[date]:
+        return [date.fromordinal(int(o)) for o in self.ordinals]
+
+    def date_at(self, position: int) -> date:
+        return date.fromordinal(int(self.ordinals[position]))
+
+    def records(self) -> list[dict[str, Any]]:
+        """``[{"date": "YYYY-MM-DD", "value": float}]`` as the state machine expects."""
+        return [
+            {"date": d.isoformat(), "value": v}
+            for d, v in zip(self.dates, self.values.tolist())
+        ]
+
+    # --- IndexTimePoint sequence view ----------------------------------------
+
+    def to_points(self) -> list[Any]:
+        from .types import IndexTimePoint
+
+        return [
+            IndexTimePoint(
+                date=d,
+                value=v,
+                outlier=bool(f & FLAG_OUTLIER),
+                interpolated=bool(f & FLAG_INTERPOLATED),
+            )
+            for d, v, f in zip(self.dates, self.values.tolist(), self.flags.tolist())
+        ]
+
+    def __len__(self) -> int:
+        return int(self.ordinals.shape[0])
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.to_points())
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, slice):
+            return IndexSeries(
+                self.ordinals[item], self.values[item], self.flags[item]
+            )
+        from .types import IndexTimePoint
+
+        flags = int(self.flags[item])
+        return IndexTimePoint(
+            date=self.date_at(item),
+            value=float(self.values[item]),
+            outlier=bool(flags & FLAG_OUTLIER),
+            interpolated=bool(flags & FLAG_INTERPOLATED),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IndexSeries):
+            return (
+                np.array_equal(self.ordinals, other.ordinals)
+                and np.array_equal(self.values, other.values)
+                and np.array_equal(self.flags, other.flags)
+            )
+        if isinstance(other, (list, tuple)):
+            return self.to_points() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"IndexSeries(n={len(self)}, outliers={int(self.outlier_mask.sum())}, interpolated={int(self.interpolated_mask.sum())})"
+
+    # --- Pydantic integration ------------------------------------------------
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        from .types import IndexTimePoint
+
+        from_points = core_schema.chain_schema(
+            [
+                handler.generate_schema(list[IndexTimePoint]),
+                core_schema.no_info_plain_validator_function(cls.from_points),
+            ]
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_points,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_points]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize
+            ),
+        )
+
+    @staticmethod
+    def _serialize(series: "IndexSeries") -> list[dict[str, Any]]:
+        return [
+            {
+                "date": d,
+                "value": v,
+                "outlier": bool(f & FLAG_OUTLIER),
+                "interpolated": bool(f & FLAG_INTERPOLATED),
+            }
+            for d, v, f in zip(
+                series.dates, series.values.tolist(), series.flags.tolist()
+            )
+        ]
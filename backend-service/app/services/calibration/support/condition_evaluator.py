@@ -3,11 +3,20 @@ Generic condition evaluator for JSON condition trees.
 
 Walks a nested condition structure and evaluates it against a flat context dict.
 Used by the calibration state machine to decide crop-stage transitions.
+
+Condition trees are compiled into nested closures (``compile_condition``) so
+callers that evaluate the same referential rules every simulated day resolve
+combinators and operator keys once instead of re-probing the raw JSON.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+Diagnostics = Optional[List[Dict[str, Any]]]
+Predicate = Callable[[Dict[str, Any], Diagnostics], bool]
 
 
 def evaluate(
@@ -38,6 +47,51 @@ def evaluate(
     ValueError
         If *condition* is a bare list (not wrapped in and/or/not).
     """
+    return _compile(condition)(context, diagnostics)
+
+
+def compile_condition(condition: Any) -> Predicate:
+    """Compile a JSON condition tree into a reusable predicate.
+
+    The returned callable takes ``(context, diagnostics=None)`` and behaves
+    exactly like :func:`evaluate`. Compiled predicates are cached by the
+    canonical JSON content of the tree, so identical referential rules share
+    one compiled instance across state-machine runs.
+    """
+    try:
+        canonical = json.dumps(condition, sort_keys=True)
+    except (TypeError, ValueError):
+        return _with_default_diagnostics(_compile(condition))
+    return _compile_canonical(canonical)
+
+
+@lru_cache(maxsize=1024)
+def _compile_canonical(canonical: str) -> Predicate:
+    return _with_default_diagnostics(_compile(json.loads(canonical)))
+
+
+def _with_default_diagnostics(predicate: Predicate) -> Predicate:
+    def run(context: Dict[str, Any], diagnostics: Diagnostics = None) -> bool:
+        return predicate(context, diagnostics)
+
+    return run
+
+
+def _compile(condition: Any) -> Predicate:
+    """Compile one node. Malformed nodes raise when evaluated, not when compiled,
+    so an invalid branch that short-circuiting never reaches stays harmless."""
+    try:
+        return _compile_node(condition)
+    except Exception as exc:
+        error = exc
+
+        def fail(context: Dict[str, Any], diagnostics: Diagnostics) -> bool:
+            raise error
+
+        return fail
+
+
+def _compile_node(condition: Any) -> Predicate:
     if isinstance(condition, list):
         raise ValueError(
             "Bare list conditions are not supported. "
@@ -46,16 +100,19 @@ def evaluate(
 
     # -- Boolean combinators ------------------------------------------------
     if "and" in condition:
-        return all(evaluate(c, context, diagnostics) for c in condition["and"])
+        parts = [_compile(c) for c in condition["and"]]
+        return lambda ctx, diag: all(p(ctx, diag) for p in parts)
 
     if "or" in condition:
-        return any(evaluate(c, context, diagnostics) for c in condition["or"])
+        parts = [_compile(c) for c in condition["or"]]
+        return lambda ctx, diag: any(p(ctx, diag) for p in parts)
 
     if "not" in condition:
-        return not evaluate(condition["not"], context, diagnostics)
+        inner = _compile(condition["not"])
+        return lambda ctx, diag: not inner(ctx, diag)
 
     # -- Atomic clause ------------------------------------------------------
-    return _evaluate_atomic(condition, context, diagnostics)
+    return _compile_atomic(condition)
 
 
 # Operator helpers mapping op-name → comparison function (actual, expected)
@@ -78,42 +135,60 @@ _VAR_OPS: Dict[str, Any] = {
 }
 
 
-def _evaluate_atomic(
-    clause: Dict[str, Any],
-    context: Dict[str, Any],
-    diagnostics: Optional[List[Dict[str, Any]]],
-) -> bool:
+def _compile_atomic(clause: Dict[str, Any]) -> Predicate:
     var_name: str = clause["var"]
-    actual = context.get(var_name)
+    missing_op = _detect_op(clause)
+    missing_expected = _detect_expected(clause)
 
-    if actual is None and var_name not in context:
+    def missing(context: Dict[str, Any], diagnostics: Diagnostics) -> bool:
         # Missing variable → False
-        _record(diagnostics, var_name, _detect_op(clause), _detect_expected(clause), None, False)
+        _record(diagnostics, var_name, missing_op, missing_expected, None, False)
         return False
 
     # --- var-vs-var operators ----------------------------------------------
     for op_key, cmp_fn in _VAR_OPS.items():
         if op_key in clause:
             ref_name = clause[op_key]
-            if ref_name not in context:
-                _record(diagnostics, var_name, op_key, ref_name, actual, False)
-                return False
             factor = clause.get("factor", 1.0)
-            ref_val = context[ref_name] * factor
-            result = cmp_fn(actual, ref_val)
-            _record(diagnostics, var_name, op_key, ref_val, actual, result)
-            return result
+
+            def var_op(context: Dict[str, Any], diagnostics: Diagnostics,
+                       op_key=op_key, cmp_fn=cmp_fn) -> bool:
+                actual = context.get(var_name)
+                if actual is None and var_name not in context:
+                    return missing(context, diagnostics)
+                if ref_name not in context:
+                    _record(diagnostics, var_name, op_key, ref_name, actual, False)
+                    return False
+                ref_val = context[ref_name] * factor
+                result = cmp_fn(actual, ref_val)
+                _record(diagnostics, var_name, op_key, ref_val, actual, result)
+                return result
+
+            return var_op
 
     # --- constant operators ------------------------------------------------
     for op_key, cmp_fn in _CONST_OPS.items():
         if op_key in clause:
             expected = clause[op_key]
-            result = cmp_fn(actual, expected)
-            _record(diagnostics, var_name, op_key, expected, actual, result)
-            return result
+
+            def const_op(context: Dict[str, Any], diagnostics: Diagnostics,
+                         op_key=op_key, cmp_fn=cmp_fn) -> bool:
+                actual = context.get(var_name)
+                if actual is None and var_name not in context:
+                    return missing(context, diagnostics)
+                result = cmp_fn(actual, expected)
+                _record(diagnostics, var_name, op_key, expected, actual, result)
+                return result
+
+            return const_op
 
     # No recognised operator — treat as always-false
-    return False
+    def unknown(context: Dict[str, Any], diagnostics: Diagnostics) -> bool:
+        if context.get(var_name) is None and var_name not in context:
+            return missing(context, diagnostics)
+        return False
+
+    return unknown
 
 
 def _detect_op(clause: Dict[str, Any]) -> str:
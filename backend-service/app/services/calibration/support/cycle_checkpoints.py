@@ -0,0 +1,135 @@
+"""Persisted phase transitions of closed phenology cycle years.
+
+Closed agronomic cycle years (Dec-Nov for olive) never change once their
+weather is final, yet ``run_state_machine`` would replay all of them on every
+calibration. Each cycle year runs on a fresh ``CropPhaseStateMachine``, so a
+closed year is fully described by its transitions. After a run, they are
+stored together with the digest of that year's inputs
+(``cycle_input_digests``). Later runs take every year whose digest still
+matches from here and only simulate the others, normally just the current
+cycle.
+
+Checkpoints are keyed by (parcel, referential content hash, variety, maturity
+phase): changing any of them changes the phase configuration, so a new key
+starts empty and the parcel's rows under its previous keys are dropped.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CycleCheckpointKey:
+    """Identifies the state-machine configuration a parcel's checkpoints belong to."""
+
+    parcel_id: str
+    referential_hash: str
+    variety: Optional[str]
+    maturity_phase: Optional[str]
+
+    def as_str(self) -> str:
+        return (
+            f"{self.parcel_id}|{self.referential_hash}"
+            f"|{self.variety or ''}|{self.maturity_phase or ''}"
+        )
+
+
+class CycleCheckpointStore:
+    """SQLite-backed ``{cycle year: {"digest", "transitions"}}`` per checkpoint key.
+
+    Same locking model as ``ObservationStore``: one connection guarded by a
+    lock, every write in one transaction.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cycle_transitions ("
+                " parcel_id TEXT NOT NULL,"
+                " checkpoint_key TEXT NOT NULL,"
+                " cycle_year INTEGER NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " transitions TEXT NOT NULL,"
+                " PRIMARY KEY (checkpoint_key, cycle_year))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cycle_transitions_parcel"
+                " ON cycle_transitions (parcel_id)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def load(self, key: CycleCheckpointKey) -> Dict[int, Dict[str, Any]]:
+        """Stored years of ``key`` as ``{year: {"digest": str, "transitions": list}}``."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT cycle_year, digest, transitions FROM cycle_transitions"
+                " WHERE checkpoint_key = ?",
+                (key.as_str(),),
+            ).fetchall()
+        return {
+            int(year): {"digest": digest, "transitions": json.loads(transitions)}
+            for year, digest, transitions in rows
+        }
+
+    def save(self, key: CycleCheckpointKey, checkpoints: Dict[int, Dict[str, Any]]) -> None:
+        """Insert or replace the given years; drops the parcel's other keys."""
+        if not checkpoints:
+            return
+        key_str = key.as_str()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM cycle_transitions"
+                    " WHERE parcel_id = ? AND checkpoint_key != ?",
+                    (key.parcel_id, key_str),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cycle_transitions"
+                    " (parcel_id, checkpoint_key, cycle_year, digest, transitions)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (
+                            key.parcel_id,
+                            key_str,
+                            int(year),
+                            entry["digest"],
+                            json.dumps(entry["transitions"]),
+                        )
+                        for year, entry in checkpoints.items()
+                    ],
+                )
+        logger.debug(
+            "Stored %d cycle checkpoint(s) for parcel %s", len(checkpoints), key.parcel_id
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM cycle_transitions")
+
+
+cycle_checkpoint_store = CycleCheckpointStore(
+    settings.CALIBRATION_CHECKPOINT_PATH
+    or os.path.join(settings.TEMP_STORAGE_PATH, "calibration_cycle_checkpoints.sqlite3")
+)
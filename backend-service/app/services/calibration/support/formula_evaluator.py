@@ -15,6 +15,9 @@ Temporal references like ``NDVI(t)`` and ``NDVI(t-1)`` are resolved by the
 caller — the evaluator receives a flat context dict where ``NDVI_t`` and
 ``NDVI_t_1`` are already populated.
 
+Formulas are compiled once into closures (``compile_formula``); the regex
+normalisation and ``ast.parse`` never run inside the per-day loop.
+
 Usage::
 
     evaluator = FormulaEvaluator()
@@ -29,7 +32,8 @@ from __future__ import annotations
 import ast
 import logging
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,10 @@ def _normalize_formula(formula: str) -> str:
     return _TEMPORAL_RE.sub(_replace_temporal, formula)
 
 
+CompiledFormula = Callable[[dict[str, float]], "float | None"]
+_Node = Callable[[dict[str, float]], float]
+
+
 class FormulaEvaluator:
     """Evaluate arithmetic formulas safely using ast."""
 
@@ -64,44 +72,54 @@ class FormulaEvaluator:
 
         Returns None if evaluation fails (missing variable, parse error, etc.).
         """
-        try:
-            normalized = _normalize_formula(formula)
-            tree = ast.parse(normalized, mode="eval")
-            return self._eval_node(tree.body, context)
-        except Exception as e:
-            logger.debug("Formula evaluation failed for '%s': %s", formula, e)
-            return None
+        return compile_formula(formula)(context)
+
+    def compile(self, formula: str) -> _Node:
+        """Parse *formula* into a closure; raises on unsupported syntax."""
+        tree = ast.parse(_normalize_formula(formula), mode="eval")
+        return self._compile_node(tree.body)
 
-    def _eval_node(self, node: ast.AST, ctx: dict[str, float]) -> float:
+    def _compile_node(self, node: ast.AST) -> _Node:
         if isinstance(node, ast.Constant):
             if isinstance(node.value, (int, float)):
-                return float(node.value)
+                value = float(node.value)
+                return lambda ctx: value
             raise ValueError(f"Unsupported constant: {node.value}")
 
         if isinstance(node, ast.Name):
-            if node.id in ctx:
-                return float(ctx[node.id])
-            raise KeyError(f"Unknown variable: {node.id}")
+            name = node.id
+
+            def lookup(ctx: dict[str, float]) -> float:
+                if name in ctx:
+                    return float(ctx[name])
+                raise KeyError(f"Unknown variable: {name}")
+
+            return lookup
 
         if isinstance(node, ast.BinOp):
-            left = self._eval_node(node.left, ctx)
-            right = self._eval_node(node.right, ctx)
+            left = self._compile_node(node.left)
+            right = self._compile_node(node.right)
             if isinstance(node.op, ast.Add):
-                return left + right
+                return lambda ctx: left(ctx) + right(ctx)
             if isinstance(node.op, ast.Sub):
-                return left - right
+                return lambda ctx: left(ctx) - right(ctx)
             if isinstance(node.op, ast.Mult):
-                return left * right
+                return lambda ctx: left(ctx) * right(ctx)
             if isinstance(node.op, ast.Div):
-                if right == 0:
-                    return 0.0
-                return left / right
+                def divide(ctx: dict[str, float]) -> float:
+                    numerator = left(ctx)
+                    denominator = right(ctx)
+                    if denominator == 0:
+                        return 0.0
+                    return numerator / denominator
+
+                return divide
             raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
 
         if isinstance(node, ast.UnaryOp):
-            operand = self._eval_node(node.operand, ctx)
+            operand = self._compile_node(node.operand)
             if isinstance(node.op, ast.USub):
-                return -operand
+                return lambda ctx: -operand(ctx)
             if isinstance(node.op, ast.UAdd):
                 return operand
             raise ValueError(f"Unsupported unary op: {type(node.op).__name__}")
@@ -112,13 +130,14 @@ class FormulaEvaluator:
             fname = node.func.id
             if fname not in self._SAFE_NAMES:
                 raise ValueError(f"Unsupported function: {fname}")
-            args = [self._eval_node(arg, ctx) for arg in node.args]
+            args = [self._compile_node(arg) for arg in node.args]
             if fname == "max":
-                return max(*args)
+                return lambda ctx: max(*(a(ctx) for a in args))
             if fname == "min":
-                return min(*args)
+                return lambda ctx: min(*(a(ctx) for a in args))
             if fname == "abs":
-                return abs(args[0])
+                first = args[0]
+                return lambda ctx: abs(first(ctx))
             raise ValueError(f"Unknown function: {fname}")
 
         raise ValueError(f"Unsupported AST node: {type(node).__name__}")
@@ -128,6 +147,64 @@ class FormulaEvaluator:
 _evaluator = FormulaEvaluator()
 
 
+@lru_cache(maxsize=512)
+def compile_formula(formula: str) -> CompiledFormula:
+    """Compile *formula* once; the result returns None wherever
+    ``FormulaEvaluator.evaluate`` would (parse error, missing variable...)."""
+    try:
+        node = _evaluator.compile(formula)
+    except Exception as e:
+        error = e
+
+        def unparseable(context: dict[str, float]) -> float | None:
+            logger.debug("Formula evaluation failed for '%s': %s", formula, error)
+            return None
+
+        return unparseable
+
+    def run(context: dict[str, float]) -> float | None:
+        try:
+            return node(context)
+        except Exception as e:
+            logger.debug("Formula evaluation failed for '%s': %s", formula, e)
+            return None
+
+    return run
+
+
+@lru_cache(maxsize=64)
+def _compile_formula_set(
+    items: tuple[tuple[str, str], ...],
+) -> tuple[tuple[str, CompiledFormula], ...]:
+    return tuple((name, compile_formula(formula)) for name, formula in items)
+
+
+def compile_preliminary_signals(
+    formulas: dict[str, str],
+) -> Callable[[dict[str, float]], dict[str, float]]:
+    """Compile a ``calculs_preliminaires`` dict into one reusable callable.
+
+    The compiled set is cached by the formulas' content, so every state
+    machine built from the same referential shares it.
+    """
+    compiled = _compile_formula_set(
+        tuple((k, v) for k, v in formulas.items() if isinstance(v, str))
+    )
+
+    def run(context: dict[str, float]) -> dict[str, float]:
+        results: dict[str, float] = {}
+        # Work on a copy so formula results can chain
+        ctx = dict(context)
+        for name, formula in compiled:
+            value = formula(ctx)
+            if value is not None:
+                results[name] = round(value, 6)
+                ctx[name] = value  # available for subsequent formulas
+        return results
+
+    return run
+
+
 def compute_preliminary_signals(
     formulas: dict[str, str],
     context: dict[str, float],
@@ -144,16 +221,4 @@ def compute_preliminary_signals(
     Returns:
         Dict of computed signal name → value (only successfully computed ones).
     """
-    results: dict[str, float] = {}
-    # Work on a copy so formula results can chain
-    ctx = dict(context)
-
-    for name, formula in formulas.items():
-        if not isinstance(formula, str):
-            continue
-        value = _evaluator.evaluate(formula, ctx)
-        if value is not None:
-            results[name] = round(value, 6)
-            ctx[name] = value  # available for subsequent formulas
-
-    return results
+    return compile_preliminary_signals(formulas)(context)
@@ -4,6 +4,8 @@ import math
 from datetime import date
 from typing import Any
 
+import numpy as np
+
 from ..referential_utils import (
     CROP_TYPE_TO_REFERENTIAL_JSON,
     FALLBACK_GDD_TBASE,
@@ -63,6 +65,18 @@ def compute_daily_gdd(
     return max(0.0, (capped_max + floored_min) / 2.0 - tbase)
 
 
+def compute_daily_gdd_array(
+    temp_max: np.ndarray,
+    temp_min: np.ndarray,
+    tbase: float,
+    tupper: float | None = None,
+) -> np.ndarray:
+    """Element-wise :func:`compute_daily_gdd` over daily Tmax/Tmin arrays."""
+    capped_max = np.minimum(temp_max, tupper) if tupper is not None else temp_max
+    floored_min = np.maximum(temp_min, tbase)
+    return np.maximum(0.0, (capped_max + floored_min) / 2.0 - tbase)
+
+
 def estimate_chill_hours(temp_max: float, temp_min: float) -> float:
     """Estimate daily chill-hour contribution (T < 7.2 °C window).
 
@@ -0,0 +1,131 @@
+"""Content hashes for incremental recalibration.
+
+A calibration records, in ``CalibrationMetadata.input_hashes``, a digest of
+what each stage consumed plus per-month digests of the raw satellite images
+and weather rows. The next run compares its own digests with those to decide
+which stages can be taken verbatim from ``previous_output`` and from which
+month onwards time series have to be recomputed.
+
+Key layout (flat, so the metadata stays a plain ``dict[str, str]``)::
+
+    "s1", "s2", "s3", ...      one digest per stage input
+    "s4/<cycle year>"           one digest per state-machine cycle year
+    "images/<YYYY-MM>"          raw satellite rows of one month
+    "weather/<YYYY-MM>"         raw weather rows of one month
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+from pydantic import BaseModel
+
+from ..series import IndexSeries
+
+IMAGES_PREFIX = "images/"
+WEATHER_PREFIX = "weather/"
+CYCLE_PREFIX = "s4/"
+
+
+def _series_digest(series: IndexSeries) -> str:
+    h = hashlib.sha1()
+    h.update(series.ordinals.tobytes())
+    h.update(series.values.tobytes())
+    h.update(series.flags.tobytes())
+    return h.hexdigest()
+
+
+def _is_series_field(value: Any) -> bool:
+    return isinstance(value, IndexSeries) or (
+        isinstance(value, dict)
+        and bool(value)
+        and all(isinstance(v, IndexSeries) for v in value.values())
+    )
+
+
+def _encode(obj: Any) -> Any:
+    """``json.dumps`` fallback: a canonical JSON-able stand-in for ``obj``."""
+    if isinstance(obj, IndexSeries):
+        return "series:" + _series_digest(obj)
+    if isinstance(obj, BaseModel):
+        # Pydantic serialises plain fields natively; series are hashed as
+        # arrays instead of going through their point-list serialiser.
+        series_fields = {
+            name for name, value in obj.__dict__.items() if _is_series_field(value)
+        }
+        payload: dict[str, Any] = {
+            "model": type(obj).__name__,
+            "fields": obj.model_dump_json(exclude=series_fields or None),
+        }
+        for name in series_fields:
+            payload[name] = getattr(obj, name)
+        return payload
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return [str(obj.dtype), hashlib.sha1(np.ascontiguousarray(obj).tobytes()).hexdigest()]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    return repr(obj)
+
+
+def content_hash(*parts: Any) -> str:
+    """Stable digest of ``parts`` (models, series, dicts, lists, scalars)."""
+    payload = json.dumps(
+        parts, sort_keys=True, default=_encode, separators=(",", ":")
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def monthly_digests(
+    rows: Iterable[dict[str, Any]], prefix: str, date_key: str = "date"
+) -> dict[str, str]:
+    """``{prefix + "YYYY-MM": digest}`` over ``rows``, independent of row order."""
+    by_month: dict[str, list[str]] = defaultdict(list)
+    for row in rows:
+        raw = row.get(date_key)
+        if raw is None:
+            continue
+        by_month[str(raw)[:7]].append(json.dumps(row, sort_keys=True, default=str))
+    digests: dict[str, str] = {}
+    for month, encoded in by_month.items():
+        h = hashlib.sha1()
+        for item in sorted(encoded):
+            h.update(item.encode("utf-8"))
+            h.update(b"\n")
+        digests[prefix + month] = h.hexdigest()
+    return digests
+
+
+def first_changed_month(
+    previous: dict[str, str], current: dict[str, str], prefix: str
+) -> str | None:
+    """Earliest ``YYYY-MM`` whose ``prefix`` digest differs (added, removed or edited).
+
+    Returns None when every month matches.
+    """
+    months = {
+        key[len(prefix):]
+        for key in (*previous, *current)
+        if key.startswith(prefix)
+    }
+    changed = [
+        month
+        for month in months
+        if previous.get(prefix + month) != current.get(prefix + month)
+    ]
+    return min(changed) if changed else None
+
+
+def has_digests(hashes: dict[str, str], prefix: str) -> bool:
+    return any(key.startswith(prefix) for key in hashes)
@@ -8,6 +8,8 @@ import math
 
 from pydantic import BaseModel, Field, model_validator
 
+from .series import IndexSeries
+
 
 class WeatherRowAccessor:
     """Single source of truth for reading weather row dicts.
@@ -243,13 +245,18 @@ class ConfidenceScore(BaseModel):
 
 
 class Step1Output(BaseModel):
-    index_time_series: dict[str, list[IndexTimePoint]]
+    # Columnar internally; validates from and serialises to list[IndexTimePoint]
+    index_time_series: dict[str, IndexSeries]
     cloud_coverage_mean: float = Field(ge=0, le=100)
     filtered_image_count: int = Field(ge=0)
     outlier_count: int = Field(ge=0)
     interpolated_dates: list[date]
     raster_paths: dict[str, list[str]]
 
+    def series(self, index: str) -> IndexSeries:
+        """Series for ``index``, empty when the index was not extracted."""
+        return self.index_time_series.get(index) or IndexSeries.empty()
+
 
 class WeatherDay(BaseModel):
     date: date
@@ -371,6 +378,11 @@ class CalibrationMetadata(BaseModel):
     version: str = "v2"
     generated_at: datetime
     data_quality_flags: list[str] = Field(default_factory=list)
+    input_hashes: dict[str, str] = Field(
+        default_factory=dict,
+        description="Per-stage input digests used by incremental recalibration.",
+    )
+    reused_stages: list[str] = Field(default_factory=list)
 
 
 class CalibrationOutput(BaseModel):
@@ -188,14 +188,12 @@ class CloudMaskingService:
         return best, cloud_coverage
 
     @staticmethod
-    def filter_by_scl_coverage(
+    def score_scl_coverage(
         collection: ee.ImageCollection,
         aoi: ee.Geometry,
-        max_cloud_coverage: float,
     ) -> ee.ImageCollection:
         """
-        Filter collection by SCL-based AOI cloud coverage.
-        Matches the available-dates endpoint logic exactly:
+        Set AOI_SCL_CLOUD_COVERAGE (percent) on every image without filtering.
         SCL classes 3 (shadow), 8 (cloud medium), 9 (cloud high), 10 (cirrus)
         at 20m native resolution, no spatial buffer.
         """
@@ -226,7 +224,20 @@ class CloudMaskingService:
             pct = ee.Number(cloud_pixels).divide(ee.Number(total_pixels)).multiply(100)
             return image.set("AOI_SCL_CLOUD_COVERAGE", pct)
 
-        scored = collection.map(score_scl)
+        return collection.map(score_scl)
+
+    @staticmethod
+    def filter_by_scl_coverage(
+        collection: ee.ImageCollection,
+        aoi: ee.Geometry,
+        max_cloud_coverage: float,
+    ) -> ee.ImageCollection:
+        """
+        Filter collection by SCL-based AOI cloud coverage.
+        Matches the available-dates endpoint logic exactly (see
+        score_scl_coverage).
+        """
+        scored = CloudMaskingService.score_scl_coverage(collection, aoi)
         return scored.filter(
             ee.Filter.lte("AOI_SCL_CLOUD_COVERAGE", max_cloud_coverage)
         )
@@ -7,10 +7,25 @@ import math
 import tempfile
 import platform
 import concurrent.futures
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from app.core.config import settings
 from app.services.cloud_masking import CloudMaskingService
+from app.services.gee_executor import submit_gee_chunk
+from app.services.gee_metrics import counted_get_info, record_round_trip
+from app.services.observation_store import (
+    ObservationSeriesKey,
+    merge_date_ranges,
+    observation_store,
+)
+from app.services.render_cache import render_cache, render_key
+from app.services.acquisition_catalogue import (
+    TILE_PREFILTER,
+    best_image_info,
+    catalogue_key,
+    group_by_date,
+    select_images,
+)
 import logging
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
@@ -18,6 +33,11 @@ import io
 import base64
 
 GEE_INIT_TIMEOUT = 30  # seconds
+TS_CHUNK_DAYS = 180  # per-observation chunk size (avoids GEE timeouts)
+HEATMAP_NODATA = -9999.0  # computePixels fill value for masked heatmap pixels
+HEATMAP_BASE_SCALE = 10  # metres, Sentinel-2 native resolution
+THUMBNAIL_DIMENSION = 512  # longest side of static index-map renders, px
+_STATISTICS_SUFFIXES = {"p2", "p25", "p50", "p75", "p98", "mean", "stdDev"}
 
 logger = logging.getLogger(__name__)
 
@@ -148,11 +168,16 @@ def _log_per_observation_chunk_debug(
     if not raw_features:
         return
 
+    prefix = f"{index_name}_"
     sample_props: Dict[str, Any] = {}
     for feat in raw_features[:20]:
         props = feat.get("properties") or {}
-        if props.get("value") is not None:
-            sample_props = dict(props)
+        if props.get(f"{prefix}value") is not None:
+            sample_props = {
+                k: v
+                for k, v in props.items()
+                if k.startswith(prefix) or k in ("date", "cloud")
+            }
             break
     if sample_props:
         keys_sorted = sorted(sample_props.keys())
@@ -217,6 +242,68 @@ def _log_serialized_time_series_debug(
         logger.debug("[gee_ts] serialized_first_point=%s", serialized[0])
 
 
+def _iter_date_chunks(start_dt: datetime, end_dt: datetime, chunk_days: int = TS_CHUNK_DAYS):
+    """Yield non-overlapping inclusive (start, end) chunks covering [start_dt, end_dt]."""
+    chunk_start = start_dt
+    while chunk_start <= end_dt:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_dt)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end + timedelta(days=1)
+
+
+def heatmap_grid_spec(
+    min_lon: float,
+    max_lon: float,
+    min_lat: float,
+    max_lat: float,
+    max_pixels: int,
+) -> Dict[str, Any]:
+    """EPSG:4326 grid covering the AOI bounds with at most ``max_pixels`` cells.
+
+    Starts at the native 10 m and coarsens uniformly for large AOIs.
+    """
+    cos_lat = max(math.cos(math.radians((min_lat + max_lat) / 2.0)), 1e-6)
+    width_m = (max_lon - min_lon) * 111320.0 * cos_lat
+    height_m = (max_lat - min_lat) * 110540.0
+    scale = max(
+        float(HEATMAP_BASE_SCALE), math.sqrt(width_m * height_m / max(max_pixels, 1))
+    )
+
+    pixel_width = scale / (111320.0 * cos_lat)
+    pixel_height = scale / 110540.0
+    return {
+        "scale": scale,
+        "pixel_width": pixel_width,
+        "pixel_height": pixel_height,
+        "width": max(1, math.ceil((max_lon - min_lon) / pixel_width)),
+        "height": max(1, math.ceil((max_lat - min_lat) / pixel_height)),
+    }
+
+
+def _parse_multi_index_features(
+    results: Dict[str, Any], indices: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Split flattened ``{index}_{field}`` feature properties into per-index observations."""
+    observations: Dict[str, List[Dict[str, Any]]] = {i: [] for i in indices}
+    for feat in results.get("features", []):
+        props = feat.get("properties", {})
+        date_str = props.get("date")
+        if date_str is None:
+            continue
+        cloud = props.get("cloud", 100)
+        for index in indices:
+            value = props.get(f"{index}_value")
+            if value is None:
+                continue
+            obs = {"date": date_str, "value": value, "cloud": cloud}
+            for key in _TS_OPTIONAL_OBS_KEYS:
+                raw = props.get(f"{index}_{key}")
+                if raw is not None:
+                    obs[key] = raw
+            observations[index].append(obs)
+    return observations
+
+
 def _find_system_font() -> str:
     _FONT_PATHS = {
         "Darwin": [
@@ -239,6 +326,98 @@ def _find_system_font() -> str:
     raise OSError("No system font found")
 
 
+class LazyCollection:
+    """Deferred handle on an ee.ImageCollection.
+
+    Building the filter chain costs nothing; a round trip only happens when a
+    caller needs a client-side value. Size and best-image metadata are memoized
+    per handle, and evaluate() returns them together with the caller's own
+    payload in a single getInfo, so the emptiness check never costs an extra
+    request.
+    """
+
+    def __init__(self, collection: ee.ImageCollection, description: str = ""):
+        self.collection = collection
+        self.description = description
+        self._size: Optional[int] = None
+        self._first: Optional[Dict[str, Any]] = None
+
+    def seed(self, size: int, first: Optional[Dict[str, Any]]) -> None:
+        """Preset size and best-image metadata already known client-side."""
+        self._size = size
+        self._first = first
+
+    def best_image(self) -> ee.Image:
+        """Lowest tile-cloud image (server-side, not evaluated)."""
+        return ee.Image(self.collection.sort("CLOUDY_PIXEL_PERCENTAGE").first())
+
+    def _first_metadata(self) -> ee.Dictionary:
+        image = self.best_image()
+        return ee.Dictionary(
+            {
+                "id": image.get("system:index"),
+                "date": ee.Date(image.get("system:time_start")).format("YYYY-MM-dd"),
+                "cloud": image.get("CLOUDY_PIXEL_PERCENTAGE"),
+            }
+        )
+
+    def evaluate(
+        self,
+        payload: Optional[Dict[str, Any]] = None,
+        always: Optional[Dict[str, Any]] = None,
+        operation: str = "collection",
+    ) -> Dict[str, Any]:
+        """Fetch size, best-image metadata and extra values in one getInfo.
+
+        ``payload`` values are only computed server-side when the collection
+        is non-empty (None otherwise); ``always`` values are computed
+        regardless. The result also carries ``size`` and ``first``.
+        """
+        payload = payload or {}
+        request: Dict[str, Any] = dict(always or {})
+        if self._size != 0:
+            size = self.collection.size()
+            if self._size is None:
+                request["size"] = size
+            if self._first is None:
+                request["first"] = ee.Algorithms.If(
+                    size.gt(0), self._first_metadata(), None
+                )
+            for key, value in payload.items():
+                # Guard only while emptiness is unknown; known non-empty needs no If
+                request[key] = (
+                    value if self._size else ee.Algorithms.If(size.gt(0), value, None)
+                )
+
+        result = counted_get_info(ee.Dictionary(request), operation) if request else {}
+        if "size" in result:
+            self._size = int(result["size"] or 0)
+            if self._size == 0:
+                logger.info(f"No Sentinel-2 images found ({self.description})")
+        if result.get("first") is not None:
+            self._first = result["first"]
+        result["size"] = self._size
+        result["first"] = self._first
+        for key in payload:
+            result.setdefault(key, None)
+        return result
+
+    def size(self) -> int:
+        """Number of images (memoized; first call costs one round trip)."""
+        if self._size is None:
+            self.evaluate(operation="collection_size")
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self.size() == 0
+
+    def first_info(self) -> Optional[Dict[str, Any]]:
+        """id/date/cloud of the lowest-cloud image, or None if empty (memoized)."""
+        if self._first is None and self._size != 0:
+            self.evaluate(operation="collection_first")
+        return self._first
+
+
 class EarthEngineService:
     def __init__(self):
         self.initialized = False
@@ -375,6 +554,7 @@ class EarthEngineService:
         end_date: str,
         max_cloud_coverage: float = None,
         use_aoi_cloud_filter: bool = False,
+        catalogued: Optional[List[Dict[str, Any]]] = None,
     ) -> ee.ImageCollection:
         """
         Get Sentinel-2 image collection for given parameters
@@ -387,6 +567,9 @@ class EarthEngineService:
             use_aoi_cloud_filter: If True, use SCL-based AOI cloud filter at 20m
                 (filter_by_scl_coverage). No tile-level pre-filter applied.
                 Default is False (tile-level CLOUDY_PIXEL_PERCENTAGE).
+            catalogued: Scenes already known to pass the AOI cloud filter
+                (acquisition catalogue); selects them by id instead of
+                re-scoring SCL coverage. Looked up when omitted.
         """
         self.initialize()
 
@@ -426,7 +609,33 @@ class EarthEngineService:
             datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
         ).strftime("%Y-%m-%d")
 
-        if use_aoi_cloud_filter:
+        if use_aoi_cloud_filter and catalogued is None:
+            catalogued = self._catalogued_images(
+                geometry, start_date, end_date, max_cloud
+            )
+
+        if use_aoi_cloud_filter and catalogued is not None:
+            # Catalogue hit: select the known scenes, carrying their AOI score
+            aoi_clouds = ee.Dictionary(
+                {image["id"]: image["aoi_cloud"] for image in catalogued}
+            )
+            collection = (
+                ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
+                .filterBounds(aoi)
+                .filterDate(start_date, end_dt_inclusive)
+                .filter(
+                    ee.Filter.inList(
+                        "system:index", [image["id"] for image in catalogued]
+                    )
+                )
+                .map(
+                    lambda image: image.set(
+                        "AOI_SCL_CLOUD_COVERAGE",
+                        aoi_clouds.get(image.get("system:index")),
+                    )
+                )
+            )
+        elif use_aoi_cloud_filter:
             # Two-gate cloud filter:
             # 1) Tile-level pre-filter at 25% to reject obviously cloudy tiles
             #    (SCL alone is unreliable for small AOIs — misclassifies cloud pixels)
@@ -435,7 +644,7 @@ class EarthEngineService:
                 ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
                 .filterBounds(aoi)
                 .filterDate(start_date, end_dt_inclusive)
-                .filter(ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", 25))
+                .filter(ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", TILE_PREFILTER))
             )
             logger.info("Applying tile pre-filter (25%%) + SCL AOI cloud filtering at 20m")
             collection = CloudMaskingService.filter_by_scl_coverage(
@@ -452,18 +661,148 @@ class EarthEngineService:
                 )
             )
 
-        # Check if collection has any images
+        # No size().getInfo() here: emptiness is checked lazily by callers
+        # (see LazyCollection), fused into their main request.
+        return collection
+
+    def get_sentinel2_collection_lazy(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        max_cloud_coverage: float = None,
+        use_aoi_cloud_filter: bool = False,
+    ) -> "LazyCollection":
+        """get_sentinel2_collection() wrapped in a memoizing LazyCollection handle.
+
+        When the acquisition catalogue covers the settled part of the range
+        (the unsettled tail is scanned on the spot), the handle is seeded with
+        the catalogued size and best image, so emptiness checks cost no
+        further round trip.
+        """
+        catalogued = (
+            self._catalogued_images(
+                geometry, start_date, end_date, max_cloud_coverage
+            )
+            if use_aoi_cloud_filter
+            else None
+        )
+        lazy = LazyCollection(
+            self.get_sentinel2_collection(
+                geometry,
+                start_date,
+                end_date,
+                max_cloud_coverage,
+                use_aoi_cloud_filter=use_aoi_cloud_filter,
+                catalogued=catalogued,
+            ),
+            description=f"S2 {start_date}→{end_date}",
+        )
+        if catalogued is not None:
+            lazy.seed(len(catalogued), best_image_info(catalogued))
+        return lazy
+
+    def scan_acquisitions(
+        self, geometry: Dict, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Score every pre-filtered scene in [start, end] with its AOI SCL cloud %.
+
+        One getInfo; returns catalogue entries grouped by acquisition date.
+        """
+        aoi = ee.Geometry(geometry)
+        end_dt_inclusive = (
+            datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        ).strftime("%Y-%m-%d")
+        collection = (
+            ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED")
+            .filterBounds(aoi)
+            .filterDate(start_date, end_dt_inclusive)
+            .filter(ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", TILE_PREFILTER))
+        )
+        scored = CloudMaskingService.score_scl_coverage(collection, aoi)
+
+        def scene_info(image):
+            acquired = ee.Date(image.get("system:time_start"))
+            return ee.Feature(
+                None,
+                {
+                    "id": image.get("system:index"),
+                    "date": acquired.format("YYYY-MM-dd"),
+                    "timestamp": acquired.millis(),
+                    "aoi_cloud": image.get("AOI_SCL_CLOUD_COVERAGE"),
+                    "tile_cloud": image.get("CLOUDY_PIXEL_PERCENTAGE"),
+                },
+            )
+
+        info = counted_get_info(scored.map(scene_info), "acquisition_scan") or {}
+        return group_by_date(
+            f.get("properties", {}) for f in info.get("features", [])
+        )
+
+    def get_acquisitions(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        refresh: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Acquisition catalogue entries for [start, end], sorted by date.
+
+        Stored entries are served locally and only never-scanned (or not yet
+        settled) ranges are scanned. With ``refresh=False`` only the unsettled
+        tail (the last ``TIMESERIES_STORE_SETTLE_DAYS``, never marked covered)
+        may be scanned; None is returned when settled history is missing.
+        """
+        key = catalogue_key(geometry)
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+
+        settled = observation_store.settled_until()
+        gaps = observation_store.missing_ranges(key, start, end)
+        if not refresh and any(gap_start <= settled for gap_start, _ in gaps):
+            return None
+
+        entries = {e["date"]: e for e in observation_store.get_observations(key, start, end)}
+        for gap_start, gap_end in gaps:
+            scanned = self.scan_acquisitions(
+                geometry, gap_start.isoformat(), gap_end.isoformat()
+            )
+            entries.update((e["date"], e) for e in scanned)
+            observation_store.record_chunk(
+                key,
+                scanned,
+                gap_start,
+                min(gap_end, settled),
+            )
+        if gaps:
+            logger.info(
+                f"Acquisition catalogue {key.fingerprint[:8]}: scanned "
+                f"{[f'{s}→{e}' for s, e in gaps]}, {len(entries)} dates"
+            )
+        return sorted(entries.values(), key=lambda e: e["date"])
+
+    def _catalogued_images(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        max_cloud_coverage: Optional[float],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Qualifying catalogued scenes, or None when the catalogue can't answer."""
+        if not settings.ACQUISITION_CATALOGUE_ENABLED:
+            return None
         try:
-            collection_size = collection.size().getInfo()
-            if collection_size == 0:
-                logger.info(
-                    f"No Sentinel-2 images found for the specified area and date range ({start_date} to {end_date}) with cloud coverage <= {max_cloud}%"
-                )
-                # Don't raise an error here, let the calling code handle empty collections
+            entries = self.get_acquisitions(
+                geometry, start_date, end_date, refresh=False
+            )
         except Exception as e:
-            logger.warning(f"Could not check collection size: {e}")
-
-        return collection
+            logger.warning(f"Acquisition catalogue read failed: {e}")
+            return None
+        if entries is None:
+            return None
+        return select_images(
+            entries, max_cloud_coverage or settings.MAX_CLOUD_COVERAGE
+        )
 
     def calculate_vegetation_indices(
         self, image: ee.Image, indices: List[str]
@@ -661,37 +1000,43 @@ class EarthEngineService:
     ) -> Dict[str, Any]:
         self.initialize()
 
-        collection = self.get_sentinel2_collection(geometry, start_date, end_date)
+        lazy = self.get_sentinel2_collection_lazy(geometry, start_date, end_date)
+
+        composite = lazy.collection.median()
+        ndvi_image = self.calculate_vegetation_indices(composite, ["NDVI"])["NDVI"]
+
+        aoi = ee.Geometry(geometry)
+        clipped = ndvi_image.clip(aoi)
+
+        sampled_pixels = clipped.sample(
+            region=aoi, scale=scale, numPixels=5000, geometries=True
+        )
 
+        # Emptiness check, AOI bounds and pixel samples in one round trip
         try:
-            collection_size = collection.size().getInfo()
-            if collection_size == 0:
-                raise ValueError(
-                    "No Sentinel-2 images found for the provided geometry and date range"
-                )
+            fused = lazy.evaluate(
+                payload={"samples": sampled_pixels},
+                always={"bounds": aoi.bounds()},
+                operation="extract_ndvi_raster",
+            )
         except Exception as exc:
             if "Empty date ranges not supported" in str(exc):
                 raise ValueError(
                     "No Sentinel-2 images found for the provided geometry and date range"
                 ) from exc
             raise
+        if fused["size"] == 0:
+            raise ValueError(
+                "No Sentinel-2 images found for the provided geometry and date range"
+            )
 
-        composite = collection.median()
-        ndvi_image = self.calculate_vegetation_indices(composite, ["NDVI"])["NDVI"]
-
-        aoi = ee.Geometry(geometry)
-        clipped = ndvi_image.clip(aoi)
-
-        bounds = aoi.bounds().getInfo()["coordinates"][0]
+        bounds = fused["bounds"]["coordinates"][0]
         min_lon = min([coord[0] for coord in bounds])
         max_lon = max([coord[0] for coord in bounds])
         min_lat = min([coord[1] for coord in bounds])
         max_lat = max([coord[1] for coord in bounds])
 
-        sampled_pixels = clipped.sample(
-            region=aoi, scale=scale, numPixels=5000, geometries=True
-        )
-        sampled_data = sampled_pixels.getInfo()
+        sampled_data = fused["samples"] or {}
 
         pixel_data: list[dict[str, float]] = []
         values: list[float] = []
@@ -836,6 +1181,70 @@ class EarthEngineService:
                     use_aoi_cloud_filter=use_aoi_cloud_filter,
                 )
 
+    def get_time_series_multi(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        interval: str = "month",
+        max_cloud_coverage: float = None,
+        use_aoi_cloud_filter: bool = False,
+    ) -> Dict[str, List[Dict]]:
+        """Per-observation time series for several indices in one collection pass.
+
+        Every index is computed from the same mapped scene and reduced with one
+        combined reducer, so N indices cost one traversal per chunk instead of N.
+        Falls back to per-index get_time_series() only on failure.
+        """
+        self.initialize()
+
+        aoi = ee.Geometry(geometry)
+        max_cloud = max_cloud_coverage or settings.MAX_CLOUD_COVERAGE
+
+        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        total_days = (end_dt - start_dt).days
+        scale = 30 if total_days > 365 else settings.DEFAULT_SCALE
+
+        try:
+            logger.info(
+                "[gee_ts] get_time_series_multi path=per_observation indices=%s "
+                "scale=%s max_cloud=%s days=%s",
+                indices,
+                scale,
+                max_cloud,
+                total_days,
+            )
+            return self._get_time_series_per_observation_multi(
+                geometry,
+                aoi,
+                start_date,
+                end_date,
+                indices,
+                scale,
+                max_cloud,
+                use_aoi_cloud_filter=use_aoi_cloud_filter,
+            )
+        except Exception as e:
+            logger.warning(
+                "[gee_ts] multi per_observation failed (%s), falling back to per-index",
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return {
+                index: self.get_time_series(
+                    geometry,
+                    start_date,
+                    end_date,
+                    index,
+                    interval,
+                    max_cloud_coverage=max_cloud_coverage,
+                    use_aoi_cloud_filter=use_aoi_cloud_filter,
+                )
+                for index in indices
+            }
+
     def _get_time_series_per_observation(
         self,
         geometry: Dict,
@@ -852,50 +1261,233 @@ class EarthEngineService:
         Batches into 6-month chunks to avoid GEE timeouts on multi-year ranges.
         Uses tile-level cloud filtering by default. AOI-level filtering can be enabled explicitly.
         """
-        CHUNK_DAYS = 180
+        return self._get_time_series_per_observation_multi(
+            geometry,
+            aoi,
+            start_date,
+            end_date,
+            [index],
+            scale,
+            max_cloud,
+            use_aoi_cloud_filter=use_aoi_cloud_filter,
+        )[index]
+
+    def _get_time_series_per_observation_multi(
+        self,
+        geometry: Dict,
+        aoi: ee.Geometry,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        scale: int,
+        max_cloud: float,
+        use_aoi_cloud_filter: bool = False,
+    ) -> Dict[str, List[Dict]]:
+        """Per-observation series for each index, sharing one pass per chunk.
+
+        Observations already reduced by a previous request are served from the
+        observation store; only date ranges never scanned (or not yet settled)
+        for at least one index are submitted to GEE.
+        """
+        all_observations: Dict[str, Dict[str, Dict]] = {i: {} for i in indices}
+        for _, _, _, batch in self._iter_per_observation_batches(
+            geometry,
+            aoi,
+            start_date,
+            end_date,
+            indices,
+            scale,
+            max_cloud,
+            use_aoi_cloud_filter=use_aoi_cloud_filter,
+        ):
+            for index, observations in batch.items():
+                # Freshly reduced scenes supersede any stored value for the same date
+                all_observations[index].update((o["date"], o) for o in observations)
+
+        series: Dict[str, List[Dict]] = {}
+        for index in indices:
+            time_series = sorted(
+                all_observations[index].values(), key=lambda x: x["date"]
+            )
+            logger.info(
+                f"Per-observation time series: {len(time_series)} real observations "
+                f"for {index} ({start_date}→{end_date})"
+            )
+            serialized = [_serialize_ts_dict_for_api(p) for p in time_series]
+            _log_serialized_time_series_debug(index, serialized)
+            series[index] = serialized
+        return series
+
+    def iter_time_series(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        index: str,
+        max_cloud_coverage: float = None,
+        use_aoi_cloud_filter: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Per-observation time series yielded batch by batch as GEE finishes.
+
+        The first batch holds observations already in the observation store;
+        the rest follow chunk by chunk, most recent chunk first. Each batch is
+        ``{"start", "end", "source", "data"}`` with API-shaped points sorted
+        newest first; a point replaces any earlier one with the same date.
+        """
+        self.initialize()
 
+        aoi = ee.Geometry(geometry)
+        max_cloud = max_cloud_coverage or settings.MAX_CLOUD_COVERAGE
+        total_days = (
+            datetime.strptime(end_date, "%Y-%m-%d")
+            - datetime.strptime(start_date, "%Y-%m-%d")
+        ).days
+        scale = 30 if total_days > 365 else settings.DEFAULT_SCALE
+
+        for batch_start, batch_end, source, batch in self._iter_per_observation_batches(
+            geometry,
+            aoi,
+            start_date,
+            end_date,
+            [index],
+            scale,
+            max_cloud,
+            use_aoi_cloud_filter=use_aoi_cloud_filter,
+        ):
+            points = sorted(batch.get(index, []), key=lambda x: x["date"], reverse=True)
+            yield {
+                "start": batch_start.strftime("%Y-%m-%d"),
+                "end": batch_end.strftime("%Y-%m-%d"),
+                "source": source,
+                "data": [_serialize_ts_dict_for_api(p) for p in points],
+            }
+
+    def _iter_per_observation_batches(
+        self,
+        geometry: Dict,
+        aoi: ee.Geometry,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        scale: int,
+        max_cloud: float,
+        use_aoi_cloud_filter: bool = False,
+    ) -> Iterator[Tuple[datetime, datetime, str, Dict[str, List[Dict]]]]:
+        """Yield (start, end, source, observations per index) batches.
+
+        Stored observations come first (source "store"), then one batch per
+        GEE chunk (source "gee"), newest chunk first, each with the lowest
+        cloud observation per date. Fresh chunks are written back to the store.
+        """
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
 
-        all_observations: Dict[str, Dict] = {}
-        chunk_start = start_dt
-
-        while chunk_start < end_dt:
-            chunk_end = min(chunk_start + timedelta(days=CHUNK_DAYS), end_dt)
-            c_start = chunk_start.strftime("%Y-%m-%d")
-            c_end = chunk_end.strftime("%Y-%m-%d")
+        store = observation_store if settings.TIMESERIES_STORE_ENABLED else None
+        store_keys: Dict[str, ObservationSeriesKey] = {}
+        cached: Dict[str, List[Dict]] = {i: [] for i in indices}
+        gaps: List[Tuple[datetime, datetime]] = [(start_dt, end_dt)]
 
+        if store is not None:
             try:
-                chunk_results = self._per_observation_chunk(
-                    geometry,
-                    aoi,
-                    c_start,
-                    c_end,
-                    index,
-                    scale,
-                    max_cloud,
-                    use_aoi_cloud_filter=use_aoi_cloud_filter,
+                missing: List[Tuple[Any, Any]] = []
+                for index in indices:
+                    key = ObservationSeriesKey.build(
+                        geometry, index, scale, max_cloud, use_aoi_cloud_filter
+                    )
+                    store_keys[index] = key
+                    cached[index] = store.get_observations(
+                        key, start_dt.date(), end_dt.date()
+                    )
+                    missing.extend(
+                        store.missing_ranges(key, start_dt.date(), end_dt.date())
+                    )
+                gaps = [
+                    (
+                        datetime.combine(g_start, datetime.min.time()),
+                        datetime.combine(g_end, datetime.min.time()),
+                    )
+                    for g_start, g_end in merge_date_ranges(missing)
+                ]
+                logger.info(
+                    "[gee_ts] observation store indices=%s cached=%s gaps=%s",
+                    indices,
+                    {i: len(obs) for i, obs in cached.items()},
+                    [f"{g[0]:%Y-%m-%d}→{g[1]:%Y-%m-%d}" for g in gaps],
                 )
-                for obs in chunk_results:
-                    d = obs["date"]
-                    if (
-                        d not in all_observations
-                        or all_observations[d]["cloud"] > obs["cloud"]
-                    ):
-                        all_observations[d] = obs
             except Exception as e:
-                logger.warning(f"Per-observation chunk {c_start}→{c_end} failed: {e}")
+                logger.warning(f"Observation store read failed, querying GEE: {e}")
+                store_keys = {}
+                cached = {i: [] for i in indices}
+                gaps = [(start_dt, end_dt)]
+
+        if any(cached.values()):
+            yield start_dt, end_dt, "store", cached
+
+        chunks = sorted(
+            (
+                chunk
+                for gap_start, gap_end in gaps
+                for chunk in _iter_date_chunks(gap_start, gap_end)
+            ),
+            reverse=True,
+        )
+        if not chunks:
+            return
 
-            chunk_start = chunk_end
+        def run_chunk(chunk: Tuple[datetime, datetime]) -> Dict[str, List[Dict]]:
+            return self._per_observation_chunk_multi(
+                geometry,
+                aoi,
+                chunk[0].strftime("%Y-%m-%d"),
+                chunk[1].strftime("%Y-%m-%d"),
+                indices,
+                scale,
+                max_cloud,
+                use_aoi_cloud_filter=use_aoi_cloud_filter,
+            )
 
-        time_series = sorted(all_observations.values(), key=lambda x: x["date"])
-        logger.info(
-            f"Per-observation time series: {len(time_series)} real observations "
-            f"for {index} ({start_date}→{end_date})"
-        )
-        serialized = [_serialize_ts_dict_for_api(p) for p in time_series]
-        _log_serialized_time_series_debug(index, serialized)
-        return serialized
+        # Chunks are independent server-side computations: run them concurrently
+        # on the shared chunk pool, so GEE_TS_CHUNK_WORKERS bounds every
+        # concurrent sync and stream together and wall time tracks the slowest chunk.
+        # The request context is copied so round trips keep their route.
+        futures = [(chunk, submit_gee_chunk(run_chunk, chunk)) for chunk in chunks]
+        try:
+            # Yield in submission (newest-first) order; later chunks keep running
+            for (chunk_start, chunk_end), future in futures:
+                try:
+                    chunk_results = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Per-observation chunk {chunk_start:%Y-%m-%d}→"
+                        f"{chunk_end:%Y-%m-%d} failed: {e}"
+                    )
+                    continue
+
+                batch: Dict[str, List[Dict]] = {}
+                for index, observations in chunk_results.items():
+                    chunk_best: Dict[str, Dict] = {}
+                    for obs in observations:
+                        d = obs["date"]
+                        if d not in chunk_best or chunk_best[d]["cloud"] > obs["cloud"]:
+                            chunk_best[d] = obs
+                    batch[index] = list(chunk_best.values())
+
+                    if index in store_keys:
+                        try:
+                            store.record_chunk(
+                                store_keys[index],
+                                batch[index],
+                                chunk_start.date(),
+                                min(chunk_end.date(), store.settled_until()),
+                            )
+                        except Exception as e:
+                            logger.warning(f"Observation store write failed: {e}")
+
+                yield chunk_start, chunk_end, "gee", batch
+        finally:
+            # A closed stream (client gone) must not keep queued chunks running
+            for _, future in futures:
+                future.cancel()
 
     def _per_observation_chunk(
         self,
@@ -907,8 +1499,35 @@ class EarthEngineService:
         scale: int,
         max_cloud: float,
         use_aoi_cloud_filter: bool = False,
-    ) -> List[Dict]:
-        """Process a single time chunk: get collection, map index, return observations."""
+    ) -> List[Dict]:
+        """Process a single time chunk: get collection, map index, return observations."""
+        return self._per_observation_chunk_multi(
+            geometry,
+            aoi,
+            start_date,
+            end_date,
+            [index],
+            scale,
+            max_cloud,
+            use_aoi_cloud_filter=use_aoi_cloud_filter,
+        )[index]
+
+    def _per_observation_chunk_multi(
+        self,
+        geometry: Dict,
+        aoi: ee.Geometry,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        scale: int,
+        max_cloud: float,
+        use_aoi_cloud_filter: bool = False,
+    ) -> Dict[str, List[Dict]]:
+        """Process a single time chunk for several indices in one mapped pass.
+
+        All index bands are stacked into one image and reduced with one combined
+        reducer; feature properties are flattened as ``{index}_{field}``.
+        """
         collection = self.get_sentinel2_collection(
             geometry,
             start_date,
@@ -917,13 +1536,13 @@ class EarthEngineService:
             use_aoi_cloud_filter=use_aoi_cloud_filter,
         )
 
-        index_name = index
+        index_names = list(indices)
 
         def extract_observation(image):
-            idx_images = self.calculate_vegetation_indices(image, [index_name])
-            idx_image = idx_images.get(index_name)
-            if idx_image is None:
-                return ee.Feature(None, {"date": None, "value": None, "cloud": None})
+            idx_images = self.calculate_vegetation_indices(image, index_names)
+            present = [name for name in index_names if name in idx_images]
+            if not present:
+                return ee.Feature(None, {"date": None, "cloud": None})
 
             # Combined reducer: same order as automated_processing.py so reduceRegion keys are
             # {index_name}_p2, _p25, …, _mean, _stdDev, _count (percentile-first chain).
@@ -938,7 +1557,7 @@ class EarthEngineService:
             )
 
             # Use CRS parameter to handle AOI crossing UTM zone boundaries
-            stats = idx_image.reduceRegion(
+            stats = ee.Image.cat([idx_images[name] for name in present]).reduceRegion(
                 reducer=combined_reducer,
                 geometry=aoi,
                 scale=scale,
@@ -948,54 +1567,39 @@ class EarthEngineService:
                 tileScale=4,
             )
 
-            return ee.Feature(
-                None,
-                {
-                    "date": ee.Date(image.get("system:time_start")).format(
-                        "YYYY-MM-dd"
-                    ),
-                    "value": stats.get(f"{index_name}_mean"),
-                    "min_value": stats.get(f"{index_name}_p2"),
-                    "max_value": stats.get(f"{index_name}_p98"),
-                    "std_value": stats.get(f"{index_name}_stdDev"),
-                    "median_value": stats.get(f"{index_name}_p50"),
-                    "percentile_25": stats.get(f"{index_name}_p25"),
-                    "percentile_75": stats.get(f"{index_name}_p75"),
-                    "percentile_90": stats.get(f"{index_name}_p90"),
-                    "pixel_count": stats.get(f"{index_name}_count"),
-                    "cloud": image.get("CLOUDY_PIXEL_PERCENTAGE"),
-                },
-            )
+            props: Dict[str, Any] = {
+                "date": ee.Date(image.get("system:time_start")).format("YYYY-MM-dd"),
+                "cloud": image.get("CLOUDY_PIXEL_PERCENTAGE"),
+            }
+            for name in present:
+                props.update(
+                    {
+                        f"{name}_value": stats.get(f"{name}_mean"),
+                        f"{name}_min_value": stats.get(f"{name}_p2"),
+                        f"{name}_max_value": stats.get(f"{name}_p98"),
+                        f"{name}_std_value": stats.get(f"{name}_stdDev"),
+                        f"{name}_median_value": stats.get(f"{name}_p50"),
+                        f"{name}_percentile_25": stats.get(f"{name}_p25"),
+                        f"{name}_percentile_75": stats.get(f"{name}_p75"),
+                        f"{name}_percentile_90": stats.get(f"{name}_p90"),
+                        f"{name}_pixel_count": stats.get(f"{name}_count"),
+                    }
+                )
+            return ee.Feature(None, props)
 
         features = collection.map(extract_observation)
-        results = features.getInfo()
+        results = counted_get_info(features, "timeseries_chunk")
 
-        observations = []
-        for feat in results.get("features", []):
-            props = feat.get("properties", {})
-            date_str = props.get("date")
-            value = props.get("value")
-            cloud = props.get("cloud", 100)
-            if date_str is not None and value is not None:
-                obs = {"date": date_str, "value": value, "cloud": cloud}
-                for key in (
-                    "min_value",
-                    "max_value",
-                    "std_value",
-                    "median_value",
-                    "percentile_25",
-                    "percentile_75",
-                    "percentile_90",
-                    "pixel_count",
-                ):
-                    if props.get(key) is not None:
-                        obs[key] = props[key]
-                observations.append(obs)
+        observations = _parse_multi_index_features(results, index_names)
 
-        logger.info(f"Chunk {start_date}→{end_date}: {len(observations)} observations")
-        _log_per_observation_chunk_debug(
-            index_name, start_date, end_date, results, observations
-        )
+        for index_name in index_names:
+            logger.info(
+                f"Chunk {start_date}→{end_date}: {len(observations[index_name])} "
+                f"observations ({index_name})"
+            )
+            _log_per_observation_chunk_debug(
+                index_name, start_date, end_date, results, observations[index_name]
+            )
         return observations
 
     def _get_time_series_batched(
@@ -1051,7 +1655,7 @@ class EarthEngineService:
                 for i, (w_start, w_end) in enumerate(windows)
             ]
         )
-        count_results = count_features.getInfo()
+        count_results = counted_get_info(count_features, "timeseries_window_counts")
 
         non_empty_indices = set()
         for feat in count_results.get("features", []):
@@ -1109,7 +1713,7 @@ class EarthEngineService:
             [make_window_feature(w) for w in non_empty_windows]
         )
 
-        results = features.getInfo()
+        results = counted_get_info(features, "timeseries_windows")
 
         time_series = []
         for feat in results.get("features", []):
@@ -1151,7 +1755,9 @@ class EarthEngineService:
                     use_aoi_cloud_filter=use_aoi_cloud_filter,
                 )
 
-                count = sub_collection.size().getInfo()
+                count = counted_get_info(
+                    sub_collection.size(), "timeseries_window_size"
+                )
                 if count == 0:
                     current = window_end
                     continue
@@ -1174,7 +1780,7 @@ class EarthEngineService:
                     bestEffort=True,
                     tileScale=4,
                 ).get(index)
-                value = stats.getInfo()
+                value = counted_get_info(stats, "timeseries_window_mean")
                 if value is not None:
                     time_series.append(
                         {"date": current.strftime("%Y-%m-%d"), "value": value}
@@ -1226,39 +1832,56 @@ class EarthEngineService:
         date: str,
         aoi: ee.Geometry,
         vis_params: Dict[str, Any],
+        geometry: Dict,
     ) -> str:
-        """Create enhanced visualization with date, scale bar, and statistics"""
+        """Create enhanced visualization with date, scale bar, and statistics.
+
+        The index is fetched once as a pixel grid, coloured locally with the
+        shared palette LUT, and the statistics are taken from the same array.
+        """
+        from app.services.satellite.types import parse_geometry
+        from app.services.satellite.utils.visualization import (
+            apply_color_palette,
+            normalize_array,
+        )
+
         try:
-            # Get the base image as bytes
-            base_url = image.getThumbUrl(
-                {
-                    "min": vis_params["min"],
-                    "max": vis_params["max"],
-                    "palette": vis_params["palette"],
-                    "dimensions": 512,
-                    "region": aoi,
-                    "format": "png",
-                }
+            band, _ = self._fetch_index_grid(
+                image,
+                index,
+                parse_geometry(geometry),
+                THUMBNAIL_DIMENSION * THUMBNAIL_DIMENSION,
+                "index_map_pixels",
             )
 
-            # Download the base image
-            import requests
-
-            response = requests.get(base_url)
-            base_image = Image.open(io.BytesIO(response.content))
+            colored = apply_color_palette(
+                normalize_array(band, vis_params["min"], vis_params["max"]),
+                vis_params["palette"],
+            )
+            colored[np.isnan(band)] = 255  # masked pixels blend into the canvas
+            base_image = Image.fromarray(colored)
+            longest = max(base_image.size)
+            if longest != THUMBNAIL_DIMENSION:
+                factor = THUMBNAIL_DIMENSION / longest
+                base_image = base_image.resize(
+                    (
+                        max(1, round(base_image.width * factor)),
+                        max(1, round(base_image.height * factor)),
+                    ),
+                    Image.NEAREST,
+                )
 
-            # Calculate statistics
-            # Use CRS parameter to handle AOI crossing UTM zone boundaries
-            stats = image.reduceRegion(
-                reducer=ee.Reducer.percentile([10, 90])
-                .combine(ee.Reducer.mean(), "", True)
-                .combine(ee.Reducer.median(), "", True)
-                .combine(ee.Reducer.stdDev(), "", True),
-                geometry=aoi,
-                scale=settings.DEFAULT_SCALE,
-                crs="EPSG:4326",  # Use WGS84 to handle AOI crossing UTM zone boundaries
-                maxPixels=settings.MAX_PIXELS,
-            ).getInfo()
+            valid = band[~np.isnan(band)]
+            stats = {}
+            if valid.size:
+                p10, p90 = np.percentile(valid, [10, 90])
+                stats = {
+                    f"{index}_mean": float(valid.mean()),
+                    f"{index}_median": float(np.median(valid)),
+                    f"{index}_p10": float(p10),
+                    f"{index}_p90": float(p90),
+                    f"{index}_stdDev": float(valid.std()),
+                }
 
             # Create enhanced image
             enhanced_image = self._add_overlays(
@@ -1537,7 +2160,7 @@ class EarthEngineService:
 
         # Get the image for the specific date.
         # Interactive/scatter uses B2,B3,B4,B8 at 10m - tile-level cloud filter only (no SCL).
-        collection = self.get_sentinel2_collection(
+        lazy = self.get_sentinel2_collection_lazy(
             geometry,
             date,
             (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime(
@@ -1547,17 +2170,7 @@ class EarthEngineService:
             use_aoi_cloud_filter=False,
         )
 
-        try:
-            collection_size = collection.size().getInfo()
-            if collection_size == 0:
-                raise ValueError(f"No images found for date {date}")
-
-            image = ee.Image(collection.first())
-        except Exception as e:
-            if "Empty date ranges not supported" in str(e):
-                raise ValueError(f"No images found for date {date}")
-            else:
-                raise e
+        image = ee.Image(lazy.collection.first())
 
         indices = self.calculate_vegetation_indices(image, [index])
         index_image = indices[index]
@@ -1566,13 +2179,6 @@ class EarthEngineService:
         aoi = ee.Geometry(geometry)
         clipped = index_image.clip(aoi)
 
-        # Get the bounds of the geometry
-        bounds = aoi.bounds().getInfo()["coordinates"][0]
-        min_lon = min([coord[0] for coord in bounds])
-        max_lon = max([coord[0] for coord in bounds])
-        min_lat = min([coord[1] for coord in bounds])
-        max_lat = max([coord[1] for coord in bounds])
-
         # Sample the image to get pixel values with coordinates
         scale = scale or settings.DEFAULT_SCALE
 
@@ -1581,8 +2187,29 @@ class EarthEngineService:
             region=aoi, scale=scale, numPixels=max_pixels, geometries=True
         )
 
-        # Get the sampled data
-        sampled_data = sample_points.getInfo()
+        # Emptiness check, bounds and sampled data in a single round trip
+        try:
+            fused = lazy.evaluate(
+                payload={"samples": sample_points},
+                always={"bounds": aoi.bounds()},
+                operation="export_interactive_data",
+            )
+        except Exception as e:
+            if "Empty date ranges not supported" in str(e):
+                raise ValueError(f"No images found for date {date}")
+            else:
+                raise e
+        if fused["size"] == 0:
+            raise ValueError(f"No images found for date {date}")
+
+        # Get the bounds of the geometry
+        bounds = fused["bounds"]["coordinates"][0]
+        min_lon = min([coord[0] for coord in bounds])
+        max_lon = max([coord[0] for coord in bounds])
+        min_lat = min([coord[1] for coord in bounds])
+        max_lat = max([coord[1] for coord in bounds])
+
+        sampled_data = fused["samples"]
 
         # Process data for ECharts
         pixel_data = []
@@ -1649,44 +2276,253 @@ class EarthEngineService:
         }
 
     async def export_heatmap_data(
-        self, geometry: Dict, date: str, index: str, sample_points: int = 1000
+        self,
+        geometry: Dict,
+        date: str,
+        index: str,
+        sample_points: int = 1000,
+        as_grid: bool = False,
     ) -> Dict[str, Any]:
         """Export real Earth Engine pixel data for heatmap visualization within AOI.
 
         Fetches the exact requested date using the same SCL-based AOI cloud filter
         as available-dates and timeseries. No fallback — the date picker guarantees
         only available dates are shown.
+
+        With ``as_grid`` (binary responses) the computePixels raster is returned
+        as a ``HeatmapGrid`` under ``"raster"`` and ``pixel_data`` is left empty;
+        sample mode always returns points.
         """
         self.initialize()
 
         # Fetch exact date — same filter as available-dates
-        collection = self.get_sentinel2_collection(
+        lazy = self.get_sentinel2_collection_lazy(
             geometry,
             date,
             date,
             max_cloud_coverage=settings.MAX_CLOUD_COVERAGE,
             use_aoi_cloud_filter=True,
         )
-        collection_size = collection.size().getInfo()
-        if collection_size == 0:
+        aoi = ee.Geometry(geometry)
+
+        # Emptiness check and AOI bounds in one round trip
+        fused = lazy.evaluate(
+            always={"bounds": aoi.bounds()}, operation="export_heatmap_data"
+        )
+        if fused["size"] == 0:
             raise ValueError(f"No Sentinel-2 images found for {date}")
 
-        image = ee.Image(collection.sort("CLOUDY_PIXEL_PERCENTAGE").first())
+        image = lazy.best_image()
 
         indices = self.calculate_vegetation_indices(image, [index])
         index_image = indices[index]
 
         # Clip to AOI
-        aoi = ee.Geometry(geometry)
         clipped = index_image.clip(aoi)
 
         # Get bounds
-        bounds = aoi.bounds().getInfo()["coordinates"][0]
+        bounds = fused["bounds"]["coordinates"][0]
         min_lon = min([coord[0] for coord in bounds])
         max_lon = max([coord[0] for coord in bounds])
         min_lat = min([coord[1] for coord in bounds])
         max_lat = max([coord[1] for coord in bounds])
 
+        raster = None
+        if settings.GEE_HEATMAP_MODE == "sample":
+            pixel_data, all_values, sampling = self._sample_heatmap_points(
+                clipped, aoi, index, min_lon, max_lon, min_lat, max_lat, sample_points
+            )
+        elif as_grid:
+            raster, sampling = self._compute_heatmap_grid(
+                clipped, index, min_lon, max_lon, min_lat, max_lat
+            )
+            pixel_data = []
+            all_values = raster.values[np.isfinite(raster.values)].astype(np.float64)
+        else:
+            pixel_data, all_values, sampling = self._compute_heatmap_pixels(
+                clipped, index, min_lon, max_lon, min_lat, max_lat
+            )
+
+        if all_values.size:
+            from app.services.satellite.utils.statistics import (
+                calculate_statistics_from_array,
+            )
+
+            stats = calculate_statistics_from_array(all_values, percentiles=[10, 90])
+        else:
+            stats = {
+                "min": 0,
+                "max": 0,
+                "mean": 0,
+                "median": 0,
+                "p10": 0,
+                "p90": 0,
+                "std": 0,
+                "count": 0,
+            }
+
+        vis_params = self._get_visualization_params(index)
+
+        # Get AOI polygon coordinates for boundary visualization
+        aoi_coordinates = []
+        if geometry.get("type") == "Polygon" and geometry.get("coordinates"):
+            aoi_coordinates = geometry["coordinates"][0]
+
+        result = {
+            "date": date,
+            "index": index,
+            "bounds": {
+                "min_lon": min_lon,
+                "max_lon": max_lon,
+                "min_lat": min_lat,
+                "max_lat": max_lat,
+            },
+            "pixel_data": pixel_data,
+            "aoi_boundary": aoi_coordinates,
+            "statistics": stats,
+            "visualization": vis_params,
+            "metadata": {
+                **sampling,
+                "total_pixels": int(all_values.size),
+                "data_source": "Sentinel-2 Earth Engine",
+                "aoi_area_deg2": (max_lat - min_lat) * (max_lon - min_lon),
+            },
+        }
+        if raster is not None:
+            result["raster"] = raster
+        return result
+
+    def _fetch_index_grid(
+        self,
+        clipped: Any,
+        index: str,
+        bounds: Tuple[float, float, float, float],
+        max_pixels: int,
+        operation: str,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """One computePixels request for ``clipped`` over ``bounds`` (min_lon, max_lon, min_lat, max_lat).
+
+        Returns the float64 band (NaN where masked) and its grid spec.
+        """
+        min_lon, max_lon, min_lat, max_lat = bounds
+        spec = heatmap_grid_spec(min_lon, max_lon, min_lat, max_lat, max_pixels)
+        logger.info(
+            f"Fetching {spec['width']}x{spec['height']} {index} grid at "
+            f"{spec['scale']:.1f}m via computePixels"
+        )
+
+        request = {
+            "expression": clipped.rename(index)
+            .toFloat()
+            .unmask(HEATMAP_NODATA, False),
+            "fileFormat": "NUMPY_NDARRAY",
+            "grid": {
+                "dimensions": {"width": spec["width"], "height": spec["height"]},
+                "affineTransform": {
+                    "scaleX": spec["pixel_width"],
+                    "shearX": 0,
+                    "translateX": min_lon,
+                    "shearY": 0,
+                    "scaleY": -spec["pixel_height"],
+                    "translateY": max_lat,
+                },
+                "crsCode": "EPSG:4326",
+            },
+        }
+        try:
+            record_round_trip(operation)
+            raster = ee.data.computePixels(request)
+        except Exception as e:
+            logger.error(f"Error computing Earth Engine pixels for {index}: {e}")
+            logger.error(
+                f"AOI bounds: lat={min_lat}-{max_lat}, lon={min_lon}-{max_lon}"
+            )
+            raise ValueError(f"Failed to fetch satellite grid data: {str(e)}")
+
+        if raster.dtype.names:
+            raster = raster[index]
+        band = np.asarray(raster, dtype=np.float64)
+        band[band == HEATMAP_NODATA] = np.nan
+        return band, spec
+
+    def _compute_heatmap_grid(
+        self,
+        clipped: Any,
+        index: str,
+        min_lon: float,
+        max_lon: float,
+        min_lat: float,
+        max_lat: float,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Fetch the clipped index as one EPSG:4326 ``HeatmapGrid`` via computePixels.
+
+        The resolution starts at 10 m and is coarsened so the grid stays within
+        GEE_HEATMAP_MAX_PIXELS; masked pixels come back as a sentinel and are
+        NaN in the grid.
+        """
+        from app.services.satellite.utils.heatmap_encoding import HeatmapGrid
+
+        band, spec = self._fetch_index_grid(
+            clipped,
+            index,
+            (min_lon, max_lon, min_lat, max_lat),
+            settings.GEE_HEATMAP_MAX_PIXELS,
+            "export_heatmap_data.compute_pixels",
+        )
+        # computePixels returns float32 (toFloat), so the cast is lossless
+        grid = HeatmapGrid(
+            origin_lon=min_lon,
+            origin_lat=max_lat,
+            pixel_width=spec["pixel_width"],
+            pixel_height=spec["pixel_height"],
+            values=band.astype(np.float32),
+        )
+        return grid, {
+            "sample_scale": spec["scale"],
+            "sampling_method": "computePixels grid",
+            "grid": {
+                "width": spec["width"],
+                "height": spec["height"],
+                "pixel_width": spec["pixel_width"],
+                "pixel_height": spec["pixel_height"],
+            },
+        }
+
+    def _compute_heatmap_pixels(
+        self,
+        clipped: Any,
+        index: str,
+        min_lon: float,
+        max_lon: float,
+        min_lat: float,
+        max_lat: float,
+    ) -> Tuple[List[Dict[str, float]], np.ndarray, Dict[str, Any]]:
+        """Valid cells of :meth:`_compute_heatmap_grid` as ``{lon, lat, value}`` points."""
+        from app.services.satellite.utils.raster_points import raster_to_points
+
+        grid, sampling = self._compute_heatmap_grid(
+            clipped, index, min_lon, max_lon, min_lat, max_lat
+        )
+
+        x_coords = grid.origin_lon + (np.arange(grid.width) + 0.5) * grid.pixel_width
+        y_coords = grid.origin_lat - (np.arange(grid.height) + 0.5) * grid.pixel_height
+        pixel_data, values = raster_to_points(grid.values, x_coords, y_coords)
+        logger.info(f"Decoded {len(pixel_data)} valid pixels from heatmap grid")
+
+        return pixel_data, values, sampling
+
+    def _sample_heatmap_points(
+        self,
+        clipped: Any,
+        aoi: Any,
+        index: str,
+        min_lon: float,
+        max_lon: float,
+        min_lat: float,
+        max_lat: float,
+        sample_points: int,
+    ) -> Tuple[List[Dict[str, float]], np.ndarray, Dict[str, Any]]:
+        """Legacy heatmap fetch: sample(numPixels) point features at 10 m."""
         # Get FULL raster grid approach - like research notebook
         # Use 10m scale for detailed visualization
         sample_scale = 10
@@ -1773,7 +2609,9 @@ class EarthEngineService:
             logger.info(
                 f"Starting to sample up to {max_pixels} pixels at {sample_scale}m resolution"
             )
-            sampled_data = sampled_pixels.getInfo()
+            sampled_data = counted_get_info(
+                sampled_pixels, "export_heatmap_data.sample"
+            )
             num_features = len(sampled_data.get("features", [])) if sampled_data else 0
             logger.info(
                 f"Successfully retrieved {num_features} pixels from Earth Engine (target was {max_pixels})"
@@ -1818,72 +2656,16 @@ class EarthEngineService:
                     pixel_data.append({"lon": lon, "lat": lat, "value": value})
                     all_values.append(value)
 
-        # Calculate real statistics from actual satellite data
-        if all_values:
-            sorted_values = sorted(all_values)
-            n = len(sorted_values)
-
-            stats = {
-                "min": min(all_values),
-                "max": max(all_values),
-                "mean": sum(all_values) / len(all_values),
-                "median": sorted_values[n // 2] if n > 0 else 0,
-                "p10": sorted_values[int(n * 0.1)] if n > 0 else 0,
-                "p90": sorted_values[int(n * 0.9)] if n > 0 else 0,
-                "std": (
-                    sum(
-                        [
-                            (x - sum(all_values) / len(all_values)) ** 2
-                            for x in all_values
-                        ]
-                    )
-                    / len(all_values)
-                )
-                ** 0.5,
-                "count": len(all_values),
-            }
-        else:
-            stats = {
-                "min": 0,
-                "max": 0,
-                "mean": 0,
-                "median": 0,
-                "p10": 0,
-                "p90": 0,
-                "std": 0,
-                "count": 0,
-            }
-
-        vis_params = self._get_visualization_params(index)
-
-        # Get AOI polygon coordinates for boundary visualization
-        aoi_coordinates = []
-        if geometry.get("type") == "Polygon" and geometry.get("coordinates"):
-            aoi_coordinates = geometry["coordinates"][0]
-
-        return {
-            "date": date,
-            "index": index,
-            "bounds": {
-                "min_lon": min_lon,
-                "max_lon": max_lon,
-                "min_lat": min_lat,
-                "max_lat": max_lat,
-            },
-            "pixel_data": pixel_data,
-            "aoi_boundary": aoi_coordinates,
-            "statistics": stats,
-            "visualization": vis_params,
-            "metadata": {
+        return (
+            pixel_data,
+            np.asarray(all_values, dtype=np.float64),
+            {
                 "sample_scale": sample_scale,
-                "total_pixels": len(pixel_data),
-                "data_source": "Sentinel-2 Earth Engine",
                 "sampling_method": "High-density grid sampling",
                 "max_requested_pixels": max_pixels,
                 "estimated_total_pixels": estimated_pixels,
-                "aoi_area_deg2": area_deg_lat * area_deg_lon,
             },
-        }
+        )
 
     async def export_index_map(
         self,
@@ -1909,11 +2691,29 @@ class EarthEngineService:
                 logger.info(f"Using existing file from bucket: {existing_url}")
                 return {"type": "static", "url": existing_url}
 
+        # Renders of settled dates never change; serve repeats from the cache
+        vis_params = self._get_visualization_params(index)
+        cache_key = None
+        if (
+            not organization_id
+            and datetime.strptime(date, "%Y-%m-%d").date()
+            <= observation_store.settled_until()
+        ):
+            cache_key = render_key(
+                geometry,
+                date,
+                index,
+                {**vis_params, "dimension": THUMBNAIL_DIMENSION},
+            )
+            cached_url = render_cache.get(cache_key)
+            if cached_url is not None:
+                return {"type": "static", "url": cached_url}
+
         self.initialize()
 
         # Get the image for the specific date.
         # Export uses B2,B3,B4,B8 at 10m - tile-level cloud filter only (no SCL).
-        collection = self.get_sentinel2_collection(
+        lazy = self.get_sentinel2_collection_lazy(
             geometry,
             date,
             (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime(
@@ -1924,11 +2724,10 @@ class EarthEngineService:
         )
 
         try:
-            collection_size = collection.size().getInfo()
-            if collection_size == 0:
+            if lazy.is_empty():
                 raise ValueError(f"No images found for date {date}")
 
-            image = ee.Image(collection.first())
+            image = ee.Image(lazy.collection.first())
         except Exception as e:
             if "Empty date ranges not supported" in str(e):
                 raise ValueError(f"No images found for date {date}")
@@ -1949,13 +2748,14 @@ class EarthEngineService:
             )
             return {"type": "static", "url": url}
         else:
-            # For web display, create enhanced visualization with overlays
-            vis_params = self._get_visualization_params(index)
-
-            # Create enhanced visualization with date, scale bar, and statistics
+            # For web display, create enhanced visualization with date, scale
+            # bar, and statistics
             enhanced_url = self._create_enhanced_visualization(
-                clipped, index, date, aoi, vis_params
+                clipped, index, date, aoi, vis_params, geometry
             )
+            # Only local renders are cached; getThumbUrl fallbacks expire
+            if cache_key and enhanced_url.startswith("data:"):
+                render_cache.put(cache_key, enhanced_url)
             return {"type": "static", "url": enhanced_url}
 
     async def _export_to_supabase_storage(
@@ -2027,40 +2827,71 @@ class EarthEngineService:
         self, geometry: Dict, start_date: str, end_date: str, indices: List[str]
     ) -> Dict:
         """Calculate statistics for multiple indices over a date range"""
-        self.initialize()
-
-        # Statistics use B2,B3,B4,B8 at 10m - tile-level cloud filter only (no SCL).
-        collection = self.get_sentinel2_collection(
-            geometry,
-            start_date,
-            end_date,
-            max_cloud_coverage=settings.MAX_CLOUD_COVERAGE,
-            use_aoi_cloud_filter=False,
-        )
-        aoi = ee.Geometry(geometry)
+        return self.get_statistics_for_periods(
+            geometry, [(start_date, end_date)], indices
+        )[0]
 
-        # Get the median composite
-        composite = collection.median()
+    def get_statistics_for_periods(
+        self,
+        geometry: Dict,
+        periods: List[Tuple[str, str]],
+        indices: List[str],
+    ) -> List[Dict]:
+        """Statistics for every index over each (start_date, end_date) period.
 
-        # Calculate all indices
-        index_images = self.calculate_vegetation_indices(composite, indices)
+        Each period's indices are stacked into one multi-band image and reduced
+        with a single combined reducer; all periods come back in one getInfo.
+        Returns one ``{index: {f"{index}_{stat}": value}}`` dict per period.
+        """
+        self.initialize()
+        aoi = ee.Geometry(geometry)
+        reducer = (
+            ee.Reducer.percentile([2, 25, 50, 75, 98])
+            .combine(ee.Reducer.mean(), "", True)
+            .combine(ee.Reducer.stdDev(), "", True)
+        )
 
-        statistics = {}
-        for index_name, index_image in index_images.items():
+        reductions = []
+        index_names: List[str] = []
+        for start_date, end_date in periods:
+            # Statistics use B2,B3,B4,B8 at 10m - tile-level cloud filter only (no SCL).
+            collection = self.get_sentinel2_collection(
+                geometry,
+                start_date,
+                end_date,
+                max_cloud_coverage=settings.MAX_CLOUD_COVERAGE,
+                use_aoi_cloud_filter=False,
+            )
+            composite = collection.median()
+            index_images = self.calculate_vegetation_indices(composite, indices)
+            index_names = list(index_images)
+            stacked = ee.Image.cat(
+                [image.rename(name) for name, image in index_images.items()]
+            )
             # Use CRS parameter to handle AOI crossing UTM zone boundaries
-            stats = index_image.reduceRegion(
-                reducer=ee.Reducer.percentile([2, 25, 50, 75, 98])
-                .combine(ee.Reducer.mean(), "", True)
-                .combine(ee.Reducer.stdDev(), "", True),
-                geometry=aoi,
-                scale=settings.DEFAULT_SCALE,
-                crs="EPSG:4326",  # Use WGS84 to handle AOI crossing UTM zone boundaries
-                maxPixels=settings.MAX_PIXELS,
+            reductions.append(
+                stacked.reduceRegion(
+                    reducer=reducer,
+                    geometry=aoi,
+                    scale=settings.DEFAULT_SCALE,
+                    crs="EPSG:4326",
+                    maxPixels=settings.MAX_PIXELS,
+                )
             )
 
-            statistics[index_name] = stats.getInfo()
-
-        return statistics
+        results = counted_get_info(ee.List(reductions), "statistics") or []
+        return [
+            {
+                name: {
+                    key: value
+                    for key, value in (result or {}).items()
+                    if key[: len(name) + 1] == f"{name}_"
+                    and key[len(name) + 1 :] in _STATISTICS_SUFFIXES
+                }
+                for name in index_names
+            }
+            for result in results
+        ]
 
     def check_cloud_coverage(
         self,
@@ -2088,7 +2919,7 @@ class EarthEngineService:
             )
 
             # Check if collection has any images at all
-            collection_size = collection.size().getInfo()
+            collection_size = counted_get_info(collection.size(), "cloud_check_size")
             logger.info(
                 f"Found {collection_size} images in collection for date range {start_date} to {end_date}"
             )
@@ -2129,9 +2960,10 @@ class EarthEngineService:
 
             # Get all cloud percentages - handle empty collection
             try:
-                cloud_percentages = cloud_info.aggregate_array(
-                    "cloud_percentage"
-                ).getInfo()
+                cloud_percentages = counted_get_info(
+                    cloud_info.aggregate_array("cloud_percentage"),
+                    "cloud_check_percentages",
+                )
                 suitable_images = cloud_info.filter(ee.Filter.eq("suitable", True))
                 # Debug logging for better understanding
                 logger.info(
@@ -2161,7 +2993,9 @@ class EarthEngineService:
 
             # Calculate statistics
             available_count = len(cloud_percentages)
-            suitable_count = suitable_images.size().getInfo()
+            suitable_count = counted_get_info(
+                suitable_images.size(), "cloud_check_suitable"
+            )
 
             if available_count > 0:
                 min_cloud = min(cloud_percentages)
@@ -2174,11 +3008,13 @@ class EarthEngineService:
             best_date = None
             if suitable_count > 0:
                 best_image = suitable_images.sort("cloud_percentage").first()
-                best_date = best_image.get("date").getInfo()
+                best_date = counted_get_info(best_image.get("date"), "cloud_check_best")
             elif available_count > 0:
                 # If no suitable images, use the image with lowest cloud coverage
                 best_image = collection.sort("CLOUDY_PIXEL_PERCENTAGE").first()
-                best_date = best_image.date().format("YYYY-MM-dd").getInfo()
+                best_date = counted_get_info(
+                    best_image.date().format("YYYY-MM-dd"), "cloud_check_best"
+                )
 
             logger.info(
                 f"Cloud coverage check: {available_count} available, {suitable_count} suitable, best date: {best_date}"
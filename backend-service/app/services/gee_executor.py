@@ -0,0 +1,179 @@
+"""
+Dedicated, bounded executor for blocking Earth Engine calls.
+
+``getInfo()`` and the provider methods built on it block for 10-120 s. Async
+routes hand that work to :func:`run_gee`, which runs it on a thread pool of
+``GEE_EXECUTOR_WORKERS`` threads kept separate from the default
+``asyncio.to_thread`` pool, so a backlog of slow parcels queues here instead of
+starving weather, PDF or database work. The context (including the
+``gee_metrics`` route) is copied into the worker so round trips stay
+attributed to the request that scheduled them.
+
+Time-series requests split into date chunks that run concurrently. Those
+sub-requests are submitted with :func:`submit_gee_chunk` to a second
+process-wide pool of ``GEE_TS_CHUNK_WORKERS`` threads. The cap therefore
+holds across all concurrent syncs and streams. Chunks are scheduled from
+inside ``run_gee`` workers, so they must never go back into the ``run_gee``
+pool: a full pool would wait on itself.
+
+Queue depth and time spent waiting for a worker are tracked per pool for
+``/api/health/gee-metrics``.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_chunk_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {}
+_chunk_stats: Dict[str, float] = {}
+
+
+def _reset_stats(stats: Dict[str, float]) -> None:
+    stats.update(
+        queued=0,
+        running=0,
+        submitted=0,
+        completed=0,
+        failed=0,
+        max_queue_depth=0,
+        total_wait_s=0.0,
+        max_wait_s=0.0,
+    )
+
+
+_reset_stats(_stats)
+_reset_stats(_chunk_stats)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.GEE_EXECUTOR_WORKERS),
+                thread_name_prefix="gee",
+            )
+        return _executor
+
+
+def _get_chunk_executor() -> ThreadPoolExecutor:
+    global _chunk_executor
+    with _executor_lock:
+        if _chunk_executor is None:
+            _chunk_executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.GEE_TS_CHUNK_WORKERS),
+                thread_name_prefix="gee-ts-chunk",
+            )
+        return _chunk_executor
+
+
+def _record_submit(stats: Dict[str, float]) -> None:
+    with _stats_lock:
+        stats["queued"] += 1
+        stats["submitted"] += 1
+        stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queued"])
+
+
+def _instrumented(
+    fn: Callable[[], T], submitted_at: float, stats: Dict[str, float] = _stats
+) -> T:
+    waited = time.monotonic() - submitted_at
+    with _stats_lock:
+        stats["queued"] -= 1
+        stats["running"] += 1
+        stats["total_wait_s"] += waited
+        stats["max_wait_s"] = max(stats["max_wait_s"], waited)
+    failed = False
+    try:
+        return fn()
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        with _stats_lock:
+            stats["running"] -= 1
+            stats["completed"] += 1
+            if failed:
+                stats["failed"] += 1
+
+
+async def run_gee(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Earth Engine call on the GEE executor and await its result."""
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    _record_submit(_stats)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), _instrumented, call, time.monotonic()
+    )
+
+
+def _dequeue_cancelled(future: Future) -> None:
+    # A chunk cancelled before it started never reaches _instrumented
+    if future.cancelled():
+        with _stats_lock:
+            _chunk_stats["queued"] -= 1
+
+
+def submit_gee_chunk(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> "Future[T]":
+    """Submit one time-series chunk request to the shared chunk pool.
+
+    Safe to call from ``run_gee`` workers. Callers cancel the futures they no
+    longer need.
+    """
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    _record_submit(_chunk_stats)
+    future = _get_chunk_executor().submit(
+        _instrumented, call, time.monotonic(), _chunk_stats
+    )
+    future.add_done_callback(_dequeue_cancelled)
+    return future
+
+
+def _snapshot(stats: Dict[str, float], workers: int) -> Dict[str, Any]:
+    with _stats_lock:
+        out: Dict[str, Any] = dict(stats)
+    started = out["completed"] + out["running"]
+    out["avg_wait_s"] = out["total_wait_s"] / started if started else 0.0
+    out["workers"] = max(1, workers)
+    return out
+
+
+def snapshot() -> Dict[str, Any]:
+    """Current queue depth, in-flight calls and wait-time totals."""
+    stats = _snapshot(_stats, settings.GEE_EXECUTOR_WORKERS)
+    stats["chunks"] = _snapshot(_chunk_stats, settings.GEE_TS_CHUNK_WORKERS)
+    return stats
+
+
+def reset() -> None:
+    with _stats_lock:
+        for stats in (_stats, _chunk_stats):
+            queued, running = stats["queued"], stats["running"]
+            _reset_stats(stats)
+            stats["queued"], stats["running"] = queued, running
+
+
+def shutdown_gee_executor() -> None:
+    """Stop the executors (app shutdown); pending calls are cancelled."""
+    global _executor, _chunk_executor
+    with _executor_lock:
+        for pool in (_executor, _chunk_executor):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _chunk_executor = None
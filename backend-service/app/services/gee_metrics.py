@@ -0,0 +1,47 @@
+"""
+Earth Engine round-trip accounting.
+
+Every blocking ``getInfo()`` issued through :func:`counted_get_info` is counted
+per (route, operation) so we can verify how many GEE round trips each endpoint
+pays. The route template is taken from a context variable set by an app-wide
+dependency (``app.main.tag_gee_route``); ``asyncio.to_thread`` copies the
+context, so counts made inside worker threads are attributed to the request
+that scheduled them.
+"""
+
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Dict
+
+current_route: ContextVar[str] = ContextVar("gee_current_route", default="background")
+
+_lock = threading.Lock()
+_round_trips: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+
+def record_round_trip(operation: str) -> None:
+    """Count one blocking GEE request for the current route."""
+    route = current_route.get()
+    with _lock:
+        _round_trips[route][operation] += 1
+
+
+def counted_get_info(ee_object: Any, operation: str) -> Any:
+    """``ee_object.getInfo()`` with round-trip accounting."""
+    record_round_trip(operation)
+    return ee_object.getInfo()
+
+
+def snapshot() -> Dict[str, Any]:
+    """Round trips per route, with a per-operation breakdown."""
+    with _lock:
+        return {
+            route: {"total": sum(ops.values()), "operations": dict(ops)}
+            for route, ops in _round_trips.items()
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _round_trips.clear()
@@ -0,0 +1,254 @@
+"""
+Incremental store for per-observation Sentinel-2 index statistics.
+
+EarthEngineService._get_time_series_per_observation reduces every scene in the
+requested range. Past acquisitions never change, so each reduced observation is
+persisted here keyed by (geometry fingerprint, index, scale, cloud-filter mode,
+acquisition date), together with the date ranges that have already been scanned.
+Subsequent requests read history locally and only ask Earth Engine for the
+uncovered gaps (typically the last few days).
+
+Coverage is only recorded up to ``today - TIMESERIES_STORE_SETTLE_DAYS`` so that
+scenes still being ingested by GEE are picked up on a later request.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def geometry_fingerprint(geometry: Dict, length: Optional[int] = 8) -> str:
+    """Hash a GeoJSON geometry (key-order independent).
+
+    The default 8-char prefix is meant for log correlation; pass ``length=None``
+    for the full digest when the fingerprint is used as a cache key.
+    """
+    raw = json.dumps(geometry, sort_keys=True)
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return digest[:length] if length else digest
+
+
+@dataclass(frozen=True)
+class ObservationSeriesKey:
+    """Identifies one stored observation series (all dates share the key)."""
+
+    fingerprint: str
+    index: str
+    scale: int
+    cloud_mode: str
+
+    @classmethod
+    def build(
+        cls,
+        geometry: Dict,
+        index: str,
+        scale: int,
+        max_cloud: float,
+        use_aoi_cloud_filter: bool,
+    ) -> "ObservationSeriesKey":
+        mode = "aoi" if use_aoi_cloud_filter else "tile"
+        return cls(
+            fingerprint=geometry_fingerprint(geometry, length=None),
+            index=index,
+            scale=int(scale),
+            cloud_mode=f"{mode}:{float(max_cloud):g}",
+        )
+
+    def as_str(self) -> str:
+        return f"{self.fingerprint}|{self.index}|{self.scale}|{self.cloud_mode}"
+
+
+def merge_date_ranges(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """Merge overlapping or day-adjacent inclusive date ranges."""
+    merged: List[Tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def uncovered_ranges(
+    covered: List[Tuple[date, date]], start: date, end: date
+) -> List[Tuple[date, date]]:
+    """Return the inclusive sub-ranges of [start, end] not in ``covered``."""
+    gaps: List[Tuple[date, date]] = []
+    cursor = start
+    for c_start, c_end in merge_date_ranges(covered):
+        if c_end < cursor:
+            continue
+        if c_start > end:
+            break
+        if c_start > cursor:
+            gaps.append((cursor, min(c_start - timedelta(days=1), end)))
+        cursor = max(cursor, c_end + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class ObservationStore:
+    """SQLite-backed store of reduced observations and scanned date ranges.
+
+    Safe to share between the worker threads that run GEE calls: a single
+    connection is guarded by a lock, and every write is one transaction.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                " series_key TEXT NOT NULL,"
+                " date TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " PRIMARY KEY (series_key, date))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                " series_key TEXT NOT NULL,"
+                " start_date TEXT NOT NULL,"
+                " end_date TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_coverage_key ON coverage (series_key)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS parcel_geometries ("
+                " parcel_id TEXT PRIMARY KEY,"
+                " fingerprint TEXT NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _covered(self, conn: sqlite3.Connection, key: str) -> List[Tuple[date, date]]:
+        rows = conn.execute(
+            "SELECT start_date, end_date FROM coverage WHERE series_key = ?", (key,)
+        ).fetchall()
+        return [(date.fromisoformat(s), date.fromisoformat(e)) for s, e in rows]
+
+    def get_observations(
+        self, key: ObservationSeriesKey, start: date, end: date
+    ) -> List[Dict[str, Any]]:
+        """Stored observations with start <= date <= end, sorted by date."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT payload FROM observations"
+                " WHERE series_key = ? AND date >= ? AND date <= ? ORDER BY date",
+                (key.as_str(), start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def missing_ranges(
+        self, key: ObservationSeriesKey, start: date, end: date
+    ) -> List[Tuple[date, date]]:
+        """Inclusive sub-ranges of [start, end] that have never been scanned."""
+        with self._lock:
+            covered = self._covered(self._connection(), key.as_str())
+        return uncovered_ranges(covered, start, end)
+
+    def record_chunk(
+        self,
+        key: ObservationSeriesKey,
+        observations: List[Dict[str, Any]],
+        scanned_start: date,
+        scanned_end: Optional[date],
+    ) -> None:
+        """Persist a chunk's observations and mark its settled range as scanned.
+
+        ``scanned_end`` of None (or before ``scanned_start``) stores the
+        observations without extending coverage, so the range is re-queried.
+        """
+        key_str = key.as_str()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO observations (series_key, date, payload)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (key_str, obs["date"], json.dumps(obs))
+                        for obs in observations
+                        if obs.get("date")
+                    ],
+                )
+                if scanned_end is None or scanned_end < scanned_start:
+                    return
+                merged = merge_date_ranges(
+                    self._covered(conn, key_str) + [(scanned_start, scanned_end)]
+                )
+                conn.execute("DELETE FROM coverage WHERE series_key = ?", (key_str,))
+                conn.executemany(
+                    "INSERT INTO coverage (series_key, start_date, end_date)"
+                    " VALUES (?, ?, ?)",
+                    [(key_str, s.isoformat(), e.isoformat()) for s, e in merged],
+                )
+
+    def bind_parcel(self, parcel_id: str, fingerprint: str) -> bool:
+        """Record the parcel's current boundary fingerprint.
+
+        When the boundary changed since the last call, every series stored for
+        the previous fingerprint is dropped and True is returned.
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT fingerprint FROM parcel_geometries WHERE parcel_id = ?",
+                    (parcel_id,),
+                ).fetchone()
+                if row and row[0] == fingerprint:
+                    return False
+                conn.execute(
+                    "INSERT OR REPLACE INTO parcel_geometries (parcel_id, fingerprint)"
+                    " VALUES (?, ?)",
+                    (parcel_id, fingerprint),
+                )
+                if not row:
+                    return False
+                prefix = f"{row[0]}|%"
+                conn.execute("DELETE FROM observations WHERE series_key LIKE ?", (prefix,))
+                conn.execute("DELETE FROM coverage WHERE series_key LIKE ?", (prefix,))
+        logger.info(f"Parcel {parcel_id} boundary changed; dropped series for {row[0][:8]}")
+        return True
+
+    def settled_until(self, today: Optional[date] = None) -> date:
+        """Last acquisition date considered final (no late GEE ingestion)."""
+        today = today or date.today()
+        return today - timedelta(days=settings.TIMESERIES_STORE_SETTLE_DAYS)
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM observations")
+                conn.execute("DELETE FROM coverage")
+                conn.execute("DELETE FROM parcel_geometries")
+
+
+observation_store = ObservationStore(
+    settings.TIMESERIES_STORE_PATH
+    or os.path.join(settings.TEMP_STORAGE_PATH, "timeseries_observations.sqlite3")
+)
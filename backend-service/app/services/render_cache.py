@@ -0,0 +1,246 @@
+"""
+Content-addressed cache for rendered static index maps.
+
+``EarthEngineService.export_index_map`` (without ``organization_id``) renders a
+PNG data URL per (parcel geometry, date, index, style). Imagery for a settled
+date never changes, so the rendered result is kept in an in-memory LRU bounded
+by ``RENDER_CACHE_MAX_BYTES`` and, when ``RENDER_CACHE_DISK_PATH`` is set, in a
+disk tier that survives restarts. Hits and misses are counted per tier.
+
+The disk tier lives under ``v<RENDER_VERSION>/``; directories of superseded
+versions are deleted on first use. It is bounded by
+``RENDER_CACHE_DISK_MAX_BYTES``: files are pruned least recently used first,
+with recency kept in file mtimes so it carries over restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.observation_store import geometry_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump when the renderer output changes so stale renders are not served.
+RENDER_VERSION = 1
+
+
+def render_key(geometry: Dict, date: str, index: str, style: Dict[str, Any]) -> str:
+    """Stable key for one render; ``style`` holds everything else that affects pixels."""
+    raw = json.dumps(
+        {
+            "geometry": geometry_fingerprint(geometry, length=None),
+            "date": date,
+            "index": index,
+            "style": style,
+            "version": RENDER_VERSION,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class RenderCache:
+    """Byte-budgeted LRU of rendered data URLs with an optional disk tier.
+
+    Thread-safe: renders run in worker threads and share the module instance.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        disk_path: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.disk_path = disk_path or None
+        self.disk_max_bytes = (
+            settings.RENDER_CACHE_DISK_MAX_BYTES if disk_max_bytes is None else disk_max_bytes
+        )
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # key -> file size, least recently used first; loaded on first disk access
+        self._disk_index: "Optional[OrderedDict[str, int]]" = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return value
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._insert(key, value)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._counters["stores"] += 1
+            self._insert(key, value)
+        self._write_disk(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = (
+                self._counters["memory_hits"]
+                + self._counters["disk_hits"]
+                + self._counters["misses"]
+            )
+            hits = lookups - self._counters["misses"]
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "disk_enabled": self.disk_path is not None,
+                "disk_bytes": self._disk_bytes,
+                "disk_max_bytes": self.disk_max_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for name in self._counters:
+                self._counters[name] = 0
+
+    def _insert(self, key: str, value: str) -> None:
+        """Add to the memory tier and evict least-recently-used entries (lock held)."""
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = value
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._counters["evictions"] += 1
+
+    def _disk_dir(self) -> str:
+        return os.path.join(self.disk_path, f"v{RENDER_VERSION}")
+
+    def _disk_file(self, key: str) -> str:
+        return os.path.join(self._disk_dir(), key[:2], f"{key}.txt")
+
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        """Index the current version's files by mtime; drop older versions (disk lock held)."""
+        if self._disk_index is not None:
+            return self._disk_index
+
+        current = f"v{RENDER_VERSION}"
+        try:
+            names = os.listdir(self.disk_path)
+        except OSError:
+            names = []
+        for name in names:
+            if name.startswith("v") and name[1:].isdigit() and name != current:
+                shutil.rmtree(os.path.join(self.disk_path, name), ignore_errors=True)
+                logger.info(f"Render cache: removed superseded disk tier {name}")
+
+        files: List[Tuple[float, str, int]] = []
+        for root, _, filenames in os.walk(self._disk_dir()):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    if filename.endswith(".tmp"):
+                        os.remove(path)  # interrupted write
+                    elif filename.endswith(".txt"):
+                        st = os.stat(path)
+                        files.append((st.st_mtime, filename[:-4], st.st_size))
+                except OSError:
+                    continue
+        files.sort()
+        self._disk_index = OrderedDict((key, size) for _, key, size in files)
+        self._disk_bytes = sum(size for _, _, size in files)
+        self._prune_disk()
+        return self._disk_index
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used files beyond the disk budget (disk lock held)."""
+        while self._disk_bytes > self.disk_max_bytes and self._disk_index:
+            key, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._disk_file(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Render cache disk prune failed for {key[:8]}: {e}")
+            with self._lock:
+                self._counters["disk_evictions"] += 1
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if not self.disk_path:
+            return None
+        path = self._disk_file(key)
+        with self._disk_lock:
+            index = self._load_disk_index()
+            if key not in index:
+                return None
+            try:
+                with open(path, "r", encoding="ascii") as f:
+                    value = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                self._disk_bytes -= index.pop(key)
+                return None
+            except OSError as e:
+                logger.warning(f"Render cache disk read failed for {key[:8]}: {e}")
+                return None
+            index.move_to_end(key)
+        return value
+
+    def _write_disk(self, key: str, value: str) -> None:
+        if not self.disk_path or len(value) > self.disk_max_bytes:
+            return
+        path = self._disk_file(key)
+        with self._disk_lock:
+            index = self._load_disk_index()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="ascii") as f:
+                    f.write(value)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Render cache disk write failed for {key[:8]}: {e}")
+                return
+            self._disk_bytes += len(value) - index.pop(key, 0)
+            index[key] = len(value)
+            self._prune_disk()
+
+
+render_cache = RenderCache(
+    settings.RENDER_CACHE_MAX_BYTES,
+    settings.RENDER_CACHE_DISK_PATH or None,
+    settings.RENDER_CACHE_DISK_MAX_BYTES,
+)
@@ -5,12 +5,15 @@ Defines the abstract interface that all satellite data providers must implement.
 This allows for provider-agnostic access to satellite data from different sources.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class ProviderType(str, Enum):
     """Supported satellite data provider types"""
@@ -193,6 +196,42 @@ class ISatelliteProvider(ABC):
         """
         pass
 
+    def get_time_series_multi(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        interval: str = "month",
+    ) -> Dict[str, TimeSeries]:
+        """
+        Get time series data for several vegetation indices.
+
+        Providers that can compute all indices in a single pass over the
+        imagery should override this; the default calls get_time_series()
+        once per index. An index whose call fails is logged and left out of
+        the result, so the other indices are still returned.
+
+        Args:
+            geometry: AOI geometry (GeoJSON format)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            indices: Vegetation index names
+            interval: Aggregation interval (day, week, month, year)
+
+        Returns:
+            Dictionary mapping index names to TimeSeries (failed indices omitted)
+        """
+        series: Dict[str, TimeSeries] = {}
+        for index in indices:
+            try:
+                series[index] = self.get_time_series(
+                    geometry, start_date, end_date, index, interval
+                )
+            except Exception as e:
+                logger.error(f"Time series for {index} failed: {e}")
+        return series
+
     @abstractmethod
     def export_heatmap_data(
         self,
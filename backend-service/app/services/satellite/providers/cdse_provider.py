@@ -35,11 +35,11 @@ from app.services.satellite.types import (
     VISUALIZATION_PARAMS,
     get_visualization_params,
     parse_geometry,
-    VEGETATION_INDEX_CALCULATORS,
     Sentinel2Band,
 )
 from app.services.satellite.utils.visualization import create_enhanced_visualization
 from app.services.satellite.utils.statistics import calculate_statistics_from_array
+from app.services.satellite.utils.raster_points import raster_to_points, sample_step
 from app.services.satellite.utils.index_calculator import (
     calculate_all_indices as calculate_indices_numpy,
 )
@@ -239,7 +239,8 @@ class CDSEProvider(ISatelliteProvider):
             indices: List of index names to calculate
 
         Returns:
-            Dictionary mapping index names to computed arrays
+            Dictionary mapping index names to computed arrays; indices that
+            are unknown or miss a band are left out
         """
         self._ensure_initialized()
 
@@ -265,26 +266,14 @@ class CDSEProvider(ISatelliteProvider):
             "B12": "swir2",
         }
 
-        # Prepare band arrays
-        bands = {}
-        for s2_band, name in band_mapping.items():
-            if s2_band in bands_dict:
-                bands[name] = bands_dict[s2_band].astype(np.float32)
-
-        # Calculate requested indices using numpy
-        results = {}
-        for index_name in indices:
-            if index_name in VEGETATION_INDEX_CALCULATORS:
-                try:
-                    index_array = VEGETATION_INDEX_CALCULATORS[index_name](bands)
-                    results[index_name] = index_array
-                except KeyError as e:
-                    logger.warning(f"Missing required band for {index_name}: {e}")
-                    results[index_name] = np.zeros_like(
-                        list(bands.values())[0], dtype=np.float32
-                    )
+        bands = {
+            name: bands_dict[s2_band]
+            for s2_band, name in band_mapping.items()
+            if s2_band in bands_dict
+        }
 
-        return results
+        # One shared float32 pass over the band math for all requested indices
+        return calculate_indices_numpy(bands, indices)
 
     def get_time_series(
         self,
@@ -485,34 +474,24 @@ class CDSEProvider(ISatelliteProvider):
                 logger.info(f"Reprojecting from {src_crs} to EPSG:4326")
                 data = data.rio.reproject("EPSG:4326")
 
-            pixel_data = []
-            values = []
-
             if len(data.shape) == 3:
                 band_data = data.values[0]
             else:
                 band_data = data.values
 
             height, width = band_data.shape
-            step = max(1, int(((height * width) / grid_size) ** 0.5))
-
-            y_coords = data.y.values
-            x_coords = data.x.values
-
-            for yi in range(0, height, step):
-                for xi in range(0, width, step):
-                    value = float(band_data[yi, xi])
-                    if not np.isnan(value) and not np.isinf(value):
-                        lon = float(x_coords[xi])
-                        lat = float(y_coords[yi])
-                        pixel_data.append({"lon": lon, "lat": lat, "value": value})
-                        values.append(value)
+            pixel_data, values = raster_to_points(
+                band_data,
+                data.x.values,
+                data.y.values,
+                sample_step(height, width, grid_size),
+            )
 
             data.close()
             os.unlink(tmp_path)
 
-            if values:
-                stats = calculate_statistics_from_array(np.array(values))
+            if values.size:
+                stats = calculate_statistics_from_array(values)
             else:
                 stats = {
                     "mean": 0,
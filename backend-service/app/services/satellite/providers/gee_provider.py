@@ -166,6 +166,47 @@ class GEEProvider(ISatelliteProvider):
             use_aoi_cloud_filter=False,
         )
 
+        return self._build_time_series(index, start_date, end_date, data)
+
+    def get_time_series_multi(
+        self,
+        geometry: Dict,
+        start_date: str,
+        end_date: str,
+        indices: List[str],
+        interval: str = "month",
+    ) -> Dict[str, TimeSeries]:
+        """
+        Get time series for several indices with one pass over the imagery.
+
+        Delegates to earth_engine_service.get_time_series_multi().
+        """
+        self._ensure_initialized()
+
+        data_by_index = earth_engine_service.get_time_series_multi(
+            geometry=geometry,
+            start_date=start_date,
+            end_date=end_date,
+            indices=indices,
+            interval=interval,
+            use_aoi_cloud_filter=False,
+        )
+
+        return {
+            index: self._build_time_series(
+                index, start_date, end_date, data_by_index.get(index, [])
+            )
+            for index in indices
+        }
+
+    def _build_time_series(
+        self,
+        index: str,
+        start_date: str,
+        end_date: str,
+        data: List[Dict[str, Any]],
+    ) -> TimeSeries:
+        """Convert earth_engine_service series dicts into a provider TimeSeries."""
         time_series_points: List[TimeSeriesPoint] = []
         for item in data:
             try:
@@ -0,0 +1,207 @@
+"""Compact binary encoding for heatmap rasters.
+
+``/api/indices/heatmap`` historically returned one ``{lon, lat, value}`` dict
+per pixel. The binary format ships the same data as a regular lon/lat grid:
+
+    magic       4 bytes   b"AHM1"
+    header_len  uint32 LE length of the JSON header (padded to 4 bytes)
+    header      UTF-8 JSON: response fields without ``pixel_data`` plus
+                ``grid`` = {origin_lon, origin_lat, pixel_width, pixel_height,
+                width, height, dtype, scale, offset, nodata}
+    values      width*height values, row-major from the north-west corner,
+                little-endian float32 (NaN = nodata) or uint16 quantised as
+                ``offset + q * scale`` (65535 = nodata)
+    mask        ceil(width*height / 8) bytes, ``np.packbits`` of the valid mask
+
+``origin_lon``/``origin_lat`` are the west/north edges of the grid, so the
+centre of cell (row, col) is ``origin_lon + (col + 0.5) * pixel_width``,
+``origin_lat - (row + 0.5) * pixel_height``.
+"""
+
+import json
+import math
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+HEATMAP_BINARY_MEDIA_TYPE = "application/vnd.agritech.heatmap"
+HEATMAP_MAGIC = b"AHM1"
+UINT16_NODATA = 65535
+
+# Grids are coarsened beyond this many cells per sampled point so sparse
+# samples over a large AOI don't produce a mostly-empty 10 m raster.
+_MAX_CELLS_PER_POINT = 4
+_MIN_MAX_CELLS = 65536
+
+_METERS_PER_DEG_LAT = 110540.0
+_METERS_PER_DEG_LON_EQUATOR = 111320.0
+
+
+@dataclass
+class HeatmapGrid:
+    """Regular lon/lat raster; ``values`` is (height, width) float32, NaN = nodata."""
+
+    origin_lon: float
+    origin_lat: float
+    pixel_width: float
+    pixel_height: float
+    values: np.ndarray
+
+    @property
+    def height(self) -> int:
+        return int(self.values.shape[0])
+
+    @property
+    def width(self) -> int:
+        return int(self.values.shape[1])
+
+
+def _axis_step(coords: np.ndarray) -> Optional[float]:
+    """Pixel size along one axis when the points sit on a regular grid."""
+    unique = np.unique(np.round(coords, 9))
+    if len(unique) < 2 or len(unique) * 2 > len(coords):
+        return None
+    return float(np.median(np.diff(unique)))
+
+
+def grid_from_points(
+    pixel_data: List[Dict[str, float]],
+    scale_m: Optional[float] = None,
+    pixel_size: Optional[Tuple[float, float]] = None,
+) -> HeatmapGrid:
+    """Bin ``{lon, lat, value}`` points onto a regular grid.
+
+    The pixel size comes from ``pixel_size`` (degrees, when the provider
+    fetched an exact grid), else ``scale_m`` (sampling scale in metres), else
+    from the spacing of grid-aligned points, else from point density. Points
+    falling in the same cell are averaged.
+    """
+    if not pixel_data:
+        return HeatmapGrid(0.0, 0.0, 0.0, 0.0, np.empty((0, 0), dtype=np.float32))
+
+    lon = np.fromiter((p["lon"] for p in pixel_data), dtype=np.float64, count=len(pixel_data))
+    lat = np.fromiter((p["lat"] for p in pixel_data), dtype=np.float64, count=len(pixel_data))
+    val = np.fromiter((p["value"] for p in pixel_data), dtype=np.float64, count=len(pixel_data))
+
+    min_lon, max_lon = float(lon.min()), float(lon.max())
+    min_lat, max_lat = float(lat.min()), float(lat.max())
+
+    if pixel_size:
+        px, py = pixel_size
+    elif scale_m:
+        mid_lat = math.radians((min_lat + max_lat) / 2.0)
+        px = scale_m / (_METERS_PER_DEG_LON_EQUATOR * max(math.cos(mid_lat), 1e-6))
+        py = scale_m / _METERS_PER_DEG_LAT
+    else:
+        px = _axis_step(lon)
+        py = _axis_step(lat)
+        if px is None or py is None:
+            span = max((max_lon - min_lon) * (max_lat - min_lat), 1e-18)
+            step = math.sqrt(span / len(pixel_data))
+            px = px or step
+            py = py or step
+
+    max_cells = max(_MIN_MAX_CELLS, _MAX_CELLS_PER_POINT * len(pixel_data))
+    width = int(round((max_lon - min_lon) / px)) + 1
+    height = int(round((max_lat - min_lat) / py)) + 1
+    if width * height > max_cells:
+        factor = math.sqrt(width * height / max_cells)
+        px *= factor
+        py *= factor
+        width = int(round((max_lon - min_lon) / px)) + 1
+        height = int(round((max_lat - min_lat) / py)) + 1
+
+    cols = np.clip(np.rint((lon - min_lon) / px).astype(np.int64), 0, width - 1)
+    rows = np.clip(np.rint((max_lat - lat) / py).astype(np.int64), 0, height - 1)
+    flat = rows * width + cols
+
+    sums = np.bincount(flat, weights=val, minlength=width * height)
+    counts = np.bincount(flat, minlength=width * height)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = (sums / counts).astype(np.float32)
+
+    return HeatmapGrid(
+        origin_lon=min_lon - px / 2.0,
+        origin_lat=max_lat + py / 2.0,
+        pixel_width=px,
+        pixel_height=py,
+        values=values.reshape(height, width),
+    )
+
+
+def encode_heatmap(
+    grid: HeatmapGrid, header: Dict[str, Any], dtype: str = "float32"
+) -> bytes:
+    """Serialise ``grid`` plus JSON ``header`` fields into the binary format."""
+    if dtype not in ("float32", "uint16"):
+        raise ValueError(f"Unsupported heatmap dtype: {dtype}")
+
+    values = grid.values.astype(np.float32, copy=False)
+    valid = np.isfinite(values)
+    scale, offset = 1.0, 0.0
+
+    if dtype == "uint16":
+        if valid.any():
+            lo = float(values[valid].min())
+            hi = float(values[valid].max())
+        else:
+            lo = hi = 0.0
+        offset = lo
+        scale = (hi - lo) / (UINT16_NODATA - 1) if hi > lo else 1.0
+        quantised = np.full(values.shape, UINT16_NODATA, dtype="<u2")
+        quantised[valid] = np.rint((values[valid] - offset) / scale).astype("<u2")
+        buffer = quantised.tobytes()
+        nodata: Any = UINT16_NODATA
+    else:
+        buffer = np.where(valid, values, np.nan).astype("<f4").tobytes()
+        nodata = "NaN"
+
+    meta = dict(header)
+    meta["grid"] = {
+        "origin_lon": grid.origin_lon,
+        "origin_lat": grid.origin_lat,
+        "pixel_width": grid.pixel_width,
+        "pixel_height": grid.pixel_height,
+        "width": grid.width,
+        "height": grid.height,
+        "dtype": dtype,
+        "scale": scale,
+        "offset": offset,
+        "nodata": nodata,
+    }
+    header_bytes = json.dumps(meta, separators=(",", ":"), default=str).encode("utf-8")
+    header_bytes += b" " * (-len(header_bytes) % 4)
+
+    mask = np.packbits(valid.reshape(-1)).tobytes()
+    return (
+        HEATMAP_MAGIC
+        + struct.pack("<I", len(header_bytes))
+        + header_bytes
+        + buffer
+        + mask
+    )
+
+
+def decode_heatmap(payload: bytes) -> Tuple[Dict[str, Any], np.ndarray]:
+    """Inverse of :func:`encode_heatmap`; returns (header, float32 values with NaN nodata)."""
+    if payload[:4] != HEATMAP_MAGIC:
+        raise ValueError("Not a heatmap payload")
+    (header_len,) = struct.unpack_from("<I", payload, 4)
+    start = 8 + header_len
+    header = json.loads(payload[8:start].decode("utf-8"))
+    grid = header["grid"]
+    count = grid["width"] * grid["height"]
+
+    if grid["dtype"] == "uint16":
+        raw = np.frombuffer(payload, dtype="<u2", count=count, offset=start)
+        end = start + count * 2
+        values = (grid["offset"] + raw.astype(np.float64) * grid["scale"]).astype(np.float32)
+    else:
+        values = np.frombuffer(payload, dtype="<f4", count=count, offset=start).astype(np.float32)
+        end = start + count * 4
+
+    valid = np.unpackbits(np.frombuffer(payload, dtype=np.uint8, offset=end), count=count).astype(bool)
+    values = np.where(valid, values, np.nan).astype(np.float32)
+    return header, values.reshape(grid["height"], grid["width"])
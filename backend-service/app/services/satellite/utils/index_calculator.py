@@ -6,9 +6,13 @@ CDSE/openEO provider and other numpy-based satellite data processing.
 """
 
 import logging
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Optional
 import numpy as np
-from app.services.satellite.types import calculate_nirv, calculate_evi
+from app.services.satellite.utils.index_engine import (
+    DEFAULT_CHUNK_PIXELS,
+    calculate_indices,
+    required_bands as required_bands_for,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -258,95 +262,25 @@ def calculate_tcari(
 def calculate_all_indices(
     bands: Dict[str, np.ndarray],
     indices: List[str],
+    chunk_pixels: Optional[int] = DEFAULT_CHUNK_PIXELS,
 ) -> Dict[str, np.ndarray]:
     """
     Calculate multiple vegetation indices from band data.
 
+    Evaluated by the shared expression graph in ``index_engine``: common
+    sub-expressions are computed once and large rasters are processed in
+    row blocks of about ``chunk_pixels`` pixels.
+
     Args:
         bands: Dictionary of band arrays (keys: blue, green, red, red_edge, etc.)
         indices: List of index names to calculate
+        chunk_pixels: Block size for chunked evaluation (None = whole raster)
 
     Returns:
-        Dictionary mapping index names to computed arrays
+        Dictionary mapping index names to computed float32 arrays. Unknown
+        indices and indices with missing bands are logged and omitted.
     """
-    results = {}
-
-    # Required bands for each index
-    requirements = {
-        "NDVI": ["nir", "red"],
-        "NDRE": ["nir", "red_edge"],
-        "NDMI": ["nir", "swir1"],
-        "MNDWI": ["green", "swir1"],
-        "GCI": ["nir", "green"],
-        "SAVI": ["nir", "red"],
-        "OSAVI": ["nir", "red"],
-        "MSAVI2": ["nir", "red"],
-        "NIRv": ["nir", "red"],
-        "EVI": ["nir", "red", "blue"],
-        "MSI": ["swir1", "nir"],
-        "MCARI": ["red_edge", "red", "green"],
-        "TCARI": ["red_edge", "red", "green"],
-    }
-
-    for index_name in indices:
-        required_bands = requirements.get(index_name, [])
-
-        # Check if all required bands are available
-        missing_bands = [b for b in required_bands if b not in bands]
-
-        if missing_bands:
-            logger.warning(
-                f"Cannot calculate {index_name}: missing bands {missing_bands}"
-            )
-            # Create empty array with correct shape
-            if bands:
-                sample_shape = next(iter(bands.values())).shape
-                results[index_name] = np.zeros(sample_shape, dtype=np.float32)
-            continue
-
-        try:
-            if index_name == "NDVI":
-                results[index_name] = calculate_ndvi(bands["nir"], bands["red"])
-            elif index_name == "NDRE":
-                results[index_name] = calculate_ndre(bands["nir"], bands["red_edge"])
-            elif index_name == "NDMI":
-                results[index_name] = calculate_ndmi(bands["nir"], bands["swir1"])
-            elif index_name == "MNDWI":
-                results[index_name] = calculate_mndwi(bands["green"], bands["swir1"])
-            elif index_name == "GCI":
-                results[index_name] = calculate_gci(bands["nir"], bands["green"])
-            elif index_name == "SAVI":
-                results[index_name] = calculate_savi(bands["nir"], bands["red"])
-            elif index_name == "OSAVI":
-                results[index_name] = calculate_osavi(bands["nir"], bands["red"])
-            elif index_name == "MSAVI2":
-                results[index_name] = calculate_msavi2(bands["nir"], bands["red"])
-            elif index_name == "NIRv":
-                results[index_name] = calculate_nirv(bands["nir"], bands["red"])
-            elif index_name == "EVI":
-                results[index_name] = calculate_evi(
-                    bands["nir"], bands["red"], bands["blue"]
-                )
-            elif index_name == "MSI":
-                results[index_name] = calculate_msi(bands["swir1"], bands["nir"])
-            elif index_name == "MCARI":
-                results[index_name] = calculate_mcari(
-                    bands["red_edge"], bands["red"], bands["green"]
-                )
-            elif index_name == "TCARI":
-                results[index_name] = calculate_tcari(
-                    bands["red_edge"], bands["red"], bands["green"]
-                )
-            else:
-                logger.warning(f"Unknown index: {index_name}")
-
-        except Exception as e:
-            logger.error(f"Error calculating {index_name}: {e}")
-            # Create empty array on error
-            sample_shape = next(iter(bands.values())).shape
-            results[index_name] = np.zeros(sample_shape, dtype=np.float32)
-
-    return results
+    return calculate_indices(bands, indices, chunk_pixels=chunk_pixels)
 
 
 def get_required_bands(indices: List[str]) -> List[str]:
@@ -373,28 +307,7 @@ def get_required_bands(indices: List[str]) -> List[str]:
         "swir2": "B12",
     }
 
-    # Band requirements per index
-    index_requirements = {
-        "NDVI": ["nir", "red"],
-        "NDRE": ["nir", "red_edge"],
-        "NDMI": ["nir", "swir1"],
-        "MNDWI": ["green", "swir1"],
-        "GCI": ["nir", "green"],
-        "SAVI": ["nir", "red"],
-        "OSAVI": ["nir", "red"],
-        "MSAVI2": ["nir", "red"],
-        "NIRv": ["nir", "red"],
-        "EVI": ["nir", "red", "blue"],
-        "MSI": ["swir1", "nir"],
-        "MCARI": ["red_edge", "red", "green"],
-        "TCARI": ["red_edge", "red", "green"],
-    }
-
-    # Collect all required bands
-    required_bands = set()
-    for index in indices:
-        if index in index_requirements:
-            required_bands.update(index_requirements[index])
+    required_bands = required_bands_for(indices)
 
     # Map to Sentinel-2 band names
     return [band_map[band] for band in required_bands if band in band_map]
@@ -0,0 +1,342 @@
+"""
+Expression-graph engine for NumPy band math.
+
+Every supported index is declared once as an expression over named bands
+(``INDEX_EXPRESSIONS``). Expressions are hash-consed, so identical
+sub-expressions (``nir - red``, ``nir + red``, the NDVI ratio inside NIRv, ...)
+are a single node; compiling a set of indices yields one topologically ordered
+plan in which every shared node is computed once.
+
+Evaluation writes each node into float32 buffers through ufunc ``out=``
+arguments. A buffer goes back to the pool (or is overwritten in place) as soon
+as its last consumer has run, so the working set stays at a handful of rasters
+however many indices are requested. Large inputs are processed in row blocks of
+about ``chunk_pixels`` pixels to keep that working set cache-sized.
+
+Ratios with a zero denominator evaluate to 0, and so does GCI as a whole where
+green is 0, as in the per-index helpers of ``index_calculator``; NaN inputs
+propagate.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ~1 MB per float32 buffer; keeps a block's working set near cache size
+DEFAULT_CHUNK_PIXELS = 1 << 18
+
+
+# =============================================================================
+# Expression nodes
+# =============================================================================
+
+
+class Expr:
+    """Hash-consed expression node; build with :func:`band` and arithmetic."""
+
+    __slots__ = ("op", "args")
+
+    def __init__(self, op: str, args: Tuple[Any, ...]):
+        self.op = op
+        self.args = args
+
+    def __add__(self, other):
+        return _node("add", self, _lift(other))
+
+    def __radd__(self, other):
+        return _node("add", _lift(other), self)
+
+    def __sub__(self, other):
+        return _node("sub", self, _lift(other))
+
+    def __rsub__(self, other):
+        return _node("sub", _lift(other), self)
+
+    def __mul__(self, other):
+        return _node("mul", self, _lift(other))
+
+    def __rmul__(self, other):
+        return _node("mul", _lift(other), self)
+
+    def __truediv__(self, other):
+        return _node("div", self, _lift(other))
+
+    def __rtruediv__(self, other):
+        return _node("div", _lift(other), self)
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.op in ("band", "const")
+
+    def __repr__(self) -> str:
+        if self.is_leaf:
+            return repr(self.args[0])
+        return f"{self.op}({', '.join(map(repr, self.args))})"
+
+
+_NODES: Dict[Tuple[Any, ...], Expr] = {}
+
+
+def _node(op: str, *args: Any) -> Expr:
+    key = (op,) + tuple(id(a) if isinstance(a, Expr) else a for a in args)
+    node = _NODES.get(key)
+    if node is None:
+        node = _NODES[key] = Expr(op, args)
+    return node
+
+
+def _lift(value: Union[Expr, float]) -> Expr:
+    return value if isinstance(value, Expr) else _node("const", float(value))
+
+
+def band(name: str) -> Expr:
+    return _node("band", name)
+
+
+def sqrt(x: Expr) -> Expr:
+    return _node("sqrt", x)
+
+
+def maximum(x: Expr, y: Union[Expr, float]) -> Expr:
+    return _node("max", x, _lift(y))
+
+
+def zero_where_zero(x: Expr, guard: Expr) -> Expr:
+    """``x``, or 0 wherever ``guard`` is 0 (for offsets applied after a ratio)."""
+    return _node("guard", x, guard)
+
+
+# =============================================================================
+# Index definitions
+# =============================================================================
+
+blue, green, red = band("blue"), band("green"), band("red")
+red_edge, nir, swir1 = band("red_edge"), band("nir"), band("swir1")
+
+_ndvi = (nir - red) / (nir + red)
+_msavi_term = 2 * nir + 1
+
+INDEX_EXPRESSIONS: Dict[str, Expr] = {
+    "NDVI": _ndvi,
+    "NDRE": (nir - red_edge) / (nir + red_edge),
+    "NDMI": (nir - swir1) / (nir + swir1),
+    "MNDWI": (green - swir1) / (green + swir1),
+    "GCI": zero_where_zero(nir / green - 1, green),
+    "SAVI": (nir - red) * 1.5 / (nir + red + 0.5),
+    "OSAVI": (nir - red) / (nir + red + 0.16),
+    "MSAVI2": (
+        _msavi_term - sqrt(maximum(_msavi_term * _msavi_term - 8 * (nir - red), 0))
+    )
+    / 2,
+    "NIRv": _ndvi * nir,
+    "EVI": 2.5 * (nir - red) / (nir + 6 * red - 7.5 * blue + 1),
+    "MSI": swir1 / nir,
+    "MCARI": (red_edge - red) - 0.2 * (red_edge - green) * (red_edge / green),
+    "TCARI": 3 * ((red_edge - red) - 0.2 * (red_edge - red) * (red_edge / red)),
+}
+
+
+def _walk(roots: Iterable[Expr]) -> List[Expr]:
+    """Post-order (dependencies first) over the distinct nodes reachable from ``roots``."""
+    order: List[Expr] = []
+    seen = set()
+    stack: List[Tuple[Expr, bool]] = [(r, False) for r in reversed(list(roots))]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in seen:
+            continue
+        if expanded or node.is_leaf:
+            seen.add(id(node))
+            order.append(node)
+            continue
+        stack.append((node, True))
+        for arg in reversed(node.args):
+            if id(arg) not in seen:
+                stack.append((arg, False))
+    return order
+
+
+def required_bands(indices: Iterable[str]) -> List[str]:
+    """Band names needed for the known ``indices`` (unknown names are ignored)."""
+    roots = [INDEX_EXPRESSIONS[i] for i in indices if i in INDEX_EXPRESSIONS]
+    return sorted({n.args[0] for n in _walk(roots) if n.op == "band"})
+
+
+# =============================================================================
+# Compiled plans
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class IndexPlan:
+    """Evaluation order for one index set; shared nodes appear once."""
+
+    outputs: Tuple[Tuple[str, Expr], ...]
+    leaves: Tuple[Expr, ...]
+    steps: Tuple[Expr, ...]
+    # Per step: intermediate nodes whose last consumer is that step
+    releases: Tuple[Tuple[Expr, ...], ...]
+
+    @property
+    def bands(self) -> List[str]:
+        return sorted(n.args[0] for n in self.leaves if n.op == "band")
+
+    def evaluate(
+        self,
+        bands: Dict[str, np.ndarray],
+        chunk_pixels: Optional[int] = DEFAULT_CHUNK_PIXELS,
+    ) -> Dict[str, np.ndarray]:
+        """Compute every output index as a float32 array shaped like the bands."""
+        inputs = {
+            name: np.asarray(bands[name], dtype=np.float32) for name in self.bands
+        }
+        shape = next(iter(inputs.values())).shape if inputs else ()
+        results = {
+            name: np.empty(shape, dtype=np.float32) for name, _ in self.outputs
+        }
+        if not inputs or not results:
+            return results
+        if not shape:
+            self._run(inputs, results, [])
+            return results
+
+        rows = shape[0]
+        row_pixels = max(1, int(np.prod(shape[1:], dtype=np.int64)))
+        block = max(1, chunk_pixels // row_pixels) if chunk_pixels else rows
+
+        pool: List[np.ndarray] = []
+        for start in range(0, rows, block):
+            window = slice(start, min(start + block, rows))
+            self._run(
+                {name: arr[window] for name, arr in inputs.items()},
+                {name: arr[window] for name, arr in results.items()},
+                pool,
+            )
+        return results
+
+    def _run(
+        self,
+        bands: Dict[str, np.ndarray],
+        out: Dict[str, np.ndarray],
+        pool: List[np.ndarray],
+    ) -> None:
+        shape = next(iter(bands.values())).shape
+        output_of = {id(node): name for name, node in self.outputs}
+        values: Dict[int, Any] = {}
+        for leaf in self.leaves:
+            values[id(leaf)] = bands[leaf.args[0]] if leaf.op == "band" else leaf.args[0]
+
+        def take() -> np.ndarray:
+            while pool:
+                buffer = pool.pop()
+                if buffer.shape == shape:
+                    return buffer
+            return np.empty(shape, dtype=np.float32)
+
+        mask = np.empty(shape, dtype=bool)
+        for node, releases in zip(self.steps, self.releases):
+            args = [values[id(a)] for a in node.args]
+            dying = [values.pop(id(n)) for n in releases]
+            if id(node) in output_of:
+                buffer = out[output_of[id(node)]]
+            elif dying:
+                buffer = dying.pop()
+            else:
+                buffer = take()
+            _apply(node.op, args, buffer, mask)
+            values[id(node)] = buffer
+            pool.extend(dying)
+
+
+def _apply(op: str, args: List[Any], out: np.ndarray, mask: np.ndarray) -> None:
+    if op == "add":
+        np.add(args[0], args[1], out=out)
+    elif op == "sub":
+        np.subtract(args[0], args[1], out=out)
+    elif op == "mul":
+        np.multiply(args[0], args[1], out=out)
+    elif op == "div":
+        numerator, denominator = args
+        if np.isscalar(denominator):
+            if denominator == 0:
+                out.fill(0)
+            else:
+                np.divide(numerator, denominator, out=out)
+            return
+        np.not_equal(denominator, 0, out=mask)
+        np.divide(numerator, denominator, out=out, where=mask)
+        np.logical_not(mask, out=mask)
+        np.copyto(out, 0, where=mask)
+    elif op == "guard":
+        value, guard = args
+        np.copyto(out, value)
+        np.equal(guard, 0, out=mask)
+        np.copyto(out, 0, where=mask)
+    elif op == "sqrt":
+        np.sqrt(args[0], out=out)
+    elif op == "max":
+        np.maximum(args[0], args[1], out=out)
+    else:
+        raise ValueError(f"Unknown expression op: {op}")
+
+
+@lru_cache(maxsize=128)
+def compile_indices(indices: Tuple[str, ...]) -> IndexPlan:
+    """Build (and cache) the shared evaluation plan for ``indices``.
+
+    Raises KeyError for names missing from ``INDEX_EXPRESSIONS``.
+    """
+    outputs = tuple((name, INDEX_EXPRESSIONS[name]) for name in dict.fromkeys(indices))
+    order = _walk(node for _, node in outputs)
+    leaves = tuple(n for n in order if n.is_leaf)
+    steps = tuple(n for n in order if not n.is_leaf)
+
+    pinned = {id(node) for _, node in outputs}
+    last_use: Dict[int, int] = {}
+    for position, node in enumerate(steps):
+        for arg in node.args:
+            if not arg.is_leaf:
+                last_use[id(arg)] = position
+    by_id = {id(n): n for n in steps}
+    releases: List[List[Expr]] = [[] for _ in steps]
+    for node_id, position in last_use.items():
+        if node_id not in pinned:
+            releases[position].append(by_id[node_id])
+
+    return IndexPlan(
+        outputs=outputs,
+        leaves=leaves,
+        steps=steps,
+        releases=tuple(tuple(r) for r in releases),
+    )
+
+
+def calculate_indices(
+    bands: Dict[str, np.ndarray],
+    indices: Iterable[str],
+    chunk_pixels: Optional[int] = DEFAULT_CHUNK_PIXELS,
+) -> Dict[str, np.ndarray]:
+    """Compute ``indices`` from ``bands`` in one shared pass.
+
+    Unknown indices and indices whose bands are missing are logged and left
+    out of the result rather than filled with placeholder values.
+    """
+    computable = []
+    for name in indices:
+        if name not in INDEX_EXPRESSIONS:
+            logger.warning(f"Unknown index: {name}")
+            continue
+        missing = [b for b in required_bands([name]) if b not in bands]
+        if missing:
+            logger.warning(f"Cannot calculate {name}: missing bands {missing}")
+            continue
+        computable.append(name)
+
+    if not computable:
+        return {}
+    return compile_indices(tuple(computable)).evaluate(bands, chunk_pixels=chunk_pixels)
@@ -0,0 +1,43 @@
+"""Array-native conversion of a single-band raster into heatmap points."""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def sample_step(height: int, width: int, grid_size: int) -> int:
+    """Stride that keeps roughly ``grid_size`` samples out of a ``height`` x ``width`` raster."""
+    return max(1, int(((height * width) / grid_size) ** 0.5))
+
+
+def raster_to_points(
+    band: np.ndarray,
+    x_coords: np.ndarray,
+    y_coords: np.ndarray,
+    step: int = 1,
+) -> Tuple[List[Dict[str, float]], np.ndarray]:
+    """
+    Subsample ``band`` every ``step`` pixels and return its finite cells.
+
+    Args:
+        band: 2D raster (rows follow ``y_coords``, columns follow ``x_coords``)
+        x_coords: Longitude of each column
+        y_coords: Latitude of each row
+        step: Stride applied along both axes, starting at (0, 0)
+
+    Returns:
+        Tuple of ``[{"lon", "lat", "value"}, ...]`` in row-major order and the
+        float64 array of the same values (for statistics)
+    """
+    sub = np.asarray(band[::step, ::step], dtype=np.float64)
+    rows, cols = np.nonzero(np.isfinite(sub))
+
+    values = sub[rows, cols]
+    lons = np.asarray(x_coords, dtype=np.float64)[::step][cols]
+    lats = np.asarray(y_coords, dtype=np.float64)[::step][rows]
+
+    pixel_data = [
+        {"lon": lon, "lat": lat, "value": value}
+        for lon, lat, value in zip(lons.tolist(), lats.tolist(), values.tolist())
+    ]
+    return pixel_data, values
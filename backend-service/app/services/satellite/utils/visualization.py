@@ -8,6 +8,7 @@ color scales, and statistics annotations.
 import logging
 import os
 import platform
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -18,6 +19,8 @@ from app.services.satellite.types import VISUALIZATION_PARAMS, get_visualization
 
 logger = logging.getLogger(__name__)
 
+PALETTE_LUT_SIZE = 1024
+
 
 def _find_system_font() -> str:
     _FONT_PATHS = {
@@ -148,46 +151,44 @@ def apply_color_palette(normalized_array: np.ndarray, palette: List[str]) -> np.
         palette: List of hex color strings
 
     Returns:
-        3D array (height, width, 3) with RGB values
+        3D array (height, width, 3) with RGB values; NaN and out-of-range
+        pixels are black
     """
-    height, width = normalized_array.shape
-    colored = np.zeros((height, width, 3), dtype=np.uint8)
-
-    # Convert hex colors to RGB
-    rgb_palette = [hex_to_rgb(color) for color in palette]
-
-    # For each pixel, interpolate between palette colors
-    if len(rgb_palette) == 1:
-        # Single color - just apply it with intensity
-        rgb = rgb_palette[0]
-        for i in range(3):
-            colored[:, :, i] = (normalized_array * rgb[i]).astype(np.uint8)
-    else:
-        # Multiple colors - interpolate
-        for y in range(height):
-            for x in range(width):
-                value = normalized_array[y, x]
-                if not np.isnan(value) and 0 <= value <= 1:
-                    # Find which segment we're in
-                    segment_size = 1.0 / (len(rgb_palette) - 1)
-                    segment_idx = min(int(value / segment_size), len(rgb_palette) - 2)
-
-                    # Local position within segment
-                    local_pos = (value - segment_idx * segment_size) / segment_size
-
-                    # Interpolate
-                    color1 = rgb_palette[segment_idx]
-                    color2 = rgb_palette[segment_idx + 1]
-
-                    rgb = [
-                        int(color1[i] + (color2[i] - color1[i]) * local_pos)
-                        for i in range(3)
-                    ]
-                    colored[y, x] = rgb
+    lut = palette_lut(tuple(palette))
+    values = np.asarray(normalized_array, dtype=np.float64)
+    valid = (values >= 0) & (values <= 1)
 
+    positions = np.rint(np.where(valid, values, 0.0) * (len(lut) - 1)).astype(np.intp)
+    colored = lut[positions]
+    colored[~valid] = 0
     return colored
 
 
+@lru_cache(maxsize=64)
+def palette_lut(palette: Tuple[str, ...], size: int = PALETTE_LUT_SIZE) -> np.ndarray:
+    """
+    Precompute ``size`` RGB entries spreading ``palette`` evenly over 0-1.
+
+    A single-color palette ramps from black to that color. The returned
+    array is shared between callers and read-only.
+    """
+    rgb = np.array([hex_to_rgb(color) for color in palette], dtype=np.float64)
+    positions = np.linspace(0.0, 1.0, size)
+
+    if len(rgb) == 1:
+        table = positions[:, None] * rgb[0]
+    else:
+        stops = np.linspace(0.0, 1.0, len(rgb))
+        table = np.stack(
+            [np.interp(positions, stops, rgb[:, channel]) for channel in range(3)],
+            axis=1,
+        )
+
+    lut = np.floor(table + 1e-9).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple"""
     if hex_color.startswith("#"):
@@ -7,7 +7,9 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Iterable, Mapping, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set
+
+import numpy as np
 
 Compare = str  # 'below' | 'above' | 'between'
 
@@ -37,6 +39,69 @@ def _is_valid_temp(t) -> bool:
     return not math.isnan(f) and not math.isinf(f)
 
 
+class HourlySeries:
+    """Compact hourly temperature series: parallel arrays instead of row dicts.
+
+    ``temperature`` is float64 with NaN for missing/invalid values and
+    ``month`` holds 1–12 (0 when ``recorded_at`` is unparseable), so
+    ``count_hours`` can filter and compare without touching Python objects.
+    Iterating still yields ``{"recorded_at", "temperature_2m"}`` dicts for
+    callers that expect rows.
+    """
+
+    __slots__ = ("recorded_at", "temperature", "month")
+
+    def __init__(self, recorded_at: List[Any], temperature: np.ndarray, month: np.ndarray) -> None:
+        self.recorded_at = recorded_at
+        self.temperature = temperature
+        self.month = month
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping]) -> "HourlySeries":
+        recorded_at: List[Any] = []
+        temps: List[float] = []
+        months: List[int] = []
+        for r in rows:
+            ra = r.get("recorded_at")
+            temp = r.get("temperature_2m")
+            recorded_at.append(ra)
+            temps.append(float(temp) if _is_valid_temp(temp) else math.nan)
+            months.append(_parse_month(ra) or 0)
+        return cls(
+            recorded_at,
+            np.asarray(temps, dtype=np.float64),
+            np.asarray(months, dtype=np.uint8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.recorded_at)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for ra, t in zip(self.recorded_at, self.temperature.tolist()):
+            yield {"recorded_at": ra, "temperature_2m": None if math.isnan(t) else t}
+
+
+def _count_hours_series(
+    series: HourlySeries,
+    threshold: float,
+    compare: Compare,
+    upper: Optional[float],
+    months: Optional[Set[int]],
+) -> int:
+    t = series.temperature
+    if compare == "below":
+        hit = t < threshold
+    elif compare == "above":
+        hit = t > threshold
+    elif compare == "between":
+        hit = (t >= threshold) & (t <= upper)
+    else:
+        return 0
+    if months is not None:
+        hit &= np.isin(series.month, list(months))
+    return int(np.count_nonzero(hit))
+
+
 def count_hours(
     rows: Iterable[Mapping],
     threshold: float,
@@ -47,7 +112,8 @@ def count_hours(
     """Count rows whose `temperature_2m` satisfies the comparison.
 
     Args:
-        rows: iterable of dicts with `recorded_at` (ISO string or datetime) + `temperature_2m`
+        rows: iterable of dicts with `recorded_at` (ISO string or datetime) + `temperature_2m`,
+            or a ``HourlySeries`` (vectorised path)
         threshold: numeric value compared against
         compare: 'below' (strict <), 'above' (strict >), 'between' (inclusive [threshold, upper])
         upper: required when compare='between'
@@ -56,6 +122,9 @@ def count_hours(
     if compare == "between" and upper is None:
         raise ValueError("compare='between' requires upper bound")
 
+    if isinstance(rows, HourlySeries):
+        return _count_hours_series(rows, threshold, compare, upper, months)
+
     count = 0
     for r in rows:
         temp = r.get("temperature_2m") if isinstance(r, Mapping) else None
@@ -1,10 +1,43 @@
+import asyncio
 import httpx
 import logging
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from itertools import chain
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.weather.hour_counter import HourlySeries
 
 logger = logging.getLogger(__name__)
 
+# One pooled client per event loop, shared by every WeatherService instance
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+_HTTP_TIMEOUT = 30.0
+
+# Gap ranges fetched concurrently per fetch_with_db_cache /
+# fetch_hourly_temperature call
+_GAP_FETCH_CONCURRENCY = 4
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive client for Open-Meteo (created lazily per event loop)."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Open-Meteo client. Call on app shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
 CROP_THRESHOLDS = {
     "olive": {"tbase": 10.0, "frost": -5.0, "heat": 40.0, "chill_hours_min": 200},
     "avocado": {"tbase": 10.0, "frost": -1.0, "heat": 35.0, "chill_hours_min": 100},
@@ -34,6 +67,17 @@ class WeatherFetchError(RuntimeError):
 
 
 class WeatherService:
+    """Open-Meteo access with a shared connection pool.
+
+    Identical upstream requests issued concurrently (e.g. many parcels in the
+    same 0.01° cell) are coalesced: the first caller performs the request and
+    the others await its result. Coalesced responses are shared, so callers
+    must treat them as read-only.
+    """
+
+    # (kind, lat, lon, range, variables) -> in-flight upstream request
+    _inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+
     HISTORICAL_URL = "https://archive-api.open-meteo.com/v1/archive"
     FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 
@@ -70,6 +114,31 @@ class WeatherService:
         ]
     )
 
+    @classmethod
+    async def _single_flight(
+        cls, key: Tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``fetch`` once per key among concurrent callers.
+
+        The request runs in its own task so a cancelled caller does not
+        cancel it for the others.
+        """
+        task = cls._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            cls._inflight[key] = task
+            task.add_done_callback(
+                lambda t, key=key: cls._inflight.pop(key, None)
+                if cls._inflight.get(key) is t else None
+            )
+        return await asyncio.shield(task)
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Dict:
+        client = await _get_http_client()
+        response = await client.get(url, params=params, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
     async def fetch_with_db_cache(
         self,
         latitude: float,
@@ -105,15 +174,24 @@ class WeatherService:
         if missing_dates:
             # Group contiguous missing date ranges to minimize API calls
             ranges = self._contiguous_ranges(missing_dates)
-            for gap_start, gap_end in ranges:
-                try:
-                    raw = await self.fetch_historical(latitude, longitude, gap_start, gap_end)
-                    gap_records = self.parse_open_meteo_response(raw)
-                    fetched_records.extend(gap_records)
-                    # Persist asynchronously — do not block on failure
-                    await supabase_service.upsert_weather_daily(latitude, longitude, gap_records)
-                except Exception as e:
-                    logger.warning(f"Could not fetch gap {gap_start}..{gap_end}: {e}")
+            semaphore = asyncio.Semaphore(_GAP_FETCH_CONCURRENCY)
+
+            async def _fill_gap(gap_start: str, gap_end: str) -> List[Dict]:
+                async with semaphore:
+                    try:
+                        raw = await self.fetch_historical(latitude, longitude, gap_start, gap_end)
+                        gap_records = self.parse_open_meteo_response(raw)
+                        # Persist asynchronously — do not block on failure
+                        await supabase_service.upsert_weather_daily(latitude, longitude, gap_records)
+                        return gap_records
+                    except Exception as e:
+                        logger.warning(f"Could not fetch gap {gap_start}..{gap_end}: {e}")
+                        return []
+
+            for gap_records in await asyncio.gather(
+                *(_fill_gap(gap_start, gap_end) for gap_start, gap_end in ranges)
+            ):
+                fetched_records.extend(gap_records)
 
         # Merge: convert cached rows to the shared record format, then append fetched
         def _from_db_row(row: Dict) -> Dict:
@@ -170,13 +248,11 @@ class WeatherService:
             "timezone": "UTC",
         }
 
+        key = ("daily", lat, lon, start_date, end_date, self.DAILY_VARIABLES)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.HISTORICAL_URL, params=params, timeout=30
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._single_flight(
+                key, lambda: self._get_json(self.HISTORICAL_URL, params)
+            )
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"Open-Meteo historical API error: {e.response.status_code} - {e.response.text}"
@@ -199,10 +275,11 @@ class WeatherService:
         longitude: float,
         start_date: str,
         end_date: str,
-    ) -> List[Dict]:
+    ) -> HourlySeries:
         """Fetch hourly temperature_2m for a (lat, lon, [start_date, end_date]) range.
 
-        Returns list of dicts: [{ "recorded_at": str ISO, "temperature_2m": float }, ...].
+        Returns a ``HourlySeries`` (compact arrays; iterates as
+        ``{"recorded_at": str ISO, "temperature_2m": float}`` dicts).
         Used as the source of truth for chill_hours and other phenological hour-counters.
         Open-Meteo failure raises (no sine fallback) — caller must handle.
         Caching is added in a later step.
@@ -215,37 +292,33 @@ class WeatherService:
         start_at_iso = f"{start_date}T00:00:00+00:00"
         end_at_iso = f"{end_date}T23:00:00+00:00"
         cached = await supabase_service.get_cached_hourly_weather(lat, lon, start_at_iso, end_at_iso)
-        cached_rows = [
-            {"recorded_at": str(r.get("recorded_at")), "temperature_2m": r.get("temperature_2m")}
-            for r in (cached or [])
-        ]
 
-        # Identify which calendar dates are missing from cache
+        # Bucket cached rows by calendar day in one pass
+        cached_by_day: Dict[str, List[Dict]] = {}
+        for r in cached or []:
+            ra = r.get("recorded_at")
+            row = {"recorded_at": str(ra), "temperature_2m": r.get("temperature_2m")}
+            cached_by_day.setdefault(str(ra)[:10] if ra else "", []).append(row)
+
+        # A day is "fully cached" only if it has 24 rows
         d_start = date.fromisoformat(start_date)
         d_end = date.fromisoformat(end_date)
-        all_dates: set[str] = set()
+        missing_dates: List[str] = []
         cur = d_start
         while cur <= d_end:
-            all_dates.add(cur.isoformat())
+            day = cur.isoformat()
+            if len(cached_by_day.get(day, ())) < 24:
+                missing_dates.append(day)
             cur += timedelta(days=1)
-        cached_dates: set[str] = set()
-        for r in cached_rows:
-            ra = r.get("recorded_at")
-            if ra:
-                cached_dates.add(str(ra)[:10])
-        # A day is "fully cached" only if it has 24 rows
-        fully_cached: set[str] = set()
-        for d in cached_dates:
-            day_count = sum(1 for r in cached_rows if str(r.get("recorded_at"))[:10] == d)
-            if day_count >= 24:
-                fully_cached.add(d)
-        missing_dates = sorted(all_dates - fully_cached)
 
         if not missing_dates:
-            return cached_rows
+            return HourlySeries.from_rows(
+                row for rows in cached_by_day.values() for row in rows
+            )
 
-        fetched_rows: List[Dict] = []
-        for sub_start, sub_end in self._contiguous_ranges(missing_dates):
+        semaphore = asyncio.Semaphore(_GAP_FETCH_CONCURRENCY)
+
+        async def _fetch_range(sub_start: str, sub_end: str) -> List[Dict]:
             params = {
                 "latitude": lat,
                 "longitude": lon,
@@ -254,11 +327,12 @@ class WeatherService:
                 "hourly": "temperature_2m",
                 "timezone": "UTC",
             }
+            key = ("hourly", lat, lon, sub_start, sub_end, "temperature_2m")
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(self.HISTORICAL_URL, params=params, timeout=30)
-                    response.raise_for_status()
-                    payload = response.json()
+                async with semaphore:
+                    payload = await self._single_flight(
+                        key, lambda: self._get_json(self.HISTORICAL_URL, params)
+                    )
             except (httpx.HTTPStatusError, httpx.RequestError) as e:
                 raise WeatherFetchError(
                     f"Open-Meteo hourly fetch failed for ({lat},{lon}) {sub_start}–{sub_end}: {e}"
@@ -266,8 +340,16 @@ class WeatherService:
             hourly = payload.get("hourly") or {}
             times = hourly.get("time") or []
             temps = hourly.get("temperature_2m") or []
-            for t, v in zip(times, temps):
-                fetched_rows.append({"recorded_at": t, "temperature_2m": v})
+            return [{"recorded_at": t, "temperature_2m": v} for t, v in zip(times, temps)]
+
+        fetched_rows: List[Dict] = []
+        for rows in await asyncio.gather(
+            *(
+                _fetch_range(sub_start, sub_end)
+                for sub_start, sub_end in self._contiguous_ranges(missing_dates)
+            )
+        ):
+            fetched_rows.extend(rows)
 
         if fetched_rows:
             try:
@@ -276,8 +358,14 @@ class WeatherService:
                 logger.warning(f"persist_hourly_weather failed (non-fatal): {e}")
 
         # Drop cached rows for missing-day partial coverage to avoid double-counting
-        cached_filtered = [r for r in cached_rows if str(r.get("recorded_at"))[:10] not in set(missing_dates)]
-        return cached_filtered + fetched_rows
+        missing = set(missing_dates)
+        cached_filtered = (
+            row
+            for day, rows in cached_by_day.items()
+            if day not in missing
+            for row in rows
+        )
+        return HourlySeries.from_rows(chain(cached_filtered, fetched_rows))
 
     async def fetch_forecast(
         self,
@@ -296,13 +384,11 @@ class WeatherService:
             "forecast_days": days,
         }
 
+        key = ("forecast", lat, lon, days, self.FORECAST_DAILY_VARIABLES)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.FORECAST_URL, params=params, timeout=30
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._single_flight(
+                key, lambda: self._get_json(self.FORECAST_URL, params)
+            )
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"Open-Meteo forecast API error: {e.response.status_code} - {e.response.text}"
@@ -0,0 +1,68 @@
+"""
+Benchmark the CDSE NumPy index computation.
+
+Compares the shared expression-graph engine against one call per index of the
+``satellite.types`` helpers, computing all 13 indices from synthetic float32
+bands. A full Sentinel-2 tile is 10980x10980 (about 2.9 GB of input bands).
+
+Usage:
+    python scripts/benchmark_index_engine.py [--size 4000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.satellite.types import VEGETATION_INDEX_CALCULATORS  # noqa: E402
+from app.services.satellite.utils.index_engine import (  # noqa: E402
+    INDEX_EXPRESSIONS,
+    calculate_indices,
+)
+
+
+def per_index(bands, indices):
+    return {name: VEGETATION_INDEX_CALCULATORS[name](bands) for name in indices}
+
+
+def best_of(fn, repeat, *args, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=4000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    bands = {
+        name: rng.uniform(0.01, 0.6, size=(args.size, args.size)).astype(np.float32)
+        for name in ("blue", "green", "red", "red_edge", "nir", "swir1")
+    }
+    indices = sorted(INDEX_EXPRESSIONS)
+
+    print(f"{args.size}x{args.size} float32 bands, {len(indices)} indices, best of {args.repeat}")
+    legacy_s, expected = best_of(per_index, args.repeat, bands, indices)
+    print(f"{'per-index helpers':>22} {legacy_s * 1000:>10.1f} ms")
+    for chunk_pixels in (None, 1 << 18, 1 << 20, 1 << 22):
+        engine_s, result = best_of(
+            calculate_indices, args.repeat, bands, indices, chunk_pixels=chunk_pixels
+        )
+        for name in indices:
+            np.testing.assert_allclose(result[name], expected[name], rtol=1e-4, atol=1e-5)
+        label = f"engine chunk={chunk_pixels or 'whole'}"
+        print(f"{label:>22} {engine_s * 1000:>10.1f} ms {legacy_s / engine_s:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
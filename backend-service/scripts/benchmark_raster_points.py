@@ -0,0 +1,80 @@
+"""
+Benchmark the CDSE heatmap raster-to-points conversion.
+
+Compares the array-native ``raster_to_points`` against the former per-pixel
+loop on synthetic 2000x2000 rasters at a few sampling densities.
+
+Usage:
+    python scripts/benchmark_raster_points.py [--size 2000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.satellite.utils.raster_points import raster_to_points, sample_step  # noqa: E402
+from app.services.satellite.utils.statistics import calculate_statistics_from_array  # noqa: E402
+
+
+def per_pixel_loop(band, x_coords, y_coords, step):
+    pixel_data, values = [], []
+    height, width = band.shape
+    for yi in range(0, height, step):
+        for xi in range(0, width, step):
+            value = float(band[yi, xi])
+            if not np.isnan(value) and not np.isinf(value):
+                pixel_data.append(
+                    {"lon": float(x_coords[xi]), "lat": float(y_coords[yi]), "value": value}
+                )
+                values.append(value)
+    calculate_statistics_from_array(np.array(values))
+    return pixel_data
+
+
+def vectorised(band, x_coords, y_coords, step):
+    pixel_data, values = raster_to_points(band, x_coords, y_coords, step)
+    calculate_statistics_from_array(values)
+    return pixel_data
+
+
+def best_of(fn, repeat, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    band = rng.uniform(-0.2, 0.9, size=(args.size, args.size)).astype(np.float32)
+    band[rng.random(band.shape) < 0.3] = np.nan
+    x_coords = np.linspace(-5.6, -5.5, args.size)
+    y_coords = np.linspace(33.95, 33.85, args.size)
+
+    print(f"{args.size}x{args.size} raster, 30% nodata, best of {args.repeat}")
+    print(f"{'grid_size':>10} {'step':>5} {'points':>9} {'loop ms':>10} {'numpy ms':>10} {'speedup':>8}")
+    for grid_size in (1_000, 50_000, 1_000_000):
+        step = sample_step(args.size, args.size, grid_size)
+        loop_s, expected = best_of(per_pixel_loop, args.repeat, band, x_coords, y_coords, step)
+        vec_s, points = best_of(vectorised, args.repeat, band, x_coords, y_coords, step)
+        assert points == expected
+        print(
+            f"{grid_size:>10} {step:>5} {len(points):>9} "
+            f"{loop_s * 1000:>10.1f} {vec_s * 1000:>10.1f} {loop_s / vec_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
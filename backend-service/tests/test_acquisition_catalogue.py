@@ -0,0 +1,159 @@
+"""Tests for the per-geometry Sentinel-2 acquisition catalogue."""
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.services import earth_engine as ee_module
+from app.services.acquisition_catalogue import (
+    best_image_info,
+    catalogue_key,
+    group_by_date,
+    select_images,
+)
+from app.services.earth_engine import EarthEngineService
+from app.services.observation_store import ObservationSeriesKey, ObservationStore
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.8], [-5.4, 33.8], [-5.4, 33.9], [-5.5, 33.8]]],
+}
+
+
+def _scene(scene_id, day, aoi_cloud, tile_cloud, timestamp=0):
+    return {
+        "id": scene_id,
+        "date": day,
+        "timestamp": timestamp,
+        "aoi_cloud": aoi_cloud,
+        "tile_cloud": tile_cloud,
+    }
+
+
+def test_group_by_date_keeps_every_scene_and_lowest_aoi_cloud():
+    entries = group_by_date(
+        [
+            _scene("B", "2024-05-01", 12.0, 20.0, timestamp=2),
+            _scene("A", "2024-05-01", 4.0, 22.0, timestamp=1),
+            _scene("C", "2024-04-26", None, 3.0),
+            {"date": None, "id": "X"},
+        ]
+    )
+
+    assert [e["date"] for e in entries] == ["2024-04-26", "2024-05-01"]
+    assert entries[0]["aoi_cloud"] is None
+    assert entries[1]["aoi_cloud"] == 4.0
+    assert entries[1]["timestamp"] == 1
+    assert [i["id"] for i in entries[1]["images"]] == ["B", "A"]
+
+
+def test_select_images_filters_locally_and_best_image_uses_tile_cloud():
+    entries = group_by_date(
+        [
+            _scene("A", "2024-05-01", 4.0, 22.0),
+            _scene("B", "2024-05-06", 35.0, 1.0),
+            _scene("C", "2024-05-11", 9.0, 15.0),
+            _scene("D", "2024-05-16", None, 0.5),
+        ]
+    )
+
+    selected = select_images(entries, max_cloud=10)
+
+    assert [i["id"] for i in selected] == ["A", "C"]
+    assert best_image_info(selected) == {"id": "C", "date": "2024-05-11", "cloud": 15.0}
+    assert best_image_info([]) is None
+
+
+def test_bind_parcel_drops_series_of_previous_boundary(tmp_path):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    moved = {**GEOMETRY, "coordinates": [[[-5.6, 33.8], [-5.4, 33.8], [-5.4, 33.9], [-5.6, 33.8]]]}
+    old_key = catalogue_key(GEOMETRY)
+    ndvi_key = ObservationSeriesKey.build(GEOMETRY, "NDVI", 10, 10.0, True)
+    for key in (old_key, ndvi_key):
+        store.record_chunk(
+            key, [{"date": "2024-05-01"}], date(2024, 5, 1), date(2024, 5, 31)
+        )
+
+    assert store.bind_parcel("p1", old_key.fingerprint) is False
+    assert store.bind_parcel("p1", old_key.fingerprint) is False
+    assert store.bind_parcel("p1", catalogue_key(moved).fingerprint) is True
+
+    for key in (old_key, ndvi_key):
+        assert store.get_observations(key, date(2024, 5, 1), date(2024, 5, 31)) == []
+        assert store.missing_ranges(key, date(2024, 5, 1), date(2024, 5, 31)) == [
+            (date(2024, 5, 1), date(2024, 5, 31))
+        ]
+
+
+def _service_with_store(tmp_path, monkeypatch, settled=date(2024, 12, 31)):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    monkeypatch.setattr(ee_module, "observation_store", store)
+    monkeypatch.setattr(store, "settled_until", lambda today=None: settled)
+    return EarthEngineService()
+
+
+def test_get_acquisitions_only_scans_dates_after_last_scan(tmp_path, monkeypatch):
+    service = _service_with_store(tmp_path, monkeypatch)
+    scans = []
+
+    def fake_scan(geometry, start, end):
+        scans.append((start, end))
+        return group_by_date([_scene(f"S{start}", start, 5.0, 10.0)])
+
+    monkeypatch.setattr(service, "scan_acquisitions", fake_scan)
+
+    service.get_acquisitions(GEOMETRY, "2024-01-01", "2024-03-31")
+    scans.clear()
+    entries = service.get_acquisitions(GEOMETRY, "2024-01-01", "2024-04-30")
+
+    assert scans == [("2024-04-01", "2024-04-30")]
+    assert [e["date"] for e in entries] == ["2024-01-01", "2024-04-01"]
+    assert service.get_acquisitions(GEOMETRY, "2024-01-01", "2024-05-31", refresh=False) is None
+
+
+def test_catalogue_read_scans_only_the_unsettled_tail(tmp_path, monkeypatch):
+    service = _service_with_store(tmp_path, monkeypatch, settled=date(2024, 4, 30))
+    scans = []
+
+    def fake_scan(geometry, start, end):
+        scans.append((start, end))
+        return group_by_date([_scene(f"S{start}", start, 5.0, 10.0)])
+
+    monkeypatch.setattr(service, "scan_acquisitions", fake_scan)
+    service.get_acquisitions(GEOMETRY, "2024-01-01", "2024-04-30")
+    scans.clear()
+
+    entries = service.get_acquisitions(GEOMETRY, "2024-01-01", "2024-05-04", refresh=False)
+
+    assert scans == [("2024-05-01", "2024-05-04")]
+    assert [e["date"] for e in entries] == ["2024-01-01", "2024-05-01"]
+    assert service.get_acquisitions(GEOMETRY, "2023-12-01", "2024-05-04", refresh=False) is None
+    assert scans == [("2024-05-01", "2024-05-04")]
+
+
+def test_catalogued_range_seeds_lazy_collection_without_round_trips(tmp_path, monkeypatch):
+    service = _service_with_store(tmp_path, monkeypatch)
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    requests = []
+    monkeypatch.setattr(
+        ee_module, "counted_get_info", lambda obj, op: requests.append(op)
+    )
+    monkeypatch.setattr(
+        service,
+        "scan_acquisitions",
+        lambda geometry, start, end: group_by_date(
+            [
+                _scene("A", "2024-05-01", 4.0, 22.0),
+                _scene("B", "2024-05-06", 35.0, 1.0),
+                _scene("C", "2024-05-11", 9.0, 15.0),
+            ]
+        ),
+    )
+    service.get_acquisitions(GEOMETRY, "2024-05-01", "2024-05-31")
+
+    lazy = service.get_sentinel2_collection_lazy(
+        GEOMETRY, "2024-05-01", "2024-05-31", 10, use_aoi_cloud_filter=True
+    )
+
+    assert lazy.size() == 2
+    assert lazy.first_info() == {"id": "C", "date": "2024-05-11", "cloud": 15.0}
+    assert requests == []
+    ee_module.ee.Filter.inList.assert_called_with("system:index", ["A", "C"])
@@ -0,0 +1,87 @@
+"""Referentials compiled once per (crop, content hash) and shared by the stages."""
+from __future__ import annotations
+
+import copy
+import json
+import math
+import pickle
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.services.calibration import compiled_referential as cr
+from app.services.calibration.pipeline import s4_state_machine as sm
+
+REFERENTIAL = (
+    Path(__file__).resolve().parents[2] / "agritech-api" / "referentials" / "DATA_OLIVIER.json"
+)
+
+
+@pytest.fixture
+def olive_reference() -> dict:
+    if not REFERENTIAL.is_file():
+        pytest.skip("olive referential not available")
+    cr.clear_compiled_referential_cache()
+    yield json.loads(REFERENTIAL.read_text(encoding="utf-8"))
+    cr.clear_compiled_referential_cache()
+
+
+def _weather(end: date) -> list[dict]:
+    rows, d = [], date(2021, 12, 1)
+    while d <= end:
+        t = 16 + 9 * math.sin((d.timetuple().tm_yday - 110) / 365 * 2 * math.pi)
+        rows.append({"date": d.isoformat(), "temp_min": t - 6, "temp_max": t + 7, "precip": 1.0})
+        d += timedelta(days=1)
+    return rows
+
+
+def test_equal_content_shares_one_compiled_referential(olive_reference) -> None:
+    compiled = cr.compile_referential("olivier", olive_reference)
+
+    assert cr.compile_referential("olivier", copy.deepcopy(olive_reference)) is compiled
+    assert pickle.loads(pickle.dumps(compiled)) is compiled
+    assert compiled.cycle_months == (12, 11)
+    assert compiled.capabilities("intensif") is compiled.capabilities("intensif")
+    # phase_config is handed out as a copy: callers set its chill threshold
+    assert compiled.phase_config() is not compiled.phase_config()
+
+    edited = copy.deepcopy(olive_reference)
+    edited["gdd"]["tbase_c"] = 11.0
+    other = cr.compile_referential("olivier", edited)
+    assert other is not compiled
+    assert other.gdd_tbase_tupper[0] == 11.0
+
+
+def test_least_recently_used_referential_is_evicted(olive_reference, monkeypatch) -> None:
+    monkeypatch.setattr(cr.settings, "CALIBRATION_REFERENTIAL_CACHE_SIZE", 2)
+    first = cr.compile_referential("olivier", olive_reference, content_hash="a")
+    second = cr.compile_referential("olivier", olive_reference, content_hash="b")
+
+    assert cr.compile_referential("olivier", olive_reference, content_hash="a") is first
+    cr.compile_referential("olivier", olive_reference, content_hash="c")
+
+    assert cr.compile_referential("olivier", olive_reference, content_hash="a") is first
+    assert cr.compile_referential("olivier", olive_reference, content_hash="b") is not second
+
+
+def test_state_machine_from_compiled_referential_matches_raw(olive_reference) -> None:
+    compiled = cr.compile_referential("olivier", olive_reference)
+    kwargs = {
+        "weather_days": _weather(date(2024, 11, 30)),
+        "nirv_series": [],
+        "ndvi_series": [],
+        "variety": "Picholine marocaine",
+        "reference_data": olive_reference,
+        "maturity_phase": "PLEINE_PRODUCTION",
+    }
+
+    raw = sm.run_state_machine(**kwargs)
+    shared = sm.run_state_machine(**kwargs, referential=compiled)
+
+    assert [(tl.year, tl.transitions) for tl in shared] == [
+        (tl.year, tl.transitions) for tl in raw
+    ]
+    assert sm.cycle_input_digests(**kwargs, referential=compiled) == sm.cycle_input_digests(
+        **kwargs
+    )
@@ -0,0 +1,67 @@
+"""Tests for stored transitions of closed cycle years and their store."""
+import json
+import math
+from datetime import date, timedelta
+
+from app.services.calibration.pipeline import s4_state_machine as sm
+from app.services.calibration.support.cycle_checkpoints import (
+    CycleCheckpointKey,
+    CycleCheckpointStore,
+)
+
+
+def _weather(end: date) -> list[dict]:
+    rows, d = [], date(2021, 12, 1)
+    while d <= end:
+        t = 16 + 9 * math.sin((d.timetuple().tm_yday - 110) / 365 * 2 * math.pi)
+        rows.append({"date": d.isoformat(), "temp_min": t - 6, "temp_max": t + 7, "precip": 1.0})
+        d += timedelta(days=1)
+    return rows
+
+
+def _key(
+    variety: str | None = "Picholine marocaine", referential_hash: str = "ref-hash"
+) -> CycleCheckpointKey:
+    return CycleCheckpointKey("parcel-1", referential_hash, variety, "PLEINE_PRODUCTION")
+
+
+def test_closed_cycles_round_trip_through_their_transitions():
+    timelines = sm.run_state_machine(
+        weather_days=_weather(date(2024, 3, 31)), nirv_series=[], ndvi_series=[]
+    )
+
+    closed, current = timelines[:-1], timelines[-1]
+    assert closed and all(tl.closed for tl in closed)
+    assert not current.closed
+
+    stored = json.loads(json.dumps([sm.transition_to_dict(t) for t in closed[0].transitions]))
+    restored = sm.timeline_from_transitions(closed[0].year, stored)
+    assert restored.transitions == closed[0].transitions
+
+
+def test_store_round_trips_isolates_keys_and_prunes_stale_ones(tmp_path):
+    store = CycleCheckpointStore(str(tmp_path / "checkpoints.sqlite3"))
+    transitions = [{"phase": "DORMANCE", "start_date": "2023-12-01"}]
+
+    store.save(_key(), {2023: {"digest": "a", "transitions": transitions}})
+    store.save(
+        _key(),
+        {
+            2023: {"digest": "b", "transitions": transitions},
+            2024: {"digest": "c", "transitions": []},
+        },
+    )
+
+    assert store.load(_key()) == {
+        2023: {"digest": "b", "transitions": transitions},
+        2024: {"digest": "c", "transitions": []},
+    }
+    assert store.load(_key(variety="Arbequina")) == {}
+
+    # A new referential for the parcel supersedes its old rows
+    store.save(_key(referential_hash="new"), {2024: {"digest": "d", "transitions": []}})
+    assert store.load(_key()) == {}
+    assert set(store.load(_key(referential_hash="new"))) == {2024}
+
+    store.clear()
+    assert store.load(_key(referential_hash="new")) == {}
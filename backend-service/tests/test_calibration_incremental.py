@@ -0,0 +1,196 @@
+"""Incremental recalibration from a previous CalibrationOutput."""
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.services.calibration import orchestrator
+from app.services.calibration.pipeline import s1_satellite_extraction as s1
+from app.services.calibration.pipeline import s4_state_machine as sm
+from app.services.calibration.support.cycle_checkpoints import CycleCheckpointStore
+from app.services.calibration.support.incremental import (
+    IMAGES_PREFIX,
+    content_hash,
+    first_changed_month,
+    monthly_digests,
+)
+from app.services.calibration.types import CalibrationInput, CalibrationOutput
+
+REFERENTIAL = (
+    Path(__file__).resolve().parents[2] / "agritech-api" / "referentials" / "DATA_OLIVIER.json"
+)
+
+
+def _weather(end: date, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    rows, d = [], date(2020, 12, 1)
+    while d <= end:
+        t = 16 + 9 * math.sin((d.timetuple().tm_yday - 110) / 365 * 2 * math.pi)
+        rows.append({
+            "date": d.isoformat(),
+            "temperature_min": t - 6 + rng.gauss(0, 1),
+            "temperature_max": t + 7 + rng.gauss(0, 1),
+            "precipitation_sum": max(0.0, rng.gauss(0, 3)),
+            "et0_fao_evapotranspiration": 3.0,
+        })
+        d += timedelta(days=1)
+    return rows
+
+
+def _images(end: date, seed: int = 2) -> list[dict]:
+    rng = random.Random(seed)
+    rows, d = [], date(2020, 12, 3)
+    while d <= end:
+        v = 0.45 + 0.15 * math.sin((d.timetuple().tm_yday - 80) / 365 * 2 * math.pi)
+        v += rng.gauss(0, 0.01)
+        indices = {
+            "NDVI": v, "NIRv": v * 0.45, "NDMI": v * 0.5, "NDRE": v * 0.6,
+            "EVI": v * 0.8, "MSAVI2": v * 0.7, "MSI": 1 - v, "GCI": v * 3,
+        }
+        rows.append({"date": d.isoformat(), "cloud_coverage": 5.0, "indices": indices})
+        d += timedelta(days=rng.choice([5, 5, 5, 10]))
+    return rows
+
+
+def _until(rows: list[dict], last: str) -> list[dict]:
+    return [r for r in rows if r["date"] <= last]
+
+
+def test_content_hash_and_monthly_digests() -> None:
+    rows = _images(date(2021, 3, 31))
+
+    assert content_hash({"a": 1, "b": [date(2024, 1, 1)]}) == content_hash(
+        {"b": [date(2024, 1, 1)], "a": 1}
+    )
+    assert content_hash(1) != content_hash(1.0)
+
+    before = monthly_digests(rows, IMAGES_PREFIX)
+    assert monthly_digests(list(reversed(rows)), IMAGES_PREFIX) == before
+    edited = [dict(r) for r in rows]
+    edited[-1]["cloud_coverage"] = 6.0
+    after = monthly_digests(edited + [{"date": "2021-04-02"}], IMAGES_PREFIX)
+    assert first_changed_month(before, after, IMAGES_PREFIX) == "2021-03"
+    assert first_changed_month(before, before, IMAGES_PREFIX) is None
+
+
+def test_extended_satellite_history_matches_full_run(monkeypatch) -> None:
+    images = _images(date(2024, 6, 30))
+    kwargs = {"organization_id": "org", "parcel_id": "p", "storage": None}
+    previous = s1.extract_satellite_history(images=_until(images, "2024-04-30"), **kwargs)
+    full = s1.extract_satellite_history(images=images, **kwargs)
+
+    cleaned: list[int] = []
+    clean = s1._clean_block
+    monkeypatch.setattr(
+        s1,
+        "_clean_block",
+        lambda ordinals, values, **kw: cleaned.append(len(ordinals)) or clean(ordinals, values, **kw),
+    )
+    extended = s1.extract_satellite_history(
+        images=images, previous=previous, changed_from=date(2024, 5, 1), **kwargs
+    )
+
+    assert extended == full
+    assert max(cleaned) < len(images) // 4
+
+
+def test_state_machine_reuses_unchanged_cycle_years(monkeypatch) -> None:
+    weather = [
+        {"date": r["date"], "temp_min": r["temperature_min"], "temp_max": r["temperature_max"],
+         "precip": r["precipitation_sum"]}
+        for r in _weather(date(2024, 11, 30))
+    ]
+    full = sm.run_state_machine(weather_days=weather, nirv_series=[], ndvi_series=[])
+    reuse = {tl.year: tl for tl in full[:-1]}
+
+    simulated: list[int] = []
+    original = sm.CropPhaseStateMachine.process_day
+    monkeypatch.setattr(
+        sm.CropPhaseStateMachine,
+        "process_day",
+        lambda self, signals: simulated.append(signals.current_date.year) or original(self, signals),
+    )
+    resumed = sm.run_state_machine(
+        weather_days=weather, nirv_series=[], ndvi_series=[], reuse=reuse
+    )
+
+    assert [(tl.year, tl.mode, tl.transitions) for tl in resumed] == [
+        (tl.year, tl.mode, tl.transitions) for tl in full
+    ]
+    assert set(simulated) <= {full[-1].year - 1, full[-1].year}
+    restored = sm.timelines_from_phase_timeline(
+        sm.map_timelines_to_step4output(full).phase_timeline
+    )
+    assert restored[full[0].year].transitions == full[0].transitions
+
+
+@pytest.fixture
+def olive_run(tmp_path, monkeypatch):
+    if not REFERENTIAL.is_file():
+        pytest.skip("olive referential not available")
+    monkeypatch.setattr(
+        orchestrator,
+        "cycle_checkpoint_store",
+        CycleCheckpointStore(str(tmp_path / "checkpoints.sqlite3")),
+    )
+    calibration_input = CalibrationInput(
+        parcel_id="parcel-1",
+        organization_id="org-1",
+        crop_type="olivier",
+        variety="Picholine marocaine",
+        planting_year=2010,
+        planting_system="intensif",
+        reference_data=json.loads(REFERENTIAL.read_text(encoding="utf-8")),
+    )
+    weather, images = _weather(date(2025, 10, 7)), _images(date(2025, 10, 7))
+
+    def run(last: str, previous=None):
+        return asyncio.run(
+            orchestrator.run_calibration_pipeline(
+                calibration_input=calibration_input,
+                satellite_images=_until(images, last),
+                weather_rows=_until(weather, last),
+                previous_output=previous,
+            )
+        )
+
+    return run
+
+
+def test_weekly_recalibration_reuses_previous_output(olive_run, monkeypatch) -> None:
+    monkeypatch.setattr(orchestrator.settings, "CALIBRATION_CHECKPOINTS_ENABLED", False)
+
+    last_week = olive_run("2025-09-30")
+    unchanged = olive_run("2025-09-30", previous=last_week)
+    full = olive_run("2025-10-07")
+    # As stored and sent back by the API
+    stored = CalibrationOutput.model_validate_json(last_week.model_dump_json())
+    incremental = olive_run("2025-10-07", previous=stored)
+
+    assert {"s1", "s2", "s4", "s8"} <= set(unchanged.metadata.reused_stages)
+    assert unchanged.step4 == last_week.step4
+    assert "s4/2024" in incremental.metadata.reused_stages
+    assert "s4/2025" not in incremental.metadata.reused_stages
+    for stage in ("step1", "step2", "step3", "step4", "step5", "step6", "step7", "step8"):
+        assert getattr(incremental, stage) == getattr(full, stage), stage
+    assert incremental.metadata.input_hashes == full.metadata.input_hashes
+
+
+def test_closed_cycle_years_resume_from_stored_checkpoints(olive_run, monkeypatch) -> None:
+    first = olive_run("2025-09-30")
+    assert not any(s.startswith("s4/") for s in first.metadata.reused_stages)
+
+    # No previous_output: closed years come from the checkpoint store
+    resumed = olive_run("2025-10-07")
+    reused = set(resumed.metadata.reused_stages)
+    assert {"s4/2022", "s4/2023", "s4/2024"} <= reused
+    assert "s4/2025" not in reused
+
+    monkeypatch.setattr(orchestrator.settings, "CALIBRATION_CHECKPOINTS_ENABLED", False)
+    assert resumed.step4 == olive_run("2025-10-07").step4
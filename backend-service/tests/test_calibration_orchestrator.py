@@ -1,4 +1,5 @@
 import asyncio
+import pickle
 from importlib import import_module
 
 
@@ -165,3 +166,26 @@ def test_orchestrator_normalizes_mixed_case_index_keys() -> None:
         )
         assert output.step3.global_percentiles[index].p10 is not None
         assert output.step3.global_percentiles[index].p25 is not None
+
+
+def test_run_stage_process_pool_matches_thread_execution(monkeypatch) -> None:
+    run_stage = getattr(orchestrator_module, "_run_stage")
+    extract_weather_history = getattr(orchestrator_module, "extract_weather_history")
+    kwargs = {
+        "weather_data": build_weather_fixture(),
+        "crop_type": "olivier",
+        "reference_data": build_crop_reference_fixture(),
+    }
+
+    threaded = asyncio.run(run_stage(extract_weather_history, **kwargs))
+
+    settings = getattr(orchestrator_module, "settings")
+    monkeypatch.setattr(settings, "CALIBRATION_STAGE_EXECUTOR", "process")
+    monkeypatch.setattr(settings, "CALIBRATION_PROCESS_WORKERS", 1)
+    try:
+        pooled = asyncio.run(run_stage(extract_weather_history, **kwargs))
+    finally:
+        orchestrator_module.shutdown_stage_pool()
+
+    assert pooled == threaded
+    assert pickle.loads(pickle.dumps(threaded)) == threaded
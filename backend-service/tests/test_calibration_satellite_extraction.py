@@ -196,3 +196,30 @@ def test_step1_ignores_missing_indices_instead_of_injecting_zero_points() -> Non
     assert [p.value for p in output.index_time_series["NDVI"]] == [0.42, 0.48]
     assert [p.value for p in output.index_time_series["NDMI"]] == [0.21]
     assert output.index_time_series["NIRv"] == []
+
+
+def test_step1_cleans_indices_with_different_dates_independently() -> None:
+    images = _build_images(total=40, cloudy_every=100)
+    for row in images[10:13]:
+        del row["indices"]["NDMI"]
+
+    output = extract_satellite_history(
+        organization_id="org-1",
+        parcel_id="parcel-1",
+        images=images,
+        storage=None,
+    )
+
+    for index in ("NDMI", "NDVI"):
+        alone = extract_satellite_history(
+            organization_id="org-1",
+            parcel_id="parcel-1",
+            images=[
+                {**row, "indices": {index: row["indices"][index]}}
+                for row in images
+                if index in row["indices"]
+            ],
+            storage=None,
+        )
+        assert output.index_time_series[index] == alone.index_time_series[index]
+    assert len(output.index_time_series["NDMI"]) < len(output.index_time_series["NDVI"])
@@ -0,0 +1,87 @@
+from datetime import date
+
+import numpy as np
+
+from app.services.calibration.series import (
+    FLAG_INTERPOLATED,
+    FLAG_OUTLIER,
+    IndexSeries,
+)
+from app.services.calibration.types import IndexTimePoint, Step1Output
+
+
+def _points():
+    return [
+        IndexTimePoint(date=date(2025, 3, 10), value=0.55, interpolated=True),
+        IndexTimePoint(date=date(2025, 3, 1), value=0.5),
+        IndexTimePoint(date=date(2024, 12, 20), value=0.9, outlier=True),
+        IndexTimePoint(date=date(2025, 3, 20), value=0.6),
+    ]
+
+
+def _step1(series):
+    return Step1Output(
+        index_time_series={"NDVI": series},
+        cloud_coverage_mean=10.0,
+        filtered_image_count=0,
+        outlier_count=1,
+        interpolated_dates=[date(2025, 3, 10)],
+        raster_paths={},
+    )
+
+
+def test_from_points_sorts_and_packs_flags():
+    series = IndexSeries.from_points(_points())
+
+    assert series.ordinals.dtype == np.int64
+    assert series.values.dtype == np.float64
+    assert series.flags.tolist() == [FLAG_OUTLIER, 0, FLAG_INTERPOLATED, 0]
+    assert series.dates == [
+        date(2024, 12, 20),
+        date(2025, 3, 1),
+        date(2025, 3, 10),
+        date(2025, 3, 20),
+    ]
+    assert series.years.tolist() == [2024, 2025, 2025, 2025]
+    assert series.months.tolist() == [12, 3, 3, 3]
+
+
+def test_masks_filter_without_materialising_points():
+    series = IndexSeries.from_points(_points())
+
+    assert series.observed().values.tolist() == [0.5, 0.6]
+    assert series.without_interpolated().values.tolist() == [0.9, 0.5, 0.6]
+    assert series.without_outliers().values.tolist() == [0.5, 0.55, 0.6]
+    assert series.records()[0] == {"date": "2024-12-20", "value": 0.9}
+
+
+def test_sequence_view_matches_point_list():
+    series = IndexSeries.from_points(_points())
+    expected = sorted(_points(), key=lambda p: p.date)
+
+    assert len(series) == 4
+    assert list(series) == expected
+    assert series == expected
+    assert series[-1] == expected[-1]
+    assert series[1:3] == expected[1:3]
+    assert IndexSeries.empty() == []
+    assert not IndexSeries.empty()
+
+
+def test_step1_output_keeps_list_shape_at_the_boundary():
+    step1 = _step1([p.model_dump() for p in _points()])
+
+    series = step1.index_time_series["NDVI"]
+    assert isinstance(series, IndexSeries)
+    assert step1.series("NIRv") == []
+
+    payload = step1.model_dump(mode="json")["index_time_series"]["NDVI"]
+    assert payload[0] == {
+        "date": "2024-12-20",
+        "value": 0.9,
+        "outlier": True,
+        "interpolated": False,
+    }
+    assert Step1Output.model_validate_json(step1.model_dump_json()) == step1
+    schema = Step1Output.model_json_schema()["properties"]["index_time_series"]
+    assert schema["additionalProperties"]["items"] == {"$ref": "#/$defs/IndexTimePoint"}
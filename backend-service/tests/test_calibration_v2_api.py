@@ -164,3 +164,66 @@ def test_precompute_gdd_v2_updates_rows() -> None:
 def test_v1_run_endpoint_removed() -> None:
     response = client.post("/api/calibration/run", json={})
     assert response.status_code == 404
+
+
+def test_run_batch_streams_ndjson_with_shared_referential(monkeypatch) -> None:
+    import asyncio
+    import json
+
+    from fastapi import HTTPException
+
+    calibration_api = import_module("app.api.calibration")
+    seen_references: list[object] = []
+    active = {"now": 0, "peak": 0}
+
+    class _Output:
+        def __init__(self, parcel_id: str) -> None:
+            self.parcel_id = parcel_id
+
+        def model_dump(self, mode: str = "python") -> dict[str, object]:
+            return {"parcel_id": self.parcel_id}
+
+    async def fake_run_v2(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        seen_references.append(request.calibration_input.reference_data)
+        if request.calibration_input.parcel_id == "p-bad":
+            raise HTTPException(status_code=400, detail={"step": "pipeline", "reason": "boom"})
+        return _Output(request.calibration_input.parcel_id)
+
+    monkeypatch.setattr(calibration_api, "_run_v2", fake_run_v2)
+
+    items = []
+    for parcel_id in ("p-1", "p-2", "p-bad", "p-3"):
+        item = _build_v2_payload()
+        item["calibration_input"]["parcel_id"] = parcel_id
+        item["calibration_input"]["reference_data"] = {}
+        items.append(item)
+
+    response = client.post(
+        "/api/calibration/v2/run-batch",
+        json={
+            "items": items,
+            "reference_data": {"olivier": build_crop_reference_fixture()},
+            "max_concurrency": 2,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2, 3]
+    by_parcel = {line["parcel_id"]: line for line in lines}
+    assert by_parcel["p-1"]["output"] == {"parcel_id": "p-1"}
+    assert by_parcel["p-bad"]["status"] == "error"
+    assert by_parcel["p-bad"]["status_code"] == 400
+    assert active["peak"] <= 2
+    assert all(ref is seen_references[0] for ref in seen_references)
+    assert seen_references[0]
+
+
+def test_run_batch_rejects_empty_items_with_422() -> None:
+    response = client.post("/api/calibration/v2/run-batch", json={"items": []})
+    assert response.status_code == 422
@@ -2,7 +2,7 @@
 
 import pytest
 
-from app.services.calibration.support.condition_evaluator import evaluate
+from app.services.calibration.support.condition_evaluator import compile_condition, evaluate
 
 
 # ---------------------------------------------------------------------------
@@ -337,3 +337,42 @@ class TestDiagnosticsNone:
     def test_explicit_none(self):
         result = evaluate({"var": "x", "gt": 5}, {"x": 10}, diagnostics=None)
         assert result is True
+
+
+# ---------------------------------------------------------------------------
+# 14. Compiled predicates
+# ---------------------------------------------------------------------------
+
+class TestCompileCondition:
+    def test_matches_evaluate(self):
+        cond = {"and": [
+            {"var": "GDD_cumul", "gte": 350},
+            {"or": [{"var": "a", "lt_var": "b", "factor": 0.5}, {"not": {"var": "x", "in": [1, 2]}}]},
+        ]}
+        predicate = compile_condition(cond)
+        for ctx in (
+            {"GDD_cumul": 400, "a": 2, "b": 10, "x": 1},
+            {"GDD_cumul": 400, "a": 8, "b": 10, "x": 1},
+            {"GDD_cumul": 400, "a": 8, "b": 10, "x": 3},
+            {"GDD_cumul": 100},
+            {},
+        ):
+            assert predicate(ctx) is evaluate(cond, ctx)
+
+    def test_cached_by_content(self):
+        first = compile_condition({"var": "x", "gt": 5, "factor": 1.0})
+        second = compile_condition({"factor": 1.0, "gt": 5, "var": "x"})
+        assert first is second
+
+    def test_diagnostics(self):
+        diag: list = []
+        compile_condition({"var": "missing", "gt": 5})({"x": 1}, diag)
+        assert diag == [
+            {"var": "missing", "op": "gt", "expected": 5, "actual": None, "result": False}
+        ]
+
+    def test_bare_list_raises_on_evaluation(self):
+        predicate = compile_condition({"or": [{"var": "x", "eq": 1}, [{"var": "y", "eq": 2}]]})
+        assert predicate({"x": 1}) is True
+        with pytest.raises(ValueError):
+            predicate({"x": 0})
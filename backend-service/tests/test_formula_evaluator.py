@@ -0,0 +1,37 @@
+"""Tests for the referential calculs_preliminaires formula evaluator."""
+
+from app.services.calibration.support.formula_evaluator import (
+    FormulaEvaluator,
+    compile_formula,
+    compute_preliminary_signals,
+)
+
+GDD_FORMULA = "max(0, (min(Tmax, Tplafond) + max(Tmin, Tbase)) / 2 - Tbase)"
+
+
+def test_evaluate_gdd_formula():
+    result = FormulaEvaluator().evaluate(
+        GDD_FORMULA, {"Tmax": 30, "Tmin": 10, "Tplafond": 35, "Tbase": 7.5}
+    )
+    assert result == 12.5
+
+
+def test_temporal_refs_and_division_by_zero():
+    ctx = {"NDVI_t": 0.6, "NDVI_t_1": 0.5, "zero": 0}
+    assert compile_formula("NDVI(t) - NDVI(t-1)")(ctx) == 0.6 - 0.5
+    assert compile_formula("NDVI(t) / zero")(ctx) == 0.0
+
+
+def test_failures_return_none():
+    assert compile_formula("Tmax + unknown")({"Tmax": 1}) is None
+    assert compile_formula("Tmax ** 2")({"Tmax": 1}) is None
+    assert compile_formula("(((")({}) is None
+
+
+def test_compiled_once():
+    assert compile_formula(GDD_FORMULA) is compile_formula(GDD_FORMULA)
+
+
+def test_preliminary_signals_chain_in_order():
+    formulas = {"a": "x * 2", "b": "a + 1", "bad": "missing * 2", "note": 3}
+    assert compute_preliminary_signals(formulas, {"x": 1.5}) == {"a": 3.0, "b": 4.0}
@@ -1,9 +1,12 @@
 from importlib import import_module
 
+import numpy as np
+
 
 gdd_module = import_module("app.services.calibration.support.gdd_service")
 
 compute_daily_gdd = getattr(gdd_module, "compute_daily_gdd")
+compute_daily_gdd_array = getattr(gdd_module, "compute_daily_gdd_array")
 estimate_chill_hours = getattr(gdd_module, "estimate_chill_hours")
 precompute_gdd_rows = getattr(gdd_module, "precompute_gdd_rows")
 compute_olive_gdd_two_phase = getattr(gdd_module, "compute_olive_gdd_two_phase")
@@ -43,6 +46,15 @@ def test_gdd_formula_floors_tmin_at_tbase() -> None:
     assert compute_daily_gdd(temp_max=20.0, temp_min=5.0, tbase=7.5, tupper=30.0) == 6.25
 
 
+def test_gdd_array_matches_scalar_formula() -> None:
+    tmax = [30.0, 8.0, 40.0, 20.0, 5.0]
+    tmin = [20.0, 2.0, 30.0, 5.0, -3.0]
+    for tupper in (None, 30.0):
+        expected = [compute_daily_gdd(hi, lo, 7.5, tupper) for hi, lo in zip(tmax, tmin)]
+        result = compute_daily_gdd_array(np.array(tmax), np.array(tmin), 7.5, tupper)
+        assert result.tolist() == expected
+
+
 # ---------------------------------------------------------------------------
 # estimate_chill_hours
 # ---------------------------------------------------------------------------
@@ -0,0 +1,111 @@
+"""Tests for the dedicated Earth Engine executor."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services import gee_executor, gee_metrics
+
+
+@pytest.fixture
+def single_worker(monkeypatch):
+    gee_executor.shutdown_gee_executor()
+    monkeypatch.setattr(gee_executor.settings, "GEE_EXECUTOR_WORKERS", 1)
+    gee_executor.reset()
+    yield
+    gee_executor.shutdown_gee_executor()
+    gee_executor.reset()
+
+
+def test_calls_run_on_gee_threads_with_request_context(single_worker):
+    def blocking_call():
+        gee_metrics.record_round_trip("probe")
+        return threading.current_thread().name
+
+    async def scenario():
+        token = gee_metrics.current_route.set("POST /api/analysis/statistics")
+        try:
+            return await gee_executor.run_gee(blocking_call)
+        finally:
+            gee_metrics.current_route.reset(token)
+
+    gee_metrics.reset()
+    thread_name = asyncio.run(scenario())
+
+    assert thread_name.startswith("gee")
+    assert gee_metrics.snapshot()["POST /api/analysis/statistics"]["operations"] == {"probe": 1}
+    gee_metrics.reset()
+
+
+def test_queue_depth_and_wait_are_tracked_without_blocking_the_loop(single_worker):
+    release = threading.Event()
+
+    async def scenario():
+        slow = [
+            asyncio.ensure_future(gee_executor.run_gee(release.wait, 5))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        # The loop keeps serving other work while GEE calls queue up
+        ticks_started = time.monotonic()
+        await asyncio.sleep(0.01)
+        loop_latency = time.monotonic() - ticks_started
+        during = gee_executor.snapshot()
+        release.set()
+        await asyncio.gather(*slow)
+        return loop_latency, during
+
+    loop_latency, during = asyncio.run(scenario())
+    after = gee_executor.snapshot()
+
+    assert loop_latency < 0.5
+    assert (during["running"], during["queued"]) == (1, 2)
+    assert after["max_queue_depth"] >= 2
+    assert after["completed"] == 3
+    assert after["queued"] == 0 and after["running"] == 0
+    assert after["max_wait_s"] >= 0.04
+
+
+def test_failures_propagate_and_are_counted(single_worker):
+    def boom():
+        raise ValueError("quota exceeded")
+
+    with pytest.raises(ValueError, match="quota exceeded"):
+        asyncio.run(gee_executor.run_gee(boom))
+
+    assert gee_executor.snapshot()["failed"] == 1
+
+
+def test_chunk_pool_is_shared_and_bounded_across_callers(single_worker, monkeypatch):
+    monkeypatch.setattr(gee_executor.settings, "GEE_TS_CHUNK_WORKERS", 2)
+    release = threading.Event()
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def chunk():
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        release.wait(5)
+        with lock:
+            active["now"] -= 1
+        return threading.current_thread().name
+
+    # Two "syncs" running on run_gee workers each schedule three chunks
+    def sync():
+        return [gee_executor.submit_gee_chunk(chunk) for _ in range(3)]
+
+    futures = sync() + sync()
+    time.sleep(0.05)
+    during = gee_executor.snapshot()["chunks"]
+    futures[-1].cancel()
+    release.set()
+    names = [f.result(5) for f in futures[:-1]]
+
+    assert active["max"] == 2
+    assert (during["running"], during["queued"]) == (2, 4)
+    assert all(name.startswith("gee-ts-chunk") for name in names)
+    after = gee_executor.snapshot()["chunks"]
+    assert after["completed"] == 5
+    assert after["queued"] == 0 and after["running"] == 0
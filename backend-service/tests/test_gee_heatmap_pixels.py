@@ -0,0 +1,120 @@
+"""Tests for the computePixels-based Earth Engine heatmap fetch."""
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import (
+    HEATMAP_NODATA,
+    EarthEngineService,
+    heatmap_grid_spec,
+)
+from app.services.satellite.utils.heatmap_encoding import decode_heatmap
+
+BOUNDS = (-5.5, -5.49, 33.9, 33.91)  # min_lon, max_lon, min_lat, max_lat
+
+
+def test_grid_spec_keeps_native_resolution_for_small_aoi():
+    spec = heatmap_grid_spec(*BOUNDS, max_pixels=50000)
+
+    assert spec["scale"] == 10
+    assert spec["width"] * spec["height"] < 50000
+    assert spec["width"] * spec["pixel_width"] >= BOUNDS[1] - BOUNDS[0]
+
+
+def test_grid_spec_coarsens_large_aoi_to_pixel_budget():
+    spec = heatmap_grid_spec(-6.0, -5.5, 33.5, 34.0, max_pixels=50000)
+
+    assert spec["scale"] > 100
+    assert spec["width"] * spec["height"] <= 50000 * 1.02
+
+
+def test_compute_pixels_decodes_grid_in_one_request(monkeypatch):
+    spec = heatmap_grid_spec(*BOUNDS, max_pixels=50000)
+    raster = np.zeros((spec["height"], spec["width"]), dtype=[("NDVI", "<f4")])
+    raster["NDVI"] = np.linspace(0.1, 0.8, raster.size).reshape(raster.shape)
+    raster["NDVI"][0, :] = HEATMAP_NODATA  # outside the AOI
+
+    fake_ee = MagicMock()
+    fake_ee.data.computePixels.return_value = raster
+    monkeypatch.setattr(ee_module, "ee", fake_ee)
+
+    pixel_data, values, sampling = EarthEngineService()._compute_heatmap_pixels(
+        MagicMock(), "NDVI", *BOUNDS
+    )
+
+    request = fake_ee.data.computePixels.call_args.args[0]
+    assert fake_ee.data.computePixels.call_count == 1
+    assert request["fileFormat"] == "NUMPY_NDARRAY"
+    assert request["grid"]["dimensions"] == {"width": spec["width"], "height": spec["height"]}
+    assert request["grid"]["affineTransform"]["translateY"] == BOUNDS[3]
+
+    assert len(pixel_data) == (spec["height"] - 1) * spec["width"]
+    assert values.size == len(pixel_data)
+    assert pixel_data[0]["lon"] == pytest.approx(BOUNDS[0] + spec["pixel_width"] / 2)
+    assert pixel_data[0]["lat"] == pytest.approx(BOUNDS[3] - 1.5 * spec["pixel_height"])
+    assert sampling["sampling_method"] == "computePixels grid"
+
+
+def test_binary_heatmap_encodes_fetched_raster_without_points(monkeypatch):
+    from app.api.indices import _binary_heatmap_response
+
+    spec = heatmap_grid_spec(*BOUNDS, max_pixels=50000)
+    raster = np.zeros((spec["height"], spec["width"]), dtype=[("NDVI", "<f4")])
+    raster["NDVI"] = np.linspace(0.1, 0.8, raster.size).reshape(raster.shape)
+    raster["NDVI"][0, :] = HEATMAP_NODATA
+
+    fake_ee = MagicMock()
+    fake_ee.data.computePixels.return_value = raster
+    monkeypatch.setattr(ee_module, "ee", fake_ee)
+    service = EarthEngineService()
+    monkeypatch.setattr(
+        service, "_compute_heatmap_pixels", MagicMock(side_effect=AssertionError("points"))
+    )
+
+    grid, sampling = service._compute_heatmap_grid(MagicMock(), "NDVI", *BOUNDS)
+    data = {"index": "NDVI", "pixel_data": [], "raster": grid, "metadata": sampling}
+    header, values = decode_heatmap(_binary_heatmap_response(data, "float32").body)
+
+    assert "raster" not in header and "pixel_data" not in header
+    assert header["grid"]["origin_lon"] == BOUNDS[0]
+    assert header["grid"]["origin_lat"] == BOUNDS[3]
+    assert values.shape == (spec["height"], spec["width"])
+    assert np.isnan(values[0]).all()
+    assert np.array_equal(values[1:], raster["NDVI"][1:])
+
+
+def test_export_heatmap_uses_pixels_mode_without_sampling(monkeypatch):
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    service = EarthEngineService()
+    lazy = MagicMock()
+    lazy.evaluate.return_value = {
+        "size": 1,
+        "bounds": {
+            "coordinates": [[[-5.5, 33.9], [-5.49, 33.9], [-5.49, 33.91], [-5.5, 33.91]]]
+        },
+    }
+    monkeypatch.setattr(service, "initialize", lambda: None)
+    monkeypatch.setattr(service, "get_sentinel2_collection_lazy", lambda *a, **k: lazy)
+    monkeypatch.setattr(service, "calculate_vegetation_indices", lambda image, idx: {"NDVI": MagicMock()})
+    monkeypatch.setattr(
+        service,
+        "_compute_heatmap_pixels",
+        lambda *a: (
+            [{"lon": -5.5, "lat": 33.9, "value": 0.5}],
+            np.array([0.5]),
+            {"sample_scale": 10.0, "sampling_method": "computePixels grid"},
+        ),
+    )
+    monkeypatch.setattr(
+        service, "_sample_heatmap_points", MagicMock(side_effect=AssertionError("sampled"))
+    )
+
+    result = asyncio.run(service.export_heatmap_data({"type": "Polygon", "coordinates": []}, "2024-05-01", "NDVI"))
+
+    assert result["statistics"]["count"] == 1
+    assert result["statistics"]["p90"] == 0.5
+    assert result["metadata"]["sampling_method"] == "computePixels grid"
+    assert result["metadata"]["total_pixels"] == 1
@@ -0,0 +1,107 @@
+"""Tests for LazyCollection memoization and GEE round-trip accounting."""
+from unittest.mock import MagicMock
+
+from app.services import earth_engine as ee_module
+from app.services import gee_metrics
+from app.services.earth_engine import LazyCollection
+
+
+def _lazy(monkeypatch, responses):
+    """LazyCollection over a mocked ee namespace; getInfo returns ``responses`` in order."""
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    requests = []
+
+    def fake_get_info(ee_object, operation):
+        requests.append(operation)
+        return dict(responses.pop(0))
+
+    monkeypatch.setattr(ee_module, "counted_get_info", fake_get_info)
+    return LazyCollection(MagicMock(), description="test"), requests
+
+
+def test_size_and_first_info_are_memoized(monkeypatch):
+    lazy, requests = _lazy(
+        monkeypatch,
+        [{"size": 3, "first": {"id": "T1", "date": "2024-05-01", "cloud": 2.0}}],
+    )
+
+    assert lazy.size() == 3
+    assert lazy.first_info() == {"id": "T1", "date": "2024-05-01", "cloud": 2.0}
+    assert not lazy.is_empty()
+    assert requests == ["collection_size"]
+
+
+def test_evaluate_fuses_emptiness_check_with_payload(monkeypatch):
+    lazy, requests = _lazy(
+        monkeypatch,
+        [{"size": 2, "first": {"id": "T1"}, "samples": {"features": []}, "bounds": {}}],
+    )
+
+    fused = lazy.evaluate(
+        payload={"samples": object()}, always={"bounds": object()}, operation="heatmap"
+    )
+
+    assert fused["size"] == 2
+    assert fused["samples"] == {"features": []}
+    assert requests == ["heatmap"]
+    assert lazy.size() == 2
+    assert requests == ["heatmap"]
+
+
+def test_known_empty_collection_skips_round_trip(monkeypatch):
+    lazy, requests = _lazy(monkeypatch, [{"size": 0, "first": None}])
+
+    assert lazy.is_empty()
+    fused = lazy.evaluate(payload={"samples": object()}, operation="heatmap")
+
+    assert fused == {"size": 0, "first": None, "samples": None}
+    assert requests == ["collection_size"]
+
+
+def test_round_trips_are_counted_per_route():
+    gee_metrics.reset()
+    token = gee_metrics.current_route.set("POST /api/indices/heatmap")
+    try:
+        gee_metrics.counted_get_info(MagicMock(), "export_heatmap_data")
+        gee_metrics.counted_get_info(MagicMock(), "export_heatmap_data")
+    finally:
+        gee_metrics.current_route.reset(token)
+    gee_metrics.record_round_trip("timeseries_chunk")
+
+    snap = gee_metrics.snapshot()
+
+    assert snap["POST /api/indices/heatmap"] == {
+        "total": 2,
+        "operations": {"export_heatmap_data": 2},
+    }
+    assert snap["background"]["total"] == 1
+    gee_metrics.reset()
+
+
+def test_round_trips_are_keyed_by_route_template():
+    from fastapi import APIRouter, Depends, FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.main import tag_gee_route
+
+    router = APIRouter()
+
+    @router.get("/parcel/{parcel_id}/status")
+    async def status(parcel_id: str):
+        gee_metrics.record_round_trip("status")
+        return {}
+
+    app = FastAPI(dependencies=[Depends(tag_gee_route)])
+    app.include_router(router, prefix="/api/sync")
+    gee_metrics.reset()
+    client = TestClient(app)
+    for parcel_id in ("p1", "p2", "p3"):
+        client.get(f"/api/sync/parcel/{parcel_id}/status")
+
+    assert gee_metrics.snapshot() == {
+        "GET /api/sync/parcel/{parcel_id}/status": {
+            "total": 3,
+            "operations": {"status": 3},
+        }
+    }
+    gee_metrics.reset()
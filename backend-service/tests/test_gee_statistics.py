@@ -0,0 +1,108 @@
+"""Tests for single-round-trip multi-index, multi-period GEE statistics."""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import EarthEngineService
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.9], [-5.49, 33.9], [-5.49, 33.91], [-5.5, 33.9]]],
+}
+
+
+def _service(monkeypatch, responses):
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    requests = []
+
+    def fake_get_info(ee_object, operation):
+        requests.append(operation)
+        return responses
+
+    monkeypatch.setattr(ee_module, "counted_get_info", fake_get_info)
+    service = EarthEngineService()
+    monkeypatch.setattr(service, "initialize", lambda: None)
+    monkeypatch.setattr(service, "get_sentinel2_collection", lambda *a, **k: MagicMock())
+    monkeypatch.setattr(
+        service,
+        "calculate_vegetation_indices",
+        lambda image, indices: {name: MagicMock() for name in indices},
+    )
+    return service, requests
+
+
+def test_all_indices_and_periods_share_one_round_trip(monkeypatch):
+    service, requests = _service(
+        monkeypatch,
+        [
+            {"NDVI_mean": 0.4, "NDVI_p50": 0.41, "NDVI_stdDev": 0.05, "NDRE_mean": 0.2},
+            {"NDVI_mean": 0.5, "NDRE_mean": 0.25, "NDRE_p98": 0.3},
+        ],
+    )
+
+    first, second = service.get_statistics_for_periods(
+        GEOMETRY,
+        [("2024-04-01", "2024-04-30"), ("2024-05-01", "2024-05-31")],
+        ["NDVI", "NDRE"],
+    )
+
+    assert requests == ["statistics"]
+    assert first == {
+        "NDVI": {"NDVI_mean": 0.4, "NDVI_p50": 0.41, "NDVI_stdDev": 0.05},
+        "NDRE": {"NDRE_mean": 0.2},
+    }
+    assert second["NDRE"] == {"NDRE_mean": 0.25, "NDRE_p98": 0.3}
+
+
+def test_index_prefixes_do_not_leak_into_each_other(monkeypatch):
+    service, _ = _service(monkeypatch, [{"MSAVI_mean": 0.3, "MSAVI2_mean": 0.6}])
+
+    stats = service.get_statistics(GEOMETRY, "2024-05-01", "2024-05-31", ["MSAVI", "MSAVI2"])
+
+    assert stats == {"MSAVI": {"MSAVI_mean": 0.3}, "MSAVI2": {"MSAVI2_mean": 0.6}}
+
+
+@pytest.fixture
+def client():
+    from app.middleware.auth import get_current_user_or_service
+
+    app.dependency_overrides[get_current_user_or_service] = lambda: {"id": "test", "service": True}
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_compare_fetches_both_periods_in_one_batched_call(client, monkeypatch):
+    from app.api import analysis
+    from app.services import earth_engine_service
+
+    gee = MagicMock(provider_name="Google Earth Engine")
+    monkeypatch.setattr(analysis, "get_satellite_provider", lambda provider=None: gee)
+    batched = MagicMock(
+        return_value=[
+            {"NDVI": {"NDVI_mean": 0.4, "NDVI_p50": 0.4}},
+            {"NDVI": {"NDVI_mean": 0.5, "NDVI_p50": 0.45}},
+        ]
+    )
+    monkeypatch.setattr(earth_engine_service, "get_statistics_for_periods", batched)
+
+    response = client.post(
+        "/api/analysis/compare",
+        json={
+            "aoi": GEOMETRY,
+            "period1": {"start_date": "2024-04-01", "end_date": "2024-04-30"},
+            "period2": {"start_date": "2024-05-01", "end_date": "2024-05-31"},
+            "indices": ["NDVI"],
+        },
+    )
+
+    assert response.status_code == 200
+    assert batched.call_count == 1
+    assert batched.call_args.args[1] == [
+        ("2024-04-01", "2024-04-30"),
+        ("2024-05-01", "2024-05-31"),
+    ]
+    change = response.json()["comparison"]["NDVI"]["change"]
+    assert change["mean_diff"] == pytest.approx(0.1)
@@ -0,0 +1,123 @@
+"""Tests for the compact binary heatmap format and its negotiation on /api/indices/heatmap."""
+import json
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.satellite.utils.heatmap_encoding import (
+    HEATMAP_BINARY_MEDIA_TYPE,
+    decode_heatmap,
+    encode_heatmap,
+    grid_from_points,
+)
+
+PX = 0.0001
+
+
+def _regular_points(width: int, height: int):
+    rng = np.random.default_rng(0)
+    points = []
+    for row in range(height):
+        for col in range(width):
+            if (row + col) % 7 == 0:  # holes → nodata
+                continue
+            points.append(
+                {
+                    "lon": -5.5 + col * PX,
+                    "lat": 33.9 - row * PX,
+                    "value": float(rng.uniform(0.1, 0.9)),
+                }
+            )
+    return points
+
+
+def test_grid_from_regular_points_recovers_layout():
+    points = _regular_points(30, 20)
+    grid = grid_from_points(points)
+
+    assert (grid.width, grid.height) == (30, 20)
+    assert grid.pixel_width == pytest.approx(PX)
+    assert np.isnan(grid.values[0, 0])
+    assert grid.values[0, 1] == pytest.approx(points[0]["value"], rel=1e-6)
+    assert int(np.isfinite(grid.values).sum()) == len(points)
+
+
+@pytest.mark.parametrize("dtype,tolerance", [("float32", 1e-6), ("uint16", 1e-4)])
+def test_encode_decode_round_trip(dtype, tolerance):
+    grid = grid_from_points(_regular_points(30, 20))
+
+    header, values = decode_heatmap(encode_heatmap(grid, {"index": "NDVI"}, dtype=dtype))
+
+    assert header["index"] == "NDVI"
+    assert header["grid"]["dtype"] == dtype
+    assert np.array_equal(np.isnan(values), np.isnan(grid.values))
+    finite = np.isfinite(grid.values)
+    assert np.allclose(values[finite], grid.values[finite], atol=tolerance)
+
+
+def test_50k_pixel_heatmap_is_a_few_hundred_kb():
+    points = _regular_points(250, 230)
+    json_size = len(json.dumps(points))
+
+    payload = encode_heatmap(grid_from_points(points), {}, dtype="uint16")
+
+    assert len(points) > 49000
+    assert len(payload) < 150_000
+    assert len(payload) * 20 < json_size
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from app.api import indices
+    from app.middleware.auth import get_current_user_or_service
+
+    class _Provider:
+        provider_name = "CDSE"
+
+        async def export_heatmap_data(self, geometry, date, index, grid_size):
+            return {
+                "date": date,
+                "index": index,
+                "bounds": {"min_lon": -5.5, "max_lon": -5.47, "min_lat": 33.88, "max_lat": 33.9},
+                "pixel_data": _regular_points(30, 20),
+                "aoi_boundary": [],
+                "statistics": {"mean": 0.5},
+                "visualization": {"min": 0, "max": 1, "palette": ["#000000"]},
+                "metadata": {},
+            }
+
+    monkeypatch.setattr(indices, "get_satellite_provider", lambda provider=None: _Provider())
+    app.dependency_overrides[get_current_user_or_service] = lambda: {"id": "test", "service": True}
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _heatmap_body():
+    return {
+        "aoi": {
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[-5.5, 33.88], [-5.47, 33.88], [-5.47, 33.9], [-5.5, 33.88]]],
+            }
+        },
+        "date": "2024-05-01",
+        "index": "NDVI",
+    }
+
+
+def test_heatmap_endpoint_negotiates_binary(client):
+    by_query = client.post("/api/indices/heatmap?format=binary&encoding=uint16", json=_heatmap_body())
+    by_accept = client.post(
+        "/api/indices/heatmap", json=_heatmap_body(), headers={"Accept": HEATMAP_BINARY_MEDIA_TYPE}
+    )
+    as_json = client.post("/api/indices/heatmap", json=_heatmap_body())
+
+    assert by_query.headers["content-type"] == HEATMAP_BINARY_MEDIA_TYPE
+    header, values = decode_heatmap(by_query.content)
+    assert header["grid"]["dtype"] == "uint16"
+    assert "pixel_data" not in header
+    assert values.shape == (20, 30)
+    assert decode_heatmap(by_accept.content)[0]["grid"]["dtype"] == "float32"
+    assert len(as_json.json()["pixel_data"]) == int(np.isfinite(values).sum())
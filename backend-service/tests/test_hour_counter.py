@@ -41,3 +41,23 @@ def test_null_and_nan_temperatures_are_excluded():
         _row("2025-01-01T04:00:00+00:00", float("nan")),
     ]
     assert count_hours(rows, threshold=7, compare="below") == 2
+
+
+def test_hourly_series_matches_row_counting():
+    from app.services.weather.hour_counter import HourlySeries
+
+    rows = [
+        _row(f"2025-{m:02d}-01T{h:02d}:00:00+00:00", t)
+        for m in (1, 6, 11)
+        for h, t in enumerate([2, 7.2, None, float("nan"), 15, 25, 36, "bad"])
+    ] + [_row(None, 1.0)]
+    series = HourlySeries.from_rows(rows)
+
+    assert len(series) == len(rows)
+    for kwargs in (
+        {"threshold": 7.2, "compare": "below"},
+        {"threshold": 35, "compare": "above"},
+        {"threshold": 15, "compare": "between", "upper": 25},
+        {"threshold": 7.2, "compare": "below", "months": {11, 12, 1, 2}},
+    ):
+        assert count_hours(series, **kwargs) == count_hours(rows, **kwargs)
@@ -0,0 +1,87 @@
+"""Tests for the shared NumPy band-math expression engine."""
+import numpy as np
+import pytest
+
+from app.services.satellite.types import VEGETATION_INDEX_CALCULATORS
+from app.services.satellite.utils.index_calculator import (
+    calculate_all_indices,
+    get_required_bands,
+)
+from app.services.satellite.utils.index_engine import (
+    INDEX_EXPRESSIONS,
+    calculate_indices,
+    compile_indices,
+    required_bands,
+)
+
+BAND_NAMES = ["blue", "green", "red", "red_edge", "nir", "swir1"]
+
+
+def _bands(shape=(64, 48), seed=7):
+    rng = np.random.default_rng(seed)
+    return {
+        name: rng.uniform(0.01, 0.6, size=shape).astype(np.float32)
+        for name in BAND_NAMES
+    }
+
+
+@pytest.mark.parametrize("index", sorted(INDEX_EXPRESSIONS))
+def test_engine_matches_per_index_formulas(index):
+    bands = _bands()
+
+    result = calculate_indices(bands, [index])[index]
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(
+        result, VEGETATION_INDEX_CALCULATORS[index](bands), rtol=1e-5, atol=1e-6
+    )
+
+
+def test_shared_sub_expressions_are_computed_once():
+    plan = compile_indices(("NDVI", "SAVI", "OSAVI", "MSAVI2", "NIRv", "EVI"))
+    separate = sum(
+        len(compile_indices((name,)).steps)
+        for name in ("NDVI", "SAVI", "OSAVI", "MSAVI2", "NIRv", "EVI")
+    )
+
+    differences = [n for n in plan.steps if n.op == "sub" and n.args[0].op == "band"]
+
+    assert len(differences) == 1  # nir - red
+    assert len(plan.steps) < separate
+    assert plan.bands == ["blue", "nir", "red"]
+
+
+def test_chunked_evaluation_matches_whole_raster():
+    bands = _bands(shape=(101, 37))
+    indices = sorted(INDEX_EXPRESSIONS)
+
+    whole = calculate_indices(bands, indices, chunk_pixels=None)
+    chunked = calculate_indices(bands, indices, chunk_pixels=37 * 8)
+
+    for name in indices:
+        np.testing.assert_array_equal(chunked[name], whole[name])
+
+
+def test_zero_denominators_give_zero_and_nan_propagates():
+    bands = _bands(shape=(2, 2))
+    bands["nir"][0, 0] = bands["red"][0, 0] = 0.0
+    bands["green"][0, 1] = 0.0
+    bands["red"][1, 1] = np.nan
+
+    result = calculate_indices(bands, ["NDVI", "GCI", "MCARI"])
+
+    assert result["NDVI"][0, 0] == 0.0
+    assert result["GCI"][0, 1] == 0.0
+    assert np.isnan(result["NDVI"][1, 1])
+    assert np.isfinite(result["MCARI"][0, 1])
+
+
+def test_missing_bands_and_unknown_indices_are_omitted():
+    bands = _bands()
+    del bands["swir1"]
+
+    result = calculate_all_indices(bands, ["NDVI", "NDMI", "NOPE"])
+
+    assert list(result) == ["NDVI"]
+    assert required_bands(["NDMI", "NOPE"]) == ["nir", "swir1"]
+    assert sorted(get_required_bands(["EVI"])) == ["B02", "B04", "B08"]
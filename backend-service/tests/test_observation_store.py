@@ -0,0 +1,225 @@
+"""Tests for the incremental per-observation time-series store."""
+from datetime import date
+
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import EarthEngineService
+from app.services.observation_store import (
+    ObservationSeriesKey,
+    ObservationStore,
+    geometry_fingerprint,
+    uncovered_ranges,
+)
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.8], [-5.4, 33.8], [-5.4, 33.9], [-5.5, 33.8]]],
+}
+
+
+def _key(index: str = "NDVI") -> ObservationSeriesKey:
+    return ObservationSeriesKey.build(GEOMETRY, index, 10, 10.0, True)
+
+
+def test_geometry_fingerprint_is_key_order_independent():
+    reordered = {"coordinates": GEOMETRY["coordinates"], "type": "Polygon"}
+
+    assert geometry_fingerprint(GEOMETRY) == geometry_fingerprint(reordered)
+    assert len(geometry_fingerprint(GEOMETRY)) == 8
+    assert len(geometry_fingerprint(GEOMETRY, length=None)) == 32
+
+
+def test_series_key_separates_cloud_modes():
+    aoi = ObservationSeriesKey.build(GEOMETRY, "NDVI", 10, 10.0, True)
+    tile = ObservationSeriesKey.build(GEOMETRY, "NDVI", 10, 10.0, False)
+
+    assert aoi.as_str() != tile.as_str()
+
+
+def test_uncovered_ranges_returns_head_middle_and_tail_gaps():
+    covered = [
+        (date(2024, 2, 1), date(2024, 2, 10)),
+        (date(2024, 2, 20), date(2024, 2, 25)),
+    ]
+
+    gaps = uncovered_ranges(covered, date(2024, 1, 30), date(2024, 3, 1))
+
+    assert gaps == [
+        (date(2024, 1, 30), date(2024, 1, 31)),
+        (date(2024, 2, 11), date(2024, 2, 19)),
+        (date(2024, 2, 26), date(2024, 3, 1)),
+    ]
+
+
+def test_uncovered_ranges_fully_covered():
+    covered = [(date(2024, 1, 1), date(2024, 12, 31))]
+
+    assert uncovered_ranges(covered, date(2024, 3, 1), date(2024, 4, 1)) == []
+
+
+def test_record_chunk_merges_adjacent_coverage(tmp_path):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    key = _key()
+
+    store.record_chunk(
+        key,
+        [{"date": "2024-01-05", "value": 0.5, "cloud": 3}],
+        date(2024, 1, 1),
+        date(2024, 1, 31),
+    )
+    store.record_chunk(key, [], date(2024, 2, 1), date(2024, 2, 29))
+
+    assert store.missing_ranges(key, date(2024, 1, 1), date(2024, 3, 10)) == [
+        (date(2024, 3, 1), date(2024, 3, 10))
+    ]
+    assert store.get_observations(key, date(2024, 1, 1), date(2024, 1, 31)) == [
+        {"date": "2024-01-05", "value": 0.5, "cloud": 3}
+    ]
+    assert store.get_observations(_key("EVI"), date(2024, 1, 1), date(2024, 1, 31)) == []
+
+
+def test_record_chunk_without_settled_range_keeps_gap(tmp_path):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    key = _key()
+
+    store.record_chunk(
+        key, [{"date": "2024-01-05", "value": 0.5, "cloud": 3}], date(2024, 1, 1), None
+    )
+
+    assert store.missing_ranges(key, date(2024, 1, 1), date(2024, 1, 10)) == [
+        (date(2024, 1, 1), date(2024, 1, 10))
+    ]
+
+
+def test_time_series_only_queries_uncovered_dates(tmp_path, monkeypatch):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    monkeypatch.setattr(ee_module, "observation_store", store)
+    monkeypatch.setattr(
+        store, "settled_until", lambda today=None: date(2024, 12, 31)
+    )
+
+    calls = []
+
+    def fake_chunk(geometry, aoi, start, end, indices, scale, max_cloud, use_aoi_cloud_filter=False):
+        calls.append((start, end))
+        return {i: [{"date": start, "value": 0.4, "cloud": 5.0}] for i in indices}
+
+    service = EarthEngineService()
+    monkeypatch.setattr(service, "_per_observation_chunk_multi", fake_chunk)
+
+    first = service._get_time_series_per_observation(
+        GEOMETRY, None, "2024-01-01", "2024-03-31", "NDVI", 10, 10.0, True
+    )
+    assert calls == [("2024-01-01", "2024-03-31")]
+
+    calls.clear()
+    second = service._get_time_series_per_observation(
+        GEOMETRY, None, "2024-01-01", "2024-04-30", "NDVI", 10, 10.0, True
+    )
+
+    assert calls == [("2024-04-01", "2024-04-30")]
+    assert [p["date"] for p in second] == ["2024-01-01", "2024-04-01"]
+    assert second[0] == first[0]
+
+
+def test_multi_index_series_share_one_pass_and_store_per_index(tmp_path, monkeypatch):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    monkeypatch.setattr(ee_module, "observation_store", store)
+    monkeypatch.setattr(
+        store, "settled_until", lambda today=None: date(2024, 12, 31)
+    )
+
+    calls = []
+
+    def fake_chunk(geometry, aoi, start, end, indices, scale, max_cloud, use_aoi_cloud_filter=False):
+        calls.append((start, end, tuple(indices)))
+        return {i: [{"date": start, "value": 0.4, "cloud": 5.0}] for i in indices}
+
+    service = EarthEngineService()
+    monkeypatch.setattr(service, "_per_observation_chunk_multi", fake_chunk)
+
+    service._get_time_series_per_observation(
+        GEOMETRY, None, "2024-01-01", "2024-03-31", "NIRv", 10, 10.0, False
+    )
+    calls.clear()
+
+    series = service._get_time_series_per_observation_multi(
+        GEOMETRY, None, "2024-01-01", "2024-03-31", ["NIRv", "EVI"], 10, 10.0, False
+    )
+
+    # NIRv was cached, EVI was not: one traversal for the union of gaps
+    assert calls == [("2024-01-01", "2024-03-31", ("NIRv", "EVI"))]
+    assert set(series) == {"NIRv", "EVI"}
+    assert [p["date"] for p in series["EVI"]] == ["2024-01-01"]
+
+
+def test_default_multi_index_series_isolates_failing_index():
+    from types import SimpleNamespace
+
+    from app.services.satellite.interfaces import ISatelliteProvider
+
+    def get_time_series(geometry, start, end, index, interval):
+        if index == "EVI":
+            raise RuntimeError("quota exceeded")
+        return f"{index} series"
+
+    provider = SimpleNamespace(get_time_series=get_time_series)
+    series = ISatelliteProvider.get_time_series_multi(
+        provider, GEOMETRY, "2024-01-01", "2024-03-31", ["NDVI", "EVI", "NIRv"], "week"
+    )
+
+    assert series == {"NDVI": "NDVI series", "NIRv": "NIRv series"}
+
+
+def test_parse_multi_index_features_splits_flat_properties():
+    results = {
+        "features": [
+            {
+                "properties": {
+                    "date": "2024-05-01",
+                    "cloud": 2.0,
+                    "NIRv_value": 0.21,
+                    "NIRv_pixel_count": 120,
+                    "EVI_value": None,
+                }
+            },
+            {"properties": {"date": None, "cloud": None}},
+        ]
+    }
+
+    parsed = ee_module._parse_multi_index_features(results, ["NIRv", "EVI"])
+
+    assert parsed == {
+        "NIRv": [
+            {"date": "2024-05-01", "value": 0.21, "cloud": 2.0, "pixel_count": 120}
+        ],
+        "EVI": [],
+    }
+
+
+def test_chunks_run_concurrently_and_keep_lowest_cloud(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(ee_module.settings, "TIMESERIES_STORE_ENABLED", False)
+    monkeypatch.setattr(ee_module.settings, "GEE_TS_CHUNK_WORKERS", 4)
+    # 2024 spans three 180-day chunks; the barrier only opens if all run at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_chunk(geometry, aoi, start, end, indices, scale, max_cloud, use_aoi_cloud_filter=False):
+        barrier.wait()
+        return {
+            i: [
+                {"date": start, "value": 0.9, "cloud": 40.0},
+                {"date": start, "value": 0.3, "cloud": 1.0},
+            ]
+            for i in indices
+        }
+
+    service = EarthEngineService()
+    monkeypatch.setattr(service, "_per_observation_chunk_multi", fake_chunk)
+
+    series = service._get_time_series_per_observation(
+        GEOMETRY, None, "2024-01-01", "2024-12-31", "NDVI", 10, 10.0, False
+    )
+
+    assert [p["date"] for p in series] == ["2024-01-01", "2024-06-29", "2024-12-26"]
+    assert all(p["value"] == 0.3 for p in series)
@@ -0,0 +1,50 @@
+"""Tests for the array-native raster-to-points conversion used by the CDSE heatmap."""
+import numpy as np
+
+from app.services.satellite.utils.raster_points import raster_to_points, sample_step
+
+
+def _reference(band, x_coords, y_coords, step):
+    """The per-pixel loop export_heatmap_data used before vectorisation."""
+    pixel_data, values = [], []
+    height, width = band.shape
+    for yi in range(0, height, step):
+        for xi in range(0, width, step):
+            value = float(band[yi, xi])
+            if not np.isnan(value) and not np.isinf(value):
+                pixel_data.append(
+                    {"lon": float(x_coords[xi]), "lat": float(y_coords[yi]), "value": value}
+                )
+                values.append(value)
+    return pixel_data, values
+
+
+def _raster(height, width, seed=0):
+    rng = np.random.default_rng(seed)
+    band = rng.uniform(-0.2, 0.9, size=(height, width)).astype(np.float32)
+    band[rng.random((height, width)) < 0.2] = np.nan
+    band[0, 3] = np.inf
+    x_coords = np.linspace(-5.6, -5.5, width)
+    y_coords = np.linspace(33.95, 33.9, height)
+    return band, x_coords, y_coords
+
+
+def test_matches_per_pixel_loop():
+    band, x_coords, y_coords = _raster(97, 131)
+    step = sample_step(97, 131, 1000)
+
+    pixel_data, values = raster_to_points(band, x_coords, y_coords, step)
+    expected, expected_values = _reference(band, x_coords, y_coords, step)
+
+    assert step == 3
+    assert pixel_data == expected
+    assert values.tolist() == expected_values
+
+
+def test_all_nodata_raster_yields_no_points():
+    band = np.full((10, 10), np.nan, dtype=np.float32)
+
+    pixel_data, values = raster_to_points(band, np.arange(10.0), np.arange(10.0))
+
+    assert pixel_data == []
+    assert values.size == 0
@@ -0,0 +1,103 @@
+"""Tests for the rendered index-map cache."""
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import EarthEngineService
+from app.services.render_cache import RenderCache, render_key
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.9], [-5.49, 33.9], [-5.49, 33.91], [-5.5, 33.9]]],
+}
+STYLE = {"min": 0.1, "max": 0.5, "palette": ["#000000", "#00FF00"]}
+
+
+def test_render_key_depends_on_every_component():
+    base = render_key(GEOMETRY, "2024-05-01", "NDVI", STYLE)
+    reordered = {"coordinates": GEOMETRY["coordinates"], "type": "Polygon"}
+
+    assert render_key(reordered, "2024-05-01", "NDVI", STYLE) == base
+    assert render_key(GEOMETRY, "2024-05-02", "NDVI", STYLE) != base
+    assert render_key(GEOMETRY, "2024-05-01", "EVI", STYLE) != base
+    assert render_key(GEOMETRY, "2024-05-01", "NDVI", {**STYLE, "max": 0.6}) != base
+
+
+def test_lru_evicts_to_stay_within_byte_budget():
+    cache = RenderCache(max_bytes=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    assert cache.get("a") == "x" * 10  # a becomes most recent
+
+    cache.put("c", "z" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 10
+    stats = cache.stats()
+    assert stats["bytes"] == 20
+    assert stats["evictions"] == 1
+    assert (stats["memory_hits"], stats["misses"]) == (2, 1)
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    RenderCache(max_bytes=1024, disk_path=str(tmp_path)).put("k1", "data:image/png;base64,AAA")
+
+    fresh = RenderCache(max_bytes=1024, disk_path=str(tmp_path))
+
+    assert fresh.get("k1") == "data:image/png;base64,AAA"
+    assert fresh.get("k1") == "data:image/png;base64,AAA"
+    stats = fresh.stats()
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+
+
+def test_disk_tier_prunes_lru_files_and_superseded_versions(tmp_path):
+    stale = tmp_path / "v0" / "ab"
+    stale.mkdir(parents=True)
+    (stale / "abc.txt").write_text("old")
+    cache = RenderCache(max_bytes=1024, disk_path=str(tmp_path), disk_max_bytes=25)
+    cache.put("k1", "x" * 10)
+    cache.put("k2", "y" * 10)
+    cache.clear()  # memory tier only
+    assert cache.get("k1") == "x" * 10  # k1 becomes most recent on disk
+
+    cache.put("k3", "z" * 10)
+
+    assert not (tmp_path / "v0").exists()
+    stats = cache.stats()
+    assert (stats["disk_bytes"], stats["disk_evictions"]) == (20, 1)
+    fresh = RenderCache(max_bytes=1024, disk_path=str(tmp_path), disk_max_bytes=25)
+    assert fresh.get("k2") is None
+    assert fresh.get("k1") == "x" * 10
+    assert fresh.get("k3") == "z" * 10
+    assert fresh.stats()["disk_bytes"] == 20
+
+
+def test_export_index_map_serves_repeat_views_from_cache(monkeypatch):
+    cache = RenderCache(max_bytes=1024 * 1024)
+    monkeypatch.setattr(ee_module, "render_cache", cache)
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    monkeypatch.setattr(
+        ee_module.observation_store, "settled_until", lambda today=None: date(2024, 12, 31)
+    )
+
+    service = EarthEngineService()
+    lazy = MagicMock()
+    lazy.is_empty.return_value = False
+    monkeypatch.setattr(service, "initialize", lambda: None)
+    monkeypatch.setattr(service, "get_sentinel2_collection_lazy", lambda *a, **k: lazy)
+    monkeypatch.setattr(service, "calculate_vegetation_indices", lambda image, idx: {"NDVI": MagicMock()})
+    render = MagicMock(return_value="data:image/png;base64,QUJD")
+    monkeypatch.setattr(service, "_create_enhanced_visualization", render)
+
+    first = asyncio.run(service.export_index_map(GEOMETRY, "2024-05-01", "NDVI"))
+    second = asyncio.run(service.export_index_map(GEOMETRY, "2024-05-01", "NDVI"))
+
+    assert first == second == {"type": "static", "url": "data:image/png;base64,QUJD"}
+    assert render.call_count == 1
+    assert cache.stats()["memory_hits"] == 1
+
+    # Dates still inside the settle window are always re-rendered
+    asyncio.run(service.export_index_map(GEOMETRY, "2025-01-03", "NDVI"))
+    asyncio.run(service.export_index_map(GEOMETRY, "2025-01-03", "NDVI"))
+    assert render.call_count == 3
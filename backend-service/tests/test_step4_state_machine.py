@@ -1090,3 +1090,38 @@ def test_mejjat_parcel_shape() -> None:
 
     assert "DEBOURREMENT" in all_phases, f"Missing DEBOURREMENT, got: {all_phases}"
     assert "STRESS_ESTIVAL" in all_phases, f"Missing STRESS_ESTIVAL, got: {all_phases}"
+
+
+def test_precompute_weather_columns_matches_compute_daily_signals() -> None:
+    import random
+
+    rng = random.Random(7)
+    start = date(2024, 1, 1)
+    rows = [
+        _make_weather(
+            start + timedelta(days=i),
+            rng.uniform(15.0, 38.0),
+            rng.uniform(-2.0, 18.0),
+            precip=rng.choice([0.0, 0.0, 0.0, round(rng.uniform(0.1, 12.0), 1)]),
+        )
+        for i in range(120)
+    ]
+    columns = sm.precompute_weather_columns(rows, tbase=7.5, tupper=30.0)
+
+    for i, row in enumerate(rows):
+        expected = compute_daily_signals(
+            current_date=row["date"],
+            weather_day=row,
+            weather_history_30d=rows[max(0, i - 29):i + 1],
+            satellite_nirv=None,
+            satellite_ndvi=None,
+            prev_nirv=None,
+            prev_ndvi=None,
+            days_since_prev_satellite=1,
+        )
+        assert columns.tmoy[i] == expected.tmoy
+        assert columns.gdd_jour[i] == expected.gdd_jour
+        assert columns.tmax_30j_pct[i] == expected.tmax_30j_pct
+        assert math.isclose(columns.precip_30j[i], expected.precip_30j, abs_tol=1e-9)
+        if expected.precip_30j == 0.0:
+            assert columns.precip_30j[i] == 0.0
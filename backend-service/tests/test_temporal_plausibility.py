@@ -114,6 +114,20 @@ def test_multiple_artefacts_in_series() -> None:
     assert points[4].outlier is True
 
 
+def test_flagged_spike_is_not_the_reference_for_the_next_point() -> None:
+    """An alternating signal: each spike after a clean point is flagged, not the ones after it."""
+    points = [
+        _pt(0, 0.10),
+        _pt(2, 0.15),    # spike, snaps back → artefact
+        _pt(4, 0.10),    # relative to the flagged 0.15 it would also qualify
+        _pt(6, 0.15),    # spike from the clean 0.10 → artefact
+        _pt(8, 0.10),
+    ]
+    count = _mark_temporal_artefacts(points)
+    assert count == 2
+    assert [p.outlier for p in points] == [False, True, False, True, False]
+
+
 def test_legitimate_seasonal_transition_not_flagged() -> None:
     """Dormancy exit: gradual rise over weeks → no artefact flags."""
     points = [
@@ -0,0 +1,117 @@
+"""Tests for the streaming /api/indices/timeseries/stream endpoint."""
+import json
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import EarthEngineService
+from app.services.observation_store import ObservationStore
+
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.8], [-5.4, 33.8], [-5.4, 33.9], [-5.5, 33.8]]],
+}
+
+
+def _body(index="NDVI"):
+    return {
+        "aoi": {"geometry": GEOMETRY},
+        "date_range": {"start_date": "2024-01-01", "end_date": "2024-12-31"},
+        "index": index,
+    }
+
+
+def test_batches_stream_store_first_then_newest_chunk(tmp_path, monkeypatch):
+    store = ObservationStore(str(tmp_path / "obs.sqlite3"))
+    monkeypatch.setattr(ee_module, "observation_store", store)
+    monkeypatch.setattr(store, "settled_until", lambda today=None: date(2024, 12, 31))
+
+    def fake_chunk(geometry, aoi, start, end, indices, scale, max_cloud, use_aoi_cloud_filter=False):
+        return {i: [{"date": start, "value": 0.4, "cloud": 5.0}] for i in indices}
+
+    service = EarthEngineService()
+    monkeypatch.setattr(service, "initialize", lambda: None)
+    monkeypatch.setattr(ee_module, "ee", MagicMock())
+    monkeypatch.setattr(service, "_per_observation_chunk_multi", fake_chunk)
+    service._get_time_series_per_observation(
+        GEOMETRY, None, "2024-01-01", "2024-03-31", "NDVI", 10, 10.0, True
+    )
+
+    batches = list(
+        service.iter_time_series(
+            GEOMETRY, "2024-01-01", "2024-12-31", "NDVI", 10.0, use_aoi_cloud_filter=True
+        )
+    )
+
+    assert [(b["source"], b["start"]) for b in batches] == [
+        ("store", "2024-01-01"),
+        ("gee", "2024-09-28"),
+        ("gee", "2024-04-01"),
+    ]
+    assert batches[0]["data"] == [{"date": "2024-01-01", "value": 0.4, "cloud_coverage": 5.0}]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from app.api import indices
+    from app.middleware.auth import get_current_user_or_service
+    from app.services import earth_engine_service
+
+    class _Gee:
+        provider_name = "Google Earth Engine"
+
+    def fake_iter(geometry, start, end, index, max_cloud_coverage=None, use_aoi_cloud_filter=False):
+        yield {
+            "start": "2024-07-01",
+            "end": "2024-12-31",
+            "source": "gee",
+            "data": [{"date": "2024-08-01", "value": 0.6}, {"date": "2024-07-01", "value": 0.4}],
+        }
+        yield {
+            "start": "2024-01-01",
+            "end": "2024-06-30",
+            "source": "gee",
+            "data": [{"date": "2024-03-01", "value": 0.2}],
+        }
+
+    async def fake_par(req_id, request, geo_summary):
+        return {"2024-08-01": 10.0, "2024-07-01": 20.0}
+
+    monkeypatch.setattr(indices, "get_satellite_provider", lambda provider=None: _Gee())
+    monkeypatch.setattr(indices, "_load_par_by_date", fake_par)
+    monkeypatch.setattr(earth_engine_service, "iter_time_series", fake_iter)
+    app.dependency_overrides[get_current_user_or_service] = lambda: {"id": "test", "service": True}
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_stream_emits_chunks_with_running_statistics(client):
+    response = client.post("/api/indices/timeseries/stream", json=_body())
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["start", "chunk", "chunk", "done"]
+    assert [p["date"] for p in events[1]["data"]] == ["2024-08-01", "2024-07-01"]
+    assert events[1]["statistics"]["mean"] == pytest.approx(0.5)
+    assert events[2]["data_points"] == 3
+    assert events[3]["statistics"]["min"] == pytest.approx(0.2)
+
+
+def test_stream_applies_par_per_chunk_as_sse(client):
+    response = client.post(
+        "/api/indices/timeseries/stream",
+        json=_body("NIRvP"),
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in response.text.split("\n\n") if b]
+    events = [json.loads(b.split("data: ", 1)[1]) for b in blocks]
+    assert blocks[1].startswith("event: chunk\n")
+    assert [p["value"] for p in events[1]["data"]] == [pytest.approx(6.0), pytest.approx(8.0)]
+    # No PAR window for March: the mean PAR of the range is used
+    assert events[2]["data"] == [{"date": "2024-03-01", "value": pytest.approx(3.0)}]
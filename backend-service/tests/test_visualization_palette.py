@@ -0,0 +1,93 @@
+"""Tests for LUT-based palette colouring and the locally rendered GEE index map."""
+import base64
+import io
+from unittest.mock import MagicMock
+
+import numpy as np
+from PIL import Image
+
+from app.services import earth_engine as ee_module
+from app.services.earth_engine import EarthEngineService
+from app.services.satellite.utils.visualization import (
+    apply_color_palette,
+    hex_to_rgb,
+    palette_lut,
+)
+
+PALETTE = ["#8B0000", "#FF4500", "#FFD700", "#ADFF2F", "#00FF00"]
+GEOMETRY = {
+    "type": "Polygon",
+    "coordinates": [[[-5.5, 33.9], [-5.49, 33.9], [-5.49, 33.91], [-5.5, 33.9]]],
+}
+
+
+def _per_pixel(normalized, palette):
+    """The nested-loop interpolation apply_color_palette used before the LUT."""
+    rgb_palette = [hex_to_rgb(color) for color in palette]
+    colored = np.zeros(normalized.shape + (3,), dtype=np.uint8)
+    segment_size = 1.0 / (len(rgb_palette) - 1)
+    for y in range(normalized.shape[0]):
+        for x in range(normalized.shape[1]):
+            value = normalized[y, x]
+            if not np.isnan(value) and 0 <= value <= 1:
+                idx = min(int(value / segment_size), len(rgb_palette) - 2)
+                local = (value - idx * segment_size) / segment_size
+                c1, c2 = rgb_palette[idx], rgb_palette[idx + 1]
+                colored[y, x] = [int(c1[i] + (c2[i] - c1[i]) * local) for i in range(3)]
+    return colored
+
+
+def test_lut_colouring_matches_per_pixel_interpolation():
+    rng = np.random.default_rng(0)
+    normalized = rng.random((64, 48))
+    normalized[3, 5] = np.nan
+    normalized[0, :4] = [0.0, 0.25, 0.5, 1.0]
+
+    colored = apply_color_palette(normalized, PALETTE)
+    expected = _per_pixel(normalized, PALETTE)
+
+    assert colored.shape == (64, 48, 3) and colored.dtype == np.uint8
+    assert np.abs(colored.astype(int) - expected.astype(int)).max() <= 1
+    assert colored[0, 0].tolist() == list(hex_to_rgb(PALETTE[0]))
+    assert colored[0, 3].tolist() == list(hex_to_rgb(PALETTE[4]))
+    assert colored[3, 5].tolist() == [0, 0, 0]
+
+
+def test_palette_stops_are_exact_and_lut_is_cached():
+    lut = palette_lut(tuple(PALETTE))
+
+    assert lut[0].tolist() == list(hex_to_rgb(PALETTE[0]))
+    assert lut[-1].tolist() == list(hex_to_rgb(PALETTE[-1]))
+    assert palette_lut(tuple(PALETTE)) is lut
+    assert not lut.flags.writeable
+
+
+def test_single_colour_palette_ramps_from_black():
+    colored = apply_color_palette(np.array([[0.0, 0.5, 1.0]]), ["#00FF00"])
+
+    assert colored[0, :, 1].tolist() == [0, 127, 255]
+
+
+def test_static_index_map_is_rendered_locally_from_one_pixel_request(monkeypatch):
+    def compute_pixels(request):
+        dims = request["grid"]["dimensions"]
+        raster = np.zeros((dims["height"], dims["width"]), dtype=[("NDVI", "<f4")])
+        raster["NDVI"] = 0.3
+        raster["NDVI"][0, 0] = ee_module.HEATMAP_NODATA
+        return raster
+
+    fake_ee = MagicMock()
+    fake_ee.data.computePixels.side_effect = compute_pixels
+    monkeypatch.setattr(ee_module, "ee", fake_ee)
+    service = EarthEngineService()
+    image = MagicMock()
+
+    url = service._create_enhanced_visualization(
+        image, "NDVI", "2024-05-01", MagicMock(), service._get_visualization_params("NDVI"), GEOMETRY
+    )
+
+    assert url.startswith("data:image/png;base64,")
+    rendered = Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1])))
+    assert rendered.size[0] >= 512
+    assert fake_ee.data.computePixels.call_count == 1
+    image.getThumbUrl.assert_not_called()
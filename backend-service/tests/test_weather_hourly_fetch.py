@@ -13,17 +13,13 @@ def _mock_open_meteo_hourly_response(num_hours: int = 4):
 
 
 def _make_async_get_mock(json_payload: dict):
-    """Patch httpx.AsyncClient.get to return a mock response with the given JSON."""
+    """Shared-client stand-in whose get() returns a mock response with the given JSON."""
     response = MagicMock()
     response.raise_for_status = MagicMock()
     response.json = MagicMock(return_value=json_payload)
     client_instance = AsyncMock()
     client_instance.get = AsyncMock(return_value=response)
-
-    client_cm = MagicMock()
-    client_cm.__aenter__ = AsyncMock(return_value=client_instance)
-    client_cm.__aexit__ = AsyncMock(return_value=None)
-    return client_cm, client_instance
+    return client_instance
 
 
 def test_raises_weather_fetch_error_on_open_meteo_failure():
@@ -37,15 +33,12 @@ def test_raises_weather_fetch_error_on_open_meteo_failure():
     response.raise_for_status = MagicMock(side_effect=error)
     client_instance = AsyncMock()
     client_instance.get = AsyncMock(return_value=response)
-    client_cm = MagicMock()
-    client_cm.__aenter__ = AsyncMock(return_value=client_instance)
-    client_cm.__aexit__ = AsyncMock(return_value=None)
 
     persist_mock = AsyncMock(return_value=None)
 
     from app.services.weather_service import WeatherFetchError
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=[]),
         create=True,
@@ -86,9 +79,9 @@ def test_gap_fill_fetches_only_missing_dates():
             "temperature_2m": [6.0 + h for h in range(24)],
         }
     }
-    client_cm, client_instance = _make_async_get_mock(api_response)
+    client_instance = _make_async_get_mock(api_response)
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=cached_rows),
         create=True,
@@ -122,9 +115,9 @@ def test_cache_hit_skips_api_call():
         {"recorded_at": f"2025-11-01T{h:02d}:00:00+00:00", "temperature_2m": 5.0 + h}
         for h in range(24)
     ]
-    client_cm, client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(0))
+    client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(0))
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=cached_rows),
         create=True,
@@ -149,10 +142,10 @@ def test_cache_hit_skips_api_call():
 
 def test_cache_miss_persists_fetched_rows():
     """When cache is empty, fetched rows are persisted via supabase_service.persist_hourly_weather."""
-    client_cm, _ = _make_async_get_mock(_mock_open_meteo_hourly_response(3))
+    client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(3))
     persist_mock = AsyncMock(return_value=None)
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=[]),
         create=True,
@@ -179,9 +172,9 @@ def test_cache_miss_persists_fetched_rows():
 
 def test_quantizes_lat_lon_to_2_decimals():
     """Coordinates must be rounded to 2 decimals (matches weather_daily_data 1km grid)."""
-    client_cm, client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(1))
+    client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(1))
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=[]),
         create=True,
@@ -207,9 +200,9 @@ def test_quantizes_lat_lon_to_2_decimals():
 
 def test_fetches_hourly_temperature_2m_from_archive_api():
     """fetch_hourly_temperature() issues GET to archive-api with hourly=temperature_2m."""
-    client_cm, client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(2))
+    client_instance = _make_async_get_mock(_mock_open_meteo_hourly_response(2))
 
-    with patch("app.services.weather_service.httpx.AsyncClient", return_value=client_cm), patch(
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
         "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
         new=AsyncMock(return_value=[]),
         create=True,
@@ -235,3 +228,48 @@ def test_fetches_hourly_temperature_2m_from_archive_api():
     assert "archive-api.open-meteo.com" in url
     assert params.get("hourly") == "temperature_2m"
     assert len(rows) == 2
+
+
+def test_partial_cached_day_is_refetched_without_double_counting():
+    """A day with fewer than 24 cached hours is refetched and its cached rows dropped."""
+    from app.services.weather.hour_counter import HourlySeries
+
+    full_day = [
+        {"recorded_at": f"2025-11-01T{h:02d}:00:00+00:00", "temperature_2m": 5.0}
+        for h in range(24)
+    ]
+    partial_day = [
+        {"recorded_at": f"2025-11-02T{h:02d}:00:00+00:00", "temperature_2m": 9.0}
+        for h in range(12)
+    ]
+    api_response = {
+        "hourly": {
+            "time": [f"2025-11-02T{h:02d}:00" for h in range(24)],
+            "temperature_2m": [6.0] * 24,
+        }
+    }
+    client_instance = _make_async_get_mock(api_response)
+
+    with patch("app.services.weather_service._get_http_client", new=AsyncMock(return_value=client_instance)), patch(
+        "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
+        new=AsyncMock(return_value=full_day + partial_day),
+        create=True,
+    ), patch(
+        "app.services.supabase_service.supabase_service.persist_hourly_weather",
+        new=AsyncMock(return_value=None),
+        create=True,
+    ):
+        rows = asyncio.run(
+            WeatherService().fetch_hourly_temperature(
+                latitude=33.89,
+                longitude=-5.55,
+                start_date="2025-11-01",
+                end_date="2025-11-02",
+            )
+        )
+
+    assert isinstance(rows, HourlySeries)
+    assert len(rows) == 48
+    assert 9.0 not in rows.temperature.tolist()
+    params = client_instance.get.call_args.kwargs.get("params") or {}
+    assert (params.get("start_date"), params.get("end_date")) == ("2025-11-02", "2025-11-02")
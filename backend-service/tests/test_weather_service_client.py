@@ -0,0 +1,116 @@
+"""Tests for WeatherService request coalescing and concurrent gap filling."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.weather_service import WeatherService
+
+
+def _slow_client(payload: dict, in_flight: dict):
+    async def get(url, params=None, timeout=None):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.02)
+        in_flight["now"] -= 1
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value=payload)
+        return response
+
+    client = AsyncMock()
+    client.get = AsyncMock(side_effect=get)
+    return client
+
+
+def test_concurrent_identical_requests_share_one_upstream_call():
+    payload = {"daily": {"time": ["2025-01-01"], "temperature_2m_max": [18.0]}}
+    in_flight = {"now": 0, "peak": 0}
+    client = _slow_client(payload, in_flight)
+
+    async def run():
+        ws = WeatherService()
+        # 200 parcels in the same 0.01° cell
+        return await asyncio.gather(
+            *(
+                ws.fetch_historical(33.8912 + i * 1e-5, -5.5461, "2025-01-01", "2025-01-01")
+                for i in range(200)
+            )
+        )
+
+    with patch(
+        "app.services.weather_service._get_http_client",
+        new=AsyncMock(return_value=client),
+    ):
+        results = asyncio.run(run())
+
+    assert client.get.call_count == 1
+    assert all(r == payload for r in results)
+    assert WeatherService._inflight == {}
+
+
+def test_db_cache_gaps_are_fetched_concurrently():
+    payload = {"daily": {"time": []}}
+    in_flight = {"now": 0, "peak": 0}
+    client = _slow_client(payload, in_flight)
+    # 01 and 03 cached → two gaps: 02 and 04..05
+    cached = [
+        {"date": "2025-01-01", "temperature_min": 5.0, "temperature_max": 15.0},
+        {"date": "2025-01-03", "temperature_min": 6.0, "temperature_max": 16.0},
+    ]
+
+    with patch(
+        "app.services.weather_service._get_http_client",
+        new=AsyncMock(return_value=client),
+    ), patch(
+        "app.services.supabase_service.supabase_service.get_cached_weather",
+        new=AsyncMock(return_value=cached),
+        create=True,
+    ), patch(
+        "app.services.supabase_service.supabase_service.upsert_weather_daily",
+        new=AsyncMock(return_value=None),
+        create=True,
+    ):
+        rows = asyncio.run(
+            WeatherService().fetch_with_db_cache(33.89, -5.55, "2025-01-01", "2025-01-05")
+        )
+
+    requested = sorted(
+        (c.kwargs["params"]["start_date"], c.kwargs["params"]["end_date"])
+        for c in client.get.call_args_list
+    )
+    assert requested == [("2025-01-02", "2025-01-02"), ("2025-01-04", "2025-01-05")]
+    assert in_flight["peak"] == 2
+    assert [r["date"] for r in rows] == ["2025-01-01", "2025-01-03"]
+
+
+def test_hourly_gaps_are_fetched_with_bounded_concurrency(monkeypatch):
+    from app.services import weather_service
+
+    monkeypatch.setattr(weather_service, "_GAP_FETCH_CONCURRENCY", 2)
+    payload = {"hourly": {"time": [], "temperature_2m": []}}
+    in_flight = {"now": 0, "peak": 0}
+    client = _slow_client(payload, in_flight)
+    # Every other day fully cached → five one-day gaps
+    cached = [
+        {"recorded_at": f"2025-01-{day:02d}T{h:02d}:00:00+00:00", "temperature_2m": 5.0}
+        for day in (2, 4, 6, 8)
+        for h in range(24)
+    ]
+
+    with patch(
+        "app.services.weather_service._get_http_client",
+        new=AsyncMock(return_value=client),
+    ), patch(
+        "app.services.supabase_service.supabase_service.get_cached_hourly_weather",
+        new=AsyncMock(return_value=cached),
+        create=True,
+    ), patch(
+        "app.services.supabase_service.supabase_service.persist_hourly_weather",
+        new=AsyncMock(return_value=None),
+        create=True,
+    ):
+        asyncio.run(
+            WeatherService().fetch_hourly_temperature(33.89, -5.55, "2025-01-01", "2025-01-09")
+        )
+
+    assert client.get.call_count == 5
+    assert in_flight["peak"] == 2